@@ -0,0 +1,110 @@
+"""Compare per-bin and batched ALE prediction for the SVR and MLP pipelines.
+
+Run with ``uv run python benchmarks/batched_ale.py``. Each model is fitted on a
+synthetic matrix as wide as the all-position contract. The per-bin baseline
+makes two ``predict`` calls per feature bin, as diagnostics did before curves
+were batched; the batched engine predicts every perturbation of every feature
+together, uncapped and with a small memory cap. The last column reports the
+largest effect difference from the per-bin curves.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+from sklearn.pipeline import Pipeline
+
+from ffpred.evaluation.explainability import (
+    AleCurve,
+    Predictor,
+    accumulated_local_effects_batch,
+)
+from ffpred.features.all_positions import ALL_POSITION_MODEL_FEATURE_COLUMNS
+from ffpred.training.mlp import create_archive_estimator
+from ffpred.training.svr import SvrConfig, create_estimator
+
+ROWS = 1_000
+BINS = 10
+CAPPED_BYTES = 1024 * 1024
+MODELS: tuple[tuple[str, Callable[[], Pipeline]], ...] = (
+    ("SVR", lambda: create_estimator(SvrConfig(c=1.0, kernel="rbf"))),
+    ("MLP", create_archive_estimator),
+)
+
+
+def _per_bin_effects(
+    estimator: Predictor,
+    features: np.ndarray,
+    column: int,
+) -> np.ndarray:
+    values = features[:, column]
+    edges = np.unique(np.quantile(values, np.linspace(0, 1, BINS + 1)))
+    if edges.size == 1:
+        return np.zeros(1)
+    assignments = np.searchsorted(edges[1:-1], values, side="right")
+    differences = np.zeros(edges.size - 1)
+    counts = np.zeros(edges.size - 1, dtype=np.int64)
+    for index in range(edges.size - 1):
+        rows = np.flatnonzero(assignments == index)
+        counts[index] = rows.size
+        if rows.size == 0:
+            continue
+        lower = features[rows].copy()
+        upper = features[rows].copy()
+        lower[:, column] = edges[index]
+        upper[:, column] = edges[index + 1]
+        differences[index] = np.mean(
+            estimator.predict(upper) - estimator.predict(lower)
+        )
+    effects = np.cumsum(differences)
+    populated = counts > 0
+    return effects - np.average(effects[populated], weights=counts[populated])
+
+
+def _largest_difference(
+    curves: tuple[AleCurve, ...],
+    baseline: list[np.ndarray],
+) -> float:
+    return max(
+        float(np.max(np.abs(np.asarray(curve.effects) - effects)))
+        for curve, effects in zip(curves, baseline, strict=True)
+    )
+
+
+def main() -> None:
+    """Print ALE wall time per model for the per-bin and batched engines."""
+    names = ALL_POSITION_MODEL_FEATURE_COLUMNS
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(ROWS, len(names)))
+    target = 2 * features[:, 0] + np.sin(features[:, 1]) + rng.normal(size=ROWS)
+    print(f"{'model':>5} {'per-bin':>8} {'batched':>8} {'capped':>8} {'max diff':>9}")
+    for label, factory in MODELS:
+        estimator = factory().fit(features, target)
+        started = time.perf_counter()
+        baseline = [
+            _per_bin_effects(estimator, features, column)
+            for column in range(len(names))
+        ]
+        per_bin = time.perf_counter() - started
+        started = time.perf_counter()
+        curves = accumulated_local_effects_batch(estimator, features, names, bins=BINS)
+        batched = time.perf_counter() - started
+        started = time.perf_counter()
+        accumulated_local_effects_batch(
+            estimator,
+            features,
+            names,
+            bins=BINS,
+            max_bytes=CAPPED_BYTES,
+        )
+        capped = time.perf_counter() - started
+        print(
+            f"{label:>5} {per_bin:>8.2f} {batched:>8.2f} {capped:>8.2f} "
+            f"{_largest_difference(curves, baseline):>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
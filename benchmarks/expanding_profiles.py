@@ -0,0 +1,148 @@
+"""Show that the all-position training build scales with the archive span.
+
+Run with ``uv run python benchmarks/expanding_profiles.py``. Each window builds
+a synthetic league with a full depth chart per team and week; the reported cost
+per training row should stay roughly flat as the window grows from 2009-2014 to
+1999-2025 because each completed season is folded into the player, team and
+position profiles once.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import polars as pl
+
+from ffpred.features.all_positions import (
+    build_actual_frame,
+    build_all_position_training_frame,
+)
+
+TEAMS = 32
+EIGHTEEN_WEEK_SEASONS_FROM = 2021
+PLAYER_CHANGE_RATE = 0.25
+SLOTS = (("QB", 1), ("RB", 3), ("WR", 4), ("TE", 2), ("K", 1))
+WINDOWS = ((2009, 2014), (2004, 2014), (1999, 2014), (1999, 2025))
+
+
+def _weeks(season: int) -> int:
+    return 18 if season >= EIGHTEEN_WEEK_SEASONS_FROM else 17
+
+
+def synthetic_sources(
+    first: int, last: int, *, seed: int = 0
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """Return player stats, team stats and schedules for a synthetic league."""
+    rng = np.random.default_rng(seed)
+    rosters = {
+        (team, position, slot): f"{position}-{first}-{team}-{slot}"
+        for team in range(TEAMS)
+        for position, slots in SLOTS
+        for slot in range(slots)
+    }
+    players: list[dict[str, object]] = []
+    teams: list[dict[str, object]] = []
+    schedules: list[dict[str, object]] = []
+    for season in range(first, last + 1):
+        for key in rosters:
+            if rng.random() < PLAYER_CHANGE_RATE:
+                team, position, slot = key
+                rosters[key] = f"{position}-{season}-{team}-{slot}"
+        for week in range(1, _weeks(season) + 1):
+            for home in range(0, TEAMS, 2):
+                game_id = f"{season}_{week:02d}_{home}_{home + 1}"
+                schedules.append(
+                    {
+                        "game_id": game_id,
+                        "season": season,
+                        "game_type": "REG",
+                        "week": week,
+                        "gameday": f"{season}-09-{week + 1:02d}",
+                        "home_team": f"T{home}",
+                        "away_team": f"T{home + 1}",
+                        "home_score": int(rng.integers(0, 40)),
+                        "away_score": int(rng.integers(0, 40)),
+                    }
+                )
+                for team, opponent in ((home, home + 1), (home + 1, home)):
+                    teams.append(
+                        {
+                            "season": season,
+                            "week": week,
+                            "season_type": "REG",
+                            "game_id": game_id,
+                            "team": f"T{team}",
+                            "opponent_team": f"T{opponent}",
+                            **{
+                                column: int(rng.integers(0, 3))
+                                for column in (
+                                    "def_sacks",
+                                    "def_interceptions",
+                                    "fumble_recovery_opp",
+                                    "def_tds",
+                                    "special_teams_tds",
+                                    "def_safeties",
+                                    "def_punt_blocks",
+                                    "def_pat_blocks",
+                                    "def_fg_blocks",
+                                )
+                            },
+                        }
+                    )
+                    for (roster_team, position, _), player_id in rosters.items():
+                        if roster_team != team:
+                            continue
+                        kicker = position == "K"
+                        players.append(
+                            {
+                                "player_id": player_id,
+                                "player_display_name": player_id,
+                                "position": position,
+                                "season": season,
+                                "week": week,
+                                "season_type": "REG",
+                                "game_id": game_id,
+                                "team": f"T{team}",
+                                "opponent_team": f"T{opponent}",
+                                "fantasy_points": float(rng.gamma(2.0, 4.0)),
+                                "attempts": int(rng.integers(20, 45))
+                                if position == "QB"
+                                else 0,
+                                "carries": int(rng.integers(0, 20)),
+                                "targets": int(rng.integers(0, 10)),
+                                "receptions": int(rng.integers(0, 6)),
+                                "fg_att": int(rng.integers(1, 4)) if kicker else 0,
+                                "fg_made_0_19": 0,
+                                "fg_made_20_29": int(kicker),
+                                "fg_made_30_39": int(kicker),
+                                "fg_made_40_49": int(rng.integers(0, 2)) * kicker,
+                                "fg_made_50_59": 0,
+                                "fg_made_60_": 0,
+                                "pat_made": int(rng.integers(0, 5)) * kicker,
+                            }
+                        )
+    return pl.DataFrame(players), pl.DataFrame(teams), pl.DataFrame(schedules)
+
+
+def main() -> None:
+    """Print the per-row training-frame build cost for widening windows."""
+    print(f"{'window':>11} {'rows':>8} {'seconds':>8} {'us/row':>7}")
+    for first, last in WINDOWS:
+        player_stats, team_stats, schedules = synthetic_sources(first, last)
+        actuals = build_actual_frame(player_stats, team_stats, schedules)
+        started = time.perf_counter()
+        frame = build_all_position_training_frame(
+            actuals,
+            schedules,
+            target_years=range(first + 1, last + 1),
+        )
+        elapsed = time.perf_counter() - started
+        print(
+            f"{first}-{last} {frame.height:>8} {elapsed:>8.2f} "
+            f"{elapsed / frame.height * 1e6:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Load-test the local inference server with and without micro-batching.
+
+Run with ``uv run python benchmarks/inference_service.py``. An MLP is fitted on
+a synthetic matrix as wide as the all-position contract and served over a Unix
+socket. Client threads each hold one connection and repeatedly request a
+handful of players for one week. The ``eager`` server never waits, so a batch
+holds only the requests already queued when the worker wakes; the ``batched``
+server also coalesces whatever arrives within the delay window.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from ffpred.features.all_positions import ALL_POSITION_MODEL_FEATURE_COLUMNS
+from ffpred.serving import InferenceClient, InferenceService, ServedModel, create_server
+from ffpred.training.mlp import create_archive_estimator
+from ffpred.training.projection import ProjectionData
+
+PLAYERS = 2_000
+WEEKS = 18
+CLIENTS = 16
+REQUESTS_PER_CLIENT = 200
+PLAYERS_PER_REQUEST = 8
+SEASON = 2024
+SETTINGS: tuple[tuple[str, int, float], ...] = (
+    ("eager", 1, 0.0),
+    ("batched", 4_096, 0.002),
+)
+
+
+def _served_model() -> ServedModel:
+    names = ALL_POSITION_MODEL_FEATURE_COLUMNS
+    rng = np.random.default_rng(0)
+    train = rng.normal(size=(5_000, len(names)))
+    target = 2 * train[:, 0] + np.sin(train[:, 1]) + rng.normal(size=train.shape[0])
+    estimator = create_archive_estimator()
+    estimator.fit(train, target)
+    rows = PLAYERS * WEEKS
+    frame = pl.DataFrame(
+        {
+            "player_id": [f"P{index % PLAYERS:05d}" for index in range(rows)],
+            "target_season": [SEASON] * rows,
+            "target_week": [index // PLAYERS + 1 for index in range(rows)],
+        }
+    )
+    return ServedModel(
+        model="mlp",
+        season=SEASON,
+        estimator=estimator,
+        forecast=ProjectionData(
+            frame=frame,
+            features=rng.normal(size=(rows, len(names))),
+            feature_names=names,
+        ),
+    )
+
+
+def _client(socket_path: Path, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    client = InferenceClient(socket_path=socket_path)
+    try:
+        for _ in range(REQUESTS_PER_CLIENT):
+            players = rng.integers(0, PLAYERS, PLAYERS_PER_REQUEST)
+            client.predict(
+                "mlp",
+                SEASON,
+                [f"P{player:05d}" for player in players],
+                week=int(rng.integers(1, WEEKS + 1)),
+            )
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Print throughput, batch size and latency percentiles per setting."""
+    served = _served_model()
+    print(
+        f"{'setting':>8} {'req/s':>8} {'batches':>8} {'rows/batch':>10} "
+        f"{'p50 ms':>7} {'p99 ms':>7}"
+    )
+    for label, max_batch_rows, max_delay in SETTINGS:
+        service = InferenceService(
+            [served],
+            max_batch_rows=max_batch_rows,
+            max_delay=max_delay,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = Path(directory) / "ffpred.sock"
+            server = create_server(service, socket_path=socket_path)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+                list(pool.map(_client, [socket_path] * CLIENTS, range(CLIENTS)))
+            elapsed = time.perf_counter() - started
+            server.shutdown()
+            server.server_close()
+        service.close()
+        stats = service.counters.summary()
+        print(
+            f"{label:>8} {stats.requests / elapsed:>8.0f} {stats.batches:>8} "
+            f"{stats.mean_batch_rows:>10.1f} {stats.p50_ms or 0:>7.2f} "
+            f"{stats.p99_ms or 0:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
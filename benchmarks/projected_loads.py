@@ -0,0 +1,166 @@
+"""Compare peak memory of complete and projected provider loads.
+
+Run with ``uv run python benchmarks/projected_loads.py``. Synthetic weekly
+player-stats and play-by-play release files, as wide as nflverse's, are served
+from a local HTTP server that stands in for the release host, so every load
+resolves its URL through nflreadpy. Each dataset and mode runs in a fresh
+interpreter and reports its peak resident set size and how far loading raised
+that peak above the one reached by the imports. For player stats,
+``complete`` loads every season in one nflreadpy call and selects the contract
+columns afterwards, while ``projected`` asks the provider for those columns and
+keeps one unprojected season at a time. For play-by-play, ``complete`` decodes
+each season's whole file before filtering it to the two-point contract, while
+``projected`` scans the file with the contract's projection and predicate.
+"""
+
+from __future__ import annotations
+
+import functools
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+from nflreadpy.config import update_config
+from nflreadpy.downloader import NflverseDownloader
+from typing_extensions import override
+
+from ffpred.acquisition.games import TWO_POINT_PBP_COLUMNS, TWO_POINT_PBP_PREDICATE
+from ffpred.providers.nflreadpy import NflReadPyProvider
+
+SEASONS = tuple(range(2015, 2025))
+ROWS_PER_SEASON = 19_000
+NUMERIC_COLUMNS = 110
+COLUMNS = ("player_id", "season", "week", "season_type", "fantasy_points")
+PBP_SEASONS = (2022, 2023, 2024)
+PLAYS_PER_SEASON = 49_000
+PBP_NUMERIC_COLUMNS = 367
+TWO_POINT_RATE = 0.003
+DATASETS = ("player_stats", "pbp")
+MODES = ("complete", "projected")
+
+
+def _write_release(directory: Path) -> None:
+    rng = np.random.default_rng(0)
+    release = directory / "stats_player"
+    release.mkdir()
+    for season in SEASONS:
+        pl.DataFrame(
+            {
+                "player_id": [
+                    f"00-{index % 2_000:05d}" for index in range(ROWS_PER_SEASON)
+                ],
+                "season": [season] * ROWS_PER_SEASON,
+                "week": rng.integers(1, 19, ROWS_PER_SEASON),
+                "season_type": ["REG"] * ROWS_PER_SEASON,
+                "fantasy_points": rng.normal(8, 6, ROWS_PER_SEASON),
+                **{
+                    f"stat_{column:03d}": rng.normal(size=ROWS_PER_SEASON)
+                    for column in range(NUMERIC_COLUMNS)
+                },
+            }
+        ).write_parquet(release / f"stats_player_week_{season}.parquet")
+    plays = directory / "pbp"
+    plays.mkdir()
+    for season in PBP_SEASONS:
+        pl.DataFrame(
+            {
+                "game_id": [
+                    f"{season}_{index // 150:03d}" for index in range(PLAYS_PER_SEASON)
+                ],
+                "season_type": ["REG"] * PLAYS_PER_SEASON,
+                "two_point_attempt": rng.random(PLAYS_PER_SEASON) < TWO_POINT_RATE,
+                "passer_player_id": [
+                    f"00-{index % 90:05d}" for index in range(PLAYS_PER_SEASON)
+                ],
+                "rusher_player_id": [
+                    f"00-{index % 300:05d}" for index in range(PLAYS_PER_SEASON)
+                ],
+                **{
+                    f"stat_{column:03d}": rng.normal(size=PLAYS_PER_SEASON)
+                    for column in range(PBP_NUMERIC_COLUMNS)
+                },
+            }
+        ).with_columns(pl.col("two_point_attempt").cast(pl.Float64)).write_parquet(
+            plays / f"play_by_play_{season}.parquet"
+        )
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        del format, args
+
+
+def _load(provider: NflReadPyProvider, dataset: str, mode: str) -> pl.DataFrame:
+    if dataset == "player_stats":
+        if mode == "complete":
+            return provider.load_player_stats(SEASONS).select(COLUMNS)
+        return provider.load_player_stats(SEASONS, columns=COLUMNS)
+    return pl.concat(
+        provider.load_pbp(season)
+        .filter(TWO_POINT_PBP_PREDICATE)
+        .select(TWO_POINT_PBP_COLUMNS)
+        if mode == "complete"
+        else provider.load_pbp(
+            season,
+            columns=TWO_POINT_PBP_COLUMNS,
+            predicate=TWO_POINT_PBP_PREDICATE,
+        )
+        for season in PBP_SEASONS
+    )
+
+
+def _peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(dataset: str, mode: str, base_url: str) -> None:
+    imported = _peak_mb()
+    NflverseDownloader.BASE_URLS["nflverse-data"] = base_url
+    update_config(cache_mode="off")
+    frame = _load(NflReadPyProvider(), dataset, mode)
+    peak = _peak_mb()
+    print(
+        f"{dataset:>12} {mode:>9} {frame.height:>8} "
+        f"{frame.estimated_size('mb'):>9.1f} {peak:>9.0f} {peak - imported:>9.0f}"
+    )
+
+
+def main() -> None:
+    """Print rows, retained frame size and peak RSS per dataset and mode."""
+    with tempfile.TemporaryDirectory() as directory:
+        # Linux carries the peak RSS across exec, so the release files are
+        # written by their own interpreter rather than the measured ones' parent.
+        subprocess.run([sys.executable, __file__, "build", directory], check=True)
+        handler = functools.partial(_QuietHandler, directory=directory)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_port}/"
+        print(
+            f"{'dataset':>12} {'mode':>9} {'rows':>8} {'frame MB':>9} "
+            f"{'peak MB':>9} {'load MB':>9}"
+        )
+        for dataset in DATASETS:
+            for mode in MODES:
+                subprocess.run(
+                    [sys.executable, __file__, dataset, mode, base_url],
+                    check=True,
+                )
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["build"]:
+        _write_release(Path(sys.argv[2]))
+    elif sys.argv[1:]:
+        _measure(*sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,114 @@
+"""Show that the QB feature build, including the rookie fallback, scales linearly.
+
+Run with ``uv run python benchmarks/rookie_fallback.py``. Each window builds a
+synthetic league of one quarterback game per team and week; the reported cost
+per game row should stay roughly flat as the window grows from 2009-2014 to
+1999-2025.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import polars as pl
+
+from ffpred.acquisition.games import (
+    DEFENSE_GAMES_SCHEMA,
+    QUARTERBACK_GAME_STAT_FIELDS,
+    QUARTERBACK_GAMES_SCHEMA,
+)
+from ffpred.features.builder import build_feature_frame_from_games
+
+TEAMS = 32
+EIGHTEEN_WEEK_SEASONS_FROM = 2021
+STARTER_CHANGE_RATE = 0.3
+WINDOWS = ((2009, 2014), (2004, 2014), (1999, 2014), (1999, 2025))
+
+
+def _weeks(season: int) -> int:
+    return 18 if season >= EIGHTEEN_WEEK_SEASONS_FROM else 17
+
+
+def synthetic_games(
+    first: int, last: int, *, seed: int = 0
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Return quarterback and defense game frames for a synthetic league."""
+    rng = np.random.default_rng(seed)
+    quarterbacks: dict[str, list[object]] = {
+        column: [] for column in QUARTERBACK_GAMES_SCHEMA
+    }
+    defenses: dict[str, list[object]] = {column: [] for column in DEFENSE_GAMES_SCHEMA}
+    starters = [f"qb-{first}-{team}" for team in range(TEAMS)]
+    rookie_seasons = dict.fromkeys(starters, first - 3)
+    for season in range(first, last + 1):
+        for team in range(TEAMS):
+            if rng.random() < STARTER_CHANGE_RATE:
+                starters[team] = f"qb-{season}-{team}"
+                rookie_seasons[starters[team]] = season
+        for week in range(1, _weeks(season) + 1):
+            game_date = date(season, 9, 1) + timedelta(days=7 * week)
+            for team in range(TEAMS):
+                opponent = team ^ 1
+                player_id = starters[team]
+                game_id = (
+                    f"{season}_{week:02d}_{min(team, opponent)}_{max(team, opponent)}"
+                )
+                context = {
+                    "season": season,
+                    "week": week,
+                    "game_id": game_id,
+                    "game_date": game_date,
+                    "home_team": str(min(team, opponent)),
+                    "away_team": str(max(team, opponent)),
+                    "team": str(team),
+                    "opponent": str(opponent),
+                }
+                for column, value in {
+                    "player_id": player_id,
+                    "player_name": player_id,
+                    "birth_date": date(rookie_seasons[player_id] - 22, 6, 1),
+                    "rookie_season": rookie_seasons[player_id],
+                    **context,
+                }.items():
+                    quarterbacks[column].append(value)
+                for field in QUARTERBACK_GAME_STAT_FIELDS:
+                    quarterbacks[field].append(float(rng.integers(0, 40)))
+                for column, value in {
+                    **context,
+                    "team": str(opponent),
+                    "opponent": str(team),
+                }.items():
+                    defenses[column].append(value)
+                for field in (
+                    "points_allowed",
+                    "passing_yards_allowed",
+                    "rushing_yards_allowed",
+                    "turnovers",
+                ):
+                    defenses[field].append(float(rng.integers(0, 300)))
+    return (
+        pl.DataFrame(quarterbacks, schema=QUARTERBACK_GAMES_SCHEMA),
+        pl.DataFrame(defenses, schema=DEFENSE_GAMES_SCHEMA),
+    )
+
+
+def main() -> None:
+    """Time the QB feature build over increasingly long history windows."""
+    print(f"{'window':>11} {'games':>7} {'seconds':>8} {'us/game':>8}")
+    for first, last in WINDOWS:
+        quarterbacks, defenses = synthetic_games(first, last)
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            build_feature_frame_from_games(quarterbacks, defenses)
+            best = min(best, time.perf_counter() - start)
+        print(
+            f"{f'{first}-{last}':>11} {quarterbacks.height:>7} {best:>8.3f} "
+            f"{best / quarterbacks.height * 1e6:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
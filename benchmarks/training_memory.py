@@ -0,0 +1,92 @@
+"""Compare peak memory of loading the all-position archive for training.
+
+Run with ``uv run python benchmarks/training_memory.py``. A synthetic league
+spanning 1999-2025 is built into an all-position training table and written
+to Parquet. Each mode then loads it in a fresh interpreter and reports the
+memory it retains, its peak resident set size, and how far loading raised
+that peak above the one reached by the imports: ``frame`` rebuilds the
+earlier representation, which kept the whole validated frame next to a
+``float64`` matrix, while ``float64`` and ``float32`` use
+``load_training_data``, which keeps only the key columns.
+"""
+
+from __future__ import annotations
+
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from expanding_profiles import synthetic_sources
+
+from ffpred.datasets.io import read_dataset
+from ffpred.features.all_positions import (
+    build_actual_frame,
+    build_all_position_training_frame,
+)
+from ffpred.features.schema import TARGET_COLUMN
+from ffpred.training.data import load_training_data, model_feature_columns
+
+FIRST_SEASON = 1999
+LAST_SEASON = 2025
+MODES = ("frame", "float64", "float32")
+
+
+def _peak_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _measure(mode: str, path: Path) -> None:
+    imported = _peak_mb()
+    if mode == "frame":
+        frame = read_dataset(path)
+        features = np.asarray(
+            frame.select(model_feature_columns(frame)).to_numpy(),
+            dtype=np.float64,
+        )
+        target = np.asarray(frame[TARGET_COLUMN].to_numpy(), dtype=np.float64)
+    else:
+        data = load_training_data(
+            path, dtype="float32" if mode == "float32" else "float64"
+        )
+        frame, features, target = data.frame, data.features, data.target
+    peak = _peak_mb()
+    retained = (frame.estimated_size() + features.nbytes + target.nbytes) / 2**20
+    print(
+        f"{mode:>8} {features.shape[0]:>8} {retained:>11.1f} {peak:>9.0f} "
+        f"{peak - imported:>9.0f}"
+    )
+
+
+def _build(path: Path) -> None:
+    player_stats, team_stats, schedules = synthetic_sources(FIRST_SEASON, LAST_SEASON)
+    build_all_position_training_frame(
+        build_actual_frame(player_stats, team_stats, schedules),
+        schedules,
+        target_years=range(FIRST_SEASON + 1, LAST_SEASON + 1),
+    ).write_parquet(path)
+
+
+def main() -> None:
+    """Print rows, retained size and peak RSS per representation."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "train.parquet"
+        # Linux carries the peak RSS across exec, so the table is built in its
+        # own interpreter rather than in the parent of the measured ones.
+        subprocess.run([sys.executable, __file__, "build", str(path)], check=True)
+        print(
+            f"{'mode':>8} {'rows':>8} {'retained MB':>11} {'peak MB':>9} {'load MB':>9}"
+        )
+        for mode in MODES:
+            subprocess.run([sys.executable, __file__, mode, str(path)], check=True)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["build"]:
+        _build(Path(sys.argv[2]))
+    elif sys.argv[1:]:
+        _measure(sys.argv[1], Path(sys.argv[2]))
+    else:
+        main()
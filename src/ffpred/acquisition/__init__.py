@@ -1,8 +1,19 @@
 """NFL data acquisition."""
 
+from ffpred.acquisition.games import (
+    acquire_defense_games,
+    acquire_quarterback_games,
+    acquire_receiving_games,
+)
 from ffpred.acquisition.normalize import (
     acquire_defense_histories,
     acquire_quarterback_histories,
 )
 
-__all__ = ["acquire_defense_histories", "acquire_quarterback_histories"]
+__all__ = [
+    "acquire_defense_games",
+    "acquire_defense_histories",
+    "acquire_quarterback_games",
+    "acquire_quarterback_histories",
+    "acquire_receiving_games",
+]
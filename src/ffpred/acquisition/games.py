@@ -0,0 +1,392 @@
+"""Convert provider frames into normalized, columnar game frames.
+
+Each ``acquire_*_games`` function applies the same contracts, schedule join,
+team-code normalization, and error checks as its ``acquire_*_histories``
+counterpart in ``ffpred.acquisition.normalize``, but never leaves Polars: the
+result is one validated row per (entity, season, week) with every
+``GameContext`` field and the stat fields of the matching ``*GameStats``
+dataclass as named columns. Feature builders consume these frames directly;
+the dataclass histories are an optional view built from them on request.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import fields
+
+import polars as pl
+
+from ffpred.acquisition.contracts import (
+    DEFAULT_SEASONS,
+    PBP_CONTRACT,
+    PLAYER_STATS_CONTRACT,
+    PLAYERS_CONTRACT,
+    RECEIVING_PLAYER_STATS_CONTRACT,
+    REGULAR_SEASON,
+    RELOCATED_TEAM_CODES,
+    SCHEDULES_CONTRACT,
+    TEAM_STATS_CONTRACT,
+)
+from ffpred.acquisition.schema import validate_frame
+from ffpred.domain.models import (
+    DefenseGameStats,
+    QuarterbackGameStats,
+    ReceivingGameStats,
+)
+from ffpred.errors import DataAcquisitionError
+from ffpred.providers.nflreadpy import NflReadPyProvider
+from ffpred.providers.protocol import NflDataProvider
+
+QUARTERBACK_GAME_STAT_FIELDS = tuple(stat.name for stat in fields(QuarterbackGameStats))
+DEFENSE_GAME_STAT_FIELDS = tuple(stat.name for stat in fields(DefenseGameStats))
+RECEIVING_GAME_STAT_FIELDS = tuple(stat.name for stat in fields(ReceivingGameStats))
+
+GAME_CONTEXT_SCHEMA = {
+    "season": pl.Int64,
+    "week": pl.Int64,
+    "game_id": pl.String,
+    "game_date": pl.Date,
+    "home_team": pl.String,
+    "away_team": pl.String,
+    "team": pl.String,
+    "opponent": pl.String,
+}
+QUARTERBACK_GAMES_SCHEMA = {
+    "player_id": pl.String,
+    "player_name": pl.String,
+    "birth_date": pl.Date,
+    "rookie_season": pl.Int64,
+    **GAME_CONTEXT_SCHEMA,
+    **dict.fromkeys(QUARTERBACK_GAME_STAT_FIELDS, pl.Float64),
+}
+DEFENSE_GAMES_SCHEMA = {
+    **GAME_CONTEXT_SCHEMA,
+    **dict.fromkeys(DEFENSE_GAME_STAT_FIELDS, pl.Float64),
+}
+RECEIVING_GAMES_SCHEMA = {
+    "player_id": pl.String,
+    "player_name": pl.String,
+    "position": pl.String,
+    **GAME_CONTEXT_SCHEMA,
+    **dict.fromkeys(RECEIVING_GAME_STAT_FIELDS, pl.Float64),
+}
+TWO_POINT_ATTEMPTS_SCHEMA = {
+    "game_id": pl.String,
+    "player_id": pl.String,
+    "passing_two_point_attempts": pl.Int64,
+    "rushing_two_point_attempts": pl.Int64,
+}
+# Play-by-play has more than 370 columns; providers push this projection and
+# predicate into their scans so only regular-season two-point plays load.
+TWO_POINT_PBP_COLUMNS = tuple(PBP_CONTRACT.columns)
+TWO_POINT_PBP_PREDICATE = (pl.col("season_type") == REGULAR_SEASON) & (
+    pl.col("two_point_attempt") == 1
+)
+
+
+def _require_text(frame: pl.DataFrame, *columns: str) -> None:
+    for column in columns:
+        values = frame.get_column(column)
+        if values.null_count() or (values.dtype == pl.String and (values == "").any()):
+            raise DataAcquisitionError(f"Expected non-empty text for {column}")
+
+
+def _text(column: str) -> pl.Expr:
+    return pl.col(column).cast(pl.String)
+
+
+def _number(column: str) -> pl.Expr:
+    return pl.col(column).cast(pl.Float64).fill_null(0.0)
+
+
+def _team_code(column: str) -> pl.Expr:
+    # Schedules report the team code contemporaneous to the season, while
+    # player_stats/team_stats report each franchise's current code even for
+    # old seasons (see normalize_team_code).
+    return _text(column).replace(RELOCATED_TEAM_CODES)
+
+
+def _dates(values: pl.Series, field: str) -> pl.Series:
+    if values.dtype == pl.Date:
+        return values
+    if values.dtype == pl.Datetime:
+        return values.dt.date()
+    if values.dtype == pl.Null:
+        return values.cast(pl.Date)
+    parsed = values.str.to_date("%Y-%m-%d", strict=False)
+    invalid = values.filter(values.is_not_null() & parsed.is_null())
+    if not invalid.is_empty():
+        raise DataAcquisitionError(
+            f"Expected an ISO date for {field}, received {invalid[0]!r}"
+        )
+    return parsed
+
+
+def _conform(
+    frame: pl.DataFrame, schema: Mapping[str, type[pl.DataType]]
+) -> pl.DataFrame:
+    return frame.select(list(schema)).cast(pl.Schema(schema))
+
+
+def _schedule_frame(frame: pl.DataFrame) -> pl.DataFrame:
+    schedules = validate_frame(frame, SCHEDULES_CONTRACT)
+    _require_text(schedules, "game_id", "home_team", "away_team")
+    return schedules.select(
+        _text("game_id"),
+        _dates(schedules.get_column("gameday"), "gameday").alias("game_date"),
+        _team_code("home_team"),
+        _team_code("away_team"),
+        _number("home_score"),
+        _number("away_score"),
+    ).unique("game_id", keep="last", maintain_order=True)
+
+
+def _player_frame(frame: pl.DataFrame) -> pl.DataFrame:
+    players = validate_frame(frame, PLAYERS_CONTRACT).filter(
+        _text("gsis_id").is_not_null() & (_text("gsis_id") != "")
+    )
+    _require_text(players, "display_name")
+    return players.select(
+        _text("gsis_id").alias("player_id"),
+        _text("display_name").alias("player_name"),
+        _dates(players.get_column("birth_date"), "birth_date").alias("birth_date"),
+        pl.col("rookie_season").cast(pl.Int64),
+    ).unique("player_id", keep="last", maintain_order=True)
+
+
+def _with_schedule(frame: pl.DataFrame, schedules: pl.DataFrame) -> pl.DataFrame:
+    missing = frame.join(schedules, on="game_id", how="anti", maintain_order="left")
+    if not missing.is_empty():
+        raise DataAcquisitionError(
+            f"No schedule row found for game {missing['game_id'][0]}"
+        )
+    return frame.join(schedules, on="game_id", how="left", maintain_order="left")
+
+
+def acquire_two_point_attempt_frame(
+    seasons: Iterable[int],
+    provider: NflDataProvider,
+) -> pl.DataFrame:
+    """Count passing and rushing two-point attempts by game and player."""
+    counts = [pl.DataFrame(schema=TWO_POINT_ATTEMPTS_SCHEMA)]
+    for season in seasons:
+        plays = validate_frame(
+            provider.load_pbp(
+                season,
+                columns=TWO_POINT_PBP_COLUMNS,
+                predicate=TWO_POINT_PBP_PREDICATE,
+            ),
+            PBP_CONTRACT,
+        )
+        plays = (
+            plays.with_columns(
+                _text(column).replace("", None)
+                for column in ("passer_player_id", "rusher_player_id")
+            )
+            .with_columns(
+                pl.coalesce("passer_player_id", "rusher_player_id").alias("player_id")
+            )
+            .filter(pl.col("player_id").is_not_null())
+        )
+        _require_text(plays, "game_id")
+        counts.append(
+            plays.group_by("game_id", "player_id", maintain_order=True)
+            .agg(
+                pl.col("passer_player_id")
+                .is_not_null()
+                .sum()
+                .alias("passing_two_point_attempts"),
+                pl.col("passer_player_id")
+                .is_null()
+                .sum()
+                .alias("rushing_two_point_attempts"),
+            )
+            .pipe(_conform, TWO_POINT_ATTEMPTS_SCHEMA)
+        )
+    return (
+        pl.concat(counts)
+        .group_by("game_id", "player_id", maintain_order=True)
+        .agg(
+            pl.col("passing_two_point_attempts").sum(),
+            pl.col("rushing_two_point_attempts").sum(),
+        )
+    )
+
+
+def acquire_quarterback_games(
+    seasons: Iterable[int] = DEFAULT_SEASONS,
+    *,
+    provider: NflDataProvider | None = None,
+    min_attempts: int = 5,
+) -> pl.DataFrame:
+    """Acquire and normalize regular-season quarterback games as one frame."""
+    season_list = sorted(set(seasons))
+    provider = provider or NflReadPyProvider()
+    schedules = _schedule_frame(provider.load_schedules(season_list))
+    players = _player_frame(provider.load_players())
+    attempts = acquire_two_point_attempt_frame(season_list, provider)
+    frame = (
+        validate_frame(
+            provider.load_player_stats(
+                season_list, columns=tuple(PLAYER_STATS_CONTRACT.columns)
+            ),
+            PLAYER_STATS_CONTRACT,
+        )
+        .select(list(PLAYER_STATS_CONTRACT.columns))
+        .filter(
+            (pl.col("season_type") == REGULAR_SEASON)
+            & (pl.col("position") == "QB")
+            & (pl.col("attempts") >= min_attempts)
+        )
+    )
+    _require_text(frame, "player_id", "game_id")
+    frame = _with_schedule(frame, schedules).join(
+        players, on="player_id", how="left", maintain_order="left"
+    )
+    # A player's profile is taken from the players table when available and
+    # otherwise from the display name on their first game row.
+    _require_text(frame.filter(pl.col("player_name").is_null()), "player_display_name")
+    _require_text(frame, "team", "opponent_team")
+    frame = frame.join(
+        attempts, on=["game_id", "player_id"], how="left", maintain_order="left"
+    ).with_columns(
+        pl.coalesce(
+            "player_name",
+            pl.col("player_display_name").first().over("player_id"),
+        ),
+        _text("opponent_team").alias("opponent"),
+        _number("attempts").alias("passing_attempts"),
+        _number("passing_yards"),
+        _number("passing_tds").alias("passing_touchdowns"),
+        _number("passing_interceptions"),
+        _number("passing_two_point_attempts"),
+        _number("passing_2pt_conversions").alias("passing_two_point_made"),
+        _number("carries").alias("rushing_attempts"),
+        _number("rushing_yards"),
+        _number("rushing_tds").alias("rushing_touchdowns"),
+        _number("rushing_two_point_attempts"),
+        _number("rushing_2pt_conversions").alias("rushing_two_point_made"),
+        _number("fumbles_total").alias("fumbles"),
+    )
+    return _conform(frame, QUARTERBACK_GAMES_SCHEMA).unique(
+        ["player_id", "season", "week"], keep="last", maintain_order=True
+    )
+
+
+def acquire_defense_games(
+    seasons: Iterable[int] = DEFAULT_SEASONS,
+    *,
+    provider: NflDataProvider | None = None,
+) -> pl.DataFrame:
+    """Acquire defensive totals by attributing opponent offense to each defense.
+
+    ``team`` is the defense and ``opponent`` the offense whose production it
+    allowed, matching the ``GameContext`` of ``acquire_defense_histories``.
+    """
+    season_list = sorted(set(seasons))
+    provider = provider or NflReadPyProvider()
+    schedules = _schedule_frame(provider.load_schedules(season_list))
+    frame = (
+        validate_frame(provider.load_team_stats(season_list), TEAM_STATS_CONTRACT)
+        .select(list(TEAM_STATS_CONTRACT.columns))
+        .filter(pl.col("season_type") == REGULAR_SEASON)
+    )
+    _require_text(frame, "game_id")
+    frame = _with_schedule(frame, schedules)
+    _require_text(frame, "team", "opponent_team")
+    unlisted = frame.filter(
+        (pl.col("team") != pl.col("home_team"))
+        & (pl.col("team") != pl.col("away_team"))
+    )
+    if not unlisted.is_empty():
+        raise DataAcquisitionError(
+            f"Team {unlisted['team'][0]} is not listed in schedule for "
+            f"{unlisted['game_id'][0]}"
+        )
+    frame = frame.with_columns(
+        _text("opponent_team").alias("team"),
+        _text("team").alias("opponent"),
+        pl.when(pl.col("team") == pl.col("home_team"))
+        .then(pl.col("home_score"))
+        .otherwise(pl.col("away_score"))
+        .alias("points_allowed"),
+        _number("passing_yards").alias("passing_yards_allowed"),
+        _number("rushing_yards").alias("rushing_yards_allowed"),
+        (_number("passing_interceptions") + _number("fumbles_lost_total")).alias(
+            "turnovers"
+        ),
+    )
+    return _conform(frame, DEFENSE_GAMES_SCHEMA).unique(
+        ["team", "season", "week"], keep="last", maintain_order=True
+    )
+
+
+def acquire_receiving_games(
+    seasons: Iterable[int] = DEFAULT_SEASONS,
+    positions: Iterable[str] = ("RB", "WR", "TE"),
+    *,
+    provider: NflDataProvider | None = None,
+) -> pl.DataFrame:
+    """Acquire regular-season RB/WR/TE games with team opportunity totals.
+
+    Team totals are summed over every identified player on the team in that
+    game before the position filter, so shares stay relative to the whole
+    offense.
+    """
+    season_list = sorted(set(seasons))
+    position_list = list(positions)
+    provider = provider or NflReadPyProvider()
+    schedules = _schedule_frame(provider.load_schedules(season_list))
+    frame = (
+        validate_frame(
+            provider.load_player_stats(
+                season_list, columns=tuple(RECEIVING_PLAYER_STATS_CONTRACT.columns)
+            ),
+            RECEIVING_PLAYER_STATS_CONTRACT,
+        )
+        .select(list(RECEIVING_PLAYER_STATS_CONTRACT.columns))
+        .filter(pl.col("season_type") == REGULAR_SEASON)
+    )
+    team_totals = (
+        frame.filter(pl.col("player_id").is_not_null())
+        .group_by("game_id", "team")
+        .agg(
+            pl.col("targets").fill_null(0).sum().alias("team_targets"),
+            pl.col("attempts").fill_null(0).sum().alias("team_pass_attempts"),
+            pl.col("carries").fill_null(0).sum().alias("team_rushing_attempts"),
+        )
+    )
+    _require_text(team_totals, "game_id", "team")
+    frame = frame.filter(pl.col("position").is_in(position_list))
+    _require_text(frame, "player_id", "game_id", "team")
+    frame = _with_schedule(
+        frame.join(
+            team_totals, on=["game_id", "team"], how="left", maintain_order="left"
+        ),
+        schedules,
+    )
+    _require_text(frame, "player_display_name", "position", "opponent_team")
+    frame = frame.with_columns(
+        pl.col("player_display_name").first().over("player_id").alias("player_name"),
+        _text("position").first().over("player_id"),
+        _text("opponent_team").alias("opponent"),
+        _number("carries").alias("rushing_attempts"),
+        _number("rushing_yards"),
+        _number("rushing_tds").alias("rushing_touchdowns"),
+        _number("rushing_2pt_conversions").alias("rushing_two_point_made"),
+        _number("receptions"),
+        _number("targets"),
+        _number("receiving_yards"),
+        _number("receiving_tds").alias("receiving_touchdowns"),
+        _number("receiving_2pt_conversions").alias("receiving_two_point_made"),
+        _number("fumbles_total").alias("fumbles"),
+        _number("team_targets"),
+        _number("team_pass_attempts"),
+        _number("team_rushing_attempts"),
+        (_number("team_pass_attempts") + _number("team_rushing_attempts")).alias(
+            "team_offensive_plays"
+        ),
+    )
+    return _conform(frame, RECEIVING_GAMES_SCHEMA).unique(
+        ["player_id", "season", "week"], keep="last", maintain_order=True
+    )
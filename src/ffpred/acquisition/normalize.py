@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
+from typing import Any
 
 import polars as pl
 
@@ -16,15 +17,19 @@ from ffpred.acquisition.contracts import (
     INJURY_REPORTS_MAX_SEASON,
     INJURY_REPORTS_MIN_SEASON,
     KICKER_PLAYER_STATS_CONTRACT,
-    PBP_CONTRACT,
-    PLAYER_STATS_CONTRACT,
-    PLAYERS_CONTRACT,
-    RECEIVING_PLAYER_STATS_CONTRACT,
     REGULAR_SEASON,
     SCHEDULES_CONTRACT,
-    TEAM_STATS_CONTRACT,
     normalize_team_code,
 )
+from ffpred.acquisition.games import (
+    DEFENSE_GAME_STAT_FIELDS,
+    QUARTERBACK_GAME_STAT_FIELDS,
+    RECEIVING_GAME_STAT_FIELDS,
+    acquire_defense_games,
+    acquire_quarterback_games,
+    acquire_receiving_games,
+    acquire_two_point_attempt_frame,
+)
 from ffpred.acquisition.schema import validate_frame
 from ffpred.domain.identifiers import GameId, PlayerId, Season, TeamCode, Week
 from ffpred.domain.models import (
@@ -70,15 +75,6 @@ class ScheduleRecord:
     away_score: float
 
 
-@dataclass(frozen=True, slots=True, kw_only=True)
-class PlayerRecord:
-    """Normalized player metadata used while joining provider frames."""
-
-    name: str
-    birth_date: date | None
-    rookie_season: Season | None
-
-
 def _number(value: object) -> float:
     if value is None:
         return 0.0
@@ -108,18 +104,6 @@ def _date(value: object, field: str) -> date:
     raise DataAcquisitionError(f"Expected a date for {field}, received {value!r}")
 
 
-def _optional_date(value: object, field: str) -> date | None:
-    return None if value is None else _date(value, field)
-
-
-def _optional_season(value: object) -> Season | None:
-    if value is None:
-        return None
-    if isinstance(value, int | float):
-        return Season(int(value))
-    raise DataAcquisitionError(f"Expected a numeric rookie season, received {value!r}")
-
-
 def _schedule_index(frame: pl.DataFrame) -> dict[GameId, ScheduleRecord]:
     schedules: dict[GameId, ScheduleRecord] = {}
     for row in validate_frame(frame, SCHEDULES_CONTRACT).iter_rows(named=True):
@@ -142,51 +126,20 @@ def _schedule_index(frame: pl.DataFrame) -> dict[GameId, ScheduleRecord]:
     return schedules
 
 
-def _player_index(frame: pl.DataFrame) -> dict[PlayerId, PlayerRecord]:
-    players: dict[PlayerId, PlayerRecord] = {}
-    for row in validate_frame(frame, PLAYERS_CONTRACT).iter_rows(named=True):
-        raw_id = row["gsis_id"]
-        if not raw_id:
-            continue
-        player_id = PlayerId(_required_text(raw_id, "gsis_id"))
-        players[player_id] = PlayerRecord(
-            name=_required_text(row["display_name"], "display_name"),
-            birth_date=_optional_date(row["birth_date"], "birth_date"),
-            rookie_season=_optional_season(row["rookie_season"]),
-        )
-    return players
-
-
 def acquire_two_point_attempts(
     seasons: Iterable[int],
     provider: NflDataProvider,
 ) -> dict[tuple[GameId, PlayerId], tuple[int, int]]:
     """Count passing and rushing two-point attempts by game and player."""
-    attempts: dict[tuple[GameId, PlayerId], list[int]] = {}
-    columns = [
-        "game_id",
-        "season_type",
-        "two_point_attempt",
-        "passer_player_id",
-        "rusher_player_id",
-    ]
-    for season in seasons:
-        plays = validate_frame(provider.load_pbp(season), PBP_CONTRACT).select(columns)
-        plays = plays.filter(
-            (pl.col("season_type") == REGULAR_SEASON)
-            & (pl.col("two_point_attempt") == 1)
+    return {
+        (GameId(row["game_id"]), PlayerId(row["player_id"])): (
+            row["passing_two_point_attempts"],
+            row["rushing_two_point_attempts"],
         )
-        for row in plays.iter_rows(named=True):
-            raw_player_id = row["passer_player_id"] or row["rusher_player_id"]
-            if not raw_player_id:
-                continue
-            key = (
-                GameId(_required_text(row["game_id"], "game_id")),
-                PlayerId(_required_text(raw_player_id, "player_id")),
-            )
-            counts = attempts.setdefault(key, [0, 0])
-            counts[0 if row["passer_player_id"] else 1] += 1
-    return {key: (counts[0], counts[1]) for key, counts in attempts.items()}
+        for row in acquire_two_point_attempt_frame(seasons, provider).iter_rows(
+            named=True
+        )
+    }
 
 
 def _game_context(
@@ -205,126 +158,127 @@ def _game_context(
     )
 
 
-def acquire_quarterback_histories(
-    seasons: Iterable[int] = DEFAULT_SEASONS,
-    *,
-    provider: NflDataProvider | None = None,
-    min_attempts: int = 5,
-) -> dict[PlayerId, QuarterbackHistory]:
-    """Acquire and normalize regular-season quarterback histories."""
-    season_list = sorted(set(seasons))
-    provider = provider or NflReadPyProvider()
-    schedules = _schedule_index(provider.load_schedules(season_list))
-    players = _player_index(provider.load_players())
-    attempts = acquire_two_point_attempts(season_list, provider)
-    frame = validate_frame(
-        provider.load_player_stats(season_list), PLAYER_STATS_CONTRACT
-    ).filter(
-        (pl.col("season_type") == REGULAR_SEASON)
-        & (pl.col("position") == "QB")
-        & (pl.col("attempts") >= min_attempts)
+def _game_key(row: Mapping[str, Any]) -> GameKey:
+    return GameKey(Season(int(row["season"])), Week(int(row["week"])))
+
+
+def _frame_context(row: Mapping[str, Any]) -> GameContext:
+    return GameContext(
+        game_id=GameId(row["game_id"]),
+        game_date=row["game_date"],
+        home_team=TeamCode(row["home_team"]),
+        away_team=TeamCode(row["away_team"]),
+        team=TeamCode(row["team"]),
+        opponent=TeamCode(row["opponent"]),
     )
 
+
+def quarterback_histories_from_games(
+    games: pl.DataFrame,
+) -> dict[PlayerId, QuarterbackHistory]:
+    """Build typed quarterback histories from ``acquire_quarterback_games``."""
     histories: dict[PlayerId, QuarterbackHistory] = {}
-    for row in frame.iter_rows(named=True):
-        player_id = PlayerId(_required_text(row["player_id"], "player_id"))
-        game_id = GameId(_required_text(row["game_id"], "game_id"))
-        if game_id not in schedules:
-            raise DataAcquisitionError(f"No schedule row found for game {game_id}")
-        metadata = players.get(player_id)
-        name = (
-            metadata.name
-            if metadata
-            else _required_text(row["player_display_name"], "player_display_name")
-        )
-        history = histories.setdefault(
-            player_id,
-            QuarterbackHistory(
+    for row in games.iter_rows(named=True):
+        player_id = PlayerId(row["player_id"])
+        history = histories.get(player_id)
+        if history is None:
+            history = histories[player_id] = QuarterbackHistory(
                 profile=PlayerProfile(
                     player_id=player_id,
-                    name=name,
-                    birth_date=metadata.birth_date if metadata else None,
-                    rookie_season=metadata.rookie_season if metadata else None,
+                    name=row["player_name"],
+                    birth_date=row["birth_date"],
+                    rookie_season=(
+                        None
+                        if row["rookie_season"] is None
+                        else Season(row["rookie_season"])
+                    ),
                 )
-            ),
-        )
-        key = GameKey(Season(int(row["season"])), Week(int(row["week"])))
-        passing_attempts, rushing_attempts = attempts.get((game_id, player_id), (0, 0))
+            )
+        key = _game_key(row)
         history.games[key] = QuarterbackGame(
             key=key,
-            context=_game_context(
-                schedules[game_id],
-                team=TeamCode(_required_text(row["team"], "team")),
-                opponent=TeamCode(
-                    _required_text(row["opponent_team"], "opponent_team")
-                ),
-            ),
+            context=_frame_context(row),
             stats=QuarterbackGameStats(
-                passing_attempts=_number(row["attempts"]),
-                passing_yards=_number(row["passing_yards"]),
-                passing_touchdowns=_number(row["passing_tds"]),
-                passing_interceptions=_number(row["passing_interceptions"]),
-                passing_two_point_attempts=passing_attempts,
-                passing_two_point_made=_number(row["passing_2pt_conversions"]),
-                rushing_attempts=_number(row["carries"]),
-                rushing_yards=_number(row["rushing_yards"]),
-                rushing_touchdowns=_number(row["rushing_tds"]),
-                rushing_two_point_attempts=rushing_attempts,
-                rushing_two_point_made=_number(row["rushing_2pt_conversions"]),
-                fumbles=_number(row["fumbles_total"]),
+                **{field: row[field] for field in QUARTERBACK_GAME_STAT_FIELDS}
             ),
         )
     return histories
 
 
-def acquire_defense_histories(
-    seasons: Iterable[int] = DEFAULT_SEASONS,
-    *,
-    provider: NflDataProvider | None = None,
+def defense_histories_from_games(
+    games: pl.DataFrame,
 ) -> dict[TeamCode, DefenseHistory]:
-    """Acquire defensive totals by attributing opponent offense to each defense."""
-    season_list = sorted(set(seasons))
-    provider = provider or NflReadPyProvider()
-    schedules = _schedule_index(provider.load_schedules(season_list))
-    frame = validate_frame(
-        provider.load_team_stats(season_list), TEAM_STATS_CONTRACT
-    ).filter(pl.col("season_type") == REGULAR_SEASON)
-
+    """Build typed defense histories from ``acquire_defense_games``."""
     histories: dict[TeamCode, DefenseHistory] = {}
-    for row in frame.iter_rows(named=True):
-        game_id = GameId(_required_text(row["game_id"], "game_id"))
-        if game_id not in schedules:
-            raise DataAcquisitionError(f"No schedule row found for game {game_id}")
-        schedule = schedules[game_id]
-        offense = TeamCode(_required_text(row["team"], "team"))
-        defense = TeamCode(_required_text(row["opponent_team"], "opponent_team"))
-        if offense == schedule.home_team:
-            points_allowed = schedule.home_score
-        elif offense == schedule.away_team:
-            points_allowed = schedule.away_score
-        else:
-            raise DataAcquisitionError(
-                f"Team {offense} is not listed in schedule for {game_id}"
-            )
-        key = GameKey(Season(int(row["season"])), Week(int(row["week"])))
-        history = histories.setdefault(
-            defense,
-            DefenseHistory(team=defense),
-        )
+    for row in games.iter_rows(named=True):
+        defense = TeamCode(row["team"])
+        history = histories.setdefault(defense, DefenseHistory(team=defense))
+        key = _game_key(row)
         history.games[key] = DefenseGame(
             key=key,
-            context=_game_context(schedule, team=defense, opponent=offense),
+            context=_frame_context(row),
             stats=DefenseGameStats(
-                points_allowed=points_allowed,
-                passing_yards_allowed=_number(row["passing_yards"]),
-                rushing_yards_allowed=_number(row["rushing_yards"]),
-                turnovers=_number(row["passing_interceptions"])
-                + _number(row["fumbles_lost_total"]),
+                **{field: row[field] for field in DEFENSE_GAME_STAT_FIELDS}
+            ),
+        )
+    return histories
+
+
+def receiving_histories_from_games(
+    games: pl.DataFrame,
+) -> dict[PlayerId, ReceivingHistory]:
+    """Build typed RB/WR/TE histories from ``acquire_receiving_games``."""
+    histories: dict[PlayerId, ReceivingHistory] = {}
+    for row in games.iter_rows(named=True):
+        player_id = PlayerId(row["player_id"])
+        history = histories.get(player_id)
+        if history is None:
+            history = histories[player_id] = ReceivingHistory(
+                player_id=player_id,
+                name=row["player_name"],
+                position=row["position"],
+            )
+        key = _game_key(row)
+        history.games[key] = ReceivingGame(
+            key=key,
+            context=_frame_context(row),
+            stats=ReceivingGameStats(
+                **{field: row[field] for field in RECEIVING_GAME_STAT_FIELDS}
             ),
         )
     return histories
 
 
+def acquire_quarterback_histories(
+    seasons: Iterable[int] = DEFAULT_SEASONS,
+    *,
+    provider: NflDataProvider | None = None,
+    min_attempts: int = 5,
+) -> dict[PlayerId, QuarterbackHistory]:
+    """Acquire and normalize regular-season quarterback histories.
+
+    This is a typed view over ``acquire_quarterback_games``; feature builds
+    should prefer the frame, which skips per-game dataclass construction.
+    """
+    return quarterback_histories_from_games(
+        acquire_quarterback_games(seasons, provider=provider, min_attempts=min_attempts)
+    )
+
+
+def acquire_defense_histories(
+    seasons: Iterable[int] = DEFAULT_SEASONS,
+    *,
+    provider: NflDataProvider | None = None,
+) -> dict[TeamCode, DefenseHistory]:
+    """Acquire defensive totals by attributing opponent offense to each defense.
+
+    This is a typed view over ``acquire_defense_games``.
+    """
+    return defense_histories_from_games(
+        acquire_defense_games(seasons, provider=provider)
+    )
+
+
 def acquire_dst_histories(
     seasons: Iterable[int] = DEFAULT_SEASONS,
     *,
@@ -395,7 +349,10 @@ def acquire_kicker_histories(
     season_list = sorted(set(seasons))
     provider = provider or NflReadPyProvider()
     frame = validate_frame(
-        provider.load_player_stats(season_list), KICKER_PLAYER_STATS_CONTRACT
+        provider.load_player_stats(
+            season_list, columns=tuple(KICKER_PLAYER_STATS_CONTRACT.columns)
+        ),
+        KICKER_PLAYER_STATS_CONTRACT,
     ).filter((pl.col("season_type") == REGULAR_SEASON) & (pl.col("position") == "K"))
 
     histories: dict[PlayerId, KickerHistory] = {}
@@ -438,81 +395,11 @@ def acquire_receiving_histories(
     Reuses the same relocation-safe schedule index as QB/D/ST acquisition,
     since the opponent context features draw on the existing
     ``acquire_defense_histories`` output keyed by that same normalized team
-    code.
+    code. This is a typed view over ``acquire_receiving_games``.
     """
-    season_list = sorted(set(seasons))
-    position_list = list(positions)
-    provider = provider or NflReadPyProvider()
-    schedules = _schedule_index(provider.load_schedules(season_list))
-    frame = validate_frame(
-        provider.load_player_stats(season_list), RECEIVING_PLAYER_STATS_CONTRACT
-    ).filter(pl.col("season_type") == REGULAR_SEASON)
-    team_totals = {
-        (
-            GameId(_required_text(row["game_id"], "game_id")),
-            TeamCode(_required_text(row["team"], "team")),
-        ): (
-            _number(row["team_targets"]),
-            _number(row["team_pass_attempts"]),
-            _number(row["team_rushing_attempts"]),
-        )
-        for row in (
-            frame.filter(pl.col("player_id").is_not_null())
-            .group_by("game_id", "team")
-            .agg(
-                pl.col("targets").fill_null(0).sum().alias("team_targets"),
-                pl.col("attempts").fill_null(0).sum().alias("team_pass_attempts"),
-                pl.col("carries").fill_null(0).sum().alias("team_rushing_attempts"),
-            )
-            .iter_rows(named=True)
-        )
-    }
-    frame = frame.filter(pl.col("position").is_in(position_list))
-
-    histories: dict[PlayerId, ReceivingHistory] = {}
-    for row in frame.iter_rows(named=True):
-        player_id = PlayerId(_required_text(row["player_id"], "player_id"))
-        game_id = GameId(_required_text(row["game_id"], "game_id"))
-        team = TeamCode(_required_text(row["team"], "team"))
-        targets, pass_attempts, rushing_attempts = team_totals[(game_id, team)]
-        if game_id not in schedules:
-            raise DataAcquisitionError(f"No schedule row found for game {game_id}")
-        history = histories.setdefault(
-            player_id,
-            ReceivingHistory(
-                player_id=player_id,
-                name=_required_text(row["player_display_name"], "player_display_name"),
-                position=_required_text(row["position"], "position"),
-            ),
-        )
-        key = GameKey(Season(int(row["season"])), Week(int(row["week"])))
-        history.games[key] = ReceivingGame(
-            key=key,
-            context=_game_context(
-                schedules[game_id],
-                team=team,
-                opponent=TeamCode(
-                    _required_text(row["opponent_team"], "opponent_team")
-                ),
-            ),
-            stats=ReceivingGameStats(
-                rushing_attempts=_number(row["carries"]),
-                rushing_yards=_number(row["rushing_yards"]),
-                rushing_touchdowns=_number(row["rushing_tds"]),
-                rushing_two_point_made=_number(row["rushing_2pt_conversions"]),
-                receptions=_number(row["receptions"]),
-                targets=_number(row["targets"]),
-                receiving_yards=_number(row["receiving_yards"]),
-                receiving_touchdowns=_number(row["receiving_tds"]),
-                receiving_two_point_made=_number(row["receiving_2pt_conversions"]),
-                fumbles=_number(row["fumbles_total"]),
-                team_targets=targets,
-                team_pass_attempts=pass_attempts,
-                team_rushing_attempts=rushing_attempts,
-                team_offensive_plays=pass_attempts + rushing_attempts,
-            ),
-        )
-    return histories
+    return receiving_histories_from_games(
+        acquire_receiving_games(seasons, positions, provider=provider)
+    )
 
 
 def acquire_idp_histories(
@@ -532,7 +419,10 @@ def acquire_idp_histories(
     season_list = sorted(set(seasons))
     provider = provider or NflReadPyProvider()
     frame = validate_frame(
-        provider.load_player_stats(season_list), IDP_PLAYER_STATS_CONTRACT
+        provider.load_player_stats(
+            season_list, columns=tuple(IDP_PLAYER_STATS_CONTRACT.columns)
+        ),
+        IDP_PLAYER_STATS_CONTRACT,
     ).filter(
         (pl.col("season_type") == REGULAR_SEASON)
         & (pl.col("position_group").is_in(["DL", "LB", "DB"]))
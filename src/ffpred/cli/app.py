@@ -6,14 +6,16 @@ import argparse
 import json
 import logging
 from collections.abc import Callable, Mapping, Sequence
-from dataclasses import asdict
-from datetime import date
+from dataclasses import asdict, replace
+from datetime import UTC, date, datetime
 from pathlib import Path
-from typing import Never
+from typing import Any, Never, TypeVar
 
 import numpy as np
 import polars as pl
+from interpret.glassbox import ExplainableBoostingRegressor
 from numpy.typing import NDArray
+from sklearn.pipeline import Pipeline
 
 from ffpred.acquisition.contracts import (
     INJURY_REPORTS_MAX_SEASON,
@@ -27,6 +29,7 @@ from ffpred.acquisition.normalize import (
 from ffpred.cli.options import (
     BuildOptions,
     CurrentInjuriesOptions,
+    DashboardViewsOptions,
     EbmOptions,
     EvaluateOptions,
     ExplainabilityOptions,
@@ -34,11 +37,26 @@ from ffpred.cli.options import (
     ForecastBuildOptions,
     InjuryReportOptions,
     MlpOptions,
+    ModelStoreOptions,
     ProjectionOptions,
     ReceivingBuildOptions,
+    RollingProjectionOptions,
+    ServeOptions,
     SvrOptions,
+    TrainAllOptions,
 )
 from ffpred.config import Settings
+from ffpred.dashboard.data import (
+    DashboardDataError,
+    discover_prediction_files,
+    materialize_views,
+    materialized_directory,
+    model_name_from_path,
+    model_scorecard,
+    prediction_file,
+    prepare_predictions,
+    sources_sha256,
+)
 from ffpred.datasets.archive import ForecastArchiveConfig, build_forecast_archive
 from ffpred.datasets.builder import (
     DatasetBuildConfig,
@@ -53,11 +71,13 @@ from ffpred.datasets.builder import (
     build_receiving_datasets,
 )
 from ffpred.datasets.forecast import ForecastBuildConfig, build_forecast_datasets
-from ffpred.errors import FfpredError
+from ffpred.datasets.io import write_chunks
+from ffpred.errors import ConfigurationError, FfpredError
 from ffpred.evaluation.cohorts import residual_cohorts
 from ffpred.evaluation.explainability import (
+    DEFAULT_ALE_MAX_BYTES,
     ConformalPredictionInterval,
-    accumulated_local_effects,
+    accumulated_local_effects_batch,
     model_agnostic_shap_values,
     temporal_permutation_importance,
 )
@@ -67,6 +87,7 @@ from ffpred.evaluation.injury_impact import (
     injury_impact_frame,
 )
 from ffpred.evaluation.metrics import evaluate
+from ffpred.evaluation.splits import period_index
 from ffpred.features import dst_schema, idp_schema, kicker_schema, receiving_schema
 from ffpred.features import schema as qb_schema
 from ffpred.features.all_positions import (
@@ -78,6 +99,7 @@ from ffpred.features.all_positions import (
 )
 from ffpred.features.schema import TARGET_COLUMN
 from ffpred.logging import configure_logging
+from ffpred.providers.cache import SeasonCacheProvider
 from ffpred.providers.espn import (
     build_espn_injury_snapshot,
     espn_injury_snapshot_frame,
@@ -85,24 +107,61 @@ from ffpred.providers.espn import (
 )
 from ffpred.providers.nflreadpy import NflReadPyProvider
 from ffpred.providers.protocol import NflDataProvider
-from ffpred.training.data import TrainingData, load_training_data
-from ffpred.training.ebm import EbmConfig, train_ebm, write_ebm_explanations
-from ffpred.training.mlp import MlpConfig, create_archive_estimator, train_mlp
-from ffpred.training.mlp import create_estimator as create_mlp
-from ffpred.training.projection import load_projection_data, project
+from ffpred.serving.server import InferenceUnixServer, create_server
+from ffpred.serving.service import (
+    DEFAULT_MAX_BATCH_ROWS,
+    DEFAULT_MAX_DELAY,
+    InferenceService,
+    load_archive_models,
+)
+from ffpred.training.data import (
+    FEATURE_DTYPES,
+    FeatureDtype,
+    TrainingData,
+    load_training_data,
+)
+from ffpred.training.ebm import (
+    DEFAULT_EBM_CONFIG,
+    EbmConfig,
+    EbmTrainingResult,
+    train_ebm,
+    write_ebm_explanations,
+    write_ebm_local_explanations,
+)
+from ffpred.training.mlp import DEFAULT_MLP_CONFIG, MlpConfig, train_mlp
+from ffpred.training.parallel import (
+    PARALLEL_MODELS,
+    ModelJob,
+    cpu_budgets,
+    train_models,
+)
+from ffpred.training.projection import (
+    PREDICTION_CHUNK_ROWS,
+    ProjectionModel,
+    predict_forecast_chunks,
+    projection_estimator,
+)
+from ffpred.training.registry import (
+    ModelArtifact,
+    ModelKey,
+    ModelRegistry,
+    model_key,
+)
 from ffpred.training.result import TrainingResult
+from ffpred.training.rolling import archive_seasons, rolling_projections
 from ffpred.training.svr import (
     DEFAULT_SVR_CONFIG,
+    SvrConfig,
     candidate_configs,
-    create_scalable_estimator,
     select_config,
     select_manual_features,
     train_svr,
 )
-from ffpred.training.svr import create_estimator as create_svr
 
 LOGGER = logging.getLogger(__name__)
 PREDICTION_COLUMN = "prediction"
+EstimatorT = TypeVar("EstimatorT")
+_ModelStore = tuple[ModelRegistry, ModelKey]
 #: Positions supported by the generic training and evaluation commands.
 #: Adding a position here only requires a feature-schema module exposing
 #: MODEL_FEATURE_COLUMNS, IDENTITY_COLUMNS, and validate_feature_frame;
@@ -218,39 +277,67 @@ def _parser(settings: Settings) -> argparse.ArgumentParser:
         "build-forecast-archive",
         help="build frozen all-position forecasts for a range of seasons",
     )
-    archive.add_argument("--output-dir", type=Path, default=settings.output_dir)
-    archive.add_argument("--history-start", type=int, default=1999)
-    archive.add_argument("--first-target-year", type=int, default=2010)
-    archive.add_argument(
-        "--last-target-year",
-        type=int,
-        default=date.today().year,
-    )
-    archive.add_argument("--as-of", type=date.fromisoformat)
+    _add_forecast_archive_arguments(archive, settings)
 
     svr = subparsers.add_parser("train-svr", help="train an SVR model")
-    _add_svr_arguments(svr)
+    _add_svr_arguments(svr, settings)
 
     mlp = subparsers.add_parser("train-mlp", help="train an MLP model")
-    _add_mlp_arguments(mlp)
+    _add_mlp_arguments(mlp, settings)
 
     ebm = subparsers.add_parser(
         "train-ebm",
         help="train an Explainable Boosting Machine",
     )
-    _add_ebm_arguments(ebm)
+    _add_ebm_arguments(ebm, settings)
+
+    train_all = subparsers.add_parser(
+        "train-all",
+        help="train SVR, MLP and EBM concurrently on one loaded split",
+    )
+    _add_train_all_arguments(train_all, settings)
 
     project_svr = subparsers.add_parser(
         "project-svr",
         help="fit SVR and predict a frozen forecast dataset",
     )
-    _add_projection_arguments(project_svr, "svr-predictions.parquet")
+    _add_projection_arguments(project_svr, "svr-predictions.parquet", settings)
 
     project_mlp = subparsers.add_parser(
         "project-mlp",
         help="fit MLP and predict a frozen forecast dataset",
     )
-    _add_projection_arguments(project_mlp, "mlp-predictions.parquet")
+    _add_projection_arguments(project_mlp, "mlp-predictions.parquet", settings)
+
+    project_archive = subparsers.add_parser(
+        "project-archive",
+        help="warm-start one model across every archive season in order",
+    )
+    _add_rolling_projection_arguments(project_archive, settings)
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="serve batched archive predictions over local HTTP",
+    )
+    _add_serve_arguments(serve, settings)
+
+    models = subparsers.add_parser(
+        "models",
+        help="report stored model artifacts and evict the least recently used",
+    )
+    _add_model_store_arguments(models, settings)
+
+    dashboard_views = subparsers.add_parser(
+        "materialize-dashboard",
+        help="precompute the dashboard's consensus, scorecard and draft-board views",
+    )
+    dashboard_views.add_argument(
+        "--predictions",
+        action="append",
+        type=Path,
+        default=[],
+        dest="prediction_paths",
+    )
 
     evaluation = subparsers.add_parser(
         "evaluate",
@@ -290,20 +377,44 @@ def _add_injury_report_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--trailing-window", type=int, default=4)
 
 
-def _add_svr_arguments(parser: argparse.ArgumentParser) -> None:
-    _add_dataset_arguments(parser, "svr-predictions.parquet")
+def _add_forecast_archive_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    parser.add_argument("--output-dir", type=Path, default=settings.output_dir)
+    parser.add_argument("--history-start", type=int, default=1999)
+    parser.add_argument("--first-target-year", type=int, default=2010)
+    parser.add_argument(
+        "--last-target-year",
+        type=int,
+        default=date.today().year,
+    )
+    parser.add_argument("--as-of", type=date.fromisoformat)
+    parser.add_argument("--jobs", type=int, default=1)
+
+
+def _add_svr_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    _add_dataset_arguments(parser, "svr-predictions.parquet", settings)
     parser.add_argument(
         "--position", choices=tuple(POSITION_FEATURE_COLUMNS), default="qb"
     )
     parser.add_argument("--manual-features", action="store_true")
     parser.add_argument("--select-hyperparameters", action="store_true")
     parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--halving-factor", type=int)
     parser.add_argument("--random-state", type=int, default=42)
     _add_explainability_arguments(parser)
 
 
-def _add_mlp_arguments(parser: argparse.ArgumentParser) -> None:
-    _add_dataset_arguments(parser, "mlp-predictions.parquet")
+def _add_mlp_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    _add_dataset_arguments(parser, "mlp-predictions.parquet", settings)
     parser.add_argument(
         "--position", choices=tuple(POSITION_FEATURE_COLUMNS), default="qb"
     )
@@ -316,11 +427,15 @@ def _add_mlp_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--iterations", type=int, default=1000)
     parser.add_argument("--learning-rate", type=float, default=0.001)
     parser.add_argument("--random-state", type=int, default=42)
+    parser.add_argument("--feature-dtype", choices=FEATURE_DTYPES, default="float64")
     _add_explainability_arguments(parser)
 
 
-def _add_ebm_arguments(parser: argparse.ArgumentParser) -> None:
-    _add_dataset_arguments(parser, "ebm-predictions.parquet")
+def _add_ebm_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    _add_dataset_arguments(parser, "ebm-predictions.parquet", settings)
     parser.add_argument(
         "--position", choices=tuple(POSITION_FEATURE_COLUMNS), default="qb"
     )
@@ -335,9 +450,35 @@ def _add_ebm_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--interval-coverage", type=float, default=0.9)
     parser.add_argument("--random-state", type=int, default=42)
     parser.add_argument("--jobs", type=int, default=-2)
+    parser.add_argument("--local-explanations", type=Path)
+    parser.add_argument("--local-explanations-json", action="store_true")
+    parser.add_argument("--feature-dtype", choices=FEATURE_DTYPES, default="float64")
     _add_explainability_arguments(parser, default=Path("ebm-explanations.json"))
 
 
+def _add_train_all_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    parser.add_argument("--train", type=Path, default=Path("train.parquet"))
+    parser.add_argument("--test", type=Path, default=Path("test.parquet"))
+    parser.add_argument("--output-dir", type=Path, default=Path())
+    parser.add_argument(
+        "--position", choices=tuple(POSITION_FEATURE_COLUMNS), default="qb"
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        choices=PARALLEL_MODELS,
+        dest="models",
+    )
+    parser.add_argument("--cpus", type=int)
+    for model in PARALLEL_MODELS:
+        parser.add_argument(f"--{model}-cpus", type=int)
+    parser.add_argument("--random-state", type=int, default=42)
+    _add_model_store_arguments(parser, settings)
+
+
 def _add_build_arguments(
     parser: argparse.ArgumentParser,
     settings: Settings,
@@ -367,6 +508,7 @@ def _add_build_arguments(
 def _add_dataset_arguments(
     parser: argparse.ArgumentParser,
     prediction_default: str,
+    settings: Settings,
 ) -> None:
     parser.add_argument("--train", type=Path, default=Path("train.parquet"))
     parser.add_argument("--test", type=Path, default=Path("test.parquet"))
@@ -375,11 +517,13 @@ def _add_dataset_arguments(
         type=Path,
         default=Path(prediction_default),
     )
+    _add_model_store_arguments(parser, settings)
 
 
 def _add_projection_arguments(
     parser: argparse.ArgumentParser,
     prediction_default: str,
+    settings: Settings,
 ) -> None:
     parser.add_argument("--train", type=Path, required=True)
     parser.add_argument("--forecast", type=Path, required=True)
@@ -388,6 +532,58 @@ def _add_projection_arguments(
         type=Path,
         default=Path(prediction_default),
     )
+    _add_model_store_arguments(parser, settings)
+
+
+def _add_model_store_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    parser.add_argument("--model-store", type=Path, default=settings.model_store_dir)
+    parser.add_argument(
+        "--model-store-max-bytes",
+        type=int,
+        default=settings.model_store_max_bytes,
+    )
+
+
+def _add_rolling_projection_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    parser.add_argument("--archive-dir", type=Path, default=settings.output_dir)
+    parser.add_argument("--model", choices=("svr", "mlp"), required=True)
+    parser.add_argument("--first-target-year", type=int)
+    parser.add_argument("--last-target-year", type=int)
+    parser.add_argument(
+        "--skip-cold-refit",
+        action="store_false",
+        dest="compare_cold",
+    )
+
+
+def _add_serve_arguments(
+    parser: argparse.ArgumentParser,
+    settings: Settings,
+) -> None:
+    parser.add_argument("--archive-dir", type=Path, default=settings.output_dir)
+    parser.add_argument(
+        "--model",
+        action="append",
+        choices=("svr", "mlp"),
+        dest="models",
+    )
+    parser.add_argument("--season", type=int, action="append", dest="seasons")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", type=Path)
+    parser.add_argument("--max-batch-rows", type=int, default=DEFAULT_MAX_BATCH_ROWS)
+    parser.add_argument(
+        "--max-delay-ms",
+        type=float,
+        default=DEFAULT_MAX_DELAY * 1_000,
+    )
+    _add_model_store_arguments(parser, settings)
 
 
 def _add_explainability_arguments(
@@ -397,46 +593,61 @@ def _add_explainability_arguments(
 ) -> None:
     parser.add_argument("--explanations", type=Path, default=default)
     parser.add_argument("--ale-bins", type=int, default=10)
+    parser.add_argument("--ale-max-bytes", type=int, default=DEFAULT_ALE_MAX_BYTES)
     parser.add_argument("--permutation-repeats", type=int, default=5)
+    parser.add_argument("--permutation-batch-size", type=int, default=1)
+    parser.add_argument("--permutation-jobs", type=int, default=1)
     parser.add_argument("--shap-background", type=int, default=100)
     parser.add_argument("--shap-samples", type=int, default=25)
 
 
 def _provider(settings: Settings) -> NflDataProvider:
+    if settings.cache_mode == "season" and settings.cache_dir is not None:
+        return SeasonCacheProvider(
+            NflReadPyProvider(cache_mode="off"),
+            settings.cache_dir,
+            max_bytes=settings.cache_max_bytes,
+            offline=settings.offline,
+        )
     return NflReadPyProvider(
         cache_mode=("filesystem" if settings.cache_mode == "filesystem" else "off"),
         cache_dir=settings.cache_dir,
     )
 
 
+def _prediction_columns(
+    available: Sequence[str],
+    identity_columns: tuple[str, ...],
+) -> list[str]:
+    columns = dict.fromkeys(
+        (
+            *identity_columns,
+            "position",
+            "team",
+            "opponent",
+            "forecast_as_of",
+            "history_through_season",
+            INJURY_STATUS_COLUMN,
+            INJURY_MISSED_COLUMN,
+            *OPPORTUNITY_OUTPUT_COLUMNS,
+            *receiving_schema.OUTPUT_CONTEXT_COLUMNS,
+            TARGET_COLUMN,
+        )
+    )
+    return [column for column in columns if column in available]
+
+
 def _write_predictions(
     path: Path,
-    test_frame: pl.DataFrame,
+    rows: pl.DataFrame | TrainingData,
     predictions: NDArray[np.float64],
     *,
     identity_columns: tuple[str, ...],
     additional_columns: Mapping[str, NDArray[np.float64]] | None = None,
-) -> None:
+) -> pl.DataFrame:
     path.parent.mkdir(parents=True, exist_ok=True)
-    identity = list(
-        dict.fromkeys(
-            (
-                *identity_columns,
-                "position",
-                "team",
-                "opponent",
-                "forecast_as_of",
-                "history_through_season",
-                INJURY_STATUS_COLUMN,
-                INJURY_MISSED_COLUMN,
-                *OPPORTUNITY_OUTPUT_COLUMNS,
-                *receiving_schema.OUTPUT_CONTEXT_COLUMNS,
-                TARGET_COLUMN,
-            )
-        )
-    )
-    identity = [column for column in identity if column in test_frame.columns]
-    frame = test_frame.select(identity).with_columns(
+    frame = rows.select(_prediction_columns(rows.columns, identity_columns))
+    frame = frame.with_columns(
         pl.Series(PREDICTION_COLUMN, predictions, dtype=pl.Float64)
     )
     if additional_columns:
@@ -447,6 +658,7 @@ def _write_predictions(
             )
         )
     frame.write_parquet(path, compression="zstd", statistics=True)
+    return frame
 
 
 def _build_options(args: argparse.Namespace) -> BuildOptions:
@@ -477,6 +689,7 @@ def _forecast_archive_options(args: argparse.Namespace) -> ForecastArchiveOption
         first_target_year=args.first_target_year,
         last_target_year=args.last_target_year,
         as_of=args.as_of,
+        jobs=args.jobs,
     )
 
 
@@ -485,6 +698,42 @@ def _projection_options(args: argparse.Namespace) -> ProjectionOptions:
         train_path=args.train,
         forecast_path=args.forecast,
         predictions_path=args.predictions,
+        model_store=_model_store_options(args),
+    )
+
+
+def _model_store_options(args: argparse.Namespace) -> ModelStoreOptions | None:
+    if args.model_store is None:
+        return None
+    return ModelStoreOptions(
+        path=args.model_store,
+        max_bytes=args.model_store_max_bytes,
+    )
+
+
+def _rolling_projection_options(
+    args: argparse.Namespace,
+) -> RollingProjectionOptions:
+    return RollingProjectionOptions(
+        archive_dir=args.archive_dir,
+        model=args.model,
+        first_target_year=args.first_target_year,
+        last_target_year=args.last_target_year,
+        compare_cold=args.compare_cold,
+    )
+
+
+def _serve_options(args: argparse.Namespace) -> ServeOptions:
+    return ServeOptions(
+        archive_dir=args.archive_dir,
+        models=tuple(args.models or ("svr", "mlp")),
+        seasons=tuple(args.seasons) if args.seasons else None,
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket,
+        max_batch_rows=args.max_batch_rows,
+        max_delay_ms=args.max_delay_ms,
+        model_store=_model_store_options(args),
     )
 
 
@@ -519,9 +768,12 @@ def _svr_options(args: argparse.Namespace) -> SvrOptions:
         predictions_path=args.predictions,
         position=args.position,
         explainability=_explainability_options(args),
+        model_store=_model_store_options(args),
         manual_features=args.manual_features,
         select_hyperparameters=args.select_hyperparameters,
         folds=args.folds,
+        jobs=args.jobs,
+        halving_factor=args.halving_factor,
     )
 
 
@@ -532,11 +784,29 @@ def _mlp_options(args: argparse.Namespace) -> MlpOptions:
         predictions_path=args.predictions,
         position=args.position,
         explainability=_explainability_options(args),
+        model_store=_model_store_options(args),
         hidden_units=args.hidden_units,
         activation=args.activation,
         iterations=args.iterations,
         learning_rate=args.learning_rate,
         random_state=args.random_state,
+        feature_dtype=args.feature_dtype,
+    )
+
+
+def _train_all_options(args: argparse.Namespace) -> TrainAllOptions:
+    return TrainAllOptions(
+        train_path=args.train,
+        test_path=args.test,
+        output_dir=args.output_dir,
+        position=args.position,
+        models=tuple(dict.fromkeys(args.models or PARALLEL_MODELS)),
+        cpus=args.cpus,
+        svr_cpus=args.svr_cpus,
+        mlp_cpus=args.mlp_cpus,
+        ebm_cpus=args.ebm_cpus,
+        random_state=args.random_state,
+        model_store=_model_store_options(args),
     )
 
 
@@ -547,6 +817,7 @@ def _ebm_options(args: argparse.Namespace) -> EbmOptions:
         predictions_path=args.predictions,
         position=args.position,
         explainability=_explainability_options(args),
+        model_store=_model_store_options(args),
         max_bins=args.max_bins,
         interactions=args.interactions,
         max_rounds=args.max_rounds,
@@ -558,6 +829,9 @@ def _ebm_options(args: argparse.Namespace) -> EbmOptions:
         interval_coverage=args.interval_coverage,
         random_state=args.random_state,
         n_jobs=args.jobs,
+        local_explanations_path=args.local_explanations,
+        local_explanations_json=args.local_explanations_json,
+        feature_dtype=args.feature_dtype,
     )
 
 
@@ -565,7 +839,10 @@ def _explainability_options(args: argparse.Namespace) -> ExplainabilityOptions:
     return ExplainabilityOptions(
         path=args.explanations,
         ale_bins=args.ale_bins,
+        ale_max_bytes=args.ale_max_bytes,
         permutation_repeats=args.permutation_repeats,
+        permutation_batch_size=args.permutation_batch_size,
+        permutation_jobs=args.permutation_jobs,
         shap_background=args.shap_background,
         shap_samples=args.shap_samples,
         random_state=args.random_state,
@@ -711,6 +988,7 @@ def _run_forecast_archive(
             as_of=options.as_of,
         ),
         provider=provider,
+        jobs=options.jobs,
     )
     return {
         "seasons": [
@@ -730,6 +1008,8 @@ def _run_forecast_archive(
 def _run_svr(options: SvrOptions) -> dict[str, object]:
     if options.manual_features and options.position != "qb":
         raise FfpredError("--manual-features is only supported for --position qb")
+    if options.halving_factor is not None and not options.select_hyperparameters:
+        raise ConfigurationError("--halving-factor requires --select-hyperparameters")
     feature_names = POSITION_FEATURE_COLUMNS[options.position]
     identity_columns = POSITION_IDENTITY_COLUMNS[options.position]
     validator = POSITION_VALIDATORS[options.position]
@@ -738,19 +1018,47 @@ def _run_svr(options: SvrOptions) -> dict[str, object]:
     if options.manual_features:
         train = select_manual_features(train)
         test = select_manual_features(test)
-    config = (
-        select_config(
-            train,
-            candidate_configs(),
-            folds=options.folds,
+    search = {
+        "candidates": candidate_configs(),
+        "folds": options.folds,
+        "halving_factor": options.halving_factor,
+    }
+    store = _model_store(
+        options.model_store,
+        "svr",
+        options.train_path,
+        train.feature_names,
+        search if options.select_hyperparameters else DEFAULT_SVR_CONFIG,
+    )
+    stored = _load_model(store, Pipeline)
+    config = None
+    if options.select_hyperparameters:
+        config = (
+            SvrConfig(**stored[1].metadata["config"])
+            if stored is not None
+            else select_config(
+                train,
+                search["candidates"],
+                folds=options.folds,
+                jobs=options.jobs,
+                halving_factor=options.halving_factor,
+            )
         )
-        if options.select_hyperparameters
-        else None
+    result = train_svr(
+        train,
+        test,
+        config=config or DEFAULT_SVR_CONFIG,
+        estimator=stored[0] if stored is not None else None,
+    )
+    model_artifact = _save_model(
+        store,
+        stored,
+        result.estimator,
+        metadata={"config": asdict(config or DEFAULT_SVR_CONFIG)},
     )
-    result = train_svr(train, test, **({"config": config} if config else {}))
     _write_predictions(
         options.predictions_path,
-        test.frame,
+        test,
         result.predictions,
         identity_columns=identity_columns,
     )
@@ -773,6 +1081,7 @@ def _run_svr(options: SvrOptions) -> dict[str, object]:
         "predictions": str(options.predictions_path),
         "explanations": str(explanations_path) if explanations_path else None,
         "config": asdict(config) if config else None,
+        "model_artifact": model_artifact,
     }
 
 
@@ -780,8 +1089,18 @@ def _run_mlp(options: MlpOptions) -> dict[str, object]:
     feature_names = POSITION_FEATURE_COLUMNS[options.position]
     identity_columns = POSITION_IDENTITY_COLUMNS[options.position]
     validator = POSITION_VALIDATORS[options.position]
-    train = load_training_data(options.train_path, feature_names, validator=validator)
-    test = load_training_data(options.test_path, feature_names, validator=validator)
+    train = load_training_data(
+        options.train_path,
+        feature_names,
+        validator=validator,
+        dtype=options.feature_dtype,
+    )
+    test = load_training_data(
+        options.test_path,
+        feature_names,
+        validator=validator,
+        dtype=options.feature_dtype,
+    )
     config = MlpConfig(
         hidden_units=options.hidden_units,
         activation=options.activation,
@@ -789,10 +1108,24 @@ def _run_mlp(options: MlpOptions) -> dict[str, object]:
         learning_rate=options.learning_rate,
         random_state=options.random_state,
     )
-    result = train_mlp(train, test, config=config)
+    store = _model_store(
+        options.model_store,
+        "mlp",
+        options.train_path,
+        train.feature_names,
+        _stored_config(config, options.feature_dtype),
+    )
+    stored = _load_model(store, Pipeline)
+    result = train_mlp(
+        train,
+        test,
+        config=config,
+        estimator=stored[0] if stored is not None else None,
+    )
+    model_artifact = _save_model(store, stored, result.estimator)
     _write_predictions(
         options.predictions_path,
-        test.frame,
+        test,
         result.predictions,
         identity_columns=identity_columns,
     )
@@ -815,61 +1148,199 @@ def _run_mlp(options: MlpOptions) -> dict[str, object]:
         "predictions": str(options.predictions_path),
         "explanations": str(explanations_path) if explanations_path else None,
         "config": asdict(config),
+        "model_artifact": model_artifact,
     }
 
 
 def _run_projection(
     options: ProjectionOptions,
     *,
-    model: str,
+    model: ProjectionModel,
 ) -> dict[str, object]:
     train = load_training_data(options.train_path)
-    forecast = load_projection_data(options.forecast_path)
     is_archive = train.feature_names == ALL_POSITION_MODEL_FEATURE_COLUMNS
-    if model == "svr":
-        estimator = (
-            create_scalable_estimator()
-            if is_archive
-            else create_svr(DEFAULT_SVR_CONFIG)
-        )
-    else:
-        estimator = (
-            create_archive_estimator() if is_archive else create_mlp(MlpConfig())
-        )
-    predictions = project(estimator, train, forecast)
+    spec = projection_estimator(model, train.feature_names)
+    store = _model_store(
+        options.model_store,
+        spec.kind,
+        options.train_path,
+        train.feature_names,
+        spec.key_config,
+    )
+    stored = _load_model(store, Pipeline)
+    estimator = (
+        stored[0]
+        if stored is not None
+        else spec.estimator.fit(train.features, train.target)
+    )
+    model_artifact = _save_model(store, stored, spec.estimator)
     identity_columns = (
         ALL_POSITION_IDENTITY_COLUMNS if is_archive else qb_schema.IDENTITY_COLUMNS
     )
-    _write_predictions(
+    forecast_schema = pl.scan_parquet(options.forecast_path).collect_schema()
+    columns = _prediction_columns(forecast_schema.names(), identity_columns)
+    rows = write_chunks(
         options.predictions_path,
-        forecast.frame,
-        predictions,
-        identity_columns=identity_columns,
-    )
-    scored = forecast.frame.with_columns(
-        pl.Series(PREDICTION_COLUMN, predictions, dtype=pl.Float64)
-    ).drop_nulls(TARGET_COLUMN)
-    metrics = (
-        asdict(evaluate(scored[TARGET_COLUMN], scored[PREDICTION_COLUMN]))
-        if not scored.is_empty()
-        else None
+        predict_forecast_chunks(
+            estimator,
+            options.forecast_path,
+            train.feature_names,
+            columns=columns,
+        ),
+        schema=pl.Schema(
+            {
+                **{column: forecast_schema[column] for column in columns},
+                PREDICTION_COLUMN: pl.Float64,
+            }
+        ),
+        row_group_rows=PREDICTION_CHUNK_ROWS,
     )
+    written = pl.scan_parquet(options.predictions_path)
+    scored = written.select(TARGET_COLUMN, PREDICTION_COLUMN).collect()
+    first = written.select("history_through_season", "target_season").head(1).collect()
     return {
-        "metrics": metrics,
+        "metrics": _forecast_metrics(scored, scored[PREDICTION_COLUMN].to_numpy()),
         "features": list(train.feature_names),
         "predictions": str(options.predictions_path),
-        "forecast_rows": forecast.frame.height,
-        "history_through_season": forecast.frame["history_through_season"][0],
-        "target_year": forecast.frame["target_season"][0],
+        "forecast_rows": rows,
+        "history_through_season": first["history_through_season"][0],
+        "target_year": first["target_season"][0],
+        "model_artifact": model_artifact,
     }
 
 
+def _model_store(
+    options: ModelStoreOptions | None,
+    model: str,
+    train_path: Path,
+    feature_names: tuple[str, ...],
+    config: object,
+) -> _ModelStore | None:
+    if options is None:
+        return None
+    return (
+        ModelRegistry(options.path, max_bytes=options.max_bytes),
+        model_key(model, train_path, feature_names, config),
+    )
+
+
+def _stored_config(config: object, dtype: FeatureDtype) -> object:
+    # The EBM's worker count does not change the fitted model, so it is left
+    # out of the key; train-all budgets it per host while train-ebm takes
+    # --jobs. Double-precision fits keep the bare config as their key, so
+    # train-all and the single-model commands share stored estimators.
+    if isinstance(config, EbmConfig):
+        config = replace(config, n_jobs=DEFAULT_EBM_CONFIG.n_jobs)
+    if dtype == "float64":
+        return config
+    return {"config": config, "feature_dtype": dtype}
+
+
+def _load_model(
+    store: _ModelStore | None,
+    kind: type[EstimatorT],
+) -> tuple[EstimatorT, ModelArtifact] | None:
+    return None if store is None else store[0].load(store[1], kind)
+
+
+def _save_model(
+    store: _ModelStore | None,
+    stored: tuple[object, ModelArtifact] | None,
+    estimator: object,
+    *,
+    metadata: Mapping[str, object] | None = None,
+) -> dict[str, object] | None:
+    if store is None:
+        return None
+    registry, key = store
+    artifact = (
+        stored[1]
+        if stored is not None
+        else registry.save(key, estimator, metadata=metadata)
+    )
+    return {
+        "digest": artifact.digest,
+        "path": artifact.path,
+        "bytes": artifact.bytes,
+        "reused": stored is not None,
+    }
+
+
+def _forecast_metrics(
+    frame: pl.DataFrame,
+    predictions: NDArray[np.float64],
+) -> dict[str, Any] | None:
+    scored = frame.with_columns(
+        pl.Series(PREDICTION_COLUMN, predictions, dtype=pl.Float64)
+    ).drop_nulls(TARGET_COLUMN)
+    if scored.is_empty():
+        return None
+    return asdict(evaluate(scored[TARGET_COLUMN], scored[PREDICTION_COLUMN]))
+
+
+def _run_rolling_projection(options: RollingProjectionOptions) -> dict[str, object]:
+    seasons = [
+        season
+        for season in archive_seasons(options.archive_dir)
+        if (options.first_target_year is None or season >= options.first_target_year)
+        and (options.last_target_year is None or season <= options.last_target_year)
+    ]
+    output: list[dict[str, object]] = []
+    for season in rolling_projections(
+        options.archive_dir,
+        model=options.model,
+        seasons=seasons,
+        compare_cold=options.compare_cold,
+    ):
+        predictions_path = (
+            options.archive_dir
+            / str(season.target_year)
+            / f"{options.model}-predictions.parquet"
+        )
+        _write_predictions(
+            predictions_path,
+            season.forecast.frame,
+            season.predictions,
+            identity_columns=ALL_POSITION_IDENTITY_COLUMNS,
+        )
+        output.append(
+            {
+                "target_year": season.target_year,
+                "predictions": str(predictions_path),
+                "forecast_rows": season.forecast.frame.height,
+                "training_rows": season.training_rows,
+                "new_training_rows": season.new_training_rows,
+                "seconds": season.seconds,
+                "metrics": _forecast_metrics(season.forecast.frame, season.predictions),
+                "cold": None
+                if season.cold_predictions is None
+                else {
+                    "seconds": season.cold_seconds,
+                    "metrics": _forecast_metrics(
+                        season.forecast.frame, season.cold_predictions
+                    ),
+                },
+            }
+        )
+    return {"model": options.model, "seasons": output}
+
+
 def _run_ebm(options: EbmOptions) -> dict[str, object]:
     feature_names = POSITION_FEATURE_COLUMNS[options.position]
     identity_columns = POSITION_IDENTITY_COLUMNS[options.position]
     validator = POSITION_VALIDATORS[options.position]
-    train = load_training_data(options.train_path, feature_names, validator=validator)
-    test = load_training_data(options.test_path, feature_names, validator=validator)
+    train = load_training_data(
+        options.train_path,
+        feature_names,
+        validator=validator,
+        dtype=options.feature_dtype,
+    )
+    test = load_training_data(
+        options.test_path,
+        feature_names,
+        validator=validator,
+        dtype=options.feature_dtype,
+    )
     config = EbmConfig(
         max_bins=options.max_bins,
         interactions=options.interactions,
@@ -883,7 +1354,22 @@ def _run_ebm(options: EbmOptions) -> dict[str, object]:
         random_state=options.random_state,
         n_jobs=options.n_jobs,
     )
-    result = train_ebm(train, test, config=config)
+    store = _model_store(
+        options.model_store,
+        "ebm",
+        options.train_path,
+        train.feature_names,
+        _stored_config(config, options.feature_dtype),
+    )
+    stored = _load_model(store, ExplainableBoostingRegressor)
+    result = train_ebm(
+        train,
+        test,
+        config=config,
+        local_explanations=options.local_explanations_json,
+        estimator=stored[0] if stored is not None else None,
+    )
+    model_artifact = _save_model(store, stored, result.estimator)
     interval_columns = (
         {
             "prediction_lower": result.prediction_interval.lower,
@@ -894,7 +1380,7 @@ def _run_ebm(options: EbmOptions) -> dict[str, object]:
     )
     _write_predictions(
         options.predictions_path,
-        test.frame,
+        test,
         result.predictions,
         identity_columns=identity_columns,
         additional_columns=interval_columns,
@@ -910,10 +1396,21 @@ def _run_ebm(options: EbmOptions) -> dict[str, object]:
     explanations_path = options.explainability.path
     if explanations_path is None:
         raise ValueError("EBM explanations require an output path")
+    identities = test.frame.select(identity_columns)
+    local_path = options.local_explanations_path or options.predictions_path.with_name(
+        f"{options.predictions_path.stem}-local-explanations.parquet"
+    )
+    write_ebm_local_explanations(
+        local_path,
+        result.estimator,
+        test,
+        result.predictions,
+        identities=identities,
+    )
     write_ebm_explanations(
         explanations_path,
         result.explanations,
-        identities=test.frame.select(identity_columns).to_dicts(),
+        identities=identities.to_dicts() if result.explanations.local else (),
         diagnostics=diagnostics,
     )
     return {
@@ -921,7 +1418,117 @@ def _run_ebm(options: EbmOptions) -> dict[str, object]:
         "features": list(result.feature_names),
         "predictions": str(options.predictions_path),
         "explanations": str(explanations_path),
+        "local_explanations": str(local_path),
         "config": asdict(config),
+        "model_artifact": model_artifact,
+    }
+
+
+def _run_train_all(options: TrainAllOptions) -> dict[str, object]:
+    feature_names = POSITION_FEATURE_COLUMNS[options.position]
+    identity_columns = POSITION_IDENTITY_COLUMNS[options.position]
+    validator = POSITION_VALIDATORS[options.position]
+    train = load_training_data(options.train_path, feature_names, validator=validator)
+    test = load_training_data(options.test_path, feature_names, validator=validator)
+    pinned = {
+        "svr": options.svr_cpus,
+        "mlp": options.mlp_cpus,
+        "ebm": options.ebm_cpus,
+    }
+    budgets = cpu_budgets(
+        options.models,
+        options.cpus,
+        overrides={model: cpus for model, cpus in pinned.items() if cpus is not None},
+    )
+    configs: dict[str, SvrConfig | MlpConfig | EbmConfig] = {
+        "svr": DEFAULT_SVR_CONFIG,
+        "mlp": replace(DEFAULT_MLP_CONFIG, random_state=options.random_state),
+        "ebm": replace(
+            DEFAULT_EBM_CONFIG,
+            random_state=options.random_state,
+            n_jobs=budgets.get("ebm", 1),
+        ),
+    }
+    stores = {
+        model: _model_store(
+            options.model_store,
+            model,
+            options.train_path,
+            train.feature_names,
+            _stored_config(configs[model], "float64"),
+        )
+        for model in options.models
+    }
+    stored = {
+        model: _load_model(
+            stores[model],
+            ExplainableBoostingRegressor if model == "ebm" else Pipeline,
+        )
+        for model in options.models
+    }
+    runs = train_models(
+        train,
+        test,
+        [
+            ModelJob(
+                model=model,
+                config=configs[model],
+                cpus=budgets[model],
+                estimator=stored_model[0] if stored_model is not None else None,
+            )
+            for model, stored_model in stored.items()
+        ],
+    )
+    frames: list[pl.DataFrame] = []
+    models: dict[str, object] = {}
+    for run in runs:
+        result = run.result
+        predictions_path = options.output_dir / f"{run.model}-predictions.parquet"
+        interval = (
+            result.prediction_interval
+            if isinstance(result, EbmTrainingResult)
+            else None
+        )
+        frame = _write_predictions(
+            predictions_path,
+            test,
+            result.predictions,
+            identity_columns=identity_columns,
+            additional_columns=(
+                {
+                    "prediction_lower": interval.lower,
+                    "prediction_upper": interval.upper,
+                }
+                if interval is not None
+                else None
+            ),
+        )
+        frames.append(
+            prepare_predictions(
+                frame, model_name=model_name_from_path(predictions_path)
+            )
+        )
+        models[run.model] = {
+            "metrics": asdict(result.metrics),
+            "predictions": str(predictions_path),
+            "config": asdict(configs[run.model]),
+            "cpus": run.cpus,
+            "seconds": run.seconds,
+            "model_artifact": _save_model(
+                stores[run.model],
+                stored[run.model],
+                result.estimator,
+                metadata={"config": asdict(configs[run.model])},
+            ),
+        }
+    scorecard = model_scorecard(pl.concat(frames, how="diagonal_relaxed"))
+    scorecard_path = options.output_dir / "scorecard.parquet"
+    scorecard.write_parquet(scorecard_path, compression="zstd", statistics=True)
+    return {
+        "features": list(train.feature_names),
+        "models": models,
+        "scorecard": str(scorecard_path),
+        "scorecard_rows": scorecard.to_dicts(),
     }
 
 
@@ -934,24 +1541,23 @@ def _model_diagnostics(  # noqa: PLR0913
     *,
     prediction_interval: ConformalPredictionInterval | None = None,
 ) -> dict[str, object]:
-    ale = tuple(
-        accumulated_local_effects(
-            result.estimator,
-            train.features,
-            index,
-            name,
-            bins=options.ale_bins,
-        )
-        for index, name in enumerate(train.feature_names)
+    ale = accumulated_local_effects_batch(
+        result.estimator,
+        train.features,
+        train.feature_names,
+        bins=options.ale_bins,
+        max_bytes=options.ale_max_bytes,
     )
     permutation = temporal_permutation_importance(
         result.estimator,
         test.features,
         test.target,
-        test.frame["target_season"],
+        period_index(test.frame).seasons,
         test.feature_names,
         repeats=options.permutation_repeats,
         random_state=options.random_state,
+        batch_size=options.permutation_batch_size,
+        jobs=options.permutation_jobs,
     )
     shap_values = model_agnostic_shap_values(
         result.estimator,
@@ -962,10 +1568,11 @@ def _model_diagnostics(  # noqa: PLR0913
         max_samples=options.shap_samples,
         random_state=options.random_state,
     )
+    columns = test.columns
     categorical_cohorts = tuple(
         column
         for column in ("position", "position_group", "target_week")
-        if column in test.frame
+        if column in columns
     )
     opponent_strength = tuple(
         name
@@ -973,10 +1580,10 @@ def _model_diagnostics(  # noqa: PLR0913
         if name.endswith("defense_last_10_points_allowed")
     )
     numeric_cohorts = tuple(
-        column for column in ("years_pro", *opponent_strength) if column in test.frame
+        column for column in ("years_pro", *opponent_strength) if column in columns
     )
     cohorts = residual_cohorts(
-        test.frame,
+        test.select((*categorical_cohorts, *numeric_cohorts)),
         test.target,
         result.predictions,
         categorical_columns=categorical_cohorts,
@@ -1034,6 +1641,99 @@ def _write_diagnostics(
     temporary.replace(path)
 
 
+def _run_serve(options: ServeOptions) -> dict[str, object]:
+    store = options.model_store
+    models = load_archive_models(
+        options.archive_dir,
+        options.models,
+        seasons=options.seasons,
+        registry=(
+            ModelRegistry(store.path, max_bytes=store.max_bytes) if store else None
+        ),
+    )
+    service = InferenceService(
+        models,
+        max_batch_rows=options.max_batch_rows,
+        max_delay=options.max_delay_ms / 1_000,
+    )
+    server = create_server(
+        service,
+        host=options.host,
+        port=options.port,
+        socket_path=options.socket_path,
+    )
+    address = (
+        str(options.socket_path)
+        if isinstance(server, InferenceUnixServer)
+        else f"http://{options.host}:{server.server_port}"
+    )
+    LOGGER.info("Serving %d models on %s", len(models), address)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        LOGGER.info("Stopping the inference server")
+    finally:
+        server.server_close()
+        service.close()
+        if options.socket_path is not None:
+            options.socket_path.unlink(missing_ok=True)
+    return {
+        "address": address,
+        "models": [
+            {"model": model, "season": season} for model, season in service.models
+        ],
+        "stats": asdict(service.counters.summary()),
+    }
+
+
+def _run_models(options: ModelStoreOptions | None) -> dict[str, object]:
+    if options is None:
+        raise ConfigurationError(
+            "models requires --model-store or FFPRED_MODEL_STORE_DIR"
+        )
+    registry = ModelRegistry(options.path)
+    evicted = (
+        registry.evict(max_bytes=options.max_bytes)
+        if options.max_bytes is not None
+        else ()
+    )
+    artifacts = registry.artifacts()
+    return {
+        "model_store": str(options.path),
+        "bytes": sum(artifact.bytes for artifact in artifacts),
+        "artifacts": [
+            {
+                "digest": artifact.digest,
+                "model": artifact.model,
+                "bytes": artifact.bytes,
+                "training_sha256": artifact.training_sha256,
+                "features": len(artifact.feature_names),
+                "created_at": artifact.created_at,
+                "last_used_at": datetime.fromtimestamp(
+                    artifact.last_used_at, UTC
+                ).isoformat(),
+            }
+            for artifact in artifacts
+        ],
+        "evicted": [artifact.digest for artifact in evicted],
+        "evicted_bytes": sum(artifact.bytes for artifact in evicted),
+    }
+
+
+def _run_materialize_dashboard(options: DashboardViewsOptions) -> dict[str, object]:
+    paths = options.prediction_paths or tuple(discover_prediction_files(Path.cwd()))
+    if not paths:
+        raise DashboardDataError("No prediction artifacts were found")
+    files = [prediction_file(path) for path in paths]
+    directory = materialized_directory(files)
+    return {
+        "directory": str(directory),
+        "predictions": [str(file.path) for file in files],
+        "sources_sha256": sources_sha256(files),
+        "views": [str(path) for path in materialize_views(files, directory)],
+    }
+
+
 def _run_evaluate(options: EvaluateOptions) -> dict[str, object]:
     frame = pl.read_parquet(options.predictions_path)
     required = {TARGET_COLUMN, PREDICTION_COLUMN}
@@ -1183,8 +1883,20 @@ def main(  # noqa: PLR0912
             output = _run_projection(_projection_options(args), model="svr")
         elif args.command == "project-mlp":
             output = _run_projection(_projection_options(args), model="mlp")
+        elif args.command == "project-archive":
+            output = _run_rolling_projection(_rolling_projection_options(args))
+        elif args.command == "train-all":
+            output = _run_train_all(_train_all_options(args))
         elif args.command == "train-ebm":
             output = _run_ebm(_ebm_options(args))
+        elif args.command == "serve":
+            output = _run_serve(_serve_options(args))
+        elif args.command == "models":
+            output = _run_models(_model_store_options(args))
+        elif args.command == "materialize-dashboard":
+            output = _run_materialize_dashboard(
+                DashboardViewsOptions(prediction_paths=tuple(args.prediction_paths))
+            )
         elif args.command == "injury-report":
             output = _run_injury_report(
                 _injury_report_options(args),
@@ -6,7 +6,11 @@ from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 
+from ffpred.training.data import FeatureDtype
 from ffpred.training.mlp import Activation
+from ffpred.training.parallel import ParallelModel
+from ffpred.training.projection import ProjectionModel
+from ffpred.training.rolling import RollingModel
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -15,7 +19,10 @@ class ExplainabilityOptions:
 
     path: Path | None
     ale_bins: int
+    ale_max_bytes: int
     permutation_repeats: int
+    permutation_batch_size: int
+    permutation_jobs: int
     shap_background: int
     shap_samples: int
     random_state: int
@@ -64,6 +71,15 @@ class ForecastArchiveOptions:
     first_target_year: int
     last_target_year: int
     as_of: date | None
+    jobs: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelStoreOptions:
+    """Fitted-model registry location and size bound."""
+
+    path: Path
+    max_bytes: int | None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -75,9 +91,12 @@ class SvrOptions:
     predictions_path: Path
     position: str = "qb"
     explainability: ExplainabilityOptions
+    model_store: ModelStoreOptions | None = None
     manual_features: bool
     select_hyperparameters: bool
     folds: int
+    jobs: int
+    halving_factor: int | None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -89,11 +108,13 @@ class MlpOptions:
     predictions_path: Path
     position: str = "qb"
     explainability: ExplainabilityOptions
+    model_store: ModelStoreOptions | None = None
     hidden_units: int
     activation: Activation
     iterations: int
     learning_rate: float
     random_state: int
+    feature_dtype: FeatureDtype = "float64"
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -105,6 +126,7 @@ class EbmOptions:
     predictions_path: Path
     position: str = "qb"
     explainability: ExplainabilityOptions
+    model_store: ModelStoreOptions | None = None
     max_bins: int
     interactions: int
     max_rounds: int
@@ -116,6 +138,36 @@ class EbmOptions:
     interval_coverage: float
     random_state: int
     n_jobs: int
+    local_explanations_path: Path | None
+    local_explanations_json: bool
+    feature_dtype: FeatureDtype = "float64"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TrainAllOptions:
+    """Concurrent multi-model training command options."""
+
+    train_path: Path
+    test_path: Path
+    output_dir: Path
+    position: str = "qb"
+    models: tuple[ParallelModel, ...]
+    cpus: int | None
+    svr_cpus: int | None
+    mlp_cpus: int | None
+    ebm_cpus: int | None
+    random_state: int
+    model_store: ModelStoreOptions | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DashboardViewsOptions:
+    """Dashboard sidecar materialization options.
+
+    No ``prediction_paths`` means the artifacts the dashboard would discover.
+    """
+
+    prediction_paths: tuple[Path, ...]
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -132,6 +184,33 @@ class ProjectionOptions:
     train_path: Path
     forecast_path: Path
     predictions_path: Path
+    model_store: ModelStoreOptions | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RollingProjectionOptions:
+    """Warm-started projection options for every archive season."""
+
+    archive_dir: Path
+    model: RollingModel
+    first_target_year: int | None
+    last_target_year: int | None
+    compare_cold: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServeOptions:
+    """Local inference server options."""
+
+    archive_dir: Path
+    models: tuple[ProjectionModel, ...]
+    seasons: tuple[int, ...] | None
+    host: str
+    port: int
+    socket_path: Path | None
+    max_batch_rows: int
+    max_delay_ms: float
+    model_store: ModelStoreOptions | None
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -20,7 +20,11 @@ class Settings:
     train_start: int = 2010
     test_year: int = 2014
     cache_dir: Path | None = None
-    cache_mode: Literal["none", "filesystem"] = "none"
+    cache_mode: Literal["none", "filesystem", "season"] = "none"
+    cache_max_bytes: int | None = None
+    model_store_dir: Path | None = None
+    model_store_max_bytes: int | None = None
+    offline: bool = False
     log_level: str = "INFO"
     scoring: ScoringConfig = field(default=DEFAULT_SCORING)
 
@@ -29,11 +33,18 @@ class Settings:
             raise ConfigurationError(
                 "Expected history_start < train_start <= test_year"
             )
+        if self.cache_mode == "season" and self.cache_dir is None:
+            raise ConfigurationError("The season cache requires a cache directory")
+        if self.offline and self.cache_mode != "season":
+            raise ConfigurationError("Offline builds require the season cache")
 
     @classmethod
     def from_env(cls) -> Settings:
         """Load process-level defaults, leaving CLI flags to override them."""
         cache_value = os.getenv("FFPRED_CACHE_DIR")
+        max_bytes = os.getenv("FFPRED_CACHE_MAX_BYTES")
+        model_store = os.getenv("FFPRED_MODEL_STORE_DIR")
+        model_store_max_bytes = os.getenv("FFPRED_MODEL_STORE_MAX_BYTES")
         return cls(
             output_dir=Path(os.getenv("FFPRED_OUTPUT_DIR", ".")),
             history_start=int(os.getenv("FFPRED_HISTORY_START", "2009")),
@@ -41,12 +52,20 @@ class Settings:
             test_year=int(os.getenv("FFPRED_TEST_YEAR", "2014")),
             cache_dir=Path(cache_value) if cache_value else None,
             cache_mode=_cache_mode(os.getenv("FFPRED_CACHE_MODE", "none")),
+            cache_max_bytes=int(max_bytes) if max_bytes else None,
+            model_store_dir=Path(model_store) if model_store else None,
+            model_store_max_bytes=(
+                int(model_store_max_bytes) if model_store_max_bytes else None
+            ),
+            offline=os.getenv("FFPRED_OFFLINE", "").lower() in {"1", "true", "yes"},
             log_level=os.getenv("FFPRED_LOG_LEVEL", "INFO").upper(),
         )
 
 
-def _cache_mode(value: str) -> Literal["none", "filesystem"]:
+def _cache_mode(value: str) -> Literal["none", "filesystem", "season"]:
     normalized = value.lower()
-    if normalized not in {"none", "filesystem"}:
-        raise ConfigurationError("FFPRED_CACHE_MODE must be 'none' or 'filesystem'")
+    if normalized not in {"none", "filesystem", "season"}:
+        raise ConfigurationError(
+            "FFPRED_CACHE_MODE must be 'none', 'filesystem' or 'season'"
+        )
     return normalized
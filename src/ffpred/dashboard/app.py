@@ -19,12 +19,27 @@ from ffpred.dashboard.data import (
     ACTUAL_COLUMN,
     CONSENSUS_MODEL,
     DashboardDataError,
-    draft_board,
-    load_prediction_files,
-    model_choices,
-    model_scorecard,
+    FilterOptions,
+    PredictionFile,
+    StageTimings,
+    chart_data,
+    discover_prediction_files,
+    draft_board_from_partials,
+    draft_partial,
+    filter_options,
+    materialize_views,
+    materialized_directory,
     player_history,
-    select_model,
+    prediction_file,
+    recording_stages,
+    season_error_histogram,
+    season_scorecard,
+    select_predictions,
+    timed,
+    timed_stage,
+    top_n,
+    views_are_fresh,
+    weekly_bands,
     weekly_board,
 )
 
@@ -47,6 +62,19 @@ POSITION_FILTER_KEY = "forecast-positions"
 MODEL_FILTER_KEY = "forecast-model"
 FILTER_STATE_KEY = "_forecast-filter-state"
 FILTER_QUERY_KEYS = ("season", "position", "model")
+DEBUG_QUERY_KEY = "debug"
+DEBUG_STATE_KEY = "_diagnostics-enabled"
+# Each cached view holds one filter state's frame; the bound keeps a long
+# session from accumulating every season, position and model combination.
+VIEW_CACHE_ENTRIES = 32
+# Draft partials are player-level aggregates of one position, so many more of
+# them fit: every position of several seasons and model views.
+DRAFT_PARTIAL_CACHE_ENTRIES = 256
+# Every rerun looks up each artifact in the same order, so an LRU bound below
+# the archive's file count would evict each fingerprint before its next use.
+# The entries are small, so the bound sits far above any archive's file count.
+PREDICTION_FILE_CACHE_ENTRIES = 4096
+DRAFT_CHART_PLAYERS = 18
 
 DRAFT_BAR_FIELDS = {
     "Projected": "projected_points",
@@ -430,26 +458,163 @@ def _arguments() -> argparse.Namespace:
     return arguments
 
 
-def _discover_prediction_files() -> list[Path]:
-    forecast_candidates = list(Path.cwd().glob("artifacts/*/*-predictions.parquet"))
-    candidates = forecast_candidates or [
-        *Path.cwd().glob("*-predictions.parquet"),
-        *Path.cwd().glob("artifacts/*-predictions.parquet"),
-    ]
-    return sorted({path.resolve() for path in candidates})
+@st.cache_data(show_spinner=False, max_entries=PREDICTION_FILE_CACHE_ENTRIES)
+def _prediction_file(path: str, modified_ns: int, size: int) -> PredictionFile:
+    # The modification time and size only invalidate the entry; the views are
+    # keyed on the SHA-256 digest this computes once per file version.
+    del modified_ns, size
+    return prediction_file(Path(path))
+
+
+@timed("load artifacts")
+def _load_paths(paths: Sequence[Path]) -> tuple[PredictionFile, ...]:
+    files: list[PredictionFile] = []
+    for path in paths:
+        status = path.stat()
+        files.append(_prediction_file(str(path), status.st_mtime_ns, status.st_size))
+    return tuple(files)
+
+
+@timed("materialize views")
+@st.cache_data(show_spinner="Materializing dashboard views...", max_entries=1)
+def _materialized_views(files: tuple[PredictionFile, ...]) -> Path | None:
+    # The first load of a set of artifacts writes its sidecars; a read-only
+    # artifact directory leaves every view computed from the artifacts.
+    directory = materialized_directory(files)
+    try:
+        if not views_are_fresh(files, directory):
+            materialize_views(files, directory)
+    except OSError:
+        return None
+    return directory
+
+
+@timed("filter options")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _filter_options(files: tuple[PredictionFile, ...]) -> FilterOptions:
+    return filter_options(files)
+
+
+@timed("season predictions")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _season_predictions(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    model: str,
+) -> pl.DataFrame:
+    return select_predictions(
+        files,
+        model,
+        season=season,
+        materialized=_materialized_views(files),
+    )
+
+
+@timed("draft partial")
+@st.cache_data(show_spinner=False, max_entries=DRAFT_PARTIAL_CACHE_ENTRIES)
+def _draft_partial(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    position: str,
+    model: str,
+) -> pl.DataFrame:
+    return draft_partial(
+        files,
+        model,
+        season=season,
+        position=position,
+        materialized=_materialized_views(files),
+    )
+
+
+@timed("draft board")
+def _draft_board(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    positions: Sequence[str],
+    model: str,
+) -> pl.DataFrame:
+    # Only the per-position partials are cached; toggling a position reuses
+    # the others and just re-ranks the concatenated players.
+    return draft_board_from_partials(
+        [_draft_partial(files, season, position, model) for position in positions]
+    )
+
+
+@timed("weekly board")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _weekly_board(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    week: int,
+    positions: tuple[str, ...],
+    model: str,
+) -> pl.DataFrame:
+    return weekly_board(
+        select_predictions(
+            files,
+            model,
+            season=season,
+            positions=positions,
+            materialized=_materialized_views(files),
+        ),
+        season=season,
+        week=week,
+        positions=positions,
+    )
+
+
+@timed("player history")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _player_history(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    player_ids: tuple[str, ...],
+    model: str,
+) -> pl.DataFrame:
+    return player_history(
+        _season_predictions(files, season, model),
+        player_ids=player_ids,
+        season=season,
+    )
+
+
+@timed("model scorecard")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _model_scorecard(files: tuple[PredictionFile, ...], season: int) -> pl.DataFrame:
+    return season_scorecard(
+        files,
+        season=season,
+        materialized=_materialized_views(files),
+    )
+
+
+@timed("position bands")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _position_bands(
+    files: tuple[PredictionFile, ...],
+    season: int,
+    positions: tuple[str, ...],
+    model: str,
+) -> pl.DataFrame:
+    season_frame = _season_predictions(files, season, model)
+    return weekly_bands(season_frame.filter(pl.col("position").is_in(list(positions))))
 
 
-@st.cache_data(show_spinner=False)
-def _load_paths(paths: tuple[str, ...]) -> pl.DataFrame:
-    return load_prediction_files([Path(path) for path in paths])
+@timed("error histogram")
+@st.cache_data(show_spinner=False, max_entries=VIEW_CACHE_ENTRIES)
+def _error_histogram(files: tuple[PredictionFile, ...], season: int) -> pl.DataFrame:
+    return season_error_histogram(files, season=season)
 
 
-def _load_data() -> pl.DataFrame:
+def _load_data() -> tuple[PredictionFile, ...]:
     arguments = _arguments()
-    paths = arguments.predictions or _discover_prediction_files()
+    with timed_stage("discover artifacts") as stage:
+        paths = arguments.predictions or discover_prediction_files(Path.cwd())
+        stage.rows = len(paths)
 
     if paths:
-        return _load_paths(tuple(str(path) for path in paths))
+        return _load_paths(paths)
 
     st.warning(
         "No prediction sheets were found. Build the forecast archive or start "
@@ -539,13 +704,12 @@ def _hydrate_filter_state(
 
 
 def _global_filters(
-    frame: pl.DataFrame,
+    files: tuple[PredictionFile, ...],
     *,
     header: st.delta_generator.DeltaGenerator,
 ) -> tuple[pl.DataFrame, int, list[str], str]:
-    seasons = sorted(frame["target_season"].unique().to_list(), reverse=True)
-    positions = sorted(frame["position"].unique().to_list())
-    models = model_choices(frame)
+    options = _filter_options(files)
+    seasons, positions, models = options.seasons, options.positions, options.models
     _hydrate_filter_state(seasons, positions, models)
 
     with st.container(key="mission-controls"):
@@ -578,10 +742,7 @@ def _global_filters(
         )
 
     _write_filter_query()
-    selected = select_model(
-        frame.filter(pl.col("target_season") == season),
-        model,
-    )
+    selected = _season_predictions(files, season, model)
     _command_header(header, selected)
     return selected, season, chosen_positions, model
 
@@ -662,7 +823,7 @@ def _masthead(frame: pl.DataFrame, model: str) -> None:
 
 
 def _draft_view(
-    frame: pl.DataFrame,
+    files: tuple[PredictionFile, ...],
     *,
     season: int,
     positions: list[str],
@@ -680,15 +841,11 @@ def _draft_view(
         st.warning("Choose at least one position to build the draft board.")
         return
 
-    board = draft_board(
-        frame,
-        season=season,
-        positions=positions,
-    )
+    board = _draft_board(files, season, positions, model)
     has_actuals = board["actual_points"].count() > 0
     controls = st.columns([2, 1, 1.6] if has_actuals else [2, 1])
     search = controls[0].text_input("Find player", placeholder="Search the board")
-    top_n = controls[1].selectbox("Board depth", [12, 24, 50, 100], index=1)
+    depth = controls[1].selectbox("Board depth", [12, 24, 50, 100], index=1)
     sort_label = (
         controls[2].selectbox("Sort players by", list(DRAFT_BAR_FIELDS))
         if has_actuals
@@ -698,17 +855,13 @@ def _draft_view(
         board = board.filter(
             pl.col("player_name").str.contains(search, literal=True, strict=False)
         )
-    display = board.sort(
-        DRAFT_BAR_FIELDS[sort_label],
-        descending=True,
-        nulls_last=True,
-    ).head(top_n)
+    display = top_n(board, DRAFT_BAR_FIELDS[sort_label], n=depth)
 
     if display.is_empty():
         st.warning("No players match this search.")
         return
 
-    chart_rows = display.head(18)
+    chart_rows = display.head(DRAFT_CHART_PLAYERS)
     player_order = chart_rows["player_name"].to_list()
     identity = [
         "player_name",
@@ -756,11 +909,12 @@ def _draft_view(
         ],
         how="vertical",
     ).filter(pl.col("injury_games") > 0)
-    chart_data = pl.concat([regular_bars, adjusted_bars], how="vertical").drop_nulls(
-        ["base_points", "total_points"]
+    chart_frame = chart_data(
+        pl.concat([regular_bars, adjusted_bars], how="vertical").drop_nulls(
+            ["base_points", "total_points"]
+        )
     )
-    chart_frame = chart_data.to_pandas()
-    available_measures = set(chart_data["measure"].to_list())
+    available_measures = set(chart_frame["measure"].to_list())
     bar_order = [label for label in DRAFT_BAR_FIELDS if label in available_measures]
     color = alt.Color(
         "measure:N",
@@ -848,12 +1002,16 @@ def _draft_view(
             tooltip=tooltip,
         )
     )
-    st.altair_chart(
-        _chart_theme(
-            (base_bars + additions).properties(height=max(420, len(player_order) * 58))
-        ),
-        width="stretch",
-    )
+    with timed_stage("draft chart") as stage:
+        stage.rows = chart_frame.height
+        st.altair_chart(
+            _chart_theme(
+                (base_bars + additions).properties(
+                    height=max(420, len(player_order) * 58)
+                )
+            ),
+            width="stretch",
+        )
     st.caption(
         "Solid bars show recorded or modeled points. On adjusted bars, the "
         "translucent dashed extension estimates points for injury misses. "
@@ -961,9 +1119,11 @@ def _draft_view(
 
 def _weekly_view(
     frame: pl.DataFrame,
+    files: tuple[PredictionFile, ...],
     *,
     season: int,
     positions: list[str],
+    model: str,
 ) -> None:
     st.header("Weekly decisions")
     st.write(
@@ -983,12 +1143,7 @@ def _weekly_view(
         st.warning("No weekly predictions are available for this season.")
         return
     week = st.select_slider("Week", options=weeks, value=weeks[-1])
-    board = weekly_board(
-        frame,
-        season=season,
-        week=week,
-        positions=positions,
-    )
+    board = _weekly_board(files, season, week, tuple(positions), model)
     if board.is_empty():
         st.warning("No players match this weekly desk.")
         return
@@ -1004,7 +1159,16 @@ def _weekly_view(
     comparison = board.filter(pl.col("player_name").is_in(compared))
     if not comparison.is_empty():
         comparison_chart = (
-            alt.Chart(comparison.to_pandas())
+            alt.Chart(
+                chart_data(
+                    comparison.select(
+                        "player_name",
+                        "prediction",
+                        "model_spread",
+                        "model_agreement",
+                    )
+                )
+            )
             .mark_bar(color=CYAN, cornerRadiusEnd=3)
             .encode(
                 x=alt.X("prediction:Q", title=f"Week {week} projected points"),
@@ -1022,15 +1186,18 @@ def _weekly_view(
             )
             .properties(height=max(160, len(compared) * 52))
         )
-        st.altair_chart(
-            _chart_theme(comparison_chart),
-            width="stretch",
-        )
+        with timed_stage("comparison chart") as stage:
+            stage.rows = comparison.height
+            st.altair_chart(
+                _chart_theme(comparison_chart),
+                width="stretch",
+            )
 
-        history = player_history(
-            frame,
-            player_ids=comparison["player_id"].to_list(),
-            season=season,
+        history = _player_history(
+            files,
+            season,
+            tuple(comparison["player_id"].to_list()),
+            model,
         )
         history_long = history.select(
             "player_name",
@@ -1043,8 +1210,32 @@ def _weekly_view(
             variable_name="series",
             value_name="points",
         )
-        trend = (
-            alt.Chart(history_long.drop_nulls("points").to_pandas())
+        # The compared players are drawn over their positions' weekly median
+        # and 10th-90th percentile projection, aggregated before charting.
+        bands = _position_bands(
+            files,
+            season,
+            tuple(sorted(set(comparison["position"].to_list()))),
+            model,
+        )
+        band_base = alt.Chart(chart_data(bands)).encode(
+            x=alt.X("target_week:O", title="Week"),
+            tooltip=[
+                alt.Tooltip("target_week:O", title="Week"),
+                alt.Tooltip("median:Q", title="Position median", format=".1f"),
+                alt.Tooltip("lower:Q", title="10th percentile", format=".1f"),
+                alt.Tooltip("upper:Q", title="90th percentile", format=".1f"),
+                alt.Tooltip("players:Q", title="Players"),
+            ],
+        )
+        field = band_base.mark_area(color=GRID, opacity=0.55).encode(
+            y=alt.Y("lower:Q", title="Fantasy points"),
+            y2=alt.Y2("upper:Q"),
+        ) + band_base.mark_line(color=TEXT, opacity=0.45, strokeDash=[2, 3]).encode(
+            y=alt.Y("median:Q", title="Fantasy points")
+        )
+        players = (
+            alt.Chart(chart_data(history_long.drop_nulls("points")))
             .mark_line(point=True, strokeWidth=2)
             .encode(
                 x=alt.X("target_week:O", title="Week"),
@@ -1071,12 +1262,14 @@ def _weekly_view(
                     alt.Tooltip("points:Q", title="Points", format=".1f"),
                 ],
             )
-            .properties(height=340)
-        )
-        st.altair_chart(
-            _chart_theme(trend),
-            width="stretch",
         )
+        trend = (field + players).properties(height=340)
+        with timed_stage("trend chart") as stage:
+            stage.rows = history_long.height + bands.height
+            st.altair_chart(
+                _chart_theme(trend),
+                width="stretch",
+            )
 
     weekly_table = board.select(
         pl.col("position_rank").alias("Rank"),
@@ -1101,13 +1294,13 @@ def _weekly_view(
     )
 
 
-def _model_room(frame: pl.DataFrame) -> None:
+def _model_room(files: tuple[PredictionFile, ...], season: int) -> None:
     st.header("Model room")
     st.write(
         "Audit the sheet before trusting it. Lower error is better; bias above "
         "zero means the model tends to project too high."
     )
-    scorecard = model_scorecard(frame)
+    scorecard = _model_scorecard(files, season)
     if scorecard.is_empty():
         st.warning("Actual results are required to calculate model accuracy.")
         return
@@ -1130,9 +1323,8 @@ def _model_room(frame: pl.DataFrame) -> None:
         },
     )
 
-    chart_frame = scorecard.to_pandas()
     chart = (
-        alt.Chart(chart_frame)
+        alt.Chart(chart_data(scorecard))
         .mark_bar(color=CORAL, cornerRadiusTopLeft=3, cornerRadiusTopRight=3)
         .encode(
             x=alt.X("model:N", title=None, sort="y"),
@@ -1146,39 +1338,112 @@ def _model_room(frame: pl.DataFrame) -> None:
         )
         .properties(height=320)
     )
-    st.altair_chart(
-        _chart_theme(chart),
-        width="stretch",
+    with timed_stage("scorecard chart") as stage:
+        stage.rows = scorecard.height
+        st.altair_chart(
+            _chart_theme(chart),
+            width="stretch",
+        )
+
+    st.subheader("Error distribution")
+    histogram = _error_histogram(files, season)
+    distribution = (
+        alt.Chart(chart_data(histogram))
+        .mark_line(interpolate="step-after", strokeWidth=2)
+        .encode(
+            x=alt.X("bin_start:Q", title="Projected minus actual points"),
+            y=alt.Y("share:Q", title="Share of scored rows", axis=alt.Axis(format="%")),
+            color=alt.Color(
+                "model:N",
+                title="Model",
+                scale=alt.Scale(range=[GREEN, CYAN, AMBER, CORAL, VIOLET]),
+            ),
+            tooltip=[
+                alt.Tooltip("model:N", title="Model"),
+                alt.Tooltip("bin_start:Q", title="From", format=".1f"),
+                alt.Tooltip("bin_end:Q", title="To", format=".1f"),
+                alt.Tooltip("rows:Q", title="Rows"),
+                alt.Tooltip("share:Q", title="Share", format=".1%"),
+            ],
+        )
+        .properties(height=320)
+    )
+    with timed_stage("error distribution chart") as stage:
+        stage.rows = histogram.height
+        st.altair_chart(
+            _chart_theme(distribution),
+            width="stretch",
+        )
+    st.caption(
+        "Every model's errors are binned on the same scale before charting, so "
+        "the chart stays the same size however many weeks the archive holds."
     )
 
 
-def _workspace_page(source: pl.DataFrame, workspace: str) -> None:
+def _workspace_page(files: tuple[PredictionFile, ...], workspace: str) -> None:
     header = st.empty()
-    selected, season, positions, model = _global_filters(source, header=header)
-    selected_season = selected.filter(pl.col("target_season") == season)
-    _masthead(selected_season, model)
+    selected, season, positions, model = _global_filters(files, header=header)
+    _masthead(selected, model)
     if workspace == "draft":
         _draft_view(
-            selected,
+            files,
             season=season,
             positions=positions,
             model=model,
         )
     elif workspace == "weekly":
-        _weekly_view(selected, season=season, positions=positions)
+        _weekly_view(
+            selected,
+            files,
+            season=season,
+            positions=positions,
+            model=model,
+        )
     else:
-        _model_room(source.filter(pl.col("target_season") == season))
+        _model_room(files, season)
+
+
+def _debug_enabled() -> bool:
+    # Page switches drop the query string, so ``?debug=1`` is remembered for
+    # the session until ``?debug=0`` turns it off.
+    requested = st.query_params.get(DEBUG_QUERY_KEY)
+    if requested is not None:
+        st.session_state[DEBUG_STATE_KEY] = requested == "1"
+    return bool(st.session_state.get(DEBUG_STATE_KEY, False))
+
+
+def _diagnostics(timings: StageTimings) -> None:
+    with st.expander("Diagnostics", expanded=False):
+        st.dataframe(
+            pl.DataFrame(
+                {
+                    "Stage": [timing.stage for timing in timings.stages],
+                    "Milliseconds": [
+                        timing.seconds * 1_000 for timing in timings.stages
+                    ],
+                    "Rows": [timing.rows for timing in timings.stages],
+                },
+                schema={
+                    "Stage": pl.String,
+                    "Milliseconds": pl.Float64,
+                    "Rows": pl.Int64,
+                },
+            ),
+            hide_index=True,
+            width="stretch",
+            column_config={
+                "Milliseconds": st.column_config.NumberColumn(format="%.1f"),
+            },
+        )
+        st.download_button(
+            "Export timings",
+            timings.to_json(),
+            file_name="dashboard-timings.json",
+            mime="application/json",
+        )
 
 
-def render() -> None:
-    """Render the dashboard."""
-    st.set_page_config(
-        page_title="Fantasy Forecast Center",
-        page_icon="F",
-        layout="wide",
-        initial_sidebar_state="collapsed",
-    )
-    _inject_styles()
+def _render_pages() -> None:
     try:
         source = _load_data()
     except (DashboardDataError, OSError, pl.exceptions.PolarsError) as error:
@@ -1217,6 +1482,22 @@ def render() -> None:
     page.run()
 
 
+def render() -> None:
+    """Render the dashboard."""
+    st.set_page_config(
+        page_title="Fantasy Forecast Center",
+        page_icon="F",
+        layout="wide",
+        initial_sidebar_state="collapsed",
+    )
+    _inject_styles()
+    debug = _debug_enabled()
+    with recording_stages() as timings:
+        _render_pages()
+    if debug:
+        _diagnostics(timings)
+
+
 def run() -> Never:
     """Launch the dashboard through the console script."""
     app_path = Path(__file__).resolve()
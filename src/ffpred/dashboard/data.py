@@ -1,13 +1,46 @@
-"""Data preparation for the prediction dashboard."""
+"""Data preparation for the prediction dashboard.
+
+Prediction artifacts are scanned lazily, one ``pl.scan_parquet`` per file.
+Season and position filters are applied inside each file's scan, before the
+dashboard normalizes its columns, so the Parquet reader can skip row groups
+whose statistics exclude the season; a model filter skips whole files.
+
+The views that aggregate the whole archive can also be materialized once into
+sidecar Parquet files: the consensus predictions, per-season scorecards and
+per-(season, position, model) draft-board aggregates. Each sidecar records the
+digest of the artifacts it was computed from, and a stale one is ignored in
+favor of computing from the artifacts.
+
+Charts are drawn from chart data reduced in Polars first: error histograms
+binned per model, per-week medians and quantile bands in place of a line per
+player, and top-N truncation. Streamlit hands the reduced frames to the browser
+as Arrow datasets, and ``chart_data`` refuses any frame over
+``CHART_MAX_ROWS``, so a chart's payload does not grow with the archive.
+
+``timed_stage`` and ``timed`` measure the wall time and resulting row count of
+a dashboard stage. They record into the ``StageTimings`` that
+``recording_stages`` activates for the current context, such as one rerun, and
+do nothing outside one.
+"""
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from math import sqrt
+import functools
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from math import ceil, sqrt
 from pathlib import Path
+from typing import ParamSpec, TypeVar
 
 import polars as pl
 
+from ffpred.datasets.io import file_sha256
 from ffpred.errors import FfpredError
 from ffpred.features.all_positions import (
     INJURY_MISSED_COLUMN,
@@ -27,6 +60,32 @@ REQUIRED_COLUMNS = frozenset(
     }
 )
 VIEW_COLUMNS = ("position", "team", "opponent")
+VIEW_DEFAULTS = {"position": "QB", "team": "N/A", "opponent": "N/A"}
+DRAFT_KEY_COLUMNS = ("player_id", "player_name", "position", "team")
+MATERIALIZED_DIRECTORY = ".ffpred-dashboard"
+CONSENSUS_VIEW = "consensus.parquet"
+SCORECARD_VIEW = "scorecard.parquet"
+DRAFT_AGGREGATES_VIEW = "draft-aggregates.parquet"
+SOURCES_METADATA_KEY = "ffpred_sources_sha256"
+VIEW_ROW_GROUP_ROWS = 65_536
+SCORECARD_SCHEMA = {
+    "model": pl.String,
+    "samples": pl.Int64,
+    "mae": pl.Float64,
+    "rmse": pl.Float64,
+    "bias": pl.Float64,
+}
+# Altair's own default row limit for inline chart data.
+CHART_MAX_ROWS = 5_000
+ERROR_HISTOGRAM_BINS = 40
+ERROR_HISTOGRAM_SCHEMA = {
+    "model": pl.String,
+    "bin_start": pl.Float64,
+    "bin_end": pl.Float64,
+    "rows": pl.Int64,
+    "share": pl.Float64,
+}
+WEEKLY_BAND_QUANTILES = (0.1, 0.9)
 SHORT_MODEL_NAME_LENGTH = 4
 TIGHT_MODEL_SPREAD = 1.5
 MIXED_MODEL_SPREAD = 3.0
@@ -57,21 +116,186 @@ LOW_TARGET_SHARE_THRESHOLD = 0.15
 LOW_VOLUME_THRESHOLD = 58.0
 
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
 class DashboardDataError(FfpredError):
     """Raised when a prediction artifact cannot power the dashboard."""
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StageTiming:
+    """Wall time and resulting row count of one dashboard stage."""
+
+    stage: str
+    seconds: float
+    rows: int | None
+
+
+@dataclass(slots=True)
+class StageRows:
+    """Row count a timed block reports for its stage, if it has one."""
+
+    rows: int | None = None
+
+
+class StageTimings:
+    """Stages timed, in completion order, while this registry was recording."""
+
+    def __init__(self) -> None:
+        self._stages: list[StageTiming] = []
+
+    @property
+    def stages(self) -> tuple[StageTiming, ...]:
+        """Return every recorded stage."""
+        return tuple(self._stages)
+
+    def record(self, timing: StageTiming) -> None:
+        """Append one finished stage."""
+        self._stages.append(timing)
+
+    def to_json(self) -> str:
+        """Serialize the stages and their total wall time."""
+        return json.dumps(
+            {
+                "stages": [asdict(timing) for timing in self._stages],
+                "seconds": sum(timing.seconds for timing in self._stages),
+            },
+            indent=2,
+        )
+
+
+_RECORDING: ContextVar[StageTimings | None] = ContextVar(
+    "dashboard_stage_timings", default=None
+)
+
+
+@contextmanager
+def recording_stages() -> Iterator[StageTimings]:
+    """Collect the stages timed in this context into a new registry."""
+    timings = StageTimings()
+    token = _RECORDING.set(timings)
+    try:
+        yield timings
+    finally:
+        _RECORDING.reset(token)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[StageRows]:
+    """Time a block; set ``rows`` on the yielded value to report its size."""
+    rows = StageRows()
+    started = time.perf_counter()
+    try:
+        yield rows
+    finally:
+        timings = _RECORDING.get()
+        if timings is not None:
+            timings.record(
+                StageTiming(
+                    stage=stage,
+                    seconds=time.perf_counter() - started,
+                    rows=rows.rows,
+                )
+            )
+
+
+def timed(stage: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Time every call of a function, counting the rows of a returned frame."""
+
+    def decorate(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with timed_stage(stage) as rows:
+                result = function(*args, **kwargs)
+                if isinstance(result, pl.DataFrame):
+                    rows.rows = result.height
+                elif isinstance(result, tuple | list):
+                    rows.rows = len(result)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PredictionFile:
+    """A validated prediction artifact identified by its content digest."""
+
+    path: Path
+    model: str
+    columns: tuple[str, ...]
+    sha256: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FilterOptions:
+    """Seasons, positions and model views offered by a set of artifacts."""
+
+    seasons: tuple[int, ...]
+    positions: tuple[str, ...]
+    models: tuple[str, ...]
+
+
 def model_name_from_path(path: Path) -> str:
     """Derive a concise display name from a prediction artifact path."""
     name = path.stem.removesuffix("-predictions").replace("-", " ").strip()
     return name.upper() if len(name) <= SHORT_MODEL_NAME_LENGTH else name.title()
 
 
-def _opportunity_expressions(frame: pl.DataFrame) -> list[pl.Expr]:
+def discover_prediction_files(root: Path) -> list[Path]:
+    """Find forecast archive artifacts, or loose ones, below ``root``."""
+    forecast_candidates = list(root.glob("artifacts/*/*-predictions.parquet"))
+    candidates = forecast_candidates or [
+        *root.glob("*-predictions.parquet"),
+        *root.glob("artifacts/*-predictions.parquet"),
+    ]
+    return sorted({path.resolve() for path in candidates})
+
+
+def prediction_file(path: Path) -> PredictionFile:
+    """Validate an artifact from its Parquet metadata and fingerprint it."""
+    scan = pl.scan_parquet(path)
+    columns = tuple(scan.collect_schema().names())
+    _check_columns(columns)
+    if scan.select(pl.len()).collect().item() == 0:
+        raise DashboardDataError("Prediction artifact contains no rows")
+    return PredictionFile(
+        path=path,
+        model=model_name_from_path(path),
+        columns=columns,
+        sha256=file_sha256(path),
+    )
+
+
+def _check_columns(columns: Collection[str]) -> None:
+    missing = REQUIRED_COLUMNS - set(columns)
+    if missing:
+        raise DashboardDataError(
+            f"Prediction artifact is missing columns: {sorted(missing)}"
+        )
+
+
+def _view_expression(columns: Collection[str], column: str) -> pl.Expr:
+    default = VIEW_DEFAULTS[column]
+    if column not in columns:
+        return pl.lit(default).alias(column)
+    return (pl.col(column).cast(pl.String).fill_null(default).str.to_uppercase()).alias(
+        column
+    )
+
+
+def _opportunity_expressions(columns: Collection[str]) -> list[pl.Expr]:
     expressions: list[pl.Expr] = []
     for column, alternatives in OPPORTUNITY_SOURCES.items():
         source = next(
-            (candidate for candidate in (column, *alternatives) if candidate in frame),
+            (
+                candidate
+                for candidate in (column, *alternatives)
+                if candidate in columns
+            ),
             None,
         )
         expressions.append(
@@ -81,10 +305,10 @@ def _opportunity_expressions(frame: pl.DataFrame) -> list[pl.Expr]:
                 else pl.lit(None, dtype=pl.Float64)
             ).alias(column)
         )
-    if any(column in frame for column in OPPORTUNITY_COLUMNS):
+    if any(column in columns for column in OPPORTUNITY_COLUMNS):
         basis = "Depth-chart estimate"
     elif any(
-        alternative in frame
+        alternative in columns
         for alternatives in OPPORTUNITY_SOURCES.values()
         for alternative in alternatives
     ):
@@ -94,16 +318,9 @@ def _opportunity_expressions(frame: pl.DataFrame) -> list[pl.Expr]:
     return [*expressions, pl.lit(basis).alias("opportunity_basis")]
 
 
-def prepare_predictions(frame: pl.DataFrame, *, model_name: str) -> pl.DataFrame:
-    """Validate and normalize one prediction artifact for dashboard use."""
-    missing = REQUIRED_COLUMNS - set(frame.columns)
-    if missing:
-        raise DashboardDataError(
-            f"Prediction artifact is missing columns: {sorted(missing)}"
-        )
-    if frame.is_empty():
-        raise DashboardDataError("Prediction artifact contains no rows")
-
+def _prepared_expressions(
+    columns: Collection[str], *, model_name: str
+) -> list[pl.Expr]:
     expressions: list[pl.Expr] = [
         pl.lit(model_name).alias("model"),
         pl.col("player_name").cast(pl.String),
@@ -111,11 +328,11 @@ def prepare_predictions(frame: pl.DataFrame, *, model_name: str) -> pl.DataFrame
         pl.col("target_week").cast(pl.Int64),
         pl.col(PREDICTION_COLUMN).cast(pl.Float64),
     ]
-    if ACTUAL_COLUMN in frame.columns:
+    if ACTUAL_COLUMN in columns:
         expressions.append(pl.col(ACTUAL_COLUMN).cast(pl.Float64))
     else:
         expressions.append(pl.lit(None, dtype=pl.Float64).alias(ACTUAL_COLUMN))
-    if INJURY_MISSED_COLUMN in frame.columns:
+    if INJURY_MISSED_COLUMN in columns:
         expressions.append(
             pl.col(INJURY_MISSED_COLUMN)
             .cast(pl.Boolean)
@@ -124,52 +341,205 @@ def prepare_predictions(frame: pl.DataFrame, *, model_name: str) -> pl.DataFrame
         )
     else:
         expressions.append(pl.lit(False).alias(INJURY_MISSED_COLUMN))
-    if INJURY_STATUS_COLUMN in frame.columns:
+    if INJURY_STATUS_COLUMN in columns:
         expressions.append(pl.col(INJURY_STATUS_COLUMN).cast(pl.String))
     else:
         expressions.append(pl.lit(None, dtype=pl.String).alias(INJURY_STATUS_COLUMN))
 
-    expressions.extend(_opportunity_expressions(frame))
-
-    defaults = {"position": "QB", "team": "N/A", "opponent": "N/A"}
-    for column, default in defaults.items():
-        if column in frame.columns:
-            expressions.append(
-                pl.col(column)
-                .cast(pl.String)
-                .fill_null(default)
-                .str.to_uppercase()
-                .alias(column)
-            )
-        else:
-            expressions.append(pl.lit(default).alias(column))
+    expressions.extend(_opportunity_expressions(columns))
+    expressions.extend(_view_expression(columns, column) for column in VIEW_COLUMNS)
+    return expressions
 
-    return frame.with_columns(expressions).with_columns(
+
+def _error_expressions() -> list[pl.Expr]:
+    return [
         (pl.col(PREDICTION_COLUMN) - pl.col(ACTUAL_COLUMN)).alias("error"),
         (pl.col(PREDICTION_COLUMN) - pl.col(ACTUAL_COLUMN))
         .abs()
         .alias("absolute_error"),
-    )
+    ]
+
+
+def prepare_predictions(frame: pl.DataFrame, *, model_name: str) -> pl.DataFrame:
+    """Validate and normalize one prediction artifact for dashboard use."""
+    _check_columns(frame.columns)
+    if frame.is_empty():
+        raise DashboardDataError("Prediction artifact contains no rows")
+    return frame.with_columns(
+        _prepared_expressions(frame.columns, model_name=model_name)
+    ).with_columns(_error_expressions())
+
+
+def scan_predictions(
+    files: Sequence[PredictionFile],
+    *,
+    season: int | None = None,
+    positions: Sequence[str] | None = None,
+    models: Collection[str] | None = None,
+) -> pl.LazyFrame:
+    """Lazily combine normalized artifacts, filtering inside each file's scan.
+
+    ``models`` restricts the files scanned by their model name; ``season`` and
+    ``positions`` are applied to the raw columns so they reach the reader.
+    """
+    scans: list[pl.LazyFrame] = []
+    for file in files:
+        if models is not None and file.model not in models:
+            continue
+        scan = pl.scan_parquet(file.path)
+        if season is not None:
+            scan = scan.filter(pl.col("target_season") == season)
+        if positions is not None:
+            scan = scan.filter(
+                _view_expression(file.columns, "position").is_in(list(positions))
+            )
+        scans.append(
+            scan.with_columns(
+                _prepared_expressions(file.columns, model_name=file.model)
+            ).with_columns(_error_expressions())
+        )
+    if not scans:
+        raise DashboardDataError("Choose at least one prediction artifact")
+    return pl.concat(scans, how="diagonal_relaxed")
 
 
 def load_prediction_files(paths: Sequence[Path]) -> pl.DataFrame:
     """Load and combine prediction artifacts from disk."""
-    if not paths:
-        raise DashboardDataError("Choose at least one prediction artifact")
-    frames = [
-        prepare_predictions(
-            pl.read_parquet(path),
-            model_name=model_name_from_path(path),
+    return scan_predictions([prediction_file(path) for path in paths]).collect()
+
+
+def filter_options(files: Sequence[PredictionFile]) -> FilterOptions:
+    """Return the distinct seasons, positions and model views of the artifacts."""
+    keys = (
+        scan_predictions(files).select("target_season", "position").unique().collect()
+    )
+    return FilterOptions(
+        seasons=tuple(sorted(keys["target_season"].unique().to_list(), reverse=True)),
+        positions=tuple(sorted(keys["position"].unique().to_list())),
+        models=_model_choices(file.model for file in files),
+    )
+
+
+def select_predictions(
+    files: Sequence[PredictionFile],
+    model: str,
+    *,
+    season: int,
+    positions: Sequence[str] | None = None,
+    materialized: Path | None = None,
+) -> pl.DataFrame:
+    """Read one season of one model or consensus view, pushing filters down.
+
+    A fresh consensus sidecar in ``materialized`` replaces the aggregation.
+    """
+    view = (
+        _fresh_view(materialized, CONSENSUS_VIEW, files)
+        if model == CONSENSUS_MODEL
+        else None
+    )
+    if view is not None:
+        view = view.filter(pl.col("target_season") == season)
+        if positions is not None:
+            view = view.filter(pl.col("position").is_in(list(positions)))
+        return view.collect()
+    models = None if model == CONSENSUS_MODEL else {model}
+    frame = scan_predictions(
+        files,
+        season=season,
+        positions=positions,
+        models=models,
+    ).collect()
+    return select_model(frame, model)
+
+
+def draft_partial(
+    files: Sequence[PredictionFile],
+    model: str,
+    *,
+    season: int,
+    position: str,
+    materialized: Path | None = None,
+) -> pl.DataFrame:
+    """Aggregate one position's season for one model, before it is ranked.
+
+    Every player's weekly rows fall in a single partial, so the partials of
+    several positions concatenate into the aggregate of all of them.
+    """
+    view = _fresh_view(materialized, DRAFT_AGGREGATES_VIEW, files)
+    if view is None:
+        return _draft_aggregates(
+            select_predictions(
+                files,
+                model,
+                season=season,
+                positions=[position],
+                materialized=materialized,
+            )
         )
-        for path in paths
-    ]
-    return pl.concat(frames, how="diagonal_relaxed")
+    return (
+        view.filter(
+            (pl.col("model") == model)
+            & (pl.col("target_season") == season)
+            & (pl.col("position") == position)
+        )
+        .drop("model", "target_season")
+        .collect()
+    )
+
+
+def draft_board_from_partials(partials: Sequence[pl.DataFrame]) -> pl.DataFrame:
+    """Concatenate position partials and rank them into a draft board."""
+    if not partials:
+        raise DashboardDataError("Choose at least one position")
+    return _draft_board_from_aggregates(pl.concat(partials))
+
+
+def season_draft_board(
+    files: Sequence[PredictionFile],
+    model: str,
+    *,
+    season: int,
+    positions: Sequence[str],
+    materialized: Path | None = None,
+) -> pl.DataFrame:
+    """Build one season's draft board from its position partials."""
+    return draft_board_from_partials(
+        [
+            draft_partial(
+                files,
+                model,
+                season=season,
+                position=position,
+                materialized=materialized,
+            )
+            for position in positions
+        ]
+    )
+
+
+def season_scorecard(
+    files: Sequence[PredictionFile],
+    *,
+    season: int,
+    materialized: Path | None = None,
+) -> pl.DataFrame:
+    """Score one season's models, from a fresh sidecar scorecard if any."""
+    view = _fresh_view(materialized, SCORECARD_VIEW, files)
+    if view is None:
+        return model_scorecard(scan_predictions(files, season=season).collect())
+    return (
+        view.filter(pl.col("target_season") == season).drop("target_season").collect()
+    )
+
+
+def _model_choices(names: Iterable[str]) -> tuple[str, ...]:
+    models = tuple(sorted(set(names)))
+    return (CONSENSUS_MODEL, *models) if len(models) > 1 else models
 
 
 def model_choices(frame: pl.DataFrame) -> tuple[str, ...]:
     """Return available model selections, including consensus when useful."""
-    models = tuple(str(model) for model in sorted(frame["model"].unique().to_list()))
-    return (CONSENSUS_MODEL, *models) if len(models) > 1 else models
+    return _model_choices(str(model) for model in frame["model"].unique())
 
 
 def select_model(frame: pl.DataFrame, model: str) -> pl.DataFrame:
@@ -234,22 +604,28 @@ def draft_board(
     selected = frame.filter(
         (pl.col("target_season") == season) & pl.col("position").is_in(list(positions))
     )
-    season_has_results = selected[ACTUAL_COLUMN].count() > 0
+    return _draft_board_from_aggregates(_draft_aggregates(selected))
+
+
+def _draft_aggregates(frame: pl.DataFrame, *, by: Sequence[str] = ()) -> pl.DataFrame:
+    return frame.group_by(*by, *DRAFT_KEY_COLUMNS).agg(
+        pl.col(PREDICTION_COLUMN).sum().alias("projected_points"),
+        pl.col(PREDICTION_COLUMN).mean().alias("points_per_game"),
+        pl.col(PREDICTION_COLUMN).std().fill_null(0.0).alias("volatility"),
+        pl.col("model_spread").mean().alias("model_spread"),
+        pl.len().alias("projected_games"),
+        pl.col(ACTUAL_COLUMN).count().alias("actual_games"),
+        pl.col(ACTUAL_COLUMN).sum().alias("actual_points"),
+        pl.col(INJURY_MISSED_COLUMN).sum().cast(pl.Int64).alias("injury_games"),
+        *(pl.col(column).mean().alias(column) for column in OPPORTUNITY_COLUMNS),
+        pl.col("opportunity_basis").first().alias("opportunity_basis"),
+    )
+
+
+def _draft_board_from_aggregates(aggregates: pl.DataFrame) -> pl.DataFrame:
+    season_has_results = aggregates["actual_games"].sum() > 0
     board = (
-        selected.group_by("player_id", "player_name", "position", "team")
-        .agg(
-            pl.col(PREDICTION_COLUMN).sum().alias("projected_points"),
-            pl.col(PREDICTION_COLUMN).mean().alias("points_per_game"),
-            pl.col(PREDICTION_COLUMN).std().fill_null(0.0).alias("volatility"),
-            pl.col("model_spread").mean().alias("model_spread"),
-            pl.len().alias("projected_games"),
-            pl.col(ACTUAL_COLUMN).count().alias("actual_games"),
-            pl.col(ACTUAL_COLUMN).sum().alias("actual_points"),
-            pl.col(INJURY_MISSED_COLUMN).sum().cast(pl.Int64).alias("injury_games"),
-            *(pl.col(column).mean().alias(column) for column in OPPORTUNITY_COLUMNS),
-            pl.col("opportunity_basis").first().alias("opportunity_basis"),
-        )
-        .with_columns(
+        aggregates.with_columns(
             pl.when(
                 pl.lit(season_has_results)
                 & ((pl.col("actual_games") > 0) | (pl.col("injury_games") > 0))
@@ -412,4 +788,192 @@ def model_scorecard(frame: pl.DataFrame) -> pl.DataFrame:
                 "bias": selected["error"].mean(),
             }
         )
-    return pl.DataFrame(rows)
+    return pl.DataFrame(rows, schema=SCORECARD_SCHEMA)
+
+
+def chart_data(
+    frame: pl.DataFrame,
+    *,
+    reduce: Callable[[pl.DataFrame], pl.DataFrame] | None = None,
+    max_rows: int = CHART_MAX_ROWS,
+) -> pl.DataFrame:
+    """Return a chart's input bounded to ``max_rows``.
+
+    A larger frame is passed through ``reduce``, such as ``error_histogram``,
+    ``weekly_bands`` or a ``top_n`` cut, or without one thinned to evenly
+    spaced rows in frame order. A reduction that still exceeds the bound is
+    refused.
+    """
+    if frame.height <= max_rows:
+        return frame
+    if reduce is None:
+        return frame.gather_every(ceil(frame.height / max_rows))
+    reduced = reduce(frame)
+    if reduced.height > max_rows:
+        raise DashboardDataError(
+            f"Chart data has {reduced.height} rows after reduction; aggregate it "
+            f"to at most {max_rows}"
+        )
+    return reduced
+
+
+def top_n(frame: pl.DataFrame, column: str, *, n: int) -> pl.DataFrame:
+    """Keep the ``n`` rows with the largest ``column``, nulls last."""
+    return frame.sort(column, descending=True, nulls_last=True).head(n)
+
+
+def error_histogram(
+    frame: pl.DataFrame,
+    *,
+    bins: int = ERROR_HISTOGRAM_BINS,
+) -> pl.DataFrame:
+    """Count each model's scored errors in equal-width bins shared by all models.
+
+    ``share`` is the fraction of the model's scored rows in the bin, so models
+    scored on different numbers of rows compare on one axis.
+    """
+    scored = frame.drop_nulls("error")
+    if scored.is_empty():
+        return pl.DataFrame(schema=ERROR_HISTOGRAM_SCHEMA)
+    low, high = scored.select(
+        pl.col("error").min().alias("low"), pl.col("error").max().alias("high")
+    ).row(0)
+    width = (high - low) / bins or 1.0
+    index = ((pl.col("error") - low) / width).floor().cast(pl.Int64).clip(0, bins - 1)
+    return (
+        scored.group_by("model", index.alias("bin"))
+        .agg(pl.len().cast(pl.Int64).alias("rows"))
+        .with_columns(
+            (low + pl.col("bin") * width).alias("bin_start"),
+            (low + (pl.col("bin") + 1) * width).alias("bin_end"),
+            (pl.col("rows") / pl.col("rows").sum().over("model")).alias("share"),
+        )
+        .select(list(ERROR_HISTOGRAM_SCHEMA))
+        .sort("model", "bin_start")
+    )
+
+
+def season_error_histogram(
+    files: Sequence[PredictionFile],
+    *,
+    season: int,
+    bins: int = ERROR_HISTOGRAM_BINS,
+) -> pl.DataFrame:
+    """Bin one season's errors for every model and consensus."""
+    frame = scan_predictions(files, season=season).collect()
+    views = [
+        select_model(frame, name).select("model", "error")
+        for name in model_choices(frame)
+    ]
+    return error_histogram(pl.concat(views) if views else frame, bins=bins)
+
+
+def weekly_bands(
+    frame: pl.DataFrame,
+    *,
+    column: str = PREDICTION_COLUMN,
+    quantiles: tuple[float, float] = WEEKLY_BAND_QUANTILES,
+) -> pl.DataFrame:
+    """Summarize every player's weekly ``column`` as a median and quantile band."""
+    lower, upper = quantiles
+    return (
+        frame.drop_nulls(column)
+        .group_by("target_week")
+        .agg(
+            pl.col(column).median().alias("median"),
+            pl.col(column).quantile(lower, interpolation="linear").alias("lower"),
+            pl.col(column).quantile(upper, interpolation="linear").alias("upper"),
+            pl.len().cast(pl.Int64).alias("players"),
+        )
+        .sort("target_week")
+    )
+
+
+def sources_sha256(files: Iterable[PredictionFile]) -> str:
+    """Identify a set of artifacts by their model names and contents."""
+    payload = json.dumps(sorted((file.model, file.sha256) for file in files))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def materialized_directory(files: Sequence[PredictionFile]) -> Path:
+    """Return the sidecar directory in the artifacts' common parent."""
+    parents = [str(file.path.resolve().parent) for file in files]
+    return Path(os.path.commonpath(parents)) / MATERIALIZED_DIRECTORY
+
+
+def views_are_fresh(files: Sequence[PredictionFile], directory: Path) -> bool:
+    """Report whether every sidecar for ``files`` was computed from them."""
+    names = [SCORECARD_VIEW, DRAFT_AGGREGATES_VIEW]
+    if CONSENSUS_MODEL in _model_choices(file.model for file in files):
+        names.append(CONSENSUS_VIEW)
+    return all(_fresh_view(directory, name, files) is not None for name in names)
+
+
+def materialize_views(
+    files: Sequence[PredictionFile],
+    directory: Path,
+) -> tuple[Path, ...]:
+    """Write the consensus, scorecard and draft-board sidecars for ``files``.
+
+    Consensus is only written when several models are loaded. Rows are sorted
+    by season first, so a season filter prunes the sidecars' row groups too.
+    """
+    frame = scan_predictions(files).collect()
+    digest = sources_sha256(files)
+    views: dict[str, pl.DataFrame] = {}
+    selections = {
+        model: select_model(frame, model)
+        for model in _model_choices(file.model for file in files)
+    }
+    if CONSENSUS_MODEL in selections:
+        views[CONSENSUS_VIEW] = selections[CONSENSUS_MODEL].sort(
+            "target_season", maintain_order=True
+        )
+    scorecards: list[pl.DataFrame] = []
+    for season in frame["target_season"].unique().sort():
+        scorecard = model_scorecard(frame.filter(pl.col("target_season") == season))
+        if not scorecard.is_empty():
+            scorecards.append(
+                scorecard.select(
+                    pl.lit(season, dtype=pl.Int64).alias("target_season"), pl.all()
+                )
+            )
+    views[SCORECARD_VIEW] = (
+        pl.concat(scorecards)
+        if scorecards
+        else pl.DataFrame(schema={"target_season": pl.Int64, **SCORECARD_SCHEMA})
+    )
+    views[DRAFT_AGGREGATES_VIEW] = pl.concat(
+        _draft_aggregates(selected, by=("target_season",)).select(
+            pl.lit(model).alias("model"), pl.all()
+        )
+        for model, selected in selections.items()
+    ).sort("target_season", "position", "model", maintain_order=True)
+    directory.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for name, view in views.items():
+        path = directory / name
+        temporary = path.with_suffix(f"{path.suffix}.tmp")
+        view.write_parquet(
+            temporary,
+            compression="zstd",
+            statistics=True,
+            row_group_size=VIEW_ROW_GROUP_ROWS,
+            metadata={SOURCES_METADATA_KEY: digest},
+        )
+        temporary.replace(path)
+        written.append(path)
+    return tuple(written)
+
+
+def _fresh_view(
+    directory: Path | None,
+    name: str,
+    files: Sequence[PredictionFile],
+) -> pl.LazyFrame | None:
+    if directory is None or not (path := directory / name).is_file():
+        return None
+    metadata = pl.read_parquet_metadata(path)
+    if metadata.get(SOURCES_METADATA_KEY) != sources_sha256(files):
+        return None
+    return pl.scan_parquet(path)
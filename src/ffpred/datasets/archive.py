@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, date, datetime
 from pathlib import Path
@@ -10,9 +15,16 @@ from pathlib import Path
 import polars as pl
 
 from ffpred import __version__
-from ffpred.datasets.io import file_sha256
-from ffpred.datasets.manifest import DatasetArtifact
-from ffpred.errors import ConfigurationError, EmptyDatasetError
+from ffpred.datasets.io import (
+    file_sha256,
+    write_dataset_view,
+    write_partitioned_dataset,
+)
+from ffpred.datasets.manifest import DatasetArtifact, PartitionArtifact
+from ffpred.errors import (
+    ConfigurationError,
+    EmptyDatasetError,
+)
 from ffpred.features.all_positions import (
     ALL_POSITION_MODEL_FEATURE_COLUMNS,
     FANTASY_POSITIONS,
@@ -23,10 +35,17 @@ from ffpred.features.all_positions import (
     validate_all_position_frame,
 )
 from ffpred.providers.nflreadpy import NflReadPyProvider
+from ffpred.providers.prefetch import (
+    DEFAULT_PREFETCH_WORKERS,
+    PrefetchProvider,
+    PrefetchRequest,
+)
 from ffpred.providers.protocol import NflDataProvider
-from ffpred.providers.provenance import ProvenanceProvider
+from ffpred.providers.provenance import ProvenanceProvider, SourceArtifact
+from ffpred.workers import WorkerSlot, worker_count
 
-ARCHIVE_MANIFEST_SCHEMA_VERSION = 2
+# Version 4 adopts the version 3 dataset-manifest source fingerprints.
+ARCHIVE_MANIFEST_SCHEMA_VERSION = 4
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -59,6 +78,7 @@ class ArchiveSeasonResult:
 
     target_year: int
     training: DatasetArtifact
+    training_partitions: tuple[PartitionArtifact, ...]
     forecast: DatasetArtifact
     manifest_path: Path
 
@@ -75,11 +95,32 @@ class ArchiveManifestInputs:
     """Inputs serialized into one archive season manifest."""
 
     config: ForecastArchiveConfig
-    provider: ProvenanceProvider
+    generated_at: str
+    provider_metadata: Mapping[str, str]
+    sources: Mapping[str, SourceArtifact]
     result: ArchiveSeasonResult
     forecast_frame: pl.DataFrame
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SeasonTask:
+    """Everything one target season needs besides the shared history frames."""
+
+    config: ForecastArchiveConfig
+    target_year: int
+    depth_charts: pl.DataFrame
+    injuries: pl.DataFrame
+    rosters_weekly: pl.DataFrame
+    training_partitions: tuple[PartitionArtifact, ...]
+    training_columns: int
+    generated_at: str
+    provider_metadata: dict[str, str]
+    sources: dict[str, SourceArtifact]
+
+
+_INPUTS: WorkerSlot[tuple[pl.DataFrame, pl.DataFrame]] = WorkerSlot("archive-inputs")
+
+
 def _write_frame(
     path: Path,
     frame: pl.DataFrame,
@@ -101,30 +142,22 @@ def _write_frame(
     )
 
 
+def _validate_training(frame: pl.DataFrame) -> pl.DataFrame:
+    return validate_all_position_frame(frame, target_required=True)
+
+
 def _write_manifest(
     path: Path,
     inputs: ArchiveManifestInputs,
 ) -> None:
     config = inputs.config
-    provider = inputs.provider
     result = inputs.result
     forecast_frame = inputs.forecast_frame
-    relevant_sources = {
-        name: asdict(artifact)
-        for name, artifact in sorted(provider.artifacts.items())
-        if not name.startswith(("depth_charts:", "injuries:", "rosters_weekly:"))
-        or name
-        in {
-            f"depth_charts:{result.target_year}",
-            f"injuries:{result.target_year}",
-            f"rosters_weekly:{result.target_year}",
-        }
-    }
     manifest = {
         "schema_version": ARCHIVE_MANIFEST_SCHEMA_VERSION,
-        "generated_at": datetime.now(UTC).isoformat(),
+        "generated_at": inputs.generated_at,
         "package_version": __version__,
-        "provider": dict(provider.metadata()),
+        "provider": dict(inputs.provider_metadata),
         "parameters": {
             "history_start": config.history_start,
             "first_target_year": config.first_target_year,
@@ -140,11 +173,20 @@ def _write_manifest(
                 "report or reserve-list weekly roster status"
             ),
         },
-        "sources": relevant_sources,
+        "sources": {
+            name: asdict(artifact) for name, artifact in sorted(inputs.sources.items())
+        },
         "outputs": {
             "training": asdict(result.training),
             "forecast": asdict(result.forecast),
         },
+        "training_partitions": [
+            {
+                **asdict(partition),
+                "path": Path(os.path.relpath(partition.path, path.parent)).as_posix(),
+            }
+            for partition in result.training_partitions
+        ],
         "roster_coverage": {
             "teams": forecast_frame["team"].n_unique(),
             "team_position_pairs": forecast_frame.select(
@@ -175,14 +217,157 @@ def _write_manifest(
     temporary.replace(path)
 
 
+def _archive_plan(
+    config: ForecastArchiveConfig,
+    *,
+    completed_through: int,
+) -> list[PrefetchRequest]:
+    stats_seasons = tuple(range(config.history_start, completed_through + 1))
+    plan = [
+        PrefetchRequest(
+            dataset="schedules",
+            seasons=tuple(range(config.history_start, config.last_target_year + 1)),
+        ),
+        PrefetchRequest(dataset="player_stats", seasons=stats_seasons),
+        PrefetchRequest(dataset="team_stats", seasons=stats_seasons),
+    ]
+    for target_year in range(config.first_target_year, config.last_target_year + 1):
+        if target_year <= completed_through:
+            plan.append(PrefetchRequest(dataset="injuries", seasons=(target_year,)))
+            plan.append(
+                PrefetchRequest(dataset="rosters_weekly", seasons=(target_year,))
+            )
+        plan.append(PrefetchRequest(dataset="depth_charts", seasons=(target_year,)))
+    return plan
+
+
+def _season_sources(
+    artifacts: Mapping[str, SourceArtifact],
+    target_year: int,
+) -> dict[str, SourceArtifact]:
+    return {
+        name: artifact
+        for name, artifact in artifacts.items()
+        if not name.startswith(("depth_charts:", "injuries:", "rosters_weekly:"))
+        or name
+        in {
+            f"depth_charts:{target_year}",
+            f"injuries:{target_year}",
+            f"rosters_weekly:{target_year}",
+        }
+    }
+
+
+def _install_inputs(actuals_path: Path, schedules_path: Path) -> None:
+    _INPUTS.install(
+        (
+            pl.read_ipc(actuals_path, memory_map=True),
+            pl.read_ipc(schedules_path, memory_map=True),
+        )
+    )
+
+
+def _build_worker_season(task: _SeasonTask) -> ArchiveSeasonResult:
+    actuals, schedules = _INPUTS.get()
+    return _build_season(task, actuals, schedules)
+
+
+def _build_season(
+    task: _SeasonTask,
+    actuals: pl.DataFrame,
+    schedules: pl.DataFrame,
+) -> ArchiveSeasonResult:
+    season_dir = task.config.output_dir / str(task.target_year)
+    forecast_frame = build_all_position_forecast_frame(
+        actuals,
+        schedules,
+        task.depth_charts,
+        config=ForecastFrameConfig(
+            target_year=task.target_year,
+            as_of=task.config.as_of,
+            injuries=task.injuries,
+            rosters_weekly=task.rosters_weekly,
+        ),
+    )
+    training = write_dataset_view(
+        season_dir / "training.json",
+        task.training_partitions,
+        partition_column="target_season",
+        before=task.target_year,
+        columns=task.training_columns,
+    )
+    forecast = _write_frame(
+        season_dir / "forecast.parquet",
+        forecast_frame,
+        target_required=False,
+    )
+    result = ArchiveSeasonResult(
+        target_year=task.target_year,
+        training=training,
+        training_partitions=task.training_partitions,
+        forecast=forecast,
+        manifest_path=season_dir / "forecast-manifest.json",
+    )
+    # The manifest is written last, so a season directory with a manifest
+    # always holds the complete outputs it describes.
+    _write_manifest(
+        result.manifest_path,
+        ArchiveManifestInputs(
+            config=task.config,
+            generated_at=task.generated_at,
+            provider_metadata=task.provider_metadata,
+            sources=task.sources,
+            result=result,
+            forecast_frame=forecast_frame,
+        ),
+    )
+    return result
+
+
 def build_forecast_archive(
     config: ForecastArchiveConfig,
     *,
     provider: NflDataProvider | None = None,
+    prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
+    jobs: int = 1,
 ) -> ForecastArchiveResult:
-    """Build frozen all-position datasets for every requested target season."""
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
+    """Build frozen all-position datasets for every requested target season.
+
+    Every provider call the archive makes is declared up front and loaded on
+    ``prefetch_workers`` threads while earlier seasons are being built. With
+    ``jobs`` above one, seasons are built on a process pool whose workers
+    memory-map the shared actuals and schedules from one Arrow IPC copy;
+    negative values count back from the available CPUs. Manifests share one
+    build timestamp and list the same sources whatever the worker count.
+    """
+    workers = worker_count(jobs)
     completed_through = min(config.last_target_year, date.today().year - 1)
+    with (
+        PrefetchProvider(
+            provider or NflReadPyProvider(),
+            _archive_plan(config, completed_through=completed_through),
+            max_workers=prefetch_workers,
+        ) as prefetching_provider,
+        ProvenanceProvider(
+            prefetching_provider, fingerprint="background"
+        ) as recording_provider,
+    ):
+        return _build_forecast_archive(
+            config,
+            recording_provider,
+            completed_through=completed_through,
+            workers=workers,
+        )
+
+
+def _build_forecast_archive(
+    config: ForecastArchiveConfig,
+    recording_provider: ProvenanceProvider,
+    *,
+    completed_through: int,
+    workers: int,
+) -> ForecastArchiveResult:
+    generated_at = datetime.now(UTC).isoformat()
     stats_seasons = tuple(range(config.history_start, completed_through + 1))
     schedule_seasons = tuple(range(config.history_start, config.last_target_year + 1))
     schedules = recording_provider.load_schedules(schedule_seasons)
@@ -197,54 +382,59 @@ def build_forecast_archive(
         target_years=range(config.history_start + 1, completed_through + 1),
     )
 
-    results: list[ArchiveSeasonResult] = []
-    for target_year in range(
-        config.first_target_year,
-        config.last_target_year + 1,
-    ):
-        season_dir = config.output_dir / str(target_year)
-        training_frame = all_training.filter(pl.col("target_season") < target_year)
-        if target_year <= completed_through:
-            injuries = recording_provider.load_injuries((target_year,))
-            rosters_weekly = recording_provider.load_rosters_weekly((target_year,))
-        else:
-            injuries = pl.DataFrame()
-            rosters_weekly = pl.DataFrame()
-        forecast_frame = build_all_position_forecast_frame(
-            actuals,
-            schedules,
-            recording_provider.load_depth_charts((target_year,)),
-            config=ForecastFrameConfig(
+    partitions = write_partitioned_dataset(
+        config.output_dir / "training",
+        all_training.filter(pl.col("target_season") < config.last_target_year),
+        partition_column="target_season",
+        validator=_validate_training,
+    )
+
+    def tasks() -> Iterator[_SeasonTask]:
+        for target_year in range(
+            config.first_target_year,
+            config.last_target_year + 1,
+        ):
+            if target_year <= completed_through:
+                injuries = recording_provider.load_injuries((target_year,))
+                rosters_weekly = recording_provider.load_rosters_weekly((target_year,))
+            else:
+                injuries = pl.DataFrame()
+                rosters_weekly = pl.DataFrame()
+            depth_charts = recording_provider.load_depth_charts((target_year,))
+            yield _SeasonTask(
+                config=config,
                 target_year=target_year,
-                as_of=config.as_of,
+                depth_charts=depth_charts,
                 injuries=injuries,
                 rosters_weekly=rosters_weekly,
-            ),
-        )
-        training = _write_frame(
-            season_dir / "training.parquet",
-            training_frame,
-            target_required=True,
-        )
-        forecast = _write_frame(
-            season_dir / "forecast.parquet",
-            forecast_frame,
-            target_required=False,
-        )
-        result = ArchiveSeasonResult(
-            target_year=target_year,
-            training=training,
-            forecast=forecast,
-            manifest_path=season_dir / "forecast-manifest.json",
-        )
-        _write_manifest(
-            result.manifest_path,
-            ArchiveManifestInputs(
-                config=config,
-                provider=recording_provider,
-                result=result,
-                forecast_frame=forecast_frame,
-            ),
+                training_partitions=tuple(
+                    partition
+                    for partition in partitions
+                    if partition.partition < target_year
+                ),
+                training_columns=all_training.width,
+                generated_at=generated_at,
+                provider_metadata=dict(recording_provider.metadata()),
+                sources=_season_sources(recording_provider.artifacts, target_year),
+            )
+
+    if workers == 1:
+        return ForecastArchiveResult(
+            seasons=tuple(_build_season(task, actuals, schedules) for task in tasks())
         )
-        results.append(result)
-    return ForecastArchiveResult(seasons=tuple(results))
+    with tempfile.TemporaryDirectory(prefix="ffpred-archive-") as scratch:
+        actuals_path = Path(scratch) / "actuals.arrow"
+        schedules_path = Path(scratch) / "schedules.arrow"
+        # Uncompressed IPC lets every worker memory-map one shared copy.
+        actuals.write_ipc(actuals_path, compression="uncompressed")
+        schedules.write_ipc(schedules_path, compression="uncompressed")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_install_inputs,
+            initargs=(actuals_path, schedules_path),
+        ) as executor:
+            futures = [executor.submit(_build_worker_season, task) for task in tasks()]
+            return ForecastArchiveResult(
+                seasons=tuple(future.result() for future in futures)
+            )
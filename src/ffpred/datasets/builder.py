@@ -14,13 +14,18 @@ from pathlib import Path
 import polars as pl
 
 from ffpred import __version__
+from ffpred.acquisition.contracts import PLAYER_STATS_CONTRACT
+from ffpred.acquisition.games import (
+    TWO_POINT_PBP_COLUMNS,
+    TWO_POINT_PBP_PREDICATE,
+    acquire_defense_games,
+    acquire_quarterback_games,
+    acquire_receiving_games,
+)
 from ffpred.acquisition.normalize import (
-    acquire_defense_histories,
     acquire_dst_histories,
     acquire_idp_histories,
     acquire_kicker_histories,
-    acquire_quarterback_histories,
-    acquire_receiving_histories,
 )
 from ffpred.datasets.io import write_dataset
 from ffpred.datasets.manifest import (
@@ -40,7 +45,7 @@ from ffpred.domain.scoring import (
     ScoringConfig,
 )
 from ffpred.errors import ConfigurationError
-from ffpred.features.builder import build_feature_frame
+from ffpred.features.builder import build_feature_frame_from_games
 from ffpred.features.dst_builder import build_dst_feature_frame
 from ffpred.features.dst_schema import FEATURE_SCHEMA as DST_FEATURE_SCHEMA
 from ffpred.features.dst_schema import validate_feature_frame as validate_dst_frame
@@ -52,7 +57,9 @@ from ffpred.features.kicker_schema import FEATURE_SCHEMA as KICKER_FEATURE_SCHEM
 from ffpred.features.kicker_schema import (
     validate_feature_frame as validate_kicker_frame,
 )
-from ffpred.features.receiving_builder import build_receiving_feature_frame
+from ffpred.features.receiving_builder import (
+    build_receiving_feature_frame_from_games,
+)
 from ffpred.features.receiving_schema import FEATURE_SCHEMA as RECEIVING_FEATURE_SCHEMA
 from ffpred.features.receiving_schema import (
     validate_feature_frame as validate_receiving_frame,
@@ -60,6 +67,11 @@ from ffpred.features.receiving_schema import (
 from ffpred.features.schema import FEATURE_SCHEMA
 from ffpred.logging import configure_logging
 from ffpred.providers.nflreadpy import NflReadPyProvider
+from ffpred.providers.prefetch import (
+    DEFAULT_PREFETCH_WORKERS,
+    PrefetchProvider,
+    PrefetchRequest,
+)
 from ffpred.providers.protocol import NflDataProvider
 from ffpred.providers.provenance import ProvenanceProvider
 
@@ -176,21 +188,55 @@ def build_datasets(
     config: DatasetBuildConfig = DEFAULT_BUILD_CONFIG,
     *,
     provider: NflDataProvider | None = None,
+    prefetch_workers: int = DEFAULT_PREFETCH_WORKERS,
 ) -> DatasetManifest:
-    """Acquire, engineer, split, persist, and describe train/test datasets."""
+    """Acquire, engineer, split, persist, and describe train/test datasets.
+
+    The quarterback and defense acquisitions' provider calls are loaded
+    concurrently on ``prefetch_workers`` threads.
+    """
     seasons = tuple(range(config.history_start, config.test_year + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    quarterback_histories = acquire_quarterback_histories(
-        seasons,
-        provider=recording_provider,
-    )
-    defense_histories = acquire_defense_histories(
-        seasons,
-        provider=recording_provider,
-    )
-    features = build_feature_frame(
-        quarterback_histories,
-        defense_histories,
+    plan = [
+        PrefetchRequest(dataset="schedules", seasons=seasons),
+        PrefetchRequest(dataset="players"),
+        *(
+            PrefetchRequest(
+                dataset="pbp",
+                seasons=(season,),
+                columns=TWO_POINT_PBP_COLUMNS,
+                predicate=TWO_POINT_PBP_PREDICATE,
+            )
+            for season in seasons
+        ),
+        PrefetchRequest(
+            dataset="player_stats",
+            seasons=seasons,
+            columns=tuple(PLAYER_STATS_CONTRACT.columns),
+        ),
+        PrefetchRequest(dataset="schedules", seasons=seasons),
+        PrefetchRequest(dataset="team_stats", seasons=seasons),
+    ]
+    with (
+        PrefetchProvider(
+            provider or NflReadPyProvider(),
+            plan,
+            max_workers=prefetch_workers,
+        ) as prefetching_provider,
+        ProvenanceProvider(
+            prefetching_provider, fingerprint="background"
+        ) as recording_provider,
+    ):
+        quarterback_games = acquire_quarterback_games(
+            seasons,
+            provider=recording_provider,
+        )
+        defense_games = acquire_defense_games(
+            seasons,
+            provider=recording_provider,
+        )
+    features = build_feature_frame_from_games(
+        quarterback_games,
+        defense_games,
         scoring=config.scoring,
     )
     train = features.filter(
@@ -232,8 +278,10 @@ def build_dst_datasets(
 ) -> DatasetManifest:
     """Acquire, engineer, split, persist, and describe team D/ST datasets."""
     seasons = tuple(range(config.history_start, config.test_year + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    histories = acquire_dst_histories(seasons, provider=recording_provider)
+    with ProvenanceProvider(
+        provider or NflReadPyProvider(), fingerprint="background"
+    ) as recording_provider:
+        histories = acquire_dst_histories(seasons, provider=recording_provider)
     features = build_dst_feature_frame(histories, scoring=config.scoring)
     train = features.filter(
         pl.col("target_season").is_between(
@@ -278,8 +326,10 @@ def build_kicker_datasets(
 ) -> DatasetManifest:
     """Acquire, engineer, split, persist, and describe kicker datasets."""
     seasons = tuple(range(config.history_start, config.test_year + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    histories = acquire_kicker_histories(seasons, provider=recording_provider)
+    with ProvenanceProvider(
+        provider or NflReadPyProvider(), fingerprint="background"
+    ) as recording_provider:
+        histories = acquire_kicker_histories(seasons, provider=recording_provider)
     features = build_kicker_feature_frame(histories, scoring=config.scoring)
     train = features.filter(
         pl.col("target_season").is_between(
@@ -328,13 +378,15 @@ def build_receiving_datasets(
 ) -> DatasetManifest:
     """Acquire, engineer, split, persist, and describe RB/WR/TE datasets."""
     seasons = tuple(range(config.history_start, config.test_year + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    receiving_histories = acquire_receiving_histories(
-        seasons, config.positions, provider=recording_provider
-    )
-    defense_histories = acquire_defense_histories(seasons, provider=recording_provider)
-    features = build_receiving_feature_frame(
-        receiving_histories, defense_histories, scoring=config.scoring
+    with ProvenanceProvider(
+        provider or NflReadPyProvider(), fingerprint="background"
+    ) as recording_provider:
+        receiving_games = acquire_receiving_games(
+            seasons, config.positions, provider=recording_provider
+        )
+        defense_games = acquire_defense_games(seasons, provider=recording_provider)
+    features = build_receiving_feature_frame_from_games(
+        receiving_games, defense_games, scoring=config.scoring
     )
     train = features.filter(
         pl.col("target_season").is_between(
@@ -383,8 +435,10 @@ def build_idp_datasets(
 ) -> DatasetManifest:
     """Acquire, engineer, split, persist, and describe IDP datasets."""
     seasons = tuple(range(config.history_start, config.test_year + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    histories = acquire_idp_histories(seasons, provider=recording_provider)
+    with ProvenanceProvider(
+        provider or NflReadPyProvider(), fingerprint="background"
+    ) as recording_provider:
+        histories = acquire_idp_histories(seasons, provider=recording_provider)
     features = build_idp_feature_frame(histories, scoring=config.scoring)
     train = features.filter(
         pl.col("target_season").is_between(
@@ -10,15 +10,16 @@ from pathlib import Path
 import polars as pl
 
 from ffpred import __version__
+from ffpred.acquisition.games import acquire_defense_games, acquire_quarterback_games
 from ffpred.acquisition.normalize import (
-    acquire_defense_histories,
-    acquire_quarterback_histories,
+    defense_histories_from_games,
+    quarterback_histories_from_games,
 )
 from ffpred.datasets.io import file_sha256, write_dataset
 from ffpred.datasets.manifest import DatasetArtifact
 from ffpred.domain.scoring import DEFAULT_SCORING, ScoringConfig
 from ffpred.errors import ConfigurationError, EmptyDatasetError
-from ffpred.features.builder import build_feature_frame
+from ffpred.features.builder import build_feature_frame_from_games
 from ffpred.features.forecast import (
     ForecastFrameConfig,
     ForecastSources,
@@ -29,7 +30,8 @@ from ffpred.providers.nflreadpy import NflReadPyProvider
 from ffpred.providers.protocol import NflDataProvider
 from ffpred.providers.provenance import ProvenanceProvider
 
-FORECAST_MANIFEST_SCHEMA_VERSION = 1
+# Version 2 adopts the version 3 dataset-manifest source fingerprints.
+FORECAST_MANIFEST_SCHEMA_VERSION = 2
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -138,18 +140,28 @@ def build_forecast_datasets(
 ) -> ForecastBuildResult:
     """Build frozen training and target-season feature artifacts."""
     seasons = tuple(range(config.history_start, config.history_through_season + 1))
-    recording_provider = ProvenanceProvider(provider or NflReadPyProvider())
-    quarterback_histories = acquire_quarterback_histories(
-        seasons,
-        provider=recording_provider,
-    )
-    defense_histories = acquire_defense_histories(
-        seasons,
-        provider=recording_provider,
-    )
-    historical = build_feature_frame(
-        quarterback_histories,
-        defense_histories,
+    with ProvenanceProvider(
+        provider or NflReadPyProvider(), fingerprint="background"
+    ) as recording_provider:
+        quarterback_games = acquire_quarterback_games(
+            seasons,
+            provider=recording_provider,
+        )
+        defense_games = acquire_defense_games(
+            seasons,
+            provider=recording_provider,
+        )
+        actual_stats = (
+            recording_provider.load_player_stats((config.target_year,))
+            if config.include_actuals
+            else None
+        )
+        schedules = recording_provider.load_schedules((config.target_year,))
+        depth_charts = recording_provider.load_depth_charts((config.target_year,))
+        players = recording_provider.load_players()
+    historical = build_feature_frame_from_games(
+        quarterback_games,
+        defense_games,
         scoring=config.scoring,
     )
     training_frame = historical.filter(
@@ -158,18 +170,13 @@ def build_forecast_datasets(
             config.history_through_season,
         )
     )
-    actual_stats = (
-        recording_provider.load_player_stats((config.target_year,))
-        if config.include_actuals
-        else None
-    )
     forecast_frame = build_forecast_frame(
         ForecastSources(
-            quarterback_histories=quarterback_histories,
-            defense_histories=defense_histories,
-            schedules=recording_provider.load_schedules((config.target_year,)),
-            depth_charts=recording_provider.load_depth_charts((config.target_year,)),
-            players=recording_provider.load_players(),
+            quarterback_histories=quarterback_histories_from_games(quarterback_games),
+            defense_histories=defense_histories_from_games(defense_games),
+            schedules=schedules,
+            depth_charts=depth_charts,
+            players=players,
             actual_player_stats=actual_stats,
         ),
         ForecastFrameConfig(
@@ -3,18 +3,29 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Callable
+import json
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import polars as pl
 
-from ffpred.datasets.manifest import DatasetArtifact
-from ffpred.errors import DatasetIntegrityError, EmptyDatasetError
+from ffpred.datasets.manifest import DatasetArtifact, PartitionArtifact
+from ffpred.errors import (
+    DatasetGenerationError,
+    DatasetIntegrityError,
+    EmptyDatasetError,
+)
 from ffpred.features.all_positions import validate_all_position_frame
 from ffpred.features.schema import validate_feature_frame, validate_forecast_frame
 
 Validator = Callable[[pl.DataFrame], pl.DataFrame]
 
+DATASET_VIEW_FORMAT = "parquet-view"
+DATASET_VIEW_SCHEMA_VERSION = 1
+
 
 def file_sha256(path: Path) -> str:
     """Return the SHA-256 identity of a file."""
@@ -25,6 +36,13 @@ def file_sha256(path: Path) -> str:
     return digest.hexdigest()
 
 
+def _write_parquet(path: Path, frame: pl.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f"{path.suffix}.tmp")
+    frame.write_parquet(temporary, compression="zstd", statistics=True)
+    temporary.replace(path)
+
+
 def write_dataset(
     path: Path,
     frame: pl.DataFrame,
@@ -35,25 +53,162 @@ def write_dataset(
     validator(frame)
     if frame.is_empty():
         raise EmptyDatasetError(path)
+    _write_parquet(path, frame)
+    return DatasetArtifact(
+        path=str(path),
+        rows=frame.height,
+        columns=frame.width,
+        sha256=file_sha256(path),
+    )
+
+
+def write_partitioned_dataset(
+    directory: Path,
+    frame: pl.DataFrame,
+    *,
+    partition_column: str,
+    validator: Validator = validate_feature_frame,
+) -> tuple[PartitionArtifact, ...]:
+    """Validate once and persist one Parquet file per partition value.
+
+    Partitions keep their rows in frame order and retain the partition column,
+    so concatenating them in ascending partition order reproduces a frame that
+    is sorted by that column.
+    """
+    validator(frame)
+    if frame.is_empty():
+        raise EmptyDatasetError(directory)
+    artifacts: list[PartitionArtifact] = []
+    for (value,), partition in frame.group_by(
+        partition_column,
+        maintain_order=True,
+    ):
+        path = directory / f"{partition_column}={value}" / "data.parquet"
+        _write_parquet(path, partition)
+        artifacts.append(
+            PartitionArtifact(
+                partition=int(value),
+                path=str(path),
+                rows=partition.height,
+                sha256=file_sha256(path),
+            )
+        )
+    return tuple(sorted(artifacts, key=lambda artifact: artifact.partition))
+
+
+def write_dataset_view(
+    path: Path,
+    partitions: Iterable[PartitionArtifact],
+    *,
+    partition_column: str,
+    before: int,
+    columns: int,
+) -> DatasetArtifact:
+    """Persist a logical table over the partitions strictly below ``before``.
+
+    The view stores partition paths relative to itself together with their
+    checksums, so its own SHA-256 pins the exact bytes a season may read.
+    """
+    selected = tuple(sorted(partitions, key=lambda artifact: artifact.partition))
+    if not selected:
+        raise EmptyDatasetError(path)
+    leaked = [
+        artifact.partition for artifact in selected if artifact.partition >= before
+    ]
+    if leaked:
+        raise DatasetGenerationError(
+            f"{path} cannot reference {partition_column} partitions {leaked} "
+            f"at or after {before}"
+        )
+    view = {
+        "schema_version": DATASET_VIEW_SCHEMA_VERSION,
+        "format": DATASET_VIEW_FORMAT,
+        "partition_column": partition_column,
+        "before": before,
+        "rows": sum(artifact.rows for artifact in selected),
+        "columns": columns,
+        "partitions": [
+            {
+                "partition": artifact.partition,
+                "path": Path(os.path.relpath(artifact.path, path.parent)).as_posix(),
+                "rows": artifact.rows,
+                "sha256": artifact.sha256,
+            }
+            for artifact in selected
+        ],
+    }
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary = path.with_suffix(f"{path.suffix}.tmp")
-    frame.write_parquet(temporary, compression="zstd", statistics=True)
+    temporary.write_text(
+        json.dumps(view, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
     temporary.replace(path)
     return DatasetArtifact(
         path=str(path),
-        rows=frame.height,
-        columns=frame.width,
+        rows=int(view["rows"]),
+        columns=columns,
         sha256=file_sha256(path),
+        format=DATASET_VIEW_FORMAT,
+    )
+
+
+def _read_view(path: Path) -> dict[str, Any]:
+    view = json.loads(path.read_text(encoding="utf-8"))
+    version = view.get("schema_version")
+    if version != DATASET_VIEW_SCHEMA_VERSION:
+        raise DatasetIntegrityError(
+            f"Unsupported dataset view schema version in {path}: {version}"
+        )
+    return view
+
+
+def dataset_view_partitions(path: Path) -> tuple[PartitionArtifact, ...]:
+    """Return the partition files a dataset view may read, resolved to disk."""
+    return tuple(
+        PartitionArtifact(
+            partition=partition["partition"],
+            path=os.path.normpath(path.parent / partition["path"]),
+            rows=partition["rows"],
+            sha256=partition["sha256"],
+        )
+        for partition in _read_view(path)["partitions"]
     )
 
 
+def scan_dataset_view(path: Path, *, verify: bool = False) -> pl.LazyFrame:
+    """Lazily scan a dataset view with its partition bound pushed down."""
+    view = _read_view(path)
+    partitions = dataset_view_partitions(path)
+    if verify:
+        for partition in partitions:
+            actual = file_sha256(Path(partition.path))
+            if actual != partition.sha256:
+                raise DatasetIntegrityError(
+                    f"Checksum mismatch for {partition.path}: "
+                    f"expected {partition.sha256}, got {actual}"
+                )
+    return pl.scan_parquet(
+        [partition.path for partition in partitions],
+        hive_partitioning=False,
+    ).filter(pl.col(view["partition_column"]) < view["before"])
+
+
+def scan_dataset(path: Path) -> pl.LazyFrame:
+    """Lazily scan a persisted feature table or dataset view without checks."""
+    return scan_dataset_view(path) if path.suffix == ".json" else pl.scan_parquet(path)
+
+
 def read_dataset(
     path: Path,
     *,
     expected_sha256: str | None = None,
     validator: Validator | None = None,
 ) -> pl.DataFrame:
-    """Read and validate a persisted feature table."""
+    """Read and validate a persisted feature table or dataset view.
+
+    An expected checksum for a view also verifies every partition it lists.
+    """
     if expected_sha256 is not None:
         actual = file_sha256(path)
         if actual != expected_sha256:
@@ -61,7 +216,11 @@ def read_dataset(
                 f"Checksum mismatch for {path}: "
                 f"expected {expected_sha256}, got {actual}"
             )
-    frame = pl.read_parquet(path)
+    frame = (
+        scan_dataset_view(path, verify=expected_sha256 is not None).collect()
+        if path.suffix == ".json"
+        else pl.read_parquet(path)
+    )
     if validator is not None:
         return validator(frame)
     if "player_history_through_season" in frame.columns:
@@ -69,9 +228,66 @@ def read_dataset(
     return validate_feature_frame(frame)
 
 
-def read_forecast(path: Path) -> pl.DataFrame:
-    """Read and validate a persisted point-in-time forecast table."""
-    frame = pl.read_parquet(path)
+def _validate_forecast(frame: pl.DataFrame) -> pl.DataFrame:
     if "player_history_through_season" in frame.columns:
         return validate_all_position_frame(frame, target_required=False)
     return validate_forecast_frame(frame)
+
+
+def read_forecast(path: Path) -> pl.DataFrame:
+    """Read and validate a persisted point-in-time forecast table."""
+    return _validate_forecast(pl.read_parquet(path))
+
+
+def read_forecast_chunks(path: Path, chunk_rows: int) -> Iterator[pl.DataFrame]:
+    """Read and validate a forecast table ``chunk_rows`` rows at a time.
+
+    Every contract check is row-local, so validating each chunk validates the
+    table. An empty table still yields one empty, validated chunk.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least one")
+    scan = pl.scan_parquet(path)
+    rows = scan.select(pl.len()).collect().item()
+    for offset in range(0, max(rows, 1), chunk_rows):
+        yield _validate_forecast(scan.slice(offset, chunk_rows).collect())
+
+
+def write_chunks(
+    path: Path,
+    chunks: Iterable[pl.DataFrame],
+    *,
+    schema: pl.Schema,
+    row_group_rows: int,
+) -> int:
+    """Atomically stream frames to one Parquet or Arrow IPC file.
+
+    Each chunk is spilled to an uncompressed IPC file in a scratch directory
+    beside ``path`` as soon as it is produced; a lazy scan of those files is
+    then sunk, and Polars memory-maps them, so at most about one chunk is held
+    in memory. Parquet row groups hold ``row_group_rows`` rows and carry
+    statistics. A ``.arrow`` or ``.ipc`` suffix selects Arrow IPC. Returns the
+    number of rows written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f"{path.suffix}.tmp")
+    rows = 0
+    with tempfile.TemporaryDirectory(prefix="ffpred-", dir=path.parent) as scratch:
+        parts: list[Path] = []
+        for index, chunk in enumerate(chunks):
+            part = Path(scratch) / f"{index:08d}.arrow"
+            chunk.write_ipc(part, compression="uncompressed")
+            parts.append(part)
+            rows += chunk.height
+        source = pl.scan_ipc(parts) if parts else pl.LazyFrame(schema=schema)
+        if path.suffix in {".arrow", ".ipc"}:
+            source.sink_ipc(temporary, compression="lz4")
+        else:
+            source.sink_parquet(
+                temporary,
+                compression="zstd",
+                statistics=True,
+                row_group_size=row_group_rows,
+            )
+    temporary.replace(path)
+    return rows
@@ -9,7 +9,12 @@ from typing import TypedDict
 
 from ffpred.providers.provenance import SourceArtifact
 
-MANIFEST_SCHEMA_VERSION = 2
+# Version 3 fingerprints sources in the ``ffpred-arrow-columns-v1`` canonical
+# form documented in ``ffpred.providers.provenance`` and records that form on
+# every source. Version 2 hashed an uncompressed Arrow IPC serialization, so
+# its source digests cannot be compared with version 3 digests of the same
+# data; rebuild datasets to migrate rather than rewriting old manifests.
+MANIFEST_SCHEMA_VERSION = 3
 
 
 class SourceArtifactJson(TypedDict):
@@ -17,6 +22,7 @@ class SourceArtifactJson(TypedDict):
     rows: int
     sha256: str
     schema: dict[str, str]
+    fingerprint: str
 
 
 class DatasetArtifactJson(TypedDict):
@@ -56,6 +62,16 @@ class DatasetArtifact:
     format: str = "parquet"
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PartitionArtifact:
+    """Metadata for one file of a partitioned feature table."""
+
+    partition: int
+    path: str
+    rows: int
+    sha256: str
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class BuildParameters:
     """Parameters that materially determine dataset contents."""
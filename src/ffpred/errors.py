@@ -47,3 +47,7 @@ class DatasetIntegrityError(DatasetGenerationError):
 
 class ModelTrainingError(FfpredError):
     """Raised when model fitting cannot proceed."""
+
+
+class InferenceError(FfpredError):
+    """Raised when a prediction request cannot be answered."""
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from typing import Protocol
 
 import numpy as np
@@ -11,19 +13,22 @@ import shap
 from numpy.typing import ArrayLike, NDArray
 from sklearn.metrics import mean_absolute_error
 
+from ffpred.workers import WorkerSlot, worker_count
+
 
 class Predictor(Protocol):
     """Minimum prediction surface required by explanation diagnostics."""
 
     def predict(
         self,
-        features: NDArray[np.float64],
+        features: NDArray[np.floating],
         /,
     ) -> NDArray[np.float64]: ...
 
 
 MINIMUM_BINS = 2
 MATRIX_DIMENSIONS = 2
+DEFAULT_ALE_MAX_BYTES = 256 * 1024 * 1024
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -101,74 +106,310 @@ def conformal_prediction_interval(
     )
 
 
-def accumulated_local_effects(
+def accumulated_local_effects(  # noqa: PLR0913
     estimator: Predictor,
-    features: NDArray[np.float64],
+    features: NDArray[np.floating],
     feature_index: int,
     feature_name: str,
     *,
     bins: int = 10,
+    max_bytes: int = DEFAULT_ALE_MAX_BYTES,
 ) -> AleCurve:
     """Estimate a centered first-order ALE curve for one numeric feature."""
-    if bins < MINIMUM_BINS:
-        raise ValueError("ALE requires at least two bins")
     if features.ndim != MATRIX_DIMENSIONS or not 0 <= feature_index < features.shape[1]:
         raise ValueError("feature_index must identify a feature column")
-    values = features[:, feature_index]
-    edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)))
+    (curve,) = _ale_curves(
+        estimator,
+        features,
+        ((feature_index, feature_name),),
+        bins=bins,
+        max_bytes=max_bytes,
+    )
+    return curve
+
+
+def accumulated_local_effects_batch(
+    estimator: Predictor,
+    features: NDArray[np.floating],
+    feature_names: Sequence[str],
+    *,
+    bins: int = 10,
+    max_bytes: int = DEFAULT_ALE_MAX_BYTES,
+) -> tuple[AleCurve, ...]:
+    """Estimate ALE curves for every feature column with stacked predictions.
+
+    The lower and upper bin-edge perturbations of all features are predicted
+    together, split into calls whose perturbed matrix stays within
+    ``max_bytes``. Each call builds its own perturbed rows, and bin layouts
+    are computed one feature at a time as the calls reach them, so no
+    perturbation index spans the whole stack. Each curve equals the one
+    ``accumulated_local_effects`` returns for that column up to rounding.
+    """
+    if features.ndim != MATRIX_DIMENSIONS or features.shape[1] != len(feature_names):
+        raise ValueError("feature_names must match the feature columns")
+    return _ale_curves(
+        estimator,
+        features,
+        tuple(enumerate(feature_names)),
+        bins=bins,
+        max_bytes=max_bytes,
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _AlePlan:
+    """Bin layout of one feature and its running per-bin effect sums."""
+
+    feature: str
+    column: int
+    edges: NDArray[np.float64]
+    counts: NDArray[np.int64]
+    differences: NDArray[np.float64]
+
+
+# One plan's rows, in bin order, with the bin of each row.
+_AleSlice = tuple[_AlePlan, NDArray[np.int64], NDArray[np.int64]]
+
+
+def _ale_plan(
+    features: NDArray[np.floating],
+    column: int,
+    name: str,
+    bins: int,
+) -> tuple[_AlePlan, NDArray[np.int64], NDArray[np.int64]] | AleCurve:
+    values = features[:, column]
+    edges = np.asarray(
+        np.unique(np.quantile(values, np.linspace(0, 1, bins + 1))),
+        dtype=np.float64,
+    )
     if edges.size == 1:
         value = float(edges[0])
         return AleCurve(
-            feature=feature_name,
+            feature=name,
             bin_edges=(value, value),
             bin_centers=(value,),
             effects=(0.0,),
             samples=(features.shape[0],),
         )
-
     assignments = np.searchsorted(edges[1:-1], values, side="right")
-    differences = np.zeros(edges.size - 1, dtype=np.float64)
-    counts = np.zeros(edges.size - 1, dtype=np.int64)
-    for index in range(edges.size - 1):
-        rows = np.flatnonzero(assignments == index)
-        counts[index] = rows.size
-        if rows.size == 0:
+    # A stable sort keeps each bin's rows contiguous and in frame order.
+    rows = np.argsort(assignments, kind="stable").astype(np.int64)
+    plan = _AlePlan(
+        feature=name,
+        column=column,
+        edges=edges,
+        counts=np.bincount(assignments, minlength=edges.size - 1),
+        differences=np.zeros(edges.size - 1, dtype=np.float64),
+    )
+    return plan, rows, assignments[rows].astype(np.int64)
+
+
+def _ale_curves(
+    estimator: Predictor,
+    features: NDArray[np.floating],
+    columns: Sequence[tuple[int, str]],
+    *,
+    bins: int,
+    max_bytes: int,
+) -> tuple[AleCurve, ...]:
+    if bins < MINIMUM_BINS:
+        raise ValueError("ALE requires at least two bins")
+    if max_bytes < 1:
+        raise ValueError("max_bytes must be positive")
+    row_bytes = max(1, features.shape[1] * features.itemsize)
+    pairs = max(1, max_bytes // row_bytes // 2)
+    curves: dict[int, AleCurve] = {}
+    plans: list[_AlePlan] = []
+    pending: list[_AleSlice] = []
+    size = 0
+    for column, name in columns:
+        planned = _ale_plan(features, column, name, bins)
+        if isinstance(planned, AleCurve):
+            curves[column] = planned
             continue
-        lower = features[rows].copy()
-        upper = features[rows].copy()
-        lower[:, feature_index] = edges[index]
-        upper[:, feature_index] = edges[index + 1]
-        differences[index] = float(
-            np.mean(estimator.predict(upper) - estimator.predict(lower))
+        plan, rows, assigned = planned
+        plans.append(plan)
+        start = 0
+        while start < rows.size:
+            # Slices of several features share a call until it holds ``pairs``.
+            end = min(start + pairs - size, rows.size)
+            pending.append((plan, rows[start:end], assigned[start:end]))
+            size += end - start
+            start = end
+            if size == pairs:
+                _predict_perturbations(estimator, features, pending)
+                pending, size = [], 0
+    if pending:
+        _predict_perturbations(estimator, features, pending)
+    for plan in plans:
+        means = np.divide(
+            plan.differences,
+            plan.counts,
+            out=np.zeros_like(plan.differences),
+            where=plan.counts > 0,
         )
+        curves[plan.column] = _centered_curve(plan, means)
+    return tuple(curves[column] for column, _ in columns)
 
+
+def _predict_perturbations(
+    estimator: Predictor,
+    features: NDArray[np.floating],
+    slices: Sequence[_AleSlice],
+) -> None:
+    """Predict each slice's lower and upper perturbations in one call.
+
+    The perturbed rows are built here, per call, so only one batch of them
+    exists at a time; each slice's effects are added to its plan's bin sums.
+    """
+    rows = sum(slice_rows.size for _, slice_rows, _ in slices)
+    batch = np.empty((2 * rows, features.shape[1]), dtype=features.dtype)
+    offset = 0
+    for plan, slice_rows, assigned in slices:
+        size = slice_rows.size
+        for edge_offset in (0, 1):
+            block = batch[offset : offset + size]
+            np.take(features, slice_rows, axis=0, out=block)
+            block[:, plan.column] = plan.edges[assigned + edge_offset]
+            offset += size
+    predictions = np.asarray(estimator.predict(batch), dtype=np.float64).reshape(-1)
+    offset = 0
+    for plan, slice_rows, assigned in slices:
+        size = slice_rows.size
+        lower = predictions[offset : offset + size]
+        upper = predictions[offset + size : offset + 2 * size]
+        plan.differences[:] += np.bincount(
+            assigned, weights=upper - lower, minlength=plan.differences.size
+        )
+        offset += 2 * size
+
+
+def _centered_curve(plan: _AlePlan, differences: NDArray[np.float64]) -> AleCurve:
     effects = np.cumsum(differences)
-    populated = counts > 0
+    populated = plan.counts > 0
     if np.any(populated):
-        effects -= np.average(effects[populated], weights=counts[populated])
-    centers = (edges[:-1] + edges[1:]) / 2
+        effects -= np.average(effects[populated], weights=plan.counts[populated])
+    centers = (plan.edges[:-1] + plan.edges[1:]) / 2
     return AleCurve(
-        feature=feature_name,
-        bin_edges=tuple(float(value) for value in edges),
+        feature=plan.feature,
+        bin_edges=tuple(float(value) for value in plan.edges),
         bin_centers=tuple(float(value) for value in centers),
         effects=tuple(float(value) for value in effects),
-        samples=tuple(int(value) for value in counts),
+        samples=tuple(int(value) for value in plan.counts),
     )
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _PermutationInputs:
+    """Read-only inputs every permutation-importance task scores against."""
+
+    estimator: Predictor
+    features: NDArray[np.floating]
+    actual: NDArray[np.float64]
+    batch_size: int
+
+
+_PERMUTATION: WorkerSlot[tuple[_PermutationInputs, NDArray[np.floating]]] = WorkerSlot(
+    "permutation-inputs"
+)
+
+
+def _permutation_state(
+    inputs: _PermutationInputs,
+) -> tuple[_PermutationInputs, NDArray[np.floating]]:
+    # The only copy of the features each process makes: one stacked working
+    # matrix per batch slot, whose permuted column is restored after use.
+    return inputs, np.tile(inputs.features, (inputs.batch_size, 1))
+
+
+def _install_permutation_inputs(inputs: _PermutationInputs) -> None:
+    _PERMUTATION.install(_permutation_state(inputs))
+
+
+def _within_period_gathers(
+    groups: Sequence[NDArray[np.int64]],
+    rows: int,
+    repeats: int,
+    random: np.random.Generator,
+) -> Iterator[NDArray[np.int64]]:
+    """Draw ``repeats`` row gathers that shuffle values within each period.
+
+    Each gather is drawn only when it is requested. ``random.permutation(n)``
+    consumes the stream exactly as permuting an ``n``-value array does, so
+    gathering with these indices reproduces the values of per-period
+    ``random.permutation(column[group])`` calls.
+    """
+    for _ in range(repeats):
+        gather = np.arange(rows, dtype=np.int64)
+        for group in groups:
+            gather[group] = group[random.permutation(group.size)]
+        yield gather
+
+
+def _permutation_errors(
+    feature_index: int,
+    gathers: Iterable[NDArray[np.int64]],
+) -> list[float]:
+    """Score each row gather of one feature column, restoring it afterwards.
+
+    Gathers are taken ``batch_size`` at a time, so a lazily drawn sequence
+    holds no more than one batch of them at once.
+    """
+    inputs, working = _PERMUTATION.get()
+    rows = inputs.actual.size
+    column = inputs.features[:, feature_index]
+    slots = inputs.batch_size
+    remaining = iter(gathers)
+    errors: list[float] = []
+    try:
+        while batch := list(islice(remaining, slots)):
+            for slot, gather in enumerate(batch):
+                working[slot * rows : (slot + 1) * rows, feature_index] = column[gather]
+            prediction = inputs.estimator.predict(working[: len(batch) * rows])
+            errors.extend(
+                float(
+                    mean_absolute_error(
+                        inputs.actual,
+                        prediction[slot * rows : (slot + 1) * rows],
+                    )
+                )
+                for slot in range(len(batch))
+            )
+    finally:
+        working[:, feature_index] = np.tile(column, slots)
+    return errors
+
+
 def temporal_permutation_importance(  # noqa: PLR0913
     estimator: Predictor,
-    features: NDArray[np.float64],
+    features: NDArray[np.floating],
     target: ArrayLike,
     periods: ArrayLike,
     feature_names: Sequence[str],
     *,
     repeats: int = 5,
     random_state: int = 42,
+    batch_size: int = 1,
+    jobs: int = 1,
 ) -> tuple[PermutationImportance, ...]:
-    """Permute within periods to preserve season-level feature distributions."""
+    """Permute within periods to preserve season-level feature distributions.
+
+    Every within-period shuffle is drawn from one ``random_state`` stream in
+    feature, repeat and period order, and applied to a single working column
+    that is restored afterwards instead of copying the matrix per repeat.
+    Without a pool, each shuffle is drawn just before it is scored.
+    ``batch_size`` stacks that many permuted matrices into one ``predict``
+    call, which only changes results for models whose predictions depend on
+    the batch shape. ``jobs`` scores features on a process pool, with negative
+    values counting back from the available CPUs as joblib does; the parent
+    draws the shuffles of one feature per worker ahead of scoring them, so
+    the results match the sequential ones.
+    """
     if repeats < 1:
         raise ValueError("permutation importance requires at least one repeat")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least one")
+    workers = worker_count(jobs)
     actual = _one_dimensional(target, "target")
     period_values = np.asarray(periods).reshape(-1)
     if features.ndim != MATRIX_DIMENSIONS or features.shape[0] != actual.size:
@@ -179,28 +420,54 @@ def temporal_permutation_importance(  # noqa: PLR0913
         raise ValueError("feature_names must match the feature columns")
 
     baseline = float(mean_absolute_error(actual, estimator.predict(features)))
-    groups = tuple(
-        np.flatnonzero(period_values == period) for period in np.unique(period_values)
+    _, inverse, counts = np.unique(
+        period_values, return_inverse=True, return_counts=True
     )
+    order = np.argsort(inverse.reshape(-1), kind="stable").astype(np.int64)
+    groups = np.split(order, np.cumsum(counts)[:-1])
     random = np.random.default_rng(random_state)
-    results: list[PermutationImportance] = []
-    for feature_index, feature_name in enumerate(feature_names):
-        increases: list[float] = []
-        for _ in range(repeats):
-            permuted = features.copy()
-            for rows in groups:
-                permuted[rows, feature_index] = random.permutation(
-                    permuted[rows, feature_index]
+    # Each feature's gathers are consumed in full before the next feature's
+    # are drawn, which keeps the single stream in feature order.
+    gathers = (
+        _within_period_gathers(groups, actual.size, repeats, random)
+        for _ in feature_names
+    )
+    inputs = _PermutationInputs(
+        estimator=estimator,
+        features=features,
+        actual=actual,
+        batch_size=min(batch_size, repeats),
+    )
+    if workers == 1:
+        with _PERMUTATION.installed(_permutation_state(inputs)):
+            feature_errors = [
+                _permutation_errors(feature_index, feature_gathers)
+                for feature_index, feature_gathers in enumerate(gathers)
+            ]
+    else:
+        feature_errors = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_install_permutation_inputs,
+            initargs=(inputs,),
+        ) as executor:
+            for start in range(0, len(feature_names), workers):
+                window = [np.stack(list(drawn)) for drawn in islice(gathers, workers)]
+                feature_errors.extend(
+                    executor.map(
+                        _permutation_errors,
+                        range(start, start + len(window)),
+                        window,
+                    )
                 )
-            error = float(mean_absolute_error(actual, estimator.predict(permuted)))
-            increases.append(error - baseline)
-        results.append(
-            PermutationImportance(
-                feature=feature_name,
-                mean_mae_increase=float(np.mean(increases)),
-                std_mae_increase=float(np.std(increases)),
-            )
+    results = [
+        PermutationImportance(
+            feature=feature_name,
+            mean_mae_increase=float(np.mean([error - baseline for error in errors])),
+            std_mae_increase=float(np.std([error - baseline for error in errors])),
         )
+        for feature_name, errors in zip(feature_names, feature_errors, strict=True)
+    ]
     return tuple(
         sorted(results, key=lambda result: result.mean_mae_increase, reverse=True)
     )
@@ -208,8 +475,8 @@ def temporal_permutation_importance(  # noqa: PLR0913
 
 def model_agnostic_shap_values(  # noqa: PLR0913
     estimator: Predictor,
-    background: NDArray[np.float64],
-    samples: NDArray[np.float64],
+    background: NDArray[np.floating],
+    samples: NDArray[np.floating],
     feature_names: Sequence[str],
     *,
     max_background: int = 100,
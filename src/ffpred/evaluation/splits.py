@@ -1,8 +1,20 @@
-"""Leakage-safe chronological validation splits."""
+"""Leakage-safe chronological validation splits.
+
+Every split orders rows by one ``int64`` period ordinal,
+``target_season * PERIOD_SEASON_SCALE + target_week``, so comparing periods is
+a single integer comparison. ``period_index`` encodes a frame once and keeps
+the encoding, together with every split derived from it, for as long as the
+frame is alive; the SVR search, EBM calibration and permutation importance all
+reuse it. Frames are treated as immutable once they have been indexed.
+"""
 
 from __future__ import annotations
 
+import threading
+import weakref
 from collections.abc import Iterator
+from dataclasses import dataclass, field
+from itertools import pairwise
 
 import numpy as np
 import polars as pl
@@ -12,42 +24,152 @@ from ffpred.errors import ModelTrainingError
 
 MINIMUM_FOLDS = 2
 MINIMUM_CALIBRATION_PERIODS = 2
+PERIOD_SEASON_SCALE = 100
 
+Split = tuple[NDArray[np.int64], NDArray[np.int64]]
 
-def chronological_folds(
-    frame: pl.DataFrame,
-    folds: int,
-) -> Iterator[tuple[NDArray[np.int64], NDArray[np.int64]]]:
-    """Split whole season/week periods so validation always follows training."""
-    if folds < MINIMUM_FOLDS:
-        raise ModelTrainingError("At least two folds are required")
-    periods = sorted(set(frame.select("target_season", "target_week").iter_rows()))
-    if len(periods) < folds + 1:
+# Reentrant, because a weakref callback may run during garbage collection
+# triggered while the lock is already held.
+_INDEX_LOCK = threading.RLock()
+_INDEXES: dict[int, tuple[weakref.ref[pl.DataFrame], PeriodIndex]] = {}
+
+
+def period_ordinals(frame: pl.DataFrame) -> NDArray[np.int64]:
+    """Encode each row's target season and week as one sortable integer."""
+    periods = frame.select("target_season", "target_week")
+    if periods.null_count().sum_horizontal().item():
+        raise ModelTrainingError("Chronological splits require non-null periods")
+    week = periods["target_week"].cast(pl.Int64).to_numpy()
+    if week.size and (week.min() < 0 or week.max() >= PERIOD_SEASON_SCALE):
         raise ModelTrainingError(
-            f"{folds} folds require at least {folds + 1} distinct periods"
+            f"target_week must be between 0 and {PERIOD_SEASON_SCALE - 1}"
         )
-    chunks = np.array_split(np.asarray(periods[1:], dtype=np.int64), folds)
-    season = frame["target_season"].to_numpy()
-    week = frame["target_week"].to_numpy()
-    for chunk in chunks:
-        first_validation = tuple(chunk[0])
-        validation_periods = {tuple(period) for period in chunk}
-        train_mask = np.array(
-            [
-                (row_season, row_week) < first_validation
-                for row_season, row_week in zip(season, week, strict=True)
-            ]
+    season = periods["target_season"].cast(pl.Int64).to_numpy()
+    return season * PERIOD_SEASON_SCALE + week
+
+
+def _read_only(indices: NDArray[np.int64]) -> NDArray[np.int64]:
+    indices.flags.writeable = False
+    return indices
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PeriodIndex:
+    """Rows of one frame grouped into ordered season/week periods.
+
+    ``order`` is a stable argsort of ``ordinals`` and ``starts[i]`` is the
+    position in that order where ``periods[i]`` begins, so the rows of any run
+    of consecutive periods are one slice of ``order``. Splits are memoized and
+    returned as read-only ascending row indices.
+    """
+
+    ordinals: NDArray[np.int64]
+    periods: NDArray[np.int64]
+    order: NDArray[np.int64]
+    starts: NDArray[np.int64]
+    _splits: dict[tuple[str, float], tuple[Split, ...]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @classmethod
+    def from_frame(cls, frame: pl.DataFrame) -> PeriodIndex:
+        """Encode the periods of ``frame`` once."""
+        ordinals = _read_only(period_ordinals(frame))
+        order = np.argsort(ordinals, kind="stable").astype(np.int64)
+        periods = np.unique(ordinals)
+        starts = np.searchsorted(ordinals[order], periods, side="left")
+        return cls(
+            ordinals=ordinals,
+            periods=_read_only(periods),
+            order=_read_only(order),
+            starts=_read_only(np.append(starts, ordinals.size).astype(np.int64)),
         )
-        validation_mask = np.array(
-            [
-                (row_season, row_week) in validation_periods
-                for row_season, row_week in zip(season, week, strict=True)
-            ]
+
+    @property
+    def seasons(self) -> NDArray[np.int64]:
+        """Return each row's target season decoded from its ordinal."""
+        return self.ordinals // PERIOD_SEASON_SCALE
+
+    def _rows(self, first_period: int, end_period: int) -> NDArray[np.int64]:
+        rows = self.order[self.starts[first_period] : self.starts[end_period]]
+        return _read_only(np.sort(rows))
+
+    def folds(self, folds: int) -> tuple[Split, ...]:
+        """Split whole periods so validation always follows training."""
+        key = ("folds", float(folds))
+        cached = self._splits.get(key)
+        if cached is not None:
+            return cached
+        if folds < MINIMUM_FOLDS:
+            raise ModelTrainingError("At least two folds are required")
+        if self.periods.size < folds + 1:
+            raise ModelTrainingError(
+                f"{folds} folds require at least {folds + 1} distinct periods"
+            )
+        # Period 0 only ever trains; the rest are divided as np.array_split
+        # would, the first chunks taking one extra period each.
+        bounds = np.cumsum(
+            [1, *(len(chunk) for chunk in np.array_split(self.periods[1:], folds))]
         )
-        yield (
-            np.flatnonzero(train_mask).astype(np.int64),
-            np.flatnonzero(validation_mask).astype(np.int64),
+        splits = tuple(
+            (self._rows(0, first), self._rows(first, end))
+            for first, end in pairwise(bounds.tolist())
         )
+        self._splits[key] = splits
+        return splits
+
+    def calibration_split(self, calibration_fraction: float) -> Split:
+        """Reserve the latest whole periods for conformal calibration."""
+        key = ("calibration", float(calibration_fraction))
+        cached = self._splits.get(key)
+        if cached is not None:
+            return cached[0]
+        if not 0 < calibration_fraction < 1:
+            raise ModelTrainingError(
+                "Calibration fraction must be between zero and one"
+            )
+        if self.periods.size < MINIMUM_CALIBRATION_PERIODS:
+            raise ModelTrainingError(
+                "Conformal calibration requires at least two distinct periods"
+            )
+        calibration_periods = min(
+            self.periods.size - 1,
+            max(1, int(np.ceil(self.periods.size * calibration_fraction))),
+        )
+        first = self.periods.size - calibration_periods
+        split = (self._rows(0, first), self._rows(first, self.periods.size))
+        self._splits[key] = (split,)
+        return split
+
+
+def period_index(frame: pl.DataFrame) -> PeriodIndex:
+    """Return the cached period index of ``frame``, building it on first use."""
+    key = id(frame)
+    with _INDEX_LOCK:
+        cached = _INDEXES.get(key)
+        if cached is not None and cached[0]() is frame:
+            return cached[1]
+    index = PeriodIndex.from_frame(frame)
+
+    def forget(_: weakref.ref[pl.DataFrame]) -> None:
+        with _INDEX_LOCK:
+            entry = _INDEXES.get(key)
+            if entry is not None and entry[0]() is None:
+                del _INDEXES[key]
+
+    with _INDEX_LOCK:
+        _INDEXES[key] = (weakref.ref(frame, forget), index)
+    return index
+
+
+def chronological_folds(
+    frame: pl.DataFrame,
+    folds: int,
+) -> Iterator[tuple[NDArray[np.int64], NDArray[np.int64]]]:
+    """Split whole season/week periods so validation always follows training."""
+    yield from period_index(frame).folds(folds)
 
 
 def chronological_calibration_split(
@@ -55,28 +177,4 @@ def chronological_calibration_split(
     calibration_fraction: float,
 ) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
     """Reserve the latest whole periods for conformal calibration."""
-    if not 0 < calibration_fraction < 1:
-        raise ModelTrainingError("Calibration fraction must be between zero and one")
-    periods = sorted(set(frame.select("target_season", "target_week").iter_rows()))
-    if len(periods) < MINIMUM_CALIBRATION_PERIODS:
-        raise ModelTrainingError(
-            "Conformal calibration requires at least two distinct periods"
-        )
-    calibration_periods = min(
-        len(periods) - 1,
-        max(1, int(np.ceil(len(periods) * calibration_fraction))),
-    )
-    first_calibration = periods[-calibration_periods]
-    season = frame["target_season"].to_numpy()
-    week = frame["target_week"].to_numpy()
-    training_mask = np.array(
-        [
-            (row_season, row_week) < first_calibration
-            for row_season, row_week in zip(season, week, strict=True)
-        ]
-    )
-    calibration_mask = ~training_mask
-    return (
-        np.flatnonzero(training_mask).astype(np.int64),
-        np.flatnonzero(calibration_mask).astype(np.int64),
-    )
+    return period_index(frame).calibration_split(calibration_fraction)
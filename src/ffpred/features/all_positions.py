@@ -7,7 +7,9 @@ from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
+import numpy as np
 import polars as pl
+from numpy.typing import NDArray
 
 from ffpred.acquisition.contracts import REGULAR_SEASON
 from ffpred.errors import DataAcquisitionError, SchemaValidationError
@@ -775,8 +777,24 @@ def _depth_opportunity_estimates(
     )
 
 
-def _position_baselines(history: pl.DataFrame, target_year: int) -> pl.DataFrame:
-    recent = history.filter(pl.col("season") >= max(0, target_year - 3))
+_PROFILE_KEYS = ("player_id", "position")
+_RECENT_GAMES = 10
+_RECENT_COLUMNS = (TARGET_COLUMN, "target_share", "carry_share")
+_BASELINE_SEASONS = 3
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _SeasonProfiles:
+    """Profile tables built only from seasons before one target year."""
+
+    players: pl.DataFrame
+    baselines: pl.DataFrame
+    team_context: pl.DataFrame
+    opponent_context: pl.DataFrame
+    team_volume: pl.DataFrame
+
+
+def _position_baselines(recent: pl.DataFrame) -> pl.DataFrame:
     return recent.group_by("position").agg(
         pl.col(TARGET_COLUMN).mean().alias("_baseline_ppg"),
         pl.col("target_share").mean().alias("_baseline_target_share"),
@@ -785,77 +803,20 @@ def _position_baselines(history: pl.DataFrame, target_year: int) -> pl.DataFrame
     )
 
 
-def _player_profiles(history: pl.DataFrame, target_year: int) -> pl.DataFrame:
-    keys = ["player_id", "position"]
-    ordered = history.sort("player_id", "position", "season", "week")
-    career = ordered.group_by(keys).agg(
-        pl.col(TARGET_COLUMN).mean().alias("player_career_ppg"),
-        pl.len().cast(pl.Float64).alias("player_career_games"),
-        pl.col("season").max().cast(pl.Int64).alias("_player_lineage"),
-        pl.col(TARGET_COLUMN).last().alias("player_last_1_points"),
-        pl.col("target_share").last().alias("player_last_1_target_share"),
-        pl.col("carry_share").last().alias("player_last_1_carry_share"),
-    )
-    last_five = (
-        ordered.group_by(keys, maintain_order=True)
-        .tail(5)
-        .group_by(keys)
-        .agg(
-            pl.col(TARGET_COLUMN).mean().alias("player_last_5_points"),
-            pl.col("target_share").mean().alias("player_last_5_target_share"),
-            pl.col("carry_share").mean().alias("player_last_5_carry_share"),
-        )
-    )
-    last_ten = (
-        ordered.group_by(keys, maintain_order=True)
-        .tail(10)
-        .group_by(keys)
-        .agg(
-            pl.col(TARGET_COLUMN).mean().alias("player_last_10_points"),
-            pl.col("target_share").mean().alias("player_last_10_target_share"),
-            pl.col("carry_share").mean().alias("player_last_10_carry_share"),
-        )
-    )
-    previous = (
-        ordered.filter(pl.col("season") == target_year - 1)
-        .group_by(keys)
-        .agg(
-            pl.col(TARGET_COLUMN).mean().alias("player_previous_season_ppg"),
-            pl.len().cast(pl.Float64).alias("player_previous_season_games"),
-        )
-    )
-    return (
-        career.join(last_five, on=keys)
-        .join(last_ten, on=keys)
-        .join(
-            previous,
-            on=keys,
-            how="left",
-        )
-    )
-
-
-def _team_volume_profiles(
-    history: pl.DataFrame,
-    target_year: int,
-) -> pl.DataFrame:
-    previous = history.filter(
-        (pl.col("season") == target_year - 1) & (pl.col("position") != "DST")
-    )
-    if previous.is_empty():
-        previous = history.filter(
-            (pl.col("season") == history["season"].max())
-            & (pl.col("position") != "DST")
+def _team_volume_profiles(previous: pl.DataFrame) -> pl.DataFrame:
+    team_games = (
+        previous.filter(pl.col("position") != "DST")
+        .unique(("team", "game_id"), maintain_order=True)
+        .select(
+            "team",
+            "game_id",
+            "team_targets",
+            "team_pass_attempts",
+            "team_rushing_attempts",
+            "team_offensive_plays",
+            "team_pass_rate",
+            "team_rush_rate",
         )
-    team_games = previous.unique(("team", "game_id")).select(
-        "team",
-        "game_id",
-        "team_targets",
-        "team_pass_attempts",
-        "team_rushing_attempts",
-        "team_offensive_plays",
-        "team_pass_rate",
-        "team_rush_rate",
     )
     source_columns = {
         "team_targets": "team_previous_season_targets",
@@ -875,12 +836,11 @@ def _team_volume_profiles(
 
 
 def _context_profiles(
-    history: pl.DataFrame, target_year: int
+    previous: pl.DataFrame,
 ) -> tuple[
     pl.DataFrame,
     pl.DataFrame,
 ]:
-    previous = history.filter(pl.col("season") == target_year - 1)
     team = previous.group_by("team", "position").agg(
         pl.col(TARGET_COLUMN).mean().alias("team_position_ppg")
     )
@@ -890,9 +850,211 @@ def _context_profiles(
     return team, opponent
 
 
+def _kahan_add(
+    total: NDArray[np.float64],
+    compensation: NDArray[np.float64],
+    index: NDArray[np.int64],
+    value: NDArray[np.float64],
+) -> None:
+    adjusted = value - compensation[index]
+    updated = total[index] + adjusted
+    compensation[index] = (updated - total[index]) - adjusted
+    total[index] = updated
+
+
+class _ExpandingProfiles:
+    """Fold completed seasons, in order, into running player profile state.
+
+    Each target year only adds the seasons completed since the previous call,
+    so an archive build no longer regroups the full history for every year.
+    Each season is folded in week order, whatever the source order, and career
+    and recent-form means use compensated (Kahan) summation over a running
+    career total and a buffer of each player's last ten games. The profiles
+    match an aggregation over the week-sorted history to within rounding.
+    """
+
+    def __init__(self, actuals: pl.DataFrame) -> None:
+        self._empty = actuals.clear()
+        self._seasons = {
+            int(season): frame
+            for (season,), frame in actuals.partition_by(
+                "season",
+                as_dict=True,
+                maintain_order=True,
+            ).items()
+        }
+        self._folded: list[int] = []
+        self._players = pl.DataFrame(
+            schema={"player_id": pl.String, "position": pl.String, "_slot": pl.Int64}
+        )
+        self._career_sum = np.zeros(0)
+        self._career_compensation = np.zeros(0)
+        self._career_games = np.zeros(0, dtype=np.int64)
+        self._lineage = np.zeros(0, dtype=np.int64)
+        self._recent = np.zeros((0, _RECENT_GAMES, len(_RECENT_COLUMNS)))
+        self._recent_games = np.zeros(0, dtype=np.int64)
+
+    def season(self, season: int) -> pl.DataFrame:
+        """Return one season of actuals in source order."""
+        return self._seasons.get(season, self._empty)
+
+    def profiles(self, target_year: int) -> _SeasonProfiles:
+        """Return profiles built from every season before ``target_year``."""
+        completed = sorted(season for season in self._seasons if season < target_year)
+        if not completed:
+            raise DataAcquisitionError(
+                f"No historical fantasy results exist before {target_year}"
+            )
+        if self._folded and self._folded[-1] > completed[-1]:
+            raise ValueError("Profiles must be requested in ascending target years")
+        for season in completed:
+            if not self._folded or season > self._folded[-1]:
+                self._fold(season, self._seasons[season])
+                self._folded.append(season)
+        previous = self.season(target_year - 1)
+        team_context, opponent_context = _context_profiles(previous)
+        return _SeasonProfiles(
+            players=self._player_profiles(previous),
+            baselines=_position_baselines(
+                pl.concat(
+                    [
+                        self._seasons[season]
+                        for season in completed
+                        if season >= max(0, target_year - _BASELINE_SEASONS)
+                    ]
+                    or [self._empty],
+                    rechunk=True,
+                )
+            ),
+            team_context=team_context,
+            opponent_context=opponent_context,
+            team_volume=_team_volume_profiles(
+                previous
+                if not previous.filter(pl.col("position") != "DST").is_empty()
+                else self._seasons[completed[-1]]
+            ),
+        )
+
+    def _slots(self, games: pl.DataFrame) -> NDArray[np.int64]:
+        keys = list(_PROFILE_KEYS)
+        arrivals = (
+            games.select(keys)
+            .unique(maintain_order=True)
+            .join(self._players, on=keys, how="anti")
+        )
+        if not arrivals.is_empty():
+            first = self._players.height
+            self._players = pl.concat(
+                [
+                    self._players,
+                    arrivals.with_columns(
+                        pl.int_range(
+                            first, first + arrivals.height, dtype=pl.Int64
+                        ).alias("_slot")
+                    ),
+                ]
+            )
+            added = arrivals.height
+            self._career_sum = np.concatenate([self._career_sum, np.zeros(added)])
+            self._career_compensation = np.concatenate(
+                [self._career_compensation, np.zeros(added)]
+            )
+            self._career_games = np.concatenate(
+                [self._career_games, np.zeros(added, dtype=np.int64)]
+            )
+            self._lineage = np.concatenate(
+                [self._lineage, np.zeros(added, dtype=np.int64)]
+            )
+            self._recent = np.concatenate(
+                [self._recent, np.zeros((added, *self._recent.shape[1:]))]
+            )
+            self._recent_games = np.concatenate(
+                [self._recent_games, np.zeros(added, dtype=np.int64)]
+            )
+        return (
+            games.select(keys)
+            .join(self._players, on=keys, how="left", maintain_order="left")["_slot"]
+            .to_numpy()
+        )
+
+    def _fold(self, season: int, games: pl.DataFrame) -> None:
+        games = games.sort("week", maintain_order=True)
+        slots = self._slots(games)
+        ranks = (
+            games.select(pl.int_range(pl.len()).over(_PROFILE_KEYS))
+            .to_series()
+            .to_numpy()
+        )
+        values = games.select(_RECENT_COLUMNS).to_numpy().astype(np.float64)
+        for rank in range(int(ranks.max()) + 1):
+            selected = ranks == rank
+            slot = slots[selected]
+            value = values[selected]
+            _kahan_add(
+                self._career_sum,
+                self._career_compensation,
+                slot,
+                value[:, 0],
+            )
+            self._career_games[slot] += 1
+            full = slot[self._recent_games[slot] == _RECENT_GAMES]
+            self._recent[full, :-1] = self._recent[full, 1:]
+            self._recent_games[full] -= 1
+            self._recent[slot, self._recent_games[slot]] = value
+            self._recent_games[slot] += 1
+        self._lineage[np.unique(slots)] = season
+
+    def _recent_means(self, games: int) -> NDArray[np.float64]:
+        counts = np.minimum(self._recent_games, games)
+        total = np.zeros((counts.size, len(_RECENT_COLUMNS)))
+        compensation = np.zeros_like(total)
+        for offset in range(games):
+            slot = np.flatnonzero(offset < counts)
+            _kahan_add(
+                total,
+                compensation,
+                slot,
+                self._recent[
+                    slot,
+                    self._recent_games[slot] - counts[slot] + offset,
+                ],
+            )
+        return total / counts[:, None]
+
+    def _player_profiles(self, previous: pl.DataFrame) -> pl.DataFrame:
+        keys = list(_PROFILE_KEYS)
+        slots = np.arange(self._players.height)
+        last = self._recent[slots, self._recent_games - 1]
+        last_five = self._recent_means(5)
+        last_ten = self._recent_means(_RECENT_GAMES)
+        columns = {
+            "player_career_ppg": self._career_sum / self._career_games,
+            "player_career_games": self._career_games.astype(np.float64),
+        }
+        for index, name in enumerate(("points", "target_share", "carry_share")):
+            columns[f"player_last_1_{name}"] = last[:, index]
+            columns[f"player_last_5_{name}"] = last_five[:, index]
+            columns[f"player_last_10_{name}"] = last_ten[:, index]
+        previous_season = previous.group_by(keys).agg(
+            pl.col(TARGET_COLUMN).mean().alias("player_previous_season_ppg"),
+            pl.len().cast(pl.Float64).alias("player_previous_season_games"),
+        )
+        return (
+            self._players.select(keys)
+            .with_columns(
+                *(
+                    pl.Series(name, values, dtype=pl.Float64)
+                    for name, values in columns.items()
+                ),
+                pl.Series("_player_lineage", self._lineage, dtype=pl.Int64),
+            )
+            .join(previous_season, on=keys, how="left")
+        )
+
+
 def _feature_rows(
     base: pl.DataFrame,
-    actuals: pl.DataFrame,
+    profiles: _SeasonProfiles,
     *,
     target_year: int,
     forecast_as_of: date,
@@ -906,21 +1068,12 @@ def _feature_rows(
     for column in ("projected_target_share", "projected_carry_share"):
         if column not in base.columns:
             base = base.with_columns(pl.lit(None, dtype=pl.Float64).alias(column))
-    history = actuals.filter(pl.col("season") < target_year)
-    if history.is_empty():
-        raise DataAcquisitionError(
-            f"No historical fantasy results exist before {target_year}"
-        )
-    profiles = _player_profiles(history, target_year)
-    baselines = _position_baselines(history, target_year)
-    team_context, opponent_context = _context_profiles(history, target_year)
-    team_volume = _team_volume_profiles(history, target_year)
     frame = (
-        base.join(profiles, on=["player_id", "position"], how="left")
-        .join(baselines, on="position", how="left")
-        .join(team_context, on=["team", "position"], how="left")
-        .join(opponent_context, on=["opponent", "position"], how="left")
-        .join(team_volume, on="team", how="left")
+        base.join(profiles.players, on=["player_id", "position"], how="left")
+        .join(profiles.baselines, on="position", how="left")
+        .join(profiles.team_context, on=["team", "position"], how="left")
+        .join(profiles.opponent_context, on=["opponent", "position"], how="left")
+        .join(profiles.team_volume, on="team", how="left")
         .with_columns(
             pl.col("player_last_1_points")
             .fill_null(pl.col("_baseline_ppg"))
@@ -1029,15 +1182,16 @@ def build_all_position_training_frame(
 ) -> pl.DataFrame:
     """Build expanding-window preseason training rows for completed seasons."""
     schedule = _schedule_context(schedules)
+    history = _ExpandingProfiles(actuals)
     frames: list[pl.DataFrame] = []
     for target_year in sorted(set(target_years)):
-        target = actuals.filter(pl.col("season") == target_year)
+        target = history.season(target_year)
         if target.is_empty():
             continue
         frames.append(
             _feature_rows(
                 target,
-                actuals,
+                history.profiles(target_year),
                 target_year=target_year,
                 forecast_as_of=_forecast_date(schedule, target_year, None),
             )
@@ -1100,7 +1254,7 @@ def build_all_position_forecast_frame(
     )
     dst = (
         matchups.select("team")
-        .unique()
+        .unique(maintain_order=True)
         .with_columns(
             (pl.lit("DST-") + pl.col("team")).alias("player_id"),
             (pl.col("team") + pl.lit(" D/ST")).alias("player_name"),
@@ -1161,7 +1315,7 @@ def build_all_position_forecast_frame(
     )
     return _feature_rows(
         base,
-        actuals,
+        _ExpandingProfiles(actuals).profiles(target_year),
         target_year=target_year,
         forecast_as_of=forecast_as_of,
     )
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Mapping
 from dataclasses import asdict
 
 import polars as pl
 
+from ffpred.acquisition.games import DEFENSE_GAMES_SCHEMA, QUARTERBACK_GAMES_SCHEMA
 from ffpred.domain.identifiers import PlayerId, TeamCode
 from ffpred.domain.models import (
     DefenseHistory,
-    GameKey,
     QuarterbackHistory,
 )
 from ffpred.domain.scoring import DEFAULT_SCORING, ScoringConfig
@@ -35,69 +35,74 @@ def _quarterback_frame(
             "player_name": history.profile.name,
             "birth_date": history.profile.birth_date,
             "rookie_season": history.profile.rookie_season,
-            "target_season": game.key.season,
-            "target_week": game.key.week,
-            "target_game_id": game.context.game_id,
-            "game_date": game.context.game_date,
-            "opponent": game.context.opponent,
+            "season": game.key.season,
+            "week": game.key.week,
+            **asdict(game.context),
             **asdict(game.stats),
         }
         for history in histories.values()
         for game in history.games.values()
     ]
-    return pl.DataFrame(rows, infer_schema_length=None).sort(
-        "player_id", "target_season", "target_week"
-    )
+    return pl.DataFrame(rows, schema=QUARTERBACK_GAMES_SCHEMA)
 
 
 def _defense_frame(histories: Mapping[TeamCode, DefenseHistory]) -> pl.DataFrame:
     rows = [
         {
-            "defense": history.team,
-            "target_season": game.key.season,
-            "target_week": game.key.week,
+            "season": game.key.season,
+            "week": game.key.week,
+            **asdict(game.context),
             **asdict(game.stats),
         }
         for history in histories.values()
         for game in history.games.values()
     ]
-    return pl.DataFrame(rows, infer_schema_length=None).sort(
-        "defense", "target_season", "target_week"
-    )
+    return pl.DataFrame(rows, schema=DEFENSE_GAMES_SCHEMA)
 
 
-def _rookie_average_rows(
-    histories: Mapping[PlayerId, QuarterbackHistory],
-    cutoffs: Iterable[GameKey],
-) -> list[dict[str, float | int]]:
-    rookie_games = [
-        game
-        for history in histories.values()
-        if history.profile.rookie_season is not None
-        for game in history.games.values()
-        if game.key.season == history.profile.rookie_season
-    ]
-    rows: list[dict[str, float | int]] = []
-    for cutoff in sorted(set(cutoffs)):
-        prior = [game for game in rookie_games if game.key < cutoff]
-        if not prior:
-            continue
-        # The most recent rookie-cohort game strictly before the cutoff is the
-        # history period this fallback actually draws on, so it must be
-        # recorded as lineage exactly like a player's own last game is.
-        latest = max(game.key for game in prior)
-        row: dict[str, float | int] = {
-            "target_season": cutoff.season,
-            "target_week": cutoff.week,
-            "rookie_history_through_season": latest.season,
-            "rookie_history_through_week": latest.week,
-        }
-        for field in QB_STAT_FIELDS:
-            row[f"rookie_{field}"] = sum(
-                getattr(game.stats, field) for game in prior
-            ) / len(prior)
-        rows.append(row)
-    return rows
+def _period(season: str, week: str) -> pl.Expr:
+    return pl.col(season) * 100 + pl.col(week)
+
+
+def _rookie_average_frame(quarterbacks: pl.DataFrame) -> pl.DataFrame:
+    """Average every rookie-cohort game strictly before each target period.
+
+    Rookie games are summed once per (season, week), accumulated in
+    chronological order, and each distinct target period is matched to the
+    latest cohort period strictly before it, so the cost is linear in the
+    number of games rather than cutoffs x rookie games.
+    """
+    cohort = (
+        quarterbacks.filter(pl.col("target_season") == pl.col("rookie_season"))
+        .group_by("target_season", "target_week")
+        .agg(
+            pl.len().alias("games"), *(pl.col(field).sum() for field in QB_STAT_FIELDS)
+        )
+        .sort("target_season", "target_week")
+        .select(
+            _period("target_season", "target_week").alias("period"),
+            # The most recent rookie-cohort game strictly before the cutoff is
+            # the history period this fallback actually draws on, so it must
+            # be recorded as lineage exactly like a player's own last game is.
+            pl.col("target_season").alias("rookie_history_through_season"),
+            pl.col("target_week").alias("rookie_history_through_week"),
+            *(
+                (pl.col(field).cum_sum() / pl.col("games").cum_sum()).alias(
+                    f"rookie_{field}"
+                )
+                for field in QB_STAT_FIELDS
+            ),
+        )
+    )
+    return (
+        quarterbacks.select("target_season", "target_week")
+        .unique()
+        .with_columns(_period("target_season", "target_week").alias("period"))
+        .sort("period")
+        .join_asof(cohort, on="period", allow_exact_matches=False)
+        .drop("period")
+        .drop_nulls("rookie_history_through_season")
+    )
 
 
 def _score_expression(config: ScoringConfig) -> pl.Expr:
@@ -122,12 +127,46 @@ def build_feature_frame(
     """Build a named feature table using only games before each target."""
     if not quarterback_histories:
         return pl.DataFrame(schema=FEATURE_SCHEMA)
-    quarterbacks = _quarterback_frame(quarterback_histories)
-    defenses = _defense_frame(defense_histories)
+    return build_feature_frame_from_games(
+        _quarterback_frame(quarterback_histories),
+        _defense_frame(defense_histories),
+        scoring=scoring,
+    )
+
 
-    quarterbacks = quarterbacks.with_columns(
-        rolling_expressions(QB_STAT_FIELDS, prefix="qb", group="player_id")
+def build_feature_frame_from_games(
+    quarterback_games: pl.DataFrame,
+    defense_games: pl.DataFrame,
+    *,
+    scoring: ScoringConfig = DEFAULT_SCORING,
+) -> pl.DataFrame:
+    """Build the feature table from columnar ``acquire_*_games`` frames."""
+    if quarterback_games.is_empty():
+        return pl.DataFrame(schema=FEATURE_SCHEMA)
+    quarterbacks = (
+        quarterback_games.select(
+            "player_id",
+            "player_name",
+            "birth_date",
+            "rookie_season",
+            pl.col("season").alias("target_season"),
+            pl.col("week").alias("target_week"),
+            pl.col("game_id").alias("target_game_id"),
+            "game_date",
+            "opponent",
+            *QB_STAT_FIELDS,
+        )
+        .sort("player_id", "target_season", "target_week")
+        .with_columns(
+            rolling_expressions(QB_STAT_FIELDS, prefix="qb", group="player_id")
+        )
     )
+    defenses = defense_games.select(
+        pl.col("team").alias("defense"),
+        pl.col("season").alias("target_season"),
+        pl.col("week").alias("target_week"),
+        *DEFENSE_STAT_FIELDS,
+    ).sort("defense", "target_season", "target_week")
     defenses = defenses.with_columns(
         rolling_expressions(DEFENSE_STAT_FIELDS, prefix="defense", group="defense")
     ).select(
@@ -140,44 +179,35 @@ def build_feature_frame(
         *(f"defense_last_10_{field}" for field in DEFENSE_STAT_FIELDS),
     )
 
-    cutoffs = (
-        GameKey(row["target_season"], row["target_week"])
-        for row in quarterbacks.select("target_season", "target_week").iter_rows(
-            named=True
-        )
-    )
-    rookie_rows = _rookie_average_rows(quarterback_histories, cutoffs)
-    if rookie_rows:
-        quarterbacks = quarterbacks.join(
-            pl.DataFrame(rookie_rows),
-            on=["target_season", "target_week"],
-            how="left",
-        )
-        quarterbacks = quarterbacks.with_columns(
+    quarterbacks = quarterbacks.join(
+        _rookie_average_frame(quarterbacks),
+        on=["target_season", "target_week"],
+        how="left",
+        maintain_order="left",
+    ).with_columns(
+        pl.coalesce(
+            pl.col("qb_history_through_season"),
+            pl.col("rookie_history_through_season"),
+        ).alias("qb_history_through_season"),
+        pl.coalesce(
+            pl.col("qb_history_through_week"),
+            pl.col("rookie_history_through_week"),
+        ).alias("qb_history_through_week"),
+        *(
             pl.coalesce(
-                pl.col("qb_history_through_season"),
-                pl.col("rookie_history_through_season"),
-            ).alias("qb_history_through_season"),
+                pl.col(f"qb_last_1_{field}"),
+                pl.col(f"rookie_{field}"),
+            ).alias(f"qb_last_1_{field}")
+            for field in QB_STAT_FIELDS
+        ),
+        *(
             pl.coalesce(
-                pl.col("qb_history_through_week"),
-                pl.col("rookie_history_through_week"),
-            ).alias("qb_history_through_week"),
-            *(
-                pl.coalesce(
-                    pl.col(f"qb_last_1_{field}"),
-                    pl.col(f"rookie_{field}"),
-                ).alias(f"qb_last_1_{field}")
-                for field in QB_STAT_FIELDS
-            ),
-            *(
-                pl.coalesce(
-                    pl.col(f"qb_last_10_{field}"),
-                    pl.col(f"rookie_{field}"),
-                ).alias(f"qb_last_10_{field}")
-                for field in QB_STAT_FIELDS
-            ),
-        )
-
+                pl.col(f"qb_last_10_{field}"),
+                pl.col(f"rookie_{field}"),
+            ).alias(f"qb_last_10_{field}")
+            for field in QB_STAT_FIELDS
+        ),
+    )
     frame = (
         quarterbacks.join(
             defenses,
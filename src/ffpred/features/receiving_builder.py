@@ -7,6 +7,11 @@ from dataclasses import asdict
 
 import polars as pl
 
+from ffpred.acquisition.games import (
+    DEFENSE_GAMES_SCHEMA,
+    RECEIVING_GAME_STAT_FIELDS,
+    RECEIVING_GAMES_SCHEMA,
+)
 from ffpred.domain.identifiers import PlayerId, TeamCode
 from ffpred.domain.models import DefenseHistory, ReceivingHistory
 from ffpred.domain.scoring import DEFAULT_RECEIVING_SCORING, ReceivingScoringConfig
@@ -28,35 +33,29 @@ def _receiving_frame(histories: Mapping[PlayerId, ReceivingHistory]) -> pl.DataF
             "player_id": history.player_id,
             "player_name": history.name,
             "position": history.position,
-            "team": game.context.team,
-            "target_season": game.key.season,
-            "target_week": game.key.week,
-            "target_game_id": game.context.game_id,
-            "opponent": game.context.opponent,
+            "season": game.key.season,
+            "week": game.key.week,
+            **asdict(game.context),
             **asdict(game.stats),
         }
         for history in histories.values()
         for game in history.games.values()
     ]
-    return pl.DataFrame(rows, infer_schema_length=None).sort(
-        "player_id", "target_season", "target_week"
-    )
+    return pl.DataFrame(rows, schema=RECEIVING_GAMES_SCHEMA)
 
 
 def _defense_frame(histories: Mapping[TeamCode, DefenseHistory]) -> pl.DataFrame:
     rows = [
         {
-            "defense": history.team,
-            "target_season": game.key.season,
-            "target_week": game.key.week,
+            "season": game.key.season,
+            "week": game.key.week,
+            **asdict(game.context),
             **asdict(game.stats),
         }
         for history in histories.values()
         for game in history.games.values()
     ]
-    return pl.DataFrame(rows, infer_schema_length=None).sort(
-        "defense", "target_season", "target_week"
-    )
+    return pl.DataFrame(rows, schema=DEFENSE_GAMES_SCHEMA)
 
 
 def _score_expression(config: ReceivingScoringConfig) -> pl.Expr:
@@ -87,8 +86,35 @@ def build_receiving_feature_frame(
     """
     if not receiving_histories:
         return pl.DataFrame(schema=FEATURE_SCHEMA)
+    return build_receiving_feature_frame_from_games(
+        _receiving_frame(receiving_histories),
+        _defense_frame(defense_histories),
+        scoring=scoring,
+    )
+
+
+def build_receiving_feature_frame_from_games(
+    receiving_games: pl.DataFrame,
+    defense_games: pl.DataFrame,
+    *,
+    scoring: ReceivingScoringConfig = DEFAULT_RECEIVING_SCORING,
+) -> pl.DataFrame:
+    """Build the RB/WR/TE feature table from columnar ``acquire_*_games`` frames."""
+    if receiving_games.is_empty():
+        return pl.DataFrame(schema=FEATURE_SCHEMA)
     receiving = (
-        _receiving_frame(receiving_histories)
+        receiving_games.select(
+            "player_id",
+            "player_name",
+            "position",
+            "team",
+            pl.col("season").alias("target_season"),
+            pl.col("week").alias("target_week"),
+            pl.col("game_id").alias("target_game_id"),
+            "opponent",
+            *RECEIVING_GAME_STAT_FIELDS,
+        )
+        .sort("player_id", "target_season", "target_week")
         .with_columns(
             pl.when(pl.col("team_targets") > 0)
             .then(pl.col("targets") / pl.col("team_targets"))
@@ -114,7 +140,13 @@ def build_receiving_feature_frame(
         )
     )
     defenses = (
-        _defense_frame(defense_histories)
+        defense_games.select(
+            pl.col("team").alias("defense"),
+            pl.col("season").alias("target_season"),
+            pl.col("week").alias("target_week"),
+            *DEFENSE_STAT_FIELDS,
+        )
+        .sort("defense", "target_season", "target_week")
         .with_columns(
             rolling_expressions(DEFENSE_STAT_FIELDS, prefix="defense", group="defense")
         )
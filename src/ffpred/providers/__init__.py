@@ -1,6 +1,15 @@
 """NFL data provider adapters."""
 
+from ffpred.providers.cache import CacheStats, SeasonCacheProvider
 from ffpred.providers.nflreadpy import NflReadPyProvider
+from ffpred.providers.prefetch import PrefetchProvider, PrefetchRequest
 from ffpred.providers.protocol import NflDataProvider
 
-__all__ = ["NflDataProvider", "NflReadPyProvider"]
+__all__ = [
+    "CacheStats",
+    "NflDataProvider",
+    "NflReadPyProvider",
+    "PrefetchProvider",
+    "PrefetchRequest",
+    "SeasonCacheProvider",
+]
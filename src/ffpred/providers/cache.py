@@ -0,0 +1,314 @@
+"""Provider decorator that caches every dataset season as its own file."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+import polars as pl
+
+from ffpred.errors import ConfigurationError, DataAcquisitionError
+from ffpred.providers.protocol import (
+    NflDataProvider,
+    concat_seasons,
+    project_frame,
+)
+
+CACHE_SUFFIX = ".arrow"
+DEFAULT_CURRENT_SEASON_TTL = timedelta(hours=12)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheStats:
+    """Counters describing how a cache served its requests."""
+
+    hits: int
+    misses: int
+    evictions: int
+    bytes: int
+
+
+class SeasonCacheProvider:
+    """Serve provider frames from one Arrow IPC file per dataset season.
+
+    A multi-season request is assembled from cached seasons, and only the
+    missing seasons are requested from the wrapped provider, together in one
+    call that is split by its ``season`` column. Completed seasons never
+    expire; seasons at or after ``current_season`` and the season-less players
+    table are refetched once their file is older than ``ttl``. When
+    ``max_bytes`` is set, the least recently read files are evicted after each
+    write, skipping any file being read. An ``offline`` cache never calls the
+    wrapped provider and serves stale entries as they are.
+
+    Files always hold complete seasons. Projected loads scan only the
+    requested columns of cached files; a miss fetches the complete season
+    once so later callers with other projections can reuse it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        provider: NflDataProvider,
+        cache_dir: Path,
+        *,
+        current_season: int | None = None,
+        ttl: timedelta = DEFAULT_CURRENT_SEASON_TTL,
+        max_bytes: int | None = None,
+        offline: bool = False,
+    ) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ConfigurationError("Provider cache max_bytes must be positive")
+        self._provider = provider
+        self.cache_dir = cache_dir
+        self.current_season = (
+            date.today().year if current_season is None else current_season
+        )
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._reading: Counter[Path] = Counter()
+
+    def path(self, dataset: str, season: int | None = None) -> Path:
+        """Return the cache file holding one dataset season."""
+        name = "all" if season is None else f"season={season}"
+        return self.cache_dir / dataset / f"{name}{CACHE_SUFFIX}"
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counts with the current cache size."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            bytes=sum(path.stat().st_size for path in self._files()),
+        )
+
+    def _files(self) -> list[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob(f"*/*{CACHE_SUFFIX}"))
+
+    def _fresh(self, path: Path, season: int | None) -> bool:
+        if not path.exists():
+            return False
+        if self.offline or (season is not None and season < self.current_season):
+            return True
+        age = time.time() - path.stat().st_mtime
+        return age < self.ttl.total_seconds()
+
+    def _read(
+        self,
+        path: Path,
+        season: int | None,
+        *,
+        columns: Sequence[str] | None,
+        predicate: pl.Expr | None,
+    ) -> pl.DataFrame | None:
+        # A fresh entry is pinned while it is read so that a concurrent
+        # eviction cannot unlink it between the freshness check and the scan.
+        with self._lock:
+            if not self._fresh(path, season):
+                return None
+            self._reading[path] += 1
+            self.hits += 1
+        try:
+            frame = (
+                pl.read_ipc(path, memory_map=False)
+                if columns is None and predicate is None
+                else project_frame(
+                    pl.scan_ipc(path, memory_map=False),
+                    columns=columns,
+                    predicate=predicate,
+                    name=str(path),
+                )
+            )
+            # Reads refresh only the access time; the modification time keeps
+            # tracking when the entry was fetched for the TTL check.
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        finally:
+            with self._lock:
+                self._reading[path] -= 1
+                if not self._reading[path]:
+                    del self._reading[path]
+        return frame
+
+    def _write(self, path: Path, frame: pl.DataFrame) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f"{path.suffix}.{threading.get_ident()}.tmp")
+        frame.write_ipc(temporary, compression="lz4")
+        temporary.replace(path)
+        self._evict(keep=path)
+
+    def _evict(self, *, keep: Path) -> None:
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            entries = sorted(
+                ((path.stat(), path) for path in self._files()),
+                key=lambda entry: entry[0].st_atime,
+            )
+            total = sum(stat.st_size for stat, _ in entries)
+            for stat, path in entries:
+                if total <= self.max_bytes:
+                    break
+                if path == keep or path in self._reading:
+                    continue
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                self.evictions += 1
+
+    def _fetch(
+        self,
+        dataset: str,
+        seasons: Sequence[int | None],
+        fetch: Callable[[], pl.DataFrame],
+    ) -> pl.DataFrame:
+        if self.offline:
+            label = (
+                dataset
+                if seasons == [None]
+                else f"{dataset} season{'s' * (len(seasons) > 1)} "
+                + ", ".join(str(season) for season in seasons)
+            )
+            raise DataAcquisitionError(
+                f"The offline provider cache at {self.cache_dir} has no {label}"
+            )
+        with self._lock:
+            self.misses += len(seasons)
+        return fetch()
+
+    def _load(
+        self,
+        dataset: str,
+        season: int | None,
+        fetch: Callable[[], pl.DataFrame],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        path = self.path(dataset, season)
+        cached = self._read(path, season, columns=columns, predicate=predicate)
+        if cached is not None:
+            return cached
+        frame = self._fetch(dataset, [season], fetch)
+        self._write(path, frame)
+        return project_frame(
+            frame, columns=columns, predicate=predicate, name=str(path)
+        )
+
+    def _load_seasons(
+        self,
+        dataset: str,
+        seasons: Sequence[int],
+        fetch: Callable[[Sequence[int]], pl.DataFrame],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        if not seasons:
+            return fetch(seasons)
+        frames: dict[int, pl.DataFrame] = {}
+        for season in dict.fromkeys(seasons):
+            cached = self._read(
+                self.path(dataset, season),
+                season,
+                columns=columns,
+                predicate=predicate,
+            )
+            if cached is not None:
+                frames[season] = cached
+        missing = [season for season in dict.fromkeys(seasons) if season not in frames]
+        if missing:
+            fetched = self._fetch(dataset, missing, lambda: fetch(tuple(missing)))
+            parts = _split_seasons(dataset, fetched, missing)
+            for season in missing:
+                path = self.path(dataset, season)
+                frame = parts.get(season)
+                if frame is None:
+                    # A season the batch did not return is left uncached, so a
+                    # transient upstream gap is refetched by the next load.
+                    frame = fetched.clear()
+                else:
+                    self._write(path, frame)
+                frames[season] = project_frame(
+                    frame, columns=columns, predicate=predicate, name=str(path)
+                )
+        return concat_seasons([frames[season] for season in seasons])
+
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        return self._load_seasons(
+            "player_stats",
+            seasons,
+            self._provider.load_player_stats,
+            columns=columns,
+            predicate=predicate,
+        )
+
+    def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load_seasons("team_stats", seasons, self._provider.load_team_stats)
+
+    def load_schedules(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load_seasons("schedules", seasons, self._provider.load_schedules)
+
+    def load_depth_charts(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load_seasons(
+            "depth_charts", seasons, self._provider.load_depth_charts
+        )
+
+    def load_injuries(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load_seasons("injuries", seasons, self._provider.load_injuries)
+
+    def load_rosters_weekly(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load_seasons(
+            "rosters_weekly", seasons, self._provider.load_rosters_weekly
+        )
+
+    def load_players(self) -> pl.DataFrame:
+        return self._load("players", None, self._provider.load_players)
+
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        return self._load(
+            "play_by_play",
+            season,
+            lambda: self._provider.load_pbp(season),
+            columns=columns,
+            predicate=predicate,
+        )
+
+    def metadata(self) -> Mapping[str, str]:
+        return self._provider.metadata()
+
+
+def _split_seasons(
+    dataset: str,
+    frame: pl.DataFrame,
+    seasons: Sequence[int],
+) -> dict[int, pl.DataFrame]:
+    if len(seasons) == 1:
+        return {seasons[0]: frame}
+    if "season" not in frame.columns:
+        raise DataAcquisitionError(
+            f"{dataset} cannot be cached by season without a season column"
+        )
+    parts = frame.partition_by("season", as_dict=True, maintain_order=True)
+    return {season: parts[(season,)] for season in seasons if (season,) in parts}
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 
 import polars as pl
 
+from ffpred.providers.protocol import project_frame
+
 
 @dataclass(slots=True, kw_only=True)
 class FakeProvider:
@@ -28,9 +30,20 @@ class FakeProvider:
         }
     )
 
-    def load_player_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
         del seasons
-        return self.player_stats
+        return project_frame(
+            self.player_stats,
+            columns=columns,
+            predicate=predicate,
+            name="player_stats",
+        )
 
     def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
         del seasons
@@ -55,8 +68,19 @@ class FakeProvider:
     def load_players(self) -> pl.DataFrame:
         return self.players
 
-    def load_pbp(self, season: int) -> pl.DataFrame:
-        return self.pbp_by_season[season]
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        return project_frame(
+            self.pbp_by_season[season],
+            columns=columns,
+            predicate=predicate,
+            name=f"play_by_play {season}",
+        )
 
     def metadata(self) -> Mapping[str, str]:
         return self.source_metadata
@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import tempfile
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from importlib.metadata import version
 from pathlib import Path
 from typing import Literal
 
 import nflreadpy as nfl
 import polars as pl
-from nflreadpy.config import update_config
+import requests
+from nflreadpy.config import CacheMode, DataFormat, get_config, update_config
+from nflreadpy.downloader import get_downloader
+
+from ffpred.errors import DataAcquisitionError
+from ffpred.providers.protocol import concat_seasons, project_frame
 
 NFLVERSE_DATA_URL = "https://github.com/nflverse/nflverse-data/releases"
+PBP_RELEASE = "nflverse-data"
+PBP_RELEASE_PATH = "pbp/play_by_play_{season}"
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 class NflReadPyProvider:
-    """Load nflverse release data through nflreadpy."""
+    """Load nflverse release data through nflreadpy.
+
+    Every load goes through nflreadpy, so its URL resolution, cache mode and
+    cache directory apply. nflreadpy always decodes complete release files,
+    so projected player-stats loads are applied one season at a time: only one
+    unprojected season is held in memory at once, and only the projected
+    frames are kept.
+
+    Projected play-by-play loads instead scan the season's release file, so
+    only the projected columns of the matching rows are ever decoded. The file
+    is resolved with nflreadpy's own URL builder and, in ``filesystem`` cache
+    mode, read from and written to nflreadpy's cache file for that season; in
+    the other modes it is streamed to a temporary file for the one scan.
+    """
 
     def __init__(
         self,
@@ -31,8 +55,26 @@ class NflReadPyProvider:
         if options:
             update_config(**options)
 
-    def load_player_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
-        return nfl.load_player_stats(list(seasons))
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        if columns is None and predicate is None:
+            return nfl.load_player_stats(list(seasons))
+        return concat_seasons(
+            [
+                project_frame(
+                    nfl.load_player_stats([season]),
+                    columns=columns,
+                    predicate=predicate,
+                    name=f"player_stats {season}",
+                )
+                for season in seasons
+            ]
+        )
 
     def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
         return nfl.load_team_stats(list(seasons))
@@ -52,8 +94,22 @@ class NflReadPyProvider:
     def load_players(self) -> pl.DataFrame:
         return nfl.load_players()
 
-    def load_pbp(self, season: int) -> pl.DataFrame:
-        return nfl.load_pbp(season)
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        if columns is None and predicate is None:
+            return nfl.load_pbp(season)
+        with _pbp_release(season) as release:
+            return project_frame(
+                release,
+                columns=columns,
+                predicate=predicate,
+                name=f"play_by_play {season}",
+            )
 
     def metadata(self) -> Mapping[str, str]:
         return {
@@ -61,3 +117,51 @@ class NflReadPyProvider:
             "client_version": version("nflreadpy"),
             "data_source": NFLVERSE_DATA_URL,
         }
+
+
+@contextmanager
+def _pbp_release(season: int) -> Iterator[pl.LazyFrame]:
+    # nflreadpy is pinned, so its URL builder and cache layout are stable:
+    # a cached season is the release file itself, keyed by URL and season.
+    downloader = get_downloader()
+    url = downloader._build_url(
+        PBP_RELEASE, PBP_RELEASE_PATH.format(season=season), DataFormat.PARQUET
+    )
+    config = get_config()
+    if config.cache_mode == CacheMode.MEMORY:
+        cached = downloader.cache.get(url, season=season)
+        if cached is not None:
+            yield cached.lazy()
+            return
+    if config.cache_mode != CacheMode.FILESYSTEM:
+        with tempfile.TemporaryDirectory(prefix="ffpred-pbp-") as directory:
+            path = Path(directory) / "release.parquet"
+            _download(url, path)
+            yield pl.scan_parquet(path)
+        return
+    cache = downloader.cache
+    path = cache._get_file_path(cache._get_cache_key(url, season=season))
+    if not path.exists() or time.time() - path.stat().st_mtime >= config.cache_duration:
+        temporary = path.with_name(f".{path.name}.tmp")
+        _download(url, temporary)
+        temporary.replace(path)
+    yield pl.scan_parquet(path)
+
+
+def _download(url: str, path: Path) -> None:
+    # Streamed to disk so the compressed release is never held in memory.
+    config = get_config()
+    try:
+        with requests.get(
+            url,
+            headers={"User-Agent": config.user_agent},
+            timeout=config.timeout,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            with path.open("wb") as file:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                    file.write(chunk)
+    except requests.RequestException as error:
+        path.unlink(missing_ok=True)
+        raise DataAcquisitionError(f"Cannot download {url}: {error}") from error
@@ -0,0 +1,255 @@
+"""Provider decorator that loads a declared plan of datasets concurrently."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from types import TracebackType
+
+import polars as pl
+
+from ffpred.errors import ConfigurationError
+from ffpred.providers.protocol import NflDataProvider
+
+DEFAULT_PREFETCH_WORKERS = 4
+SEASONAL_DATASETS = frozenset(
+    {
+        "player_stats",
+        "team_stats",
+        "schedules",
+        "depth_charts",
+        "injuries",
+        "rosters_weekly",
+    }
+)
+
+PUSHDOWN_DATASETS = frozenset({"player_stats", "pbp"})
+
+_PrefetchKey = tuple[str, tuple[int, ...], tuple[str, ...] | None, bytes | None]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PrefetchRequest:
+    """One provider call a build will make, named by its loader suffix.
+
+    ``pbp`` takes exactly one season and ``players`` takes none, matching the
+    ``load_pbp`` and ``load_players`` signatures. ``columns`` and
+    ``predicate`` are only accepted for the datasets whose loaders take them,
+    and a call matches the request only if it passes the same pushdown.
+    """
+
+    dataset: str
+    seasons: tuple[int, ...] = ()
+    columns: tuple[str, ...] | None = None
+    predicate: pl.Expr | None = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.dataset == "players":
+            valid = not self.seasons
+        elif self.dataset == "pbp":
+            valid = len(self.seasons) == 1
+        else:
+            valid = self.dataset in SEASONAL_DATASETS
+        if self.dataset not in PUSHDOWN_DATASETS:
+            valid = valid and self.columns is None and self.predicate is None
+        if not valid:
+            raise ConfigurationError(
+                f"Cannot prefetch {self.dataset} for seasons {list(self.seasons)}"
+            )
+
+
+class PrefetchProvider:
+    """Load planned requests ahead of use on a bounded thread pool.
+
+    Planned requests are submitted in plan order, and at most ``lookahead``
+    of them, by default twice ``max_workers``, are loading or holding a
+    finished frame at once. A call matching a planned request waits for its
+    shared future, submitting it first if the window has not reached it. A
+    request planned ``n`` times is loaded once and released after its
+    ``n``-th use, which lets the window advance; unplanned calls go straight
+    to the wrapped provider. Frames are returned unchanged, so a
+    ``ProvenanceProvider`` wrapped around this decorator records the same
+    fingerprints in the same order as without it. Errors raised by a planned
+    load surface at the call that consumes it.
+    """
+
+    def __init__(
+        self,
+        provider: NflDataProvider,
+        plan: Iterable[PrefetchRequest],
+        *,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+        lookahead: int | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ConfigurationError("Prefetch max_workers must be at least one")
+        if lookahead is not None and lookahead < 1:
+            raise ConfigurationError("Prefetch lookahead must be at least one")
+        self._provider = provider
+        self._lookahead = 2 * max_workers if lookahead is None else lookahead
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="ffpred-prefetch",
+        )
+        self._futures: dict[_PrefetchKey, Future[pl.DataFrame]] = {}
+        self._uses: dict[_PrefetchKey, int] = {}
+        self._predicates: dict[bytes, pl.Expr] = {}
+        for request in plan:
+            key = self._key(
+                request.dataset,
+                request.seasons,
+                columns=request.columns,
+                predicate=request.predicate,
+            )
+            self._uses[key] = self._uses.get(key, 0) + 1
+        self._queue = deque(self._uses)
+        with self._lock:
+            self._advance()
+
+    def __enter__(self) -> PrefetchProvider:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel loads that have not started and wait for running ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._queue.clear()
+            self._futures.clear()
+            self._uses.clear()
+            self._predicates.clear()
+
+    def pending(self) -> tuple[PrefetchRequest, ...]:
+        """Return planned requests that have not been consumed yet."""
+        with self._lock:
+            return tuple(
+                PrefetchRequest(
+                    dataset=dataset,
+                    seasons=seasons,
+                    columns=columns,
+                    predicate=self._predicates[serialized] if serialized else None,
+                )
+                for dataset, seasons, columns, serialized in self._uses
+            )
+
+    def _key(
+        self,
+        dataset: str,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> _PrefetchKey:
+        serialized = None
+        if predicate is not None:
+            serialized = predicate.meta.serialize()
+            self._predicates.setdefault(serialized, predicate)
+        return (
+            dataset,
+            tuple(seasons),
+            None if columns is None else tuple(columns),
+            serialized,
+        )
+
+    def _advance(self) -> None:
+        while self._queue and len(self._futures) < self._lookahead:
+            key = self._queue.popleft()
+            self._futures[key] = self._executor.submit(self._fetch, key)
+
+    def _fetch(self, key: _PrefetchKey) -> pl.DataFrame:
+        dataset, seasons, columns, serialized = key
+        predicate = None if serialized is None else self._predicates[serialized]
+        if dataset == "players":
+            return self._provider.load_players()
+        if dataset == "pbp":
+            return self._provider.load_pbp(
+                seasons[0], columns=columns, predicate=predicate
+            )
+        if dataset == "player_stats":
+            return self._provider.load_player_stats(
+                seasons, columns=columns, predicate=predicate
+            )
+        loaders: dict[str, Callable[[Sequence[int]], pl.DataFrame]] = {
+            "team_stats": self._provider.load_team_stats,
+            "schedules": self._provider.load_schedules,
+            "depth_charts": self._provider.load_depth_charts,
+            "injuries": self._provider.load_injuries,
+            "rosters_weekly": self._provider.load_rosters_weekly,
+        }
+        return loaders[dataset](seasons)
+
+    def _load(
+        self,
+        dataset: str,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        with self._lock:
+            key = self._key(dataset, seasons, columns=columns, predicate=predicate)
+            future = None
+            if key in self._uses:
+                future = self._futures.get(key)
+                if future is None:
+                    self._queue.remove(key)
+                    future = self._futures[key] = self._executor.submit(
+                        self._fetch, key
+                    )
+                self._uses[key] -= 1
+                if not self._uses[key]:
+                    del self._futures[key], self._uses[key]
+                    self._advance()
+        if future is None:
+            return self._fetch(key)
+        return future.result()
+
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        return self._load("player_stats", seasons, columns=columns, predicate=predicate)
+
+    def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load("team_stats", seasons)
+
+    def load_schedules(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load("schedules", seasons)
+
+    def load_depth_charts(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load("depth_charts", seasons)
+
+    def load_injuries(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load("injuries", seasons)
+
+    def load_rosters_weekly(self, seasons: Sequence[int]) -> pl.DataFrame:
+        return self._load("rosters_weekly", seasons)
+
+    def load_players(self) -> pl.DataFrame:
+        return self._load("players", ())
+
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        return self._load("pbp", (season,), columns=columns, predicate=predicate)
+
+    def metadata(self) -> Mapping[str, str]:
+        return self._provider.metadata()
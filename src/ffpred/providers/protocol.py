@@ -7,11 +7,25 @@ from typing import Protocol
 
 import polars as pl
 
+from ffpred.errors import DataAcquisitionError
+
 
 class NflDataProvider(Protocol):
-    """Provider operations required by the acquisition layer."""
+    """Provider operations required by the acquisition layer.
+
+    ``load_player_stats`` and ``load_pbp`` accept an optional projection and
+    row predicate. The predicate may reference any source column and is applied
+    before the projection; projecting a column a season does not publish raises
+    ``DataAcquisitionError``. Omitting both returns the complete source frame.
+    """
 
-    def load_player_stats(self, seasons: Sequence[int]) -> pl.DataFrame: ...
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame: ...
 
     def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame: ...
 
@@ -25,6 +39,48 @@ class NflDataProvider(Protocol):
 
     def load_players(self) -> pl.DataFrame: ...
 
-    def load_pbp(self, season: int) -> pl.DataFrame: ...
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame: ...
 
     def metadata(self) -> Mapping[str, str]: ...
+
+
+def project_frame(
+    source: pl.DataFrame | pl.LazyFrame,
+    *,
+    columns: Sequence[str] | None,
+    predicate: pl.Expr | None,
+    name: str,
+) -> pl.DataFrame:
+    """Apply a provider projection and predicate, pushing both into scans."""
+    if columns is None and predicate is None and isinstance(source, pl.DataFrame):
+        return source
+    frame = source.lazy()
+    try:
+        if predicate is not None:
+            frame = frame.filter(predicate)
+        if columns is not None:
+            available = set(frame.collect_schema().names())
+            missing = [column for column in columns if column not in available]
+            if missing:
+                raise DataAcquisitionError(
+                    f"{name} does not publish the projected columns {missing}"
+                )
+            frame = frame.select(columns)
+        return frame.collect()
+    except pl.exceptions.PolarsError as error:
+        raise DataAcquisitionError(
+            f"Cannot apply the requested projection to {name}: {error}"
+        ) from error
+
+
+def concat_seasons(frames: Sequence[pl.DataFrame]) -> pl.DataFrame:
+    """Combine per-season frames the way nflreadpy combines multi-season loads."""
+    if len(frames) == 1:
+        return frames[0]
+    return pl.concat(frames, how="diagonal_relaxed")
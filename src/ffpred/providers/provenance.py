@@ -1,16 +1,58 @@
-"""Provider decorator that records source-frame provenance."""
+"""Provider decorator that records source-frame provenance.
+
+Frames are fingerprinted in the ``ffpred-arrow-columns-v1`` canonical form, a
+SHA-256 over the following byte stream:
+
+1. The format name, row count and ``[name, dtype]`` schema pairs as compact,
+   key-sorted JSON, prefixed by its byte length as an unsigned 64-bit
+   little-endian integer. Every later integer uses the same encoding.
+2. For each column in schema order, a validity block: ``0x00`` when the
+   column has no nulls, otherwise ``0x01`` followed by the null mask packed
+   eight rows per byte, most significant bit first.
+3. The column's values, with nulls replaced by zero, ``False`` or ``""``:
+
+   - booleans as the packed bit mask described above;
+   - integers, floats, dates, times, datetimes and durations as their physical
+     little-endian values, floats keeping their exact IEEE-754 bits;
+   - strings, categoricals, enums and binaries as ``rows + 1`` offsets into
+     the concatenated UTF-8 or raw bytes, starting at zero, then those bytes;
+   - any other dtype, such as lists, structs and decimals, as the
+     length-prefixed uncompressed Arrow IPC stream of that column alone,
+     rebuilt from its Python values so that its layout is canonical.
+
+The form is independent of chunking, slicing and the bytes behind null slots,
+so equal frames always share a digest. Fixed-width columns without nulls are
+hashed straight from their buffers without a copy. Text offsets are rebuilt
+from byte lengths and the text bytes are encoded in bounded row slices, so
+hashing needs only Polars and NumPy and never holds a whole text column as one
+Python string.
+"""
 
 from __future__ import annotations
 
 import hashlib
-import tempfile
-from collections.abc import Mapping, Sequence
+import io
+import json
+import threading
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from types import TracebackType
+from typing import Literal
 
+import numpy as np
 import polars as pl
 
 from ffpred.providers.protocol import NflDataProvider
 
+FINGERPRINT_FORMAT = "ffpred-arrow-columns-v1"
+FingerprintMode = Literal["eager", "background", "lazy"]
+
+_TEXT_DTYPES = (pl.String, pl.Categorical, pl.Enum)
+_FINGERPRINT_WORKERS = 1
+# Text and binary bytes are hashed this many rows at a time.
+_BYTES_SLICE_ROWS = 65_536
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SourceArtifact:
@@ -20,42 +62,190 @@ class SourceArtifact:
     rows: int
     sha256: str
     schema: Mapping[str, str]
+    fingerprint: str = FINGERPRINT_FORMAT
+
+
+def _length(value: int) -> bytes:
+    return value.to_bytes(8, "little")
+
+
+def _bits(mask: pl.Series) -> memoryview:
+    return np.packbits(mask.to_numpy()).data
+
+
+def _offsets(lengths: pl.Series) -> memoryview:
+    offsets = np.zeros(lengths.len() + 1, dtype="<i8")
+    np.cumsum(lengths.to_numpy(), out=offsets[1:])
+    return offsets.data
+
+
+def _sliced_bytes(values: pl.Series) -> Iterator[bytes]:
+    for start in range(0, values.len(), _BYTES_SLICE_ROWS):
+        part = values.slice(start, _BYTES_SLICE_ROWS)
+        if part.dtype == pl.Binary:
+            yield b"".join(part.to_list())
+        else:
+            text: str = part.str.join("").item()
+            yield text.encode()
+
+
+def _canonical_buffers(column: pl.Series) -> Iterator[bytes | memoryview]:
+    if column.n_chunks() > 1:
+        column = column.rechunk()
+    if column.null_count():
+        yield b"\x01"
+        yield _bits(column.is_null())
+    else:
+        yield b"\x00"
+    dtype = column.dtype
+    if dtype == pl.Null:
+        return
+    if dtype == pl.Boolean:
+        yield _bits(column.fill_null(value=False))
+    elif (dtype.is_numeric() and not dtype.is_decimal()) or dtype.is_temporal():
+        values = column.to_physical()
+        if values.null_count():
+            values = values.fill_null(0)
+        array = values.to_numpy()
+        yield array.astype(array.dtype.newbyteorder("<"), copy=False).data
+    elif dtype == pl.Binary:
+        values = column.fill_null(b"")
+        yield _offsets(values.bin.size())
+        yield from _sliced_bytes(values)
+    elif isinstance(dtype, _TEXT_DTYPES):
+        values = column.cast(pl.String).fill_null("")
+        yield _offsets(values.str.len_bytes())
+        yield from _sliced_bytes(values)
+    else:
+        # Nested layouts may keep unreachable child values behind nulls, so
+        # rare dtypes are rebuilt from their values before serializing.
+        rebuilt = pl.Series(column.name, column.to_list(), dtype=dtype)
+        buffer = io.BytesIO()
+        rebuilt.to_frame().write_ipc(buffer, compression="uncompressed")
+        yield _length(buffer.tell())
+        yield buffer.getbuffer()
 
 
 def fingerprint_frame(name: str, frame: pl.DataFrame) -> SourceArtifact:
-    """Fingerprint exact frame content using uncompressed Arrow IPC."""
-    digest = hashlib.sha256()
-    with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as buffer:
-        frame.write_ipc(buffer, compression="uncompressed")
-        buffer.seek(0)
-        for chunk in iter(lambda: buffer.read(1024 * 1024), b""):
-            digest.update(chunk)
+    """Fingerprint exact frame content in the canonical columnar form."""
+    schema = {column: str(dtype) for column, dtype in frame.schema.items()}
+    header = json.dumps(
+        {
+            "format": FINGERPRINT_FORMAT,
+            "rows": frame.height,
+            "schema": [[column, dtype] for column, dtype in schema.items()],
+        },
+        separators=(",", ":"),
+        sort_keys=True,
+    ).encode()
+    digest = hashlib.sha256(_length(len(header)))
+    digest.update(header)
+    for column in frame.iter_columns():
+        for buffer in _canonical_buffers(column):
+            digest.update(buffer)
     return SourceArtifact(
         name=name,
         rows=frame.height,
         sha256=digest.hexdigest(),
-        schema={column: str(dtype) for column, dtype in frame.schema.items()},
+        schema=schema,
     )
 
 
 class ProvenanceProvider:
-    """Record hashes while transparently delegating provider calls."""
+    """Record hashes while transparently delegating provider calls.
 
-    def __init__(self, provider: NflDataProvider) -> None:
+    Projected loads are fingerprinted as received, so a source artifact pins
+    exactly the columns and rows a build consumed. ``fingerprint="background"``
+    hashes on a worker thread while the caller keeps building, and ``"lazy"``
+    keeps each frame until ``artifacts`` is first read, typically when a
+    manifest is written. Either way ``artifacts`` lists every source in call
+    order with the same digests as the eager default. A background provider
+    owns its fingerprint thread; ``close`` waits for pending fingerprints and
+    stops it.
+    """
+
+    def __init__(
+        self,
+        provider: NflDataProvider,
+        *,
+        fingerprint: FingerprintMode = "eager",
+    ) -> None:
         self._provider = provider
-        self.artifacts: dict[str, SourceArtifact] = {}
+        self._fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._records: dict[
+            str, SourceArtifact | Future[SourceArtifact] | pl.DataFrame
+        ] = {}
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=_FINGERPRINT_WORKERS,
+                thread_name_prefix="ffpred-fingerprint",
+            )
+            if fingerprint == "background"
+            else None
+        )
+
+    def __enter__(self) -> ProvenanceProvider:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Finish pending fingerprints and stop the background thread."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    @property
+    def artifacts(self) -> dict[str, SourceArtifact]:
+        """Return every recorded source, waiting for pending fingerprints."""
+        with self._lock:
+            for name, record in self._records.items():
+                if isinstance(record, Future):
+                    self._records[name] = record.result()
+                elif isinstance(record, pl.DataFrame):
+                    self._records[name] = fingerprint_frame(name, record)
+            return {
+                name: record
+                for name, record in self._records.items()
+                if isinstance(record, SourceArtifact)
+            }
 
     def _record(self, name: str, frame: pl.DataFrame) -> pl.DataFrame:
-        self.artifacts[name] = fingerprint_frame(name, frame)
+        record: SourceArtifact | Future[SourceArtifact] | pl.DataFrame
+        if self._executor is not None:
+            record = self._executor.submit(fingerprint_frame, name, frame)
+        elif self._fingerprint == "lazy":
+            record = frame
+        else:
+            record = fingerprint_frame(name, frame)
+        with self._lock:
+            self._records[name] = record
         return frame
 
     @staticmethod
     def _season_key(seasons: Sequence[int]) -> str:
         return "-".join(str(season) for season in seasons)
 
-    def load_player_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
         name = f"player_stats:{self._season_key(seasons)}"
-        return self._record(name, self._provider.load_player_stats(seasons))
+        return self._record(
+            name,
+            self._provider.load_player_stats(
+                seasons, columns=columns, predicate=predicate
+            ),
+        )
 
     def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
         name = f"team_stats:{self._season_key(seasons)}"
@@ -80,9 +270,18 @@ class ProvenanceProvider:
     def load_players(self) -> pl.DataFrame:
         return self._record("players", self._provider.load_players())
 
-    def load_pbp(self, season: int) -> pl.DataFrame:
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
         name = f"play_by_play:{season}"
-        return self._record(name, self._provider.load_pbp(season))
+        return self._record(
+            name,
+            self._provider.load_pbp(season, columns=columns, predicate=predicate),
+        )
 
     def metadata(self) -> Mapping[str, str]:
         return self._provider.metadata()
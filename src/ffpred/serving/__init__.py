@@ -0,0 +1,13 @@
+"""Long-running local inference over persisted projection models."""
+
+from ffpred.serving.client import InferenceClient
+from ffpred.serving.server import create_server
+from ffpred.serving.service import InferenceService, ServedModel, load_archive_models
+
+__all__ = [
+    "InferenceClient",
+    "InferenceService",
+    "ServedModel",
+    "create_server",
+    "load_archive_models",
+]
@@ -0,0 +1,91 @@
+"""Minimal blocking client for the local inference server."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from typing_extensions import override
+
+from ffpred.errors import InferenceError
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: Path, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    @override
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self._socket_path))
+
+
+class InferenceClient:
+    """Send prediction requests over one persistent connection.
+
+    A client is not thread-safe; concurrent callers should each hold one.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int | None = None,
+        socket_path: Path | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        if (port is None) == (socket_path is None):
+            raise ValueError("Pass exactly one of port or socket_path")
+        self._connection = (
+            _UnixConnection(socket_path, timeout)
+            if socket_path is not None
+            else http.client.HTTPConnection(host, port, timeout=timeout)
+        )
+
+    def _request(self, method: str, path: str, payload: object = None) -> Any:
+        body = None if payload is None else json.dumps(payload).encode()
+        headers = {} if body is None else {"Content-Type": "application/json"}
+        self._connection.request(method, path, body=body, headers=headers)
+        response = self._connection.getresponse()
+        content = json.loads(response.read())
+        if response.status != http.client.OK:
+            raise InferenceError(content.get("error", response.reason))
+        return content
+
+    def predict(
+        self,
+        model: str,
+        season: int,
+        player_ids: Sequence[str],
+        *,
+        week: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return one identity-and-prediction record per matching forecast row."""
+        return self._request(
+            "POST",
+            "/predict",
+            {
+                "model": model,
+                "season": season,
+                "player_ids": list(player_ids),
+                "week": week,
+            },
+        )["rows"]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the server's request, batch and latency counters."""
+        return self._request("GET", "/stats")
+
+    def health(self) -> dict[str, Any]:
+        """Return the served ``(model, season)`` pairs."""
+        return self._request("GET", "/health")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._connection.close()
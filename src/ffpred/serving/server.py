@@ -0,0 +1,162 @@
+"""Local JSON-over-HTTP transport for the inference service.
+
+``POST /predict`` takes ``{"model", "season", "player_ids", "week"}`` and
+returns ``{"rows": [...]}`` with identity columns and a ``prediction`` per
+forecast row. ``GET /stats`` returns the latency counters and ``GET /health``
+the served models. Each connection is handled on its own thread, so
+concurrent requests reach the micro-batcher together. The server listens on a
+TCP address or, when given a path, a Unix domain socket.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import socketserver
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, cast
+
+from typing_extensions import override
+
+from ffpred.errors import InferenceError
+from ffpred.serving.service import InferenceService
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+# Unix sockets refuse connections outright once the listen backlog is full.
+REQUEST_QUEUE_SIZE = 128
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "ffpred-inference"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> InferenceService:
+        return cast("_ServiceServer", self.server).service
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        LOGGER.debug(format, *args)
+
+    def _send(self, status: HTTPStatus, payload: object) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            self._send(HTTPStatus.OK, asdict(self.service.counters.summary()))
+        elif self.path == "/health":
+            self._send(
+                HTTPStatus.OK,
+                {
+                    "models": [
+                        {"model": model, "season": season}
+                        for model, season in self.service.models
+                    ]
+                },
+            )
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/predict":
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be delimited, so the connection cannot be reused.
+            self.close_connection = True
+            self._send(HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._send(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                {"error": f"Requests are limited to {MAX_REQUEST_BYTES} bytes"},
+            )
+            return
+        try:
+            request = _predict_request(self.rfile.read(length))
+            week = request.get("week")
+            rows = self.service.predict(
+                model=str(request["model"]),
+                season=int(request["season"]),
+                player_ids=[str(player_id) for player_id in request["player_ids"]],
+                week=None if week is None else int(week),
+            )
+        except (InferenceError, KeyError, TypeError, ValueError) as error:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+            return
+        # Any other predictor failure still owes the client a response.
+        except Exception as error:
+            LOGGER.exception("Prediction request failed")
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error)})
+            return
+        self._send(HTTPStatus.OK, {"rows": rows.to_dicts()})
+
+
+def _predict_request(body: bytes) -> dict[str, Any]:
+    request = json.loads(body)
+    if not isinstance(request, dict):
+        raise TypeError("The request body must be a JSON object")
+    return request
+
+
+class _ServiceServer(socketserver.BaseServer):
+    service: InferenceService
+
+
+class InferenceHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a TCP address."""
+
+    daemon_threads = True
+    request_queue_size = REQUEST_QUEUE_SIZE
+
+    def __init__(self, address: tuple[str, int], service: InferenceService) -> None:
+        self.service = service
+        super().__init__(address, _Handler)
+
+
+class InferenceUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server bound to a Unix domain socket."""
+
+    daemon_threads = True
+    request_queue_size = REQUEST_QUEUE_SIZE
+
+    def __init__(self, path: Path, service: InferenceService) -> None:
+        self.service = service
+        if path.is_socket():
+            # A socket left behind by a previous server that did not exit.
+            path.unlink()
+        super().__init__(str(path), _Handler)
+
+    @override
+    def get_request(self) -> tuple[Any, tuple[str, int]]:
+        # HTTP handlers expect a (host, port) client address.
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def create_server(
+    service: InferenceService,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    socket_path: Path | None = None,
+) -> InferenceHTTPServer | InferenceUnixServer:
+    """Bind the service to a Unix socket when a path is given, else to TCP."""
+    if socket_path is not None:
+        return InferenceUnixServer(socket_path, service)
+    return InferenceHTTPServer((host, port), service)
@@ -0,0 +1,380 @@
+"""Memory-resident forecast inference with request micro-batching.
+
+A service holds one fitted estimator and one forecast frame per
+``(model, season)``. Concurrent requests for the same pair are queued for at
+most ``max_delay`` seconds, or until ``max_batch_rows`` rows are waiting, and
+answered by a single ``predict`` call over the stacked rows. Every request's
+wall time, from submission to its result, feeds a bounded latency window that
+reports p50 and p99.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+from sklearn.pipeline import Pipeline
+
+from ffpred.errors import InferenceError, ModelTrainingError
+from ffpred.features.all_positions import ALL_POSITION_IDENTITY_COLUMNS
+from ffpred.training.data import load_training_data
+from ffpred.training.projection import (
+    ProjectionData,
+    ProjectionModel,
+    load_projection_data,
+    projection_estimator,
+)
+from ffpred.training.protocol import Regressor
+from ffpred.training.registry import ModelRegistry, model_key
+from ffpred.training.rolling import (
+    ARCHIVE_FORECAST,
+    ARCHIVE_TRAINING_VIEW,
+    archive_seasons,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_ROWS = 4_096
+DEFAULT_MAX_DELAY = 0.002
+DEFAULT_LATENCY_WINDOW = 10_000
+PREDICTION_COLUMN = "prediction"
+
+Predictor = Callable[[NDArray[np.float64]], NDArray[np.float64]]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ServedModel:
+    """A fitted estimator and the forecast rows it answers for."""
+
+    model: str
+    season: int
+    estimator: Regressor
+    forecast: ProjectionData
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LatencySummary:
+    """Request and batch counters with latency percentiles in milliseconds."""
+
+    requests: int
+    rows: int
+    batches: int
+    mean_batch_rows: float
+    p50_ms: float | None
+    p99_ms: float | None
+
+
+class LatencyCounters:
+    """Thread-safe request counters over a bounded latency window."""
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.batch_rows = 0
+
+    def record_request(self, seconds: float, rows: int) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+            self.requests += 1
+            self.rows += rows
+
+    def record_batch(self, rows: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.batch_rows += rows
+
+    def summary(self) -> LatencySummary:
+        with self._lock:
+            latencies = np.fromiter(self._latencies, dtype=np.float64)
+            requests, rows = self.requests, self.rows
+            batches, batch_rows = self.batches, self.batch_rows
+        p50, p99 = (
+            (float(value) * 1_000 for value in np.percentile(latencies, [50, 99]))
+            if latencies.size
+            else (None, None)
+        )
+        return LatencySummary(
+            requests=requests,
+            rows=rows,
+            batches=batches,
+            mean_batch_rows=batch_rows / batches if batches else 0.0,
+            p50_ms=p50,
+            p99_ms=p99,
+        )
+
+
+@dataclass(slots=True)
+class _Pending:
+    features: NDArray[np.float64]
+    result: Future[NDArray[np.float64]]
+
+
+class MicroBatcher:
+    """Coalesce concurrent feature blocks into single ``predict`` calls."""
+
+    def __init__(
+        self,
+        predict: Predictor,
+        *,
+        counters: LatencyCounters,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        if max_batch_rows < 1:
+            raise ValueError("max_batch_rows must be positive")
+        if max_delay < 0:
+            raise ValueError("max_delay cannot be negative")
+        self._predict = predict
+        self._counters = counters
+        self.max_batch_rows = max_batch_rows
+        self.max_delay = max_delay
+        self._condition = threading.Condition()
+        self._pending: list[_Pending] = []
+        self._pending_rows = 0
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run,
+            name="ffpred-micro-batcher",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def submit(self, features: NDArray[np.float64]) -> Future[NDArray[np.float64]]:
+        """Queue rows for the next batch and return their future predictions."""
+        result: Future[NDArray[np.float64]] = Future()
+        with self._condition:
+            if self._closed:
+                raise InferenceError("The inference service is shutting down")
+            self._pending.append(_Pending(features=features, result=result))
+            self._pending_rows += features.shape[0]
+            self._condition.notify()
+        return result
+
+    def close(self) -> None:
+        """Answer everything already queued, then stop the worker."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._worker.join()
+
+    def _take(self) -> list[_Pending]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            deadline = time.monotonic() + self.max_delay
+            while not self._closed and self._pending_rows < self.max_batch_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch, self._pending = self._pending, []
+            self._pending_rows = 0
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if not batch:
+                return
+            try:
+                self._answer(batch)
+            # Failures belong to the callers waiting on this batch.
+            except Exception as error:
+                for pending in batch:
+                    if not pending.result.done():
+                        pending.result.set_exception(error)
+
+    def _answer(self, batch: list[_Pending]) -> None:
+        rows = [pending.features.shape[0] for pending in batch]
+        predictions = self._predict(
+            np.concatenate([pending.features for pending in batch])
+        )
+        if predictions.shape[0] != sum(rows):
+            raise InferenceError(
+                f"The model returned {predictions.shape[0]} predictions "
+                f"for {sum(rows)} rows"
+            )
+        self._counters.record_batch(sum(rows))
+        offsets = np.cumsum(rows)[:-1]
+        for pending, values in zip(batch, np.split(predictions, offsets), strict=True):
+            pending.result.set_result(values)
+
+
+class _ServedForecast:
+    """Row lookup and batching for one served model."""
+
+    def __init__(
+        self,
+        served: ServedModel,
+        *,
+        counters: LatencyCounters,
+        max_batch_rows: int,
+        max_delay: float,
+    ) -> None:
+        self.served = served
+        frame = served.forecast.frame
+        self.identity_columns = tuple(
+            column for column in ALL_POSITION_IDENTITY_COLUMNS if column in frame
+        )
+        self.identities = frame.select(self.identity_columns)
+        self.rows = {
+            str(player_id): np.asarray(rows, dtype=np.int64)
+            for player_id, rows in frame.with_row_index("__row")
+            .group_by("player_id", maintain_order=True)
+            .agg(pl.col("__row"))
+            .iter_rows()
+        }
+        self.weeks = frame["target_week"].to_numpy()
+        self.batcher = MicroBatcher(
+            lambda features: np.asarray(
+                served.estimator.predict(features), dtype=np.float64
+            ),
+            counters=counters,
+            max_batch_rows=max_batch_rows,
+            max_delay=max_delay,
+        )
+
+    def select(self, player_ids: Sequence[str], week: int | None) -> NDArray[np.int64]:
+        empty = np.empty(0, dtype=np.int64)
+        selected = np.concatenate(
+            [empty, *(self.rows.get(player_id, empty) for player_id in player_ids)]
+        )
+        if week is not None:
+            selected = selected[self.weeks[selected] == week]
+        return selected
+
+
+class InferenceService:
+    """Answer batched player projections from memory-resident models."""
+
+    def __init__(
+        self,
+        models: Sequence[ServedModel],
+        *,
+        max_batch_rows: int = DEFAULT_MAX_BATCH_ROWS,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        latency_window: int = DEFAULT_LATENCY_WINDOW,
+    ) -> None:
+        self.counters = LatencyCounters(latency_window)
+        self._forecasts = {
+            (served.model, served.season): _ServedForecast(
+                served,
+                counters=self.counters,
+                max_batch_rows=max_batch_rows,
+                max_delay=max_delay,
+            )
+            for served in models
+        }
+
+    @property
+    def models(self) -> tuple[tuple[str, int], ...]:
+        """Return the served ``(model, season)`` pairs."""
+        return tuple(sorted(self._forecasts))
+
+    def predict(
+        self,
+        *,
+        model: str,
+        season: int,
+        player_ids: Sequence[str],
+        week: int | None = None,
+    ) -> pl.DataFrame:
+        """Return identity columns and predictions for the requested rows.
+
+        Rows follow the order of ``player_ids`` and then forecast order; unknown
+        players are omitted.
+        """
+        started = time.perf_counter()
+        forecast = self._forecasts.get((model, season))
+        if forecast is None:
+            raise InferenceError(f"No {model} model is served for {season}")
+        rows = forecast.select(player_ids, week)
+        predictions = (
+            forecast.batcher.submit(forecast.served.forecast.features[rows]).result()
+            if rows.size
+            else np.empty(0, dtype=np.float64)
+        )
+        self.counters.record_request(time.perf_counter() - started, int(rows.size))
+        return forecast.identities[rows].with_columns(
+            pl.Series(PREDICTION_COLUMN, predictions, dtype=pl.Float64)
+        )
+
+    def close(self) -> None:
+        """Drain and stop every batching worker."""
+        for forecast in self._forecasts.values():
+            forecast.batcher.close()
+
+
+def _projection_estimator(
+    model: ProjectionModel,
+    training_path: Path,
+    forecast: ProjectionData,
+    registry: ModelRegistry | None,
+) -> tuple[Pipeline, bool]:
+    spec = projection_estimator(model, forecast.feature_names)
+    key = model_key(spec.kind, training_path, forecast.feature_names, spec.key_config)
+    stored = registry.load(key, Pipeline) if registry is not None else None
+    if stored is not None:
+        return stored[0], True
+    train = load_training_data(training_path)
+    if train.feature_names != forecast.feature_names:
+        raise ValueError("Training and forecast feature contracts do not match")
+    estimator = spec.estimator
+    estimator.fit(train.features, train.target)
+    if registry is not None:
+        registry.save(key, estimator)
+    return estimator, False
+
+
+def load_archive_models(
+    archive_dir: Path,
+    models: Sequence[ProjectionModel],
+    *,
+    seasons: Sequence[int] | None = None,
+    registry: ModelRegistry | None = None,
+) -> tuple[ServedModel, ...]:
+    """Load every archive season's forecast with its fitted projection models.
+
+    Estimators come from ``registry`` when it holds the artifact the matching
+    ``project-*`` command would store; otherwise they are fitted on the
+    season's training view and saved there for the next start.
+    """
+    target_years = archive_seasons(archive_dir) if seasons is None else seasons
+    if not target_years:
+        raise ModelTrainingError(f"No archive seasons found in {archive_dir}")
+    served: list[ServedModel] = []
+    for season in target_years:
+        season_dir = archive_dir / str(season)
+        forecast = load_projection_data(season_dir / ARCHIVE_FORECAST)
+        training_path = season_dir / ARCHIVE_TRAINING_VIEW
+        for model in models:
+            estimator, stored = _projection_estimator(
+                model, training_path, forecast, registry
+            )
+            LOGGER.info(
+                "Serving %s for %s (%s)",
+                model,
+                season,
+                "stored" if stored else "fitted",
+            )
+            served.append(
+                ServedModel(
+                    model=model,
+                    season=season,
+                    estimator=estimator,
+                    forecast=forecast,
+                )
+            )
+    return tuple(served)
@@ -1,45 +1,123 @@
-"""Named dataset conversion at the scikit-learn boundary."""
+"""Named dataset conversion at the scikit-learn boundary.
+
+Training data keeps its feature values only once, in the NumPy matrix. The
+rows' identity and period columns stay alongside it as a small frame, and any
+other source column is read back on demand, from the Parquet file or dataset
+view when the data was loaded from disk. Each feature column is copied
+straight into the matrix from its Arrow chunks, which ``to_numpy`` exposes
+without a copy when they are null-free, so ``float32`` matrices never pass
+through a ``float64`` one.
+"""
 
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 import numpy as np
 import polars as pl
 from numpy.typing import NDArray
 
-from ffpred.datasets.io import Validator, read_dataset
-from ffpred.features.all_positions import ALL_POSITION_MODEL_FEATURE_COLUMNS
+from ffpred.datasets.io import Validator, read_dataset, scan_dataset
+from ffpred.features import dst_schema, idp_schema, kicker_schema, receiving_schema
+from ffpred.features import schema as qb_schema
+from ffpred.features.all_positions import (
+    ALL_POSITION_IDENTITY_COLUMNS,
+    ALL_POSITION_MODEL_FEATURE_COLUMNS,
+)
 from ffpred.features.schema import MODEL_FEATURE_COLUMNS, TARGET_COLUMN
 
+FeatureDtype = Literal["float64", "float32"]
+
+FEATURE_DTYPES: tuple[FeatureDtype, ...] = ("float64", "float32")
+# Identity and period columns of every feature contract: all the trainers,
+# splitters and prediction writers read from a frame without asking for it.
+KEY_COLUMNS = tuple(
+    dict.fromkeys(
+        (
+            *ALL_POSITION_IDENTITY_COLUMNS,
+            *qb_schema.IDENTITY_COLUMNS,
+            *receiving_schema.IDENTITY_COLUMNS,
+            *idp_schema.IDENTITY_COLUMNS,
+            *kicker_schema.IDENTITY_COLUMNS,
+            *dst_schema.IDENTITY_COLUMNS,
+        )
+    )
+)
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class TrainingData:
-    """Typed arrays plus their source frame and feature names."""
+    """Typed arrays plus their rows' identity columns and feature names.
+
+    ``frame`` holds only the ``KEY_COLUMNS`` present in the source; ``select``
+    reads any other column from ``source``.
+    """
 
     frame: pl.DataFrame
-    features: NDArray[np.float64]
+    features: NDArray[np.floating]
     target: NDArray[np.float64]
     feature_names: tuple[str, ...]
+    source: pl.LazyFrame | None = None
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """Return every column name ``select`` can return."""
+        if self.source is None:
+            return tuple(self.frame.columns)
+        return tuple(self.source.collect_schema().names())
+
+    def select(self, columns: Sequence[str]) -> pl.DataFrame:
+        """Return the named columns in order, reading non-key ones from source."""
+        missing = [column for column in columns if column not in self.frame.columns]
+        if not missing:
+            return self.frame.select(columns)
+        if self.source is None:
+            raise ValueError(f"Training data does not retain the columns {missing}")
+        return self.frame.hstack(self.source.select(missing).collect()).select(columns)
+
+    def with_features(self, feature_names: tuple[str, ...]) -> TrainingData:
+        """Return the same rows restricted to, or reread with, other features."""
+        if set(feature_names) <= set(self.feature_names):
+            indices = [self.feature_names.index(name) for name in feature_names]
+            return dataclasses.replace(
+                self,
+                features=self.features[:, indices],
+                feature_names=feature_names,
+            )
+        return dataclasses.replace(
+            self,
+            features=_feature_matrix(
+                self.select(feature_names),
+                feature_names,
+                self.features.dtype,
+                release=True,
+            ),
+            feature_names=feature_names,
+        )
 
 
 def training_data_from_frame(
     frame: pl.DataFrame,
     feature_names: tuple[str, ...] | None = None,
+    *,
+    dtype: FeatureDtype = "float64",
 ) -> TrainingData:
-    """Convert named, schema-validated columns to typed NumPy arrays."""
+    """Convert named, schema-validated columns to typed NumPy arrays.
+
+    ``float32`` halves the matrix for estimators that fit in single precision;
+    the target stays ``float64``.
+    """
     resolved_features = feature_names or model_feature_columns(frame)
-    features = np.asarray(
-        frame.select(resolved_features).to_numpy(),
-        dtype=np.float64,
-    )
-    target = np.asarray(frame[TARGET_COLUMN].to_numpy(), dtype=np.float64)
     return TrainingData(
-        frame=frame,
-        features=features,
-        target=target,
+        frame=frame.select(column for column in KEY_COLUMNS if column in frame),
+        features=_feature_matrix(frame, resolved_features, dtype, release=False),
+        target=_target(frame),
         feature_names=resolved_features,
+        source=frame.lazy(),
     )
 
 
@@ -55,7 +133,47 @@ def load_training_data(
     feature_names: tuple[str, ...] | None = None,
     *,
     validator: Validator | None = None,
+    dtype: FeatureDtype = "float64",
 ) -> TrainingData:
-    """Load one Parquet split for model training or evaluation."""
+    """Load one Parquet split or archive dataset view for training or evaluation.
+
+    The validated frame is released column by column as its features are
+    copied, and only its key columns are kept; other columns are rescanned
+    from ``path`` when selected.
+    """
     frame = read_dataset(path, validator=validator)
-    return training_data_from_frame(frame, feature_names)
+    resolved_features = feature_names or model_feature_columns(frame)
+    target = _target(frame)
+    features = _feature_matrix(frame, resolved_features, dtype, release=True)
+    return TrainingData(
+        frame=frame.select(column for column in KEY_COLUMNS if column in frame),
+        features=features,
+        target=target,
+        feature_names=resolved_features,
+        source=scan_dataset(path),
+    )
+
+
+def _target(frame: pl.DataFrame) -> NDArray[np.float64]:
+    return np.asarray(frame[TARGET_COLUMN].to_numpy(), dtype=np.float64)
+
+
+def _feature_matrix(
+    frame: pl.DataFrame,
+    feature_names: Sequence[str],
+    dtype: FeatureDtype | np.dtype,
+    *,
+    release: bool,
+) -> NDArray[np.floating]:
+    # Columns are filled chunk by chunk so no whole-column temporary is made;
+    # ``release`` drops each column from ``frame`` once it has been copied.
+    matrix = np.empty((frame.height, len(feature_names)), dtype=dtype)
+    for index, name in enumerate(feature_names):
+        column = frame.drop_in_place(name) if release else frame.get_column(name)
+        offset = 0
+        for length in column.chunk_lengths():
+            matrix[offset : offset + length, index] = column.slice(
+                offset, length
+            ).to_numpy()
+            offset += length
+    return matrix
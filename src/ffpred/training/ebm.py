@@ -1,15 +1,25 @@
-"""Explainable Boosting Machine training and explanation export."""
+"""Explainable Boosting Machine training and explanation export.
+
+Local explanations are read straight from the model's binned term scores with
+``eval_terms``, which yields a (rows x terms) contribution matrix that sums
+with the intercept to each prediction. ``write_ebm_local_explanations`` streams
+that matrix to Parquet or Arrow IPC in bounded row chunks through
+``write_chunks``; per-row JSON terms are only built when ``train_ebm`` is
+asked for them.
+"""
 
 from __future__ import annotations
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
+import polars as pl
 from interpret.glassbox import ExplainableBoostingRegressor
 
+from ffpred.datasets.io import write_chunks
 from ffpred.evaluation.explainability import (
     ConformalPredictionInterval,
     conformal_prediction_interval,
@@ -19,6 +29,9 @@ from ffpred.evaluation.splits import chronological_calibration_split
 from ffpred.training.data import TrainingData
 from ffpred.training.result import TrainingResult
 
+LOCAL_EXPLANATION_CHUNK_ROWS = 8_192
+LOCAL_EXPLANATION_COLUMNS = ("row", "actual", "prediction", "intercept")
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class EbmConfig:
@@ -78,10 +91,13 @@ class EbmExplanations:
         self,
         identities: Sequence[Mapping[str, object]],
     ) -> dict[str, object]:
-        """Return a versioned, JSON-compatible explanation artifact."""
-        if len(identities) != len(self.local):
+        """Return a versioned, JSON-compatible explanation artifact.
+
+        Per-row ``local`` terms are included only when they were built.
+        """
+        if self.local and len(identities) != len(self.local):
             raise ValueError("Identity rows must match local explanation rows")
-        return {
+        artifact: dict[str, object] = {
             "schema_version": 1,
             "model": "ExplainableBoostingRegressor",
             "feature_names": list(self.feature_names),
@@ -95,7 +111,9 @@ class EbmExplanations:
                     for term in self.global_terms
                 ]
             },
-            "local": [
+        }
+        if self.local:
+            artifact["local"] = [
                 {
                     "row": explanation.row,
                     "identity": _json_value(identities[explanation.row]),
@@ -112,8 +130,8 @@ class EbmExplanations:
                     ],
                 }
                 for explanation in self.local
-            ],
-        }
+            ]
+        return artifact
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -152,20 +170,28 @@ def train_ebm(
     test: TrainingData,
     *,
     config: EbmConfig = DEFAULT_EBM_CONFIG,
+    local_explanations: bool = False,
+    estimator: ExplainableBoostingRegressor | None = None,
 ) -> EbmTrainingResult:
-    """Fit and evaluate an EBM with native global and local explanations."""
-    estimator = create_estimator(config, train.feature_names)
-    fit_features = train.features
-    fit_target = train.target
+    """Fit and evaluate an EBM with native global explanations.
+
+    ``local_explanations`` also builds per-row term objects for the JSON
+    artifact; the columnar export does not need them. A previously fitted
+    ``estimator`` is calibrated and explained as is instead of being refit.
+    """
+    fit_indices: np.ndarray | None = None
     calibration_indices: np.ndarray | None = None
     if config.calibration_fraction:
         fit_indices, calibration_indices = chronological_calibration_split(
             train.frame,
             config.calibration_fraction,
         )
-        fit_features = train.features[fit_indices]
-        fit_target = train.target[fit_indices]
-    estimator.fit(fit_features, fit_target)
+    if estimator is None:
+        estimator = create_estimator(config, train.feature_names)
+        if fit_indices is None:
+            estimator.fit(train.features, train.target)
+        else:
+            estimator.fit(train.features[fit_indices], train.target[fit_indices])
     predictions = np.asarray(
         estimator.predict(test.features),
         dtype=np.float64,
@@ -179,7 +205,12 @@ def train_ebm(
             predictions,
             coverage=config.interval_coverage,
         )
-    explanations = _build_explanations(estimator, test, predictions)
+    explanations = _build_explanations(
+        estimator,
+        test,
+        predictions,
+        local=local_explanations,
+    )
     return EbmTrainingResult(
         estimator=estimator,
         predictions=predictions,
@@ -216,10 +247,97 @@ def write_ebm_explanations(
     temporary.replace(path)
 
 
+def write_ebm_local_explanations(  # noqa: PLR0913
+    path: Path,
+    estimator: ExplainableBoostingRegressor,
+    test: TrainingData,
+    predictions: np.ndarray,
+    *,
+    identities: pl.DataFrame,
+    chunk_rows: int = LOCAL_EXPLANATION_CHUNK_ROWS,
+) -> None:
+    """Atomically stream per-term local contributions as Parquet or Arrow IPC.
+
+    Each row holds its identity columns, ``row``, ``actual``, ``prediction``
+    and ``intercept``, then one contribution column per EBM term named as the
+    term; contributions and the intercept sum to the prediction. At most
+    ``chunk_rows`` rows are scored and held in memory at a time, and each
+    chunk becomes one Parquet row group. A ``.arrow`` or ``.ipc`` suffix
+    selects Arrow IPC; any other suffix writes Parquet.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least one")
+    rows = test.features.shape[0]
+    if identities.height != rows or predictions.shape[0] != rows:
+        raise ValueError("Identity and prediction rows must match the test rows")
+    term_names = tuple(str(name) for name in estimator.term_names_)
+    reserved = set(identities.columns) | set(LOCAL_EXPLANATION_COLUMNS)
+    clashes = sorted(reserved.intersection(term_names))
+    if clashes:
+        raise ValueError(f"EBM term names clash with explanation columns: {clashes}")
+    schema = pl.Schema(
+        {
+            **identities.schema,
+            "row": pl.Int64,
+            "actual": pl.Float64,
+            "prediction": pl.Float64,
+            "intercept": pl.Float64,
+            **dict.fromkeys(term_names, pl.Float64),
+        }
+    )
+
+    write_chunks(
+        path,
+        _local_explanation_chunks(
+            estimator,
+            test,
+            predictions,
+            identities=identities,
+            term_names=term_names,
+            chunk_rows=chunk_rows,
+        ),
+        schema=schema,
+        row_group_rows=chunk_rows,
+    )
+
+
+def _local_explanation_chunks(  # noqa: PLR0913
+    estimator: ExplainableBoostingRegressor,
+    test: TrainingData,
+    predictions: np.ndarray,
+    *,
+    identities: pl.DataFrame,
+    term_names: tuple[str, ...],
+    chunk_rows: int,
+) -> Iterator[pl.DataFrame]:
+    rows = test.features.shape[0]
+    intercept = float(estimator.intercept_)
+    for start in range(0, rows, chunk_rows):
+        stop = min(start + chunk_rows, rows)
+        contributions = np.asarray(
+            estimator.eval_terms(test.features[start:stop]),
+            dtype=np.float64,
+        ).reshape(stop - start, len(term_names))
+        yield identities.slice(start, stop - start).hstack(
+            [
+                pl.Series("row", np.arange(start, stop, dtype=np.int64)),
+                pl.Series("actual", test.target[start:stop], pl.Float64),
+                pl.Series("prediction", predictions[start:stop], pl.Float64),
+                pl.Series("intercept", np.full(stop - start, intercept)),
+                *(
+                    pl.Series(name, contributions[:, index])
+                    for index, name in enumerate(term_names)
+                ),
+            ]
+        )
+
+
 def _build_explanations(
     estimator: ExplainableBoostingRegressor,
     test: TrainingData,
     predictions: np.ndarray,
+    *,
+    local: bool,
 ) -> EbmExplanations:
     global_explanation = estimator.explain_global()
     importances = np.asarray(estimator.term_importances(), dtype=np.float64)
@@ -233,62 +351,59 @@ def _build_explanations(
             zip(estimator.term_names_, importances, strict=True)
         )
     )
-
-    local_explanation = estimator.explain_local(test.features, test.target)
-    local_rows: list[LocalExplanation] = []
-    for index, (actual, prediction) in enumerate(
-        zip(test.target, predictions, strict=True)
-    ):
-        data = _mapping(local_explanation.data(index))
-        names = _sequence(data["names"])
-        values = _sequence(data["values"])
-        scores = _sequence(data["scores"])
-        terms = tuple(
-            LocalTermExplanation(
-                name=str(name),
-                value=_local_term_value(
-                    str(name),
-                    value,
-                    test,
-                    index,
-                ),
-                contribution=_float_value(score),
-            )
-            for name, value, score in zip(names, values, scores, strict=True)
-        )
-        local_rows.append(
-            LocalExplanation(
-                row=index,
-                actual=float(actual),
-                prediction=float(prediction),
-                intercept=float(estimator.intercept_),
-                terms=terms,
-            )
-        )
     return EbmExplanations(
         feature_names=test.feature_names,
         global_terms=global_terms,
-        local=tuple(local_rows),
+        local=_local_explanations(estimator, test, predictions) if local else (),
+    )
+
+
+def _local_explanations(
+    estimator: ExplainableBoostingRegressor,
+    test: TrainingData,
+    predictions: np.ndarray,
+) -> tuple[LocalExplanation, ...]:
+    contributions = np.asarray(estimator.eval_terms(test.features), dtype=np.float64)
+    terms = tuple(
+        (str(name), tuple(int(feature) for feature in features))
+        for name, features in zip(
+            estimator.term_names_, estimator.term_features_, strict=True
+        )
+    )
+    intercept = float(estimator.intercept_)
+    return tuple(
+        LocalExplanation(
+            row=row,
+            actual=float(actual),
+            prediction=float(prediction),
+            intercept=intercept,
+            terms=tuple(
+                LocalTermExplanation(
+                    name=name,
+                    value=_local_term_value(test, row, features),
+                    contribution=float(contribution),
+                )
+                for (name, features), contribution in zip(
+                    terms, contributions[row], strict=True
+                )
+            ),
+        )
+        for row, (actual, prediction) in enumerate(
+            zip(test.target, predictions, strict=True)
+        )
     )
 
 
 def _local_term_value(
-    name: str,
-    value: object,
     test: TrainingData,
     row: int,
+    features: tuple[int, ...],
 ) -> object:
-    feature_indices = {
-        feature: index for index, feature in enumerate(test.feature_names)
-    }
-    interaction_features = name.split(" & ")
-    if len(interaction_features) == 1:
-        return _json_value(value)
-    if not all(feature in feature_indices for feature in interaction_features):
-        raise ValueError(f"Unknown EBM interaction term {name!r}")
+    if len(features) == 1:
+        return float(test.features[row, features[0]])
     return {
-        feature: float(test.features[row, feature_indices[feature]])
-        for feature in interaction_features
+        test.feature_names[feature]: float(test.features[row, feature])
+        for feature in features
     }
 
 
@@ -298,14 +413,6 @@ def _mapping(value: object) -> Mapping[str, object]:
     return {str(key): item for key, item in value.items()}
 
 
-def _sequence(value: object) -> Sequence[object]:
-    if isinstance(value, np.ndarray):
-        value = value.tolist()
-    if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
-        raise TypeError("InterpretML explanation values must be a sequence")
-    return value
-
-
 def _json_mapping(value: object) -> dict[str, object]:
     converted = _json_value(_mapping(value))
     if not isinstance(converted, dict):
@@ -313,12 +420,6 @@ def _json_mapping(value: object) -> dict[str, object]:
     return {str(key): item for key, item in converted.items()}
 
 
-def _float_value(value: object) -> float:
-    if not isinstance(value, (int, float, np.integer, np.floating)):
-        raise TypeError("InterpretML explanation scores must be numeric")
-    return float(value)
-
-
 def _json_value(value: object) -> object:
     if isinstance(value, np.ndarray):
         return [_json_value(item) for item in value.tolist()]
@@ -77,13 +77,15 @@ def train_mlp(
     test: TrainingData,
     *,
     config: MlpConfig = DEFAULT_MLP_CONFIG,
+    estimator: Pipeline | None = None,
 ) -> TrainingResult:
-    """Fit and evaluate a scaled deterministic MLP."""
-    estimator = create_estimator(config)
-    prediction = np.asarray(
-        estimator.fit(train.features, train.target).predict(test.features),
-        dtype=np.float64,
-    )
+    """Fit and evaluate a scaled deterministic MLP.
+
+    A previously fitted ``estimator`` is evaluated as is instead of being refit.
+    """
+    if estimator is None:
+        estimator = create_estimator(config).fit(train.features, train.target)
+    prediction = np.asarray(estimator.predict(test.features), dtype=np.float64)
     return TrainingResult(
         estimator=estimator,
         predictions=prediction,
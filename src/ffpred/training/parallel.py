@@ -0,0 +1,251 @@
+"""Concurrent training of several model families on one loaded split.
+
+The train and test matrices are copied once into named shared-memory blocks.
+Each worker process maps them read-only when it starts, so no model re-reads
+the Parquet files or receives its own pickled copy of the features. Only the
+period columns of each frame travel with them, which is all the chronological
+calibration split needs. Every model runs in its own process under a CPU
+budget: native BLAS and OpenMP pools are capped with ``threadpoolctl``, and
+the EBM's own ``n_jobs`` is expected to match its budget.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Literal
+
+import numpy as np
+import polars as pl
+from interpret.glassbox import ExplainableBoostingRegressor
+from joblib.externals.loky import get_reusable_executor
+from numpy.typing import NDArray
+from sklearn.pipeline import Pipeline
+from threadpoolctl import threadpool_limits
+
+from ffpred.errors import ModelTrainingError
+from ffpred.training.data import TrainingData
+from ffpred.training.ebm import EbmConfig, train_ebm
+from ffpred.training.mlp import MlpConfig, train_mlp
+from ffpred.training.result import TrainingResult
+from ffpred.training.svr import SvrConfig, train_svr
+from ffpred.workers import WorkerSlot
+
+ParallelModel = Literal["svr", "mlp", "ebm"]
+
+PARALLEL_MODELS: tuple[ParallelModel, ...] = ("svr", "mlp", "ebm")
+PERIOD_COLUMNS = ("target_season", "target_week")
+# libsvm and liblinear fit on one thread, so SVR never needs a larger budget.
+SINGLE_THREADED_MODELS = frozenset({"svr"})
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelJob:
+    """One model family to fit, with its configuration and CPU budget.
+
+    A previously fitted ``estimator`` is evaluated as is instead of being refit.
+    """
+
+    model: ParallelModel
+    config: SvrConfig | MlpConfig | EbmConfig
+    cpus: int
+    estimator: Pipeline | ExplainableBoostingRegressor | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelRun:
+    """A finished job with its wall time."""
+
+    model: ParallelModel
+    result: TrainingResult
+    cpus: int
+    seconds: float
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SharedArray:
+    """Location of a NumPy array in a named shared-memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SharedTrainingData:
+    """Picklable handle to a split whose arrays live in shared memory."""
+
+    periods: pl.DataFrame
+    features: SharedArray
+    target: SharedArray
+    feature_names: tuple[str, ...]
+
+
+_SPLIT: WorkerSlot[tuple[TrainingData, TrainingData]] = WorkerSlot("training-split")
+# Views into attached blocks stay valid while the blocks are referenced.
+_BLOCKS: WorkerSlot[list[SharedMemory]] = WorkerSlot("training-blocks")
+
+
+def cpu_budgets(
+    models: Sequence[ParallelModel],
+    cpus: int | None = None,
+    *,
+    overrides: Mapping[str, int] | None = None,
+) -> dict[ParallelModel, int]:
+    """Divide ``cpus``, by default every available CPU, between the models.
+
+    Each model gets at least one CPU. Single-threaded models get exactly one
+    and the rest is shared by the others, later models taking any remainder,
+    so the EBM's bagging gets the largest share. ``overrides`` pins budgets.
+    """
+    total = cpus if cpus is not None else os.cpu_count() or 1
+    pinned = dict(overrides or {})
+    if total < 1 or any(budget < 1 for budget in pinned.values()):
+        raise ModelTrainingError("CPU budgets must be positive")
+    budgets: dict[ParallelModel, int] = {
+        model: pinned.get(model, 1) for model in models
+    }
+    threaded = [
+        model
+        for model in models
+        if model not in SINGLE_THREADED_MODELS and model not in pinned
+    ]
+    spare = max(total - sum(budgets.values()), 0)
+    if threaded:
+        share, extra = divmod(spare, len(threaded))
+        for index, model in enumerate(threaded):
+            budgets[model] += share + (index >= len(threaded) - extra)
+    return budgets
+
+
+def _fit(
+    job: ModelJob,
+    train: TrainingData,
+    test: TrainingData,
+) -> TrainingResult:
+    config = job.config
+    estimator = job.estimator
+    if isinstance(config, EbmConfig):
+        return train_ebm(
+            train,
+            test,
+            config=config,
+            estimator=(
+                estimator
+                if isinstance(estimator, ExplainableBoostingRegressor)
+                else None
+            ),
+        )
+    pipeline = estimator if isinstance(estimator, Pipeline) else None
+    if isinstance(config, SvrConfig):
+        return train_svr(train, test, config=config, estimator=pipeline)
+    return train_mlp(train, test, config=config, estimator=pipeline)
+
+
+def _run_job(
+    job: ModelJob,
+    train: TrainingData,
+    test: TrainingData,
+) -> ModelRun:
+    started = time.perf_counter()
+    with threadpool_limits(limits=job.cpus):
+        result = _fit(job, train, test)
+    return ModelRun(
+        model=job.model,
+        result=result,
+        cpus=job.cpus,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _share_array(array: NDArray[np.floating], stack: ExitStack) -> SharedArray:
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    stack.callback(block.unlink)
+    stack.callback(block.close)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return SharedArray(name=block.name, shape=array.shape, dtype=array.dtype.str)
+
+
+@contextmanager
+def shared_training_data(
+    *splits: TrainingData,
+) -> Iterator[tuple[SharedTrainingData, ...]]:
+    """Copy each split's arrays into shared memory for the duration."""
+    with ExitStack() as stack:
+        yield tuple(
+            SharedTrainingData(
+                periods=data.frame.select(PERIOD_COLUMNS),
+                features=_share_array(data.features, stack),
+                target=_share_array(data.target, stack),
+                feature_names=data.feature_names,
+            )
+            for data in splits
+        )
+
+
+def _attach_array(
+    shared: SharedArray, blocks: list[SharedMemory]
+) -> NDArray[np.float64]:
+    block = SharedMemory(name=shared.name)
+    blocks.append(block)
+    array = np.ndarray(shared.shape, dtype=shared.dtype, buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+
+def _attach(shared: SharedTrainingData, blocks: list[SharedMemory]) -> TrainingData:
+    return TrainingData(
+        frame=shared.periods,
+        features=_attach_array(shared.features, blocks),
+        target=_attach_array(shared.target, blocks),
+        feature_names=shared.feature_names,
+    )
+
+
+def _install_split(train: SharedTrainingData, test: SharedTrainingData) -> None:
+    blocks: list[SharedMemory] = []
+    _SPLIT.install((_attach(train, blocks), _attach(test, blocks)))
+    _BLOCKS.install(blocks)
+
+
+def _run_shared_job(job: ModelJob) -> ModelRun:
+    try:
+        return _run_job(job, *_SPLIT.get())
+    finally:
+        # The EBM bags on joblib's reusable loky executor. Its idle workers
+        # are children of this process, which would otherwise wait for loky's
+        # idle timeout before it could exit at pool shutdown.
+        get_reusable_executor().shutdown(wait=True)
+
+
+def train_models(
+    train: TrainingData,
+    test: TrainingData,
+    jobs: Sequence[ModelJob],
+) -> tuple[ModelRun, ...]:
+    """Fit every job on the same split, concurrently when there are several.
+
+    Results are returned in job order. A single job runs in this process.
+    """
+    if not jobs:
+        raise ModelTrainingError("At least one model is required")
+    if train.feature_names != test.feature_names:
+        raise ModelTrainingError("Training and test feature contracts do not match")
+    if len(jobs) == 1:
+        return (_run_job(jobs[0], train, test),)
+    with (
+        shared_training_data(train, test) as (shared_train, shared_test),
+        ProcessPoolExecutor(
+            max_workers=len(jobs),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_install_split,
+            initargs=(shared_train, shared_test),
+        ) as executor,
+    ):
+        return tuple(executor.map(_run_shared_job, jobs))
@@ -1,17 +1,38 @@
-"""Model inference over target-free point-in-time forecast rows."""
+"""Model inference over target-free point-in-time forecast rows.
+
+``predict_forecast_chunks`` reads, validates and predicts a forecast table a
+bounded number of rows at a time, for writers that stream their output.
+"""
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 import numpy as np
 import polars as pl
 from numpy.typing import NDArray
+from sklearn.pipeline import Pipeline
 
-from ffpred.datasets.io import read_forecast
+from ffpred.datasets.io import read_forecast, read_forecast_chunks
+from ffpred.features.all_positions import ALL_POSITION_MODEL_FEATURE_COLUMNS
 from ffpred.training.data import TrainingData, model_feature_columns
+from ffpred.training.mlp import MlpConfig, create_archive_estimator
+from ffpred.training.mlp import create_estimator as create_mlp
 from ffpred.training.protocol import Regressor
+from ffpred.training.svr import (
+    DEFAULT_SVR_CONFIG,
+    SvrConfig,
+    create_scalable_estimator,
+)
+from ffpred.training.svr import create_estimator as create_svr
+
+ProjectionModel = Literal["svr", "mlp"]
+
+PREDICTION_COLUMN = "prediction"
+PREDICTION_CHUNK_ROWS = 65_536
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -23,6 +44,54 @@ class ProjectionData:
     feature_names: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ProjectionEstimator:
+    """Unfitted projection estimator and the identity it is stored under."""
+
+    kind: str
+    config: SvrConfig | MlpConfig
+    estimator: Pipeline
+
+    @property
+    def key_config(self) -> dict[str, object]:
+        """Return what a fitted copy is keyed on: config and estimator settings.
+
+        Archive factories fix parameters that are not in ``config``, so the
+        unfitted estimator's own parameters are part of the key.
+        """
+        return {"config": self.config, "estimator": self.estimator}
+
+
+def projection_estimator(
+    model: ProjectionModel,
+    feature_names: tuple[str, ...],
+) -> ProjectionEstimator:
+    """Choose the estimator a projection fits for a feature contract.
+
+    The all-position archive uses the linear SVR and early-stopping MLP; the
+    QB contract uses the default training estimators.
+    """
+    is_archive = feature_names == ALL_POSITION_MODEL_FEATURE_COLUMNS
+    if model == "svr":
+        return ProjectionEstimator(
+            kind="linear-svr" if is_archive else "svr",
+            config=DEFAULT_SVR_CONFIG,
+            estimator=(
+                create_scalable_estimator()
+                if is_archive
+                else create_svr(DEFAULT_SVR_CONFIG)
+            ),
+        )
+    config = MlpConfig()
+    return ProjectionEstimator(
+        kind="archive-mlp" if is_archive else "mlp",
+        config=config,
+        estimator=create_archive_estimator(config)
+        if is_archive
+        else create_mlp(config),
+    )
+
+
 def load_projection_data(path: Path) -> ProjectionData:
     """Load a forecast artifact for model inference."""
     frame = read_forecast(path)
@@ -42,11 +111,42 @@ def project(
     estimator: Regressor,
     train: TrainingData,
     forecast: ProjectionData,
+    *,
+    fit: bool = True,
 ) -> NDArray[np.float64]:
-    """Fit on completed games and predict frozen forecast rows."""
+    """Fit on completed games and predict frozen forecast rows.
+
+    ``fit=False`` predicts with an estimator already fitted on ``train``.
+    """
     if train.feature_names != forecast.feature_names:
         raise ValueError("Training and forecast feature contracts do not match")
-    return np.asarray(
-        estimator.fit(train.features, train.target).predict(forecast.features),
-        dtype=np.float64,
-    )
+    if fit:
+        estimator = estimator.fit(train.features, train.target)
+    return np.asarray(estimator.predict(forecast.features), dtype=np.float64)
+
+
+def predict_forecast_chunks(
+    estimator: Regressor,
+    forecast_path: Path,
+    feature_names: tuple[str, ...],
+    *,
+    columns: Sequence[str],
+    chunk_rows: int = PREDICTION_CHUNK_ROWS,
+) -> Iterator[pl.DataFrame]:
+    """Predict a forecast table chunk by chunk with an already fitted estimator.
+
+    Each chunk keeps ``columns`` of its rows, in order, followed by a
+    ``prediction`` column.
+    """
+    for chunk in read_forecast_chunks(forecast_path, chunk_rows):
+        if model_feature_columns(chunk) != feature_names:
+            raise ValueError("Training and forecast feature contracts do not match")
+        features = np.asarray(chunk.select(feature_names).to_numpy(), np.float64)
+        predictions = (
+            np.asarray(estimator.predict(features), dtype=np.float64)
+            if chunk.height
+            else np.empty(0, dtype=np.float64)
+        )
+        yield chunk.select(columns).with_columns(
+            pl.Series(PREDICTION_COLUMN, predictions, dtype=pl.Float64)
+        )
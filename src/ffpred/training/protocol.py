@@ -13,11 +13,11 @@ class Regressor(Protocol):
 
     def fit(
         self,
-        features: NDArray[np.float64],
+        features: NDArray[np.floating],
         target: NDArray[np.float64],
     ) -> Self: ...
 
     def predict(
         self,
-        features: NDArray[np.float64],
+        features: NDArray[np.floating],
     ) -> NDArray[np.float64]: ...
@@ -0,0 +1,324 @@
+"""Content-addressed store of fitted estimators.
+
+An artifact is keyed by the SHA-256 of the training file it was fitted on, the
+ordered feature names, and a hash of the model configuration, together with
+the installed scikit-learn and interpret versions. An entry is therefore only
+reused for the exact training bytes, feature contract, hyperparameters, and
+libraries that produced it. Estimators are written uncompressed with joblib
+and loaded with memory-mapped, read-only arrays, next to a JSON record that is
+written last. When ``max_bytes`` is set, the least recently loaded artifacts
+are evicted after each save.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, TypeVar
+
+import joblib
+from sklearn.base import BaseEstimator
+
+from ffpred.datasets.io import file_sha256
+from ffpred.errors import ConfigurationError
+
+LOGGER = logging.getLogger(__name__)
+
+REGISTRY_FORMAT = "ffpred-model-registry-v1"
+ARTIFACT_SUFFIX = ".joblib"
+RECORD_SUFFIX = ".json"
+_LIBRARIES = ("scikit-learn", "interpret")
+
+T = TypeVar("T")
+
+
+def _library_versions() -> dict[str, str]:
+    versions: dict[str, str] = {}
+    for library in _LIBRARIES:
+        try:
+            versions[library] = version(library)
+        except PackageNotFoundError:
+            versions[library] = "missing"
+    return versions
+
+
+def _canonical(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "type": type(value).__name__,
+            "fields": {
+                field.name: _canonical(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, BaseEstimator):
+        return {
+            "type": type(value).__name__,
+            "params": _canonical(value.get_params(deep=False)),
+        }
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Cannot hash model configuration value {value!r}")
+
+
+def config_sha256(config: object) -> str:
+    """Hash a configuration dataclass, or nested plain values, canonically.
+
+    Unfitted scikit-learn estimators hash as their class and constructor
+    parameters, so settings fixed by an estimator factory are covered too.
+    """
+    payload = json.dumps(_canonical(config), separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelKey:
+    """Everything that determines a fitted estimator."""
+
+    model: str
+    training_sha256: str
+    feature_names: tuple[str, ...]
+    config_sha256: str
+
+    @property
+    def digest(self) -> str:
+        """Return the content address of the estimator this key describes."""
+        payload = json.dumps(
+            {
+                "format": REGISTRY_FORMAT,
+                "model": self.model,
+                "training_sha256": self.training_sha256,
+                "feature_names": list(self.feature_names),
+                "config_sha256": self.config_sha256,
+                "libraries": _library_versions(),
+            },
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def model_key(
+    model: str,
+    training_path: Path,
+    feature_names: Sequence[str],
+    config: object,
+) -> ModelKey:
+    """Key an estimator by its training file, features, and configuration."""
+    return ModelKey(
+        model=model,
+        training_sha256=file_sha256(training_path),
+        feature_names=tuple(feature_names),
+        config_sha256=config_sha256(config),
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ModelArtifact:
+    """One stored estimator and the key that produced it."""
+
+    digest: str
+    model: str
+    path: str
+    bytes: int
+    sha256: str
+    training_sha256: str
+    feature_names: tuple[str, ...]
+    config_sha256: str
+    created_at: str
+    last_used_at: float
+    metadata: Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RegistryStats:
+    """Counters describing how a registry served its requests."""
+
+    hits: int
+    misses: int
+    evictions: int
+    artifacts: int
+    bytes: int
+
+
+class ModelRegistry:
+    """Save and reuse fitted estimators under ``root/<model>/<digest>``."""
+
+    def __init__(self, root: Path, *, max_bytes: int | None = None) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ConfigurationError("Model registry max_bytes must be positive")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: ModelKey) -> Path:
+        return self.root / key.model / f"{key.digest}{ARTIFACT_SUFFIX}"
+
+    def _artifact(self, record_path: Path) -> ModelArtifact | None:
+        artifact_path = record_path.with_suffix(ARTIFACT_SUFFIX)
+        try:
+            record = json.loads(record_path.read_text(encoding="utf-8"))
+            stat = artifact_path.stat()
+            record_bytes = record_path.stat().st_size
+        except (OSError, ValueError):
+            return None
+        if record.get("format") != REGISTRY_FORMAT:
+            return None
+        return ModelArtifact(
+            digest=record_path.stem,
+            model=record["model"],
+            path=str(artifact_path),
+            bytes=stat.st_size + record_bytes,
+            sha256=record["sha256"],
+            training_sha256=record["training_sha256"],
+            feature_names=tuple(record["feature_names"]),
+            config_sha256=record["config_sha256"],
+            created_at=record["created_at"],
+            last_used_at=stat.st_atime,
+            metadata=record["metadata"],
+        )
+
+    def artifacts(self) -> tuple[ModelArtifact, ...]:
+        """Return stored artifacts, most recently used first."""
+        if not self.root.exists():
+            return ()
+        artifacts = (
+            self._artifact(path) for path in self.root.glob(f"*/*{RECORD_SUFFIX}")
+        )
+        return tuple(
+            sorted(
+                (artifact for artifact in artifacts if artifact is not None),
+                key=lambda artifact: artifact.last_used_at,
+                reverse=True,
+            )
+        )
+
+    def stats(self) -> RegistryStats:
+        """Return hit, miss and eviction counts with the current store size."""
+        artifacts = self.artifacts()
+        return RegistryStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            artifacts=len(artifacts),
+            bytes=sum(artifact.bytes for artifact in artifacts),
+        )
+
+    def load(
+        self,
+        key: ModelKey,
+        kind: type[T],
+    ) -> tuple[T, ModelArtifact] | None:
+        """Return the stored estimator for ``key``, or ``None`` on a miss.
+
+        An artifact whose bytes no longer match its record is removed and
+        counted as a miss, so the caller refits and saves a fresh copy.
+        """
+        path = self._path(key)
+        artifact = self._artifact(path.with_suffix(RECORD_SUFFIX))
+        estimator = None
+        if artifact is not None:
+            if file_sha256(path) == artifact.sha256:
+                estimator = joblib.load(path, mmap_mode="r")
+            else:
+                LOGGER.warning("Discarding corrupted model artifact %s", path)
+        if artifact is None or not isinstance(estimator, kind):
+            if artifact is not None:
+                self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+        os.utime(path, (time.time(), path.stat().st_mtime))
+        with self._lock:
+            self.hits += 1
+        return estimator, artifact
+
+    def save(
+        self,
+        key: ModelKey,
+        estimator: object,
+        *,
+        metadata: Mapping[str, object] | None = None,
+    ) -> ModelArtifact:
+        """Persist a fitted estimator, replacing any entry with the same key."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        temporary = path.with_suffix(f"{ARTIFACT_SUFFIX}{suffix}")
+        joblib.dump(estimator, temporary, compress=0)
+        sha256 = file_sha256(temporary)
+        temporary.replace(path)
+        record_path = path.with_suffix(RECORD_SUFFIX)
+        record_temporary = path.with_suffix(f"{RECORD_SUFFIX}{suffix}")
+        record_temporary.write_text(
+            json.dumps(
+                {
+                    "format": REGISTRY_FORMAT,
+                    "model": key.model,
+                    "sha256": sha256,
+                    "training_sha256": key.training_sha256,
+                    "feature_names": list(key.feature_names),
+                    "config_sha256": key.config_sha256,
+                    "libraries": _library_versions(),
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "metadata": dict(metadata or {}),
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        record_temporary.replace(record_path)
+        if self.max_bytes is not None:
+            self.evict(max_bytes=self.max_bytes, keep=key.digest)
+        artifact = self._artifact(record_path)
+        if artifact is None:
+            raise OSError(f"Model artifact {path} disappeared while saving")
+        return artifact
+
+    def _remove(self, path: Path) -> None:
+        # The record goes first so a half-removed entry is never listed.
+        path.with_suffix(RECORD_SUFFIX).unlink(missing_ok=True)
+        path.unlink(missing_ok=True)
+
+    def evict(
+        self,
+        *,
+        max_bytes: int,
+        keep: str | None = None,
+    ) -> tuple[ModelArtifact, ...]:
+        """Remove least recently used artifacts until the store fits."""
+        if max_bytes < 0:
+            raise ConfigurationError("Model registry max_bytes cannot be negative")
+        evicted: list[ModelArtifact] = []
+        with self._lock:
+            artifacts = self.artifacts()
+            total = sum(artifact.bytes for artifact in artifacts)
+            for artifact in reversed(artifacts):
+                if total <= max_bytes:
+                    break
+                if artifact.digest == keep:
+                    continue
+                self._remove(Path(artifact.path))
+                total -= artifact.bytes
+                evicted.append(artifact)
+            self.evictions += len(evicted)
+        return tuple(evicted)
@@ -0,0 +1,245 @@
+"""Warm-started rolling-origin projections over a forecast archive.
+
+Season ``N`` of an archive trains on the partitions of season ``N - 1`` plus
+one more completed season, so the rolling mode reads each training partition
+once, updates one ``StandardScaler`` with ``partial_fit`` on the new rows only,
+and continues optimizing the previous season's weights. The MLP resumes from
+its previous coefficients through ``partial_fit`` epochs with the archive
+estimator's early-stopping rule. ``LinearSVR``'s liblinear solver cannot be
+seeded, so the rolling SVR minimizes the same L2-regularized
+epsilon-insensitive objective with a warm-started ``SGDRegressor``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+from numpy.typing import NDArray
+from sklearn.base import clone
+from sklearn.linear_model import SGDRegressor
+from sklearn.model_selection import train_test_split
+from sklearn.neural_network import MLPRegressor
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from ffpred.datasets.io import dataset_view_partitions, read_dataset
+from ffpred.errors import DatasetIntegrityError, ModelTrainingError
+from ffpred.training.data import training_data_from_frame
+from ffpred.training.mlp import create_archive_estimator
+from ffpred.training.projection import ProjectionData, load_projection_data
+from ffpred.training.svr import (
+    DEFAULT_SVR_CONFIG,
+    SvrConfig,
+    create_scalable_estimator,
+)
+
+RollingModel = Literal["svr", "mlp"]
+
+ARCHIVE_TRAINING_VIEW = "training.json"
+ARCHIVE_FORECAST = "forecast.parquet"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RollingSeason:
+    """Warm-started predictions for one archive season and their cold baseline."""
+
+    target_year: int
+    forecast: ProjectionData
+    training_rows: int
+    new_training_rows: int
+    predictions: NDArray[np.float64]
+    seconds: float
+    cold_predictions: NDArray[np.float64] | None
+    cold_seconds: float | None
+
+
+class WarmStartSvr:
+    """Linear epsilon-insensitive regression that resumes from its last fit."""
+
+    def __init__(self, config: SvrConfig = DEFAULT_SVR_CONFIG) -> None:
+        self.config = config
+        self.regressor = SGDRegressor(
+            loss="epsilon_insensitive",
+            epsilon=config.epsilon,
+            penalty="l2",
+            max_iter=1_000,
+            tol=1e-4,
+            random_state=42,
+            warm_start=True,
+        )
+
+    def fit(
+        self,
+        features: NDArray[np.float64],
+        target: NDArray[np.float64],
+    ) -> WarmStartSvr:
+        # SGD scales the penalty by 1 / rows while liblinear weighs the loss
+        # by C, so this alpha keeps the LinearSVR optimum as the window grows.
+        self.regressor.set_params(alpha=1 / (self.config.c * features.shape[0]))
+        self.regressor.fit(features, target)
+        return self
+
+    def predict(self, features: NDArray[np.float64]) -> NDArray[np.float64]:
+        return np.asarray(self.regressor.predict(features), dtype=np.float64)
+
+
+class WarmStartMlp:
+    """Archive MLP that continues from its previous coefficients."""
+
+    def __init__(self, template: MLPRegressor | None = None) -> None:
+        regressor = template or create_archive_estimator().named_steps["regressor"]
+        self.template = regressor
+        # partial_fit rejects sklearn's own early stopping, which also keeps
+        # its best score across fits; the equivalent rule is applied per fit.
+        # Each fit spends at most the template's max_iter epochs, while the
+        # regressor's own iteration counter runs on across every season, so
+        # its limit is lifted out of reach.
+        self.regressor = clone(regressor).set_params(
+            early_stopping=False, max_iter=sys.maxsize
+        )
+
+    def fit(
+        self,
+        features: NDArray[np.float64],
+        target: NDArray[np.float64],
+    ) -> WarmStartMlp:
+        template = self.template
+        fit_features, validation_features, fit_target, validation_target = (
+            train_test_split(
+                features,
+                target,
+                test_size=template.validation_fraction,
+                random_state=template.random_state,
+            )
+        )
+        regressor = self.regressor
+        best_score = -np.inf
+        best: tuple[list[NDArray[np.float64]], list[NDArray[np.float64]]] | None = None
+        stale = 0
+        for _ in range(template.max_iter):
+            regressor.partial_fit(fit_features, fit_target)
+            score = float(regressor.score(validation_features, validation_target))
+            stale = stale + 1 if score < best_score + template.tol else 0
+            if score > best_score:
+                best_score = score
+                best = (
+                    [coef.copy() for coef in regressor.coefs_],
+                    [intercept.copy() for intercept in regressor.intercepts_],
+                )
+            if stale > template.n_iter_no_change:
+                break
+        if best is not None:
+            regressor.coefs_, regressor.intercepts_ = best
+        return self
+
+    def predict(self, features: NDArray[np.float64]) -> NDArray[np.float64]:
+        return np.asarray(self.regressor.predict(features), dtype=np.float64)
+
+
+def _cold_estimator(model: RollingModel) -> Pipeline:
+    return create_scalable_estimator() if model == "svr" else create_archive_estimator()
+
+
+def archive_seasons(archive_dir: Path) -> tuple[int, ...]:
+    """Return the target years with both a training view and a forecast."""
+    if not archive_dir.is_dir():
+        return ()
+    return tuple(
+        sorted(
+            int(path.name)
+            for path in archive_dir.iterdir()
+            if path.name.isdigit()
+            and (path / ARCHIVE_TRAINING_VIEW).exists()
+            and (path / ARCHIVE_FORECAST).exists()
+        )
+    )
+
+
+def rolling_projections(
+    archive_dir: Path,
+    *,
+    model: RollingModel,
+    seasons: Sequence[int] | None = None,
+    compare_cold: bool = True,
+) -> Iterator[RollingSeason]:
+    """Project archive seasons in order, warm-starting each from the last.
+
+    Each season's training view must extend the partitions already read with
+    only later seasons, as the archive builder writes them. With
+    ``compare_cold`` the project command's estimator is also refit from
+    scratch on the same rows so callers can report time and accuracy side by
+    side.
+    """
+    target_years = (
+        tuple(seasons) if seasons is not None else archive_seasons(archive_dir)
+    )
+    if not target_years:
+        raise ModelTrainingError(f"No archive seasons found in {archive_dir}")
+    if list(target_years) != sorted(set(target_years)):
+        raise ModelTrainingError("Rolling seasons must be distinct and ascending")
+    scaler = StandardScaler()
+    estimator = WarmStartSvr() if model == "svr" else WarmStartMlp()
+    loaded: dict[int, str] = {}
+    feature_blocks: list[NDArray[np.floating]] = []
+    target_blocks: list[NDArray[np.float64]] = []
+    feature_names: tuple[str, ...] | None = None
+    for target_year in target_years:
+        season_dir = archive_dir / str(target_year)
+        forecast = load_projection_data(season_dir / ARCHIVE_FORECAST)
+        started = time.perf_counter()
+        new_rows = 0
+        for partition in dataset_view_partitions(season_dir / ARCHIVE_TRAINING_VIEW):
+            if partition.partition in loaded:
+                if loaded[partition.partition] != partition.sha256:
+                    raise DatasetIntegrityError(
+                        f"{partition.path} changed during the rolling projection"
+                    )
+                continue
+            if loaded and partition.partition < max(loaded):
+                raise DatasetIntegrityError(
+                    f"{season_dir} adds partition {partition.partition} before "
+                    "partitions that were already trained on"
+                )
+            data = training_data_from_frame(
+                read_dataset(Path(partition.path), expected_sha256=partition.sha256),
+                feature_names,
+            )
+            feature_names = data.feature_names
+            scaler.partial_fit(data.features)
+            feature_blocks.append(data.features)
+            target_blocks.append(data.target)
+            loaded[partition.partition] = partition.sha256
+            new_rows += data.target.size
+        if feature_names != forecast.feature_names:
+            raise ValueError("Training and forecast feature contracts do not match")
+        if len(feature_blocks) > 1:
+            feature_blocks[:] = [np.concatenate(feature_blocks)]
+            target_blocks[:] = [np.concatenate(target_blocks)]
+        features, target = feature_blocks[0], target_blocks[0]
+        estimator.fit(scaler.transform(features), target)
+        predictions = estimator.predict(scaler.transform(forecast.features))
+        seconds = time.perf_counter() - started
+        cold_predictions = cold_seconds = None
+        if compare_cold:
+            started = time.perf_counter()
+            cold_predictions = np.asarray(
+                _cold_estimator(model).fit(features, target).predict(forecast.features),
+                dtype=np.float64,
+            )
+            cold_seconds = time.perf_counter() - started
+        yield RollingSeason(
+            target_year=target_year,
+            forecast=forecast,
+            training_rows=target.size,
+            new_training_rows=new_rows,
+            predictions=predictions,
+            seconds=seconds,
+            cold_predictions=cold_predictions,
+            cold_seconds=cold_seconds,
+        )
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import itertools
-from collections.abc import Iterable
+import math
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Literal
 
@@ -13,14 +15,18 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVR, LinearSVR
 
+from ffpred.errors import ConfigurationError
 from ffpred.evaluation.metrics import evaluate
 from ffpred.evaluation.splits import chronological_folds
 from ffpred.features.schema import MODEL_FEATURE_COLUMNS
-from ffpred.training.data import TrainingData, training_data_from_frame
+from ffpred.training.data import TrainingData
 from ffpred.training.result import TrainingResult
+from ffpred.workers import WorkerSlot, worker_count
 
 Kernel = Literal["linear", "poly", "rbf", "sigmoid"]
 
+MIN_HALVING_FACTOR = 2
+
 MANUAL_FEATURE_COLUMNS = tuple(
     MODEL_FEATURE_COLUMNS[index]
     for index in (
@@ -141,36 +147,126 @@ def candidate_configs() -> tuple[SvrConfig, ...]:
     return tuple(configs)
 
 
+@dataclass(frozen=True, slots=True)
+class _ScaledFold:
+    """One chronological fold, standardized with its own training scaler."""
+
+    train_features: np.ndarray
+    train_target: np.ndarray
+    validation_features: np.ndarray
+    validation_target: np.ndarray
+
+
+_FOLDS: WorkerSlot[tuple[_ScaledFold, ...]] = WorkerSlot("svr-folds")
+
+
+def _scaled_folds(data: TrainingData, folds: int) -> tuple[_ScaledFold, ...]:
+    scaled: list[_ScaledFold] = []
+    for train_indices, validation_indices in chronological_folds(data.frame, folds):
+        scaler = StandardScaler()
+        scaled.append(
+            _ScaledFold(
+                train_features=scaler.fit_transform(data.features[train_indices]),
+                train_target=data.target[train_indices],
+                validation_features=scaler.transform(data.features[validation_indices]),
+                validation_target=data.target[validation_indices],
+            )
+        )
+    for fold in scaled:
+        for array in (
+            fold.train_features,
+            fold.train_target,
+            fold.validation_features,
+            fold.validation_target,
+        ):
+            array.flags.writeable = False
+    return tuple(scaled)
+
+
+def _fold_error(config: SvrConfig, fold_index: int) -> float:
+    fold = _FOLDS.get()[fold_index]
+    regressor = create_estimator(config).named_steps["regressor"]
+    prediction = regressor.fit(fold.train_features, fold.train_target).predict(
+        fold.validation_features
+    )
+    return float(mean_absolute_error(fold.validation_target, prediction))
+
+
+def _survivors(
+    survivors: list[int],
+    errors: Mapping[int, list[float]],
+    halving_factor: int,
+) -> list[int]:
+    keep = max(math.ceil(len(survivors) / halving_factor), 1)
+    ranked = sorted(survivors, key=lambda index: (np.mean(errors[index]), index))
+    return sorted(ranked[:keep])
+
+
 def select_config(
     data: TrainingData,
     configs: Iterable[SvrConfig],
     *,
     folds: int = 5,
+    jobs: int = 1,
+    halving_factor: int | None = None,
 ) -> SvrConfig:
-    """Choose hyperparameters using strictly chronological validation."""
+    """Choose hyperparameters using strictly chronological validation.
+
+    Each fold is standardized once and shared read-only by every candidate
+    fit, which is equivalent to refitting the scaling pipeline per candidate.
+    ``jobs`` spreads the (configuration, fold) fits over a process pool, with
+    negative values counting back from the available CPUs as joblib does.
+    With ``halving_factor`` set, only the best ``1 / halving_factor`` of the
+    surviving candidates, ranked by mean error over the folds scored so far,
+    advance to each later fold. Ties resolve to the earliest candidate, so
+    the search is deterministic and, without halving, selects exactly what an
+    exhaustive search would.
+    """
     candidates = tuple(configs)
     if not candidates:
         raise ValueError("At least one SVR configuration is required")
-    scores: list[float] = []
-    splits = tuple(chronological_folds(data.frame, folds))
-    for config in candidates:
-        errors: list[float] = []
-        for train_indices, validation_indices in splits:
-            estimator = create_estimator(config)
-            prediction = estimator.fit(
-                data.features[train_indices],
-                data.target[train_indices],
-            ).predict(data.features[validation_indices])
-            errors.append(
-                float(
-                    mean_absolute_error(
-                        data.target[validation_indices],
-                        prediction,
+    if halving_factor is not None and halving_factor < MIN_HALVING_FACTOR:
+        raise ConfigurationError(
+            f"halving_factor must be at least {MIN_HALVING_FACTOR}"
+        )
+    workers = worker_count(jobs)
+    scaled = _scaled_folds(data, folds)
+    errors: dict[int, list[float]] = {index: [] for index in range(len(candidates))}
+    survivors = list(errors)
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_FOLDS.install,
+            initargs=(scaled,),
+        )
+        if workers > 1
+        else None
+    )
+    try:
+        # Without a pool the folds are scored from this process's slot.
+        with _FOLDS.installed(scaled):
+            for fold_index in range(len(scaled)):
+                if fold_index and halving_factor is not None:
+                    survivors = _survivors(survivors, errors, halving_factor)
+                configs_at_rung = [candidates[index] for index in survivors]
+                fold_indices = [fold_index] * len(survivors)
+                scores = (
+                    executor.map(
+                        _fold_error,
+                        configs_at_rung,
+                        fold_indices,
+                        chunksize=max(len(survivors) // (workers * 4), 1),
                     )
+                    if executor is not None
+                    else map(_fold_error, configs_at_rung, fold_indices)
                 )
-            )
-        scores.append(float(np.mean(errors)))
-    return candidates[int(np.argmin(scores))]
+                for index, score in zip(survivors, scores, strict=True):
+                    errors[index].append(score)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    means = [float(np.mean(errors[index])) for index in survivors]
+    return candidates[survivors[int(np.argmin(means))]]
 
 
 def train_svr(
@@ -178,13 +274,15 @@ def train_svr(
     test: TrainingData,
     *,
     config: SvrConfig = DEFAULT_SVR_CONFIG,
+    estimator: Pipeline | None = None,
 ) -> TrainingResult:
-    """Fit and evaluate an SVR pipeline."""
-    estimator = create_estimator(config)
-    prediction = np.asarray(
-        estimator.fit(train.features, train.target).predict(test.features),
-        dtype=np.float64,
-    )
+    """Fit and evaluate an SVR pipeline.
+
+    A previously fitted ``estimator`` is evaluated as is instead of being refit.
+    """
+    if estimator is None:
+        estimator = create_estimator(config).fit(train.features, train.target)
+    prediction = np.asarray(estimator.predict(test.features), dtype=np.float64)
     return TrainingResult(
         estimator=estimator,
         predictions=prediction,
@@ -195,4 +293,4 @@ def train_svr(
 
 def select_manual_features(data: TrainingData) -> TrainingData:
     """Select the historical hand-picked columns by stable names."""
-    return training_data_from_frame(data.frame, MANUAL_FEATURE_COLUMNS)
+    return data.with_features(MANUAL_FEATURE_COLUMNS)
@@ -0,0 +1,66 @@
+"""Process-pool helpers shared by parallel builds, searches and scorers.
+
+Pool workers receive their large read-only inputs once, through the pool
+initializer, instead of with every task. A module declares a ``WorkerSlot``
+for each such input and passes the slot's ``install`` method as the
+initializer. Slots pickle by name, so a spawned worker installs the value
+into its own copy of this module's registry.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generic, TypeVar, cast
+
+from ffpred.errors import ConfigurationError
+
+T = TypeVar("T")
+
+_INSTALLED: dict[str, object] = {}
+
+
+def worker_count(jobs: int) -> int:
+    """Resolve a joblib-style job count to a number of worker processes.
+
+    Negative values count back from the available CPUs, so ``-1`` uses all of
+    them, and never resolve to fewer than one worker.
+    """
+    if jobs == 0:
+        raise ConfigurationError("jobs must be a positive or negative worker count")
+    if jobs < 0:
+        return max((os.cpu_count() or 1) + 1 + jobs, 1)
+    return jobs
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerSlot(Generic[T]):
+    """Named per-process value installed by a pool initializer."""
+
+    name: str
+
+    def install(self, value: T) -> None:
+        """Store ``value`` for tasks running in this process."""
+        _INSTALLED[self.name] = value
+
+    def get(self) -> T:
+        """Return the installed value."""
+        if self.name not in _INSTALLED:
+            raise ConfigurationError(f"Worker input {self.name} was not installed")
+        return cast("T", _INSTALLED[self.name])
+
+    @contextmanager
+    def installed(self, value: T) -> Iterator[T]:
+        """Install ``value`` for in-process tasks, restoring the previous one."""
+        missing = self.name not in _INSTALLED
+        previous = _INSTALLED.get(self.name)
+        self.install(value)
+        try:
+            yield value
+        finally:
+            if missing:
+                _INSTALLED.pop(self.name, None)
+            else:
+                _INSTALLED[self.name] = previous
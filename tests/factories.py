@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, Mapping, Sequence
 from datetime import date, timedelta
 
 import polars as pl
 
+from ffpred.features.schema import FEATURE_SCHEMA, TARGET_COLUMN
 from ffpred.providers.fakes import FakeProvider
+from ffpred.providers.protocol import NflDataProvider
 
 
 def make_provider(seasons: tuple[int, ...] = (2020, 2021, 2022)) -> FakeProvider:
@@ -412,3 +416,93 @@ def make_idp_provider(seasons: tuple[int, ...] = (2020, 2021, 2022)) -> FakeProv
                 }
             )
     return FakeProvider(player_stats=pl.DataFrame(player_stats))
+
+
+def make_training_frame(rows: int, *, season: int) -> pl.DataFrame:
+    values: dict[str, list[object]] = {}
+    for column, dtype in FEATURE_SCHEMA.items():
+        if dtype == pl.String:
+            values[column] = [f"{column}-{index}" for index in range(rows)]
+        elif dtype == pl.Int64:
+            values[column] = [season + index // 4 for index in range(rows)]
+        else:
+            values[column] = [float(index + 1) for index in range(rows)]
+    values["target_week"] = [index % 4 + 1 for index in range(rows)]
+    values[TARGET_COLUMN] = [float(index * 2 + 1) for index in range(rows)]
+    return pl.DataFrame(values, schema=FEATURE_SCHEMA)
+
+
+class RecordingProvider:
+    """Delegate to a provider, recording each load and its pushdown arguments.
+
+    Every load first waits on ``gate`` when one is given.
+    """
+
+    def __init__(
+        self,
+        provider: NflDataProvider,
+        *,
+        gate: Callable[[], object] | None = None,
+    ) -> None:
+        self.provider = provider
+        self.gate = gate
+        self.calls: list[tuple[str, dict[str, object]]] = []
+        self._lock = threading.Lock()
+
+    def names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+    def _enter(self, name: str, **pushdown: object) -> None:
+        with self._lock:
+            self.calls.append((name, pushdown))
+        if self.gate is not None:
+            self.gate()
+
+    def load_player_stats(
+        self,
+        seasons: Sequence[int],
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        self._enter("load_player_stats", columns=columns, predicate=predicate)
+        return self.provider.load_player_stats(
+            seasons, columns=columns, predicate=predicate
+        )
+
+    def load_team_stats(self, seasons: Sequence[int]) -> pl.DataFrame:
+        self._enter("load_team_stats")
+        return self.provider.load_team_stats(seasons)
+
+    def load_schedules(self, seasons: Sequence[int]) -> pl.DataFrame:
+        self._enter("load_schedules")
+        return self.provider.load_schedules(seasons)
+
+    def load_depth_charts(self, seasons: Sequence[int]) -> pl.DataFrame:
+        self._enter("load_depth_charts")
+        return self.provider.load_depth_charts(seasons)
+
+    def load_injuries(self, seasons: Sequence[int]) -> pl.DataFrame:
+        self._enter("load_injuries")
+        return self.provider.load_injuries(seasons)
+
+    def load_rosters_weekly(self, seasons: Sequence[int]) -> pl.DataFrame:
+        self._enter("load_rosters_weekly")
+        return self.provider.load_rosters_weekly(seasons)
+
+    def load_players(self) -> pl.DataFrame:
+        self._enter("load_players")
+        return self.provider.load_players()
+
+    def load_pbp(
+        self,
+        season: int,
+        *,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.DataFrame:
+        self._enter("load_pbp", columns=columns, predicate=predicate)
+        return self.provider.load_pbp(season, columns=columns, predicate=predicate)
+
+    def metadata(self) -> Mapping[str, str]:
+        return self.provider.metadata()
@@ -1,24 +1,50 @@
 from __future__ import annotations
 
+import http.client
 import json
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
+from sklearn.exceptions import ConvergenceWarning
 
 from ffpred.cli.app import main
 from ffpred.datasets.archive import ForecastArchiveConfig, build_forecast_archive
-from ffpred.errors import ConfigurationError
+from ffpred.datasets.io import dataset_view_partitions, read_dataset, write_chunks
+from ffpred.errors import ConfigurationError, DatasetIntegrityError, InferenceError
 from ffpred.features.all_positions import (
     ALL_POSITION_MODEL_FEATURE_COLUMNS,
     FANTASY_POSITIONS,
     build_actual_frame,
+    build_all_position_training_frame,
     build_injury_absence_frame,
 )
 from ffpred.providers.fakes import FakeProvider
+from ffpred.serving import (
+    InferenceClient,
+    InferenceService,
+    create_server,
+    load_archive_models,
+)
+from ffpred.serving.server import InferenceHTTPServer
+from ffpred.serving.service import LatencyCounters, MicroBatcher
 from ffpred.training.data import load_training_data
-from ffpred.training.projection import load_projection_data
+from ffpred.training.mlp import create_archive_estimator
+from ffpred.training.projection import (
+    load_projection_data,
+    predict_forecast_chunks,
+    project,
+)
+from ffpred.training.registry import ModelRegistry
+from ffpred.training.rolling import RollingModel, rolling_projections
+from ffpred.training.svr import create_scalable_estimator
 
 
 def _schedule(season: int) -> dict[str, object]:
@@ -217,6 +243,116 @@ def test_actuals_capture_player_share_and_team_volume() -> None:
     assert receiver["team_pass_rate"][0] == pytest.approx(25 / 37)
 
 
+def _weekly_league() -> tuple[pl.DataFrame, pl.DataFrame]:
+    weeks = range(1, 13)
+    seasons = (2008, 2009, 2010)
+
+    def game(row: dict[str, object], season: int, week: int) -> dict[str, object]:
+        game_id = f"{season}_{week:02d}_GB_SEA"
+        return {**row, "week": week, "game_id": game_id}
+
+    schedules = pl.DataFrame(
+        [
+            {**game(_schedule(season), season, week), "gameday": f"{season}-09-10"}
+            for season in seasons
+            for week in weeks
+        ]
+    )
+    player_stats = pl.DataFrame(
+        [
+            {
+                **game(
+                    _player_row(
+                        season,
+                        position=position,
+                        team=team,
+                        opponent=("SEA" if team == "GB" else "GB"),
+                    ),
+                    season,
+                    week,
+                ),
+                "fantasy_points": (season * 7 + week * 3 + len(position)) % 23 / 3,
+            }
+            for season in seasons
+            for week in weeks
+            for team in ("GB", "SEA")
+            for position in ("QB", "RB", "WR", "TE")
+        ]
+    )
+    team_stats = pl.DataFrame(
+        [
+            game(
+                _team_row(
+                    season, team=team, opponent=("SEA" if team == "GB" else "GB")
+                ),
+                season,
+                week,
+            )
+            for season in seasons
+            for week in weeks
+            for team in ("GB", "SEA")
+        ]
+    )
+    return build_actual_frame(player_stats, team_stats, schedules), schedules
+
+
+def test_training_frame_folds_seasons_like_independent_builds() -> None:
+    actuals, schedules = _weekly_league()
+
+    combined = build_all_position_training_frame(
+        actuals,
+        schedules,
+        target_years=(2009, 2010),
+    )
+    separate = pl.concat(
+        [
+            build_all_position_training_frame(
+                actuals,
+                schedules,
+                target_years=(year,),
+            )
+            for year in (2009, 2010)
+        ]
+    )
+    history = actuals.filter(pl.col("season") < 2010).sort(
+        "player_id", "season", "week"
+    )
+    expected = history.group_by("player_id").agg(
+        pl.col("fantasy_points").mean().alias("career"),
+        pl.col("fantasy_points").tail(10).mean().alias("last_10"),
+    )
+    actual = (
+        combined.filter(pl.col("target_season") == 2010)
+        .unique("player_id")
+        .join(expected, on="player_id")
+    )
+
+    assert_frame_equal(combined, separate, check_exact=True)
+    assert actual.height == 10
+    assert actual["player_career_ppg"].to_list() == pytest.approx(
+        actual["career"].to_list()
+    )
+    assert actual["player_last_10_points"].to_list() == pytest.approx(
+        actual["last_10"].to_list()
+    )
+
+
+def test_training_frame_ignores_source_row_order() -> None:
+    actuals, schedules = _weekly_league()
+    keys = ("player_id", "target_season", "target_week")
+
+    def build(frame: pl.DataFrame) -> pl.DataFrame:
+        return build_all_position_training_frame(
+            frame, schedules, target_years=(2009, 2010)
+        ).sort(keys)
+
+    assert_frame_equal(
+        build(actuals.sample(fraction=1.0, shuffle=True, seed=7)),
+        build(actuals),
+        check_exact=False,
+    )
+
+
 def test_injury_absences_require_out_or_reserve_status() -> None:
     injuries = pl.DataFrame(
         {
@@ -327,7 +463,10 @@ def test_archive_builds_every_position_with_frozen_lineage(
         provider=_provider(),
     )
     season = result.seasons[0]
-    training = pl.read_parquet(season.training.path)
+    training = read_dataset(
+        Path(season.training.path),
+        expected_sha256=season.training.sha256,
+    )
     forecast = pl.read_parquet(season.forecast.path)
 
     assert set(forecast["position"]) == set(FANTASY_POSITIONS)
@@ -350,6 +489,134 @@ def test_archive_builds_every_position_with_frozen_lineage(
     assert season.manifest_path.exists()
 
 
+def _two_season_provider() -> FakeProvider:
+    provider = _provider()
+    provider.schedules = pl.concat(
+        [provider.schedules, pl.DataFrame([_schedule(2011)])]
+    )
+    provider.player_stats = pl.concat(
+        [
+            provider.player_stats,
+            pl.DataFrame(
+                [
+                    _player_row(
+                        2011,
+                        position=position,
+                        team=team,
+                        opponent=("SEA" if team == "GB" else "GB"),
+                    )
+                    for team in ("GB", "SEA")
+                    for position in ("QB", "RB", "WR", "TE", "K")
+                ]
+            ),
+        ]
+    )
+    provider.team_stats = pl.concat(
+        [
+            provider.team_stats,
+            pl.DataFrame(
+                [
+                    _team_row(
+                        2011, team=team, opponent=("SEA" if team == "GB" else "GB")
+                    )
+                    for team in ("GB", "SEA")
+                ]
+            ),
+        ]
+    )
+    provider.depth_charts = pl.concat([_depth_charts(2010), _depth_charts(2011)])
+    return provider
+
+
+def test_archive_shares_season_partitions_across_target_views(
+    tmp_path: Path,
+) -> None:
+    provider = _two_season_provider()
+
+    result = build_forecast_archive(
+        ForecastArchiveConfig(
+            output_dir=tmp_path,
+            history_start=2008,
+            first_target_year=2010,
+            last_target_year=2011,
+        ),
+        provider=provider,
+    )
+    first, second = result.seasons
+    manifest = json.loads(second.manifest_path.read_text())
+    training = read_dataset(
+        Path(second.training.path),
+        expected_sha256=second.training.sha256,
+    )
+
+    assert sorted(path.parent.name for path in tmp_path.glob("training/*/*")) == [
+        "target_season=2009",
+        "target_season=2010",
+    ]
+    assert [partition.partition for partition in first.training_partitions] == [2009]
+    assert second.training_partitions[0] == first.training_partitions[0]
+    assert dataset_view_partitions(Path(second.training.path)) == tuple(
+        second.training_partitions
+    )
+    assert [partition["path"] for partition in manifest["training_partitions"]] == [
+        "../training/target_season=2009/data.parquet",
+        "../training/target_season=2010/data.parquet",
+    ]
+    assert manifest["outputs"]["training"]["format"] == "parquet-view"
+    assert training["target_season"].unique().sort().to_list() == [2009, 2010]
+    assert training.height == second.training.rows
+
+    Path(first.training_partitions[0].path).write_bytes(b"tampered")
+    with pytest.raises(DatasetIntegrityError, match="Checksum mismatch"):
+        read_dataset(
+            Path(second.training.path),
+            expected_sha256=second.training.sha256,
+        )
+
+
+def test_parallel_archive_matches_serial_build(tmp_path: Path) -> None:
+    config = ForecastArchiveConfig(
+        output_dir=tmp_path / "serial",
+        history_start=2008,
+        first_target_year=2010,
+        last_target_year=2011,
+    )
+    serial = build_forecast_archive(config, provider=_two_season_provider())
+    parallel = build_forecast_archive(
+        replace(config, output_dir=tmp_path / "parallel"),
+        provider=_two_season_provider(),
+        jobs=2,
+    )
+
+    def manifest(path: Path) -> dict[str, object]:
+        root = path.parents[1]
+        text = path.read_text().replace(str(root), "<archive>")
+        content: dict[str, object] = json.loads(text)
+        content.pop("generated_at")
+        return content
+
+    assert [season.target_year for season in parallel.seasons] == [2010, 2011]
+    for expected, actual in zip(serial.seasons, parallel.seasons, strict=True):
+        assert actual.forecast.sha256 == expected.forecast.sha256
+        assert actual.training.sha256 == expected.training.sha256
+        assert manifest(actual.manifest_path) == manifest(expected.manifest_path)
+    assert not list((tmp_path / "parallel").rglob("*.tmp"))
+
+
+def test_archive_rejects_zero_jobs(tmp_path: Path) -> None:
+    with pytest.raises(ConfigurationError, match="jobs"):
+        build_forecast_archive(
+            ForecastArchiveConfig(
+                output_dir=tmp_path,
+                history_start=2008,
+                first_target_year=2010,
+                last_target_year=2010,
+            ),
+            provider=_provider(),
+            jobs=0,
+        )
+
+
 def test_projection_commands_detect_all_position_features(
     tmp_path: Path,
     capsys,
@@ -384,9 +651,231 @@ def test_projection_commands_detect_all_position_features(
     assert set(prediction_frame["position"]) == set(FANTASY_POSITIONS)
     assert "projected_target_share" in prediction_frame
     assert "team_previous_season_offensive_plays" in prediction_frame
-    assert load_training_data(Path(season.training.path)).features.shape[1] == len(
-        ALL_POSITION_MODEL_FEATURE_COLUMNS
+    train = load_training_data(Path(season.training.path))
+    assert train.features.shape[1] == len(ALL_POSITION_MODEL_FEATURE_COLUMNS)
+    forecast = load_projection_data(Path(season.forecast.path))
+    assert forecast.features.shape[1] == len(ALL_POSITION_MODEL_FEATURE_COLUMNS)
+    expected = project(create_scalable_estimator(), train, forecast)
+    assert_frame_equal(
+        prediction_frame,
+        forecast.frame.select(prediction_frame.columns[:-1]).with_columns(
+            pl.Series("prediction", expected)
+        ),
     )
-    assert load_projection_data(Path(season.forecast.path)).features.shape[1] == len(
-        ALL_POSITION_MODEL_FEATURE_COLUMNS
+    chunked = tmp_path / "chunked.parquet"
+    rows = write_chunks(
+        chunked,
+        predict_forecast_chunks(
+            create_scalable_estimator().fit(train.features, train.target),
+            Path(season.forecast.path),
+            ALL_POSITION_MODEL_FEATURE_COLUMNS,
+            columns=prediction_frame.columns[:-1],
+            chunk_rows=7,
+        ),
+        schema=prediction_frame.schema,
+        row_group_rows=7,
     )
+    assert rows == forecast.frame.height
+    assert_frame_equal(pl.read_parquet(chunked), prediction_frame)
+
+
+@pytest.mark.parametrize("model", ["svr", "mlp"])
+def test_rolling_projection_warm_starts_each_archive_season(
+    tmp_path: Path,
+    model: RollingModel,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    seasons = build_forecast_archive(
+        ForecastArchiveConfig(
+            output_dir=tmp_path,
+            history_start=2008,
+            first_target_year=2010,
+            last_target_year=2011,
+        ),
+        provider=_two_season_provider(),
+    ).seasons
+
+    exit_code = main(
+        ["project-archive", "--archive-dir", str(tmp_path), "--model", model]
+    )
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert [season["target_year"] for season in output["seasons"]] == [2010, 2011]
+    first, second = output["seasons"]
+    assert first["new_training_rows"] == first["training_rows"]
+    assert second["training_rows"] == seasons[1].training.rows
+    assert second["new_training_rows"] == (
+        seasons[1].training.rows - seasons[0].training.rows
+    )
+    for season, summary in zip(seasons, output["seasons"], strict=True):
+        assert summary["seconds"] > 0
+        assert summary["cold"]["seconds"] > 0
+        predictions = pl.read_parquet(summary["predictions"])
+        assert predictions.height == season.forecast.rows
+        assert predictions["prediction"].is_finite().all()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ConvergenceWarning)
+        warm = list(rolling_projections(tmp_path, model=model, compare_cold=False))
+    assert [season.target_year for season in warm] == [2010, 2011]
+
+    rolled = list(
+        rolling_projections(tmp_path, model=model, seasons=[2011], compare_cold=True)
+    )
+    estimator = (
+        create_scalable_estimator() if model == "svr" else create_archive_estimator()
+    )
+    expected = project(
+        estimator,
+        load_training_data(Path(seasons[1].training.path)),
+        load_projection_data(Path(seasons[1].forecast.path)),
+    )
+    assert rolled[0].cold_predictions is not None
+    assert np.allclose(rolled[0].cold_predictions, expected)
+
+
+def test_inference_service_micro_batches_concurrent_socket_requests(
+    tmp_path: Path,
+) -> None:
+    archive_dir = tmp_path / "archive"
+    build_forecast_archive(
+        ForecastArchiveConfig(
+            output_dir=archive_dir,
+            history_start=2008,
+            first_target_year=2010,
+            last_target_year=2011,
+        ),
+        provider=_two_season_provider(),
+    )
+    registry = ModelRegistry(tmp_path / "models")
+    models = load_archive_models(archive_dir, ["svr"], registry=registry)
+    assert [(served.model, served.season) for served in models] == [
+        ("svr", 2010),
+        ("svr", 2011),
+    ]
+    assert registry.stats().artifacts == 2
+    load_archive_models(archive_dir, ["svr"], registry=registry)
+    assert registry.hits == 2
+
+    forecast = models[1].forecast
+    expected = dict(
+        zip(
+            forecast.frame["player_id"].to_list(),
+            models[1].estimator.predict(forecast.features).tolist(),
+            strict=True,
+        )
+    )
+    service = InferenceService(models, max_delay=0.05)
+    socket_path = tmp_path / "ffpred.sock"
+    server = create_server(service, socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def request(player_id: str) -> list[dict[str, object]]:
+        client = InferenceClient(socket_path=socket_path)
+        try:
+            result: list[dict[str, object]] = client.predict(
+                "svr", 2011, [player_id, "missing"], week=1
+            )
+            return result
+        finally:
+            client.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(expected)) as pool:
+            responses = list(pool.map(request, expected))
+        client = InferenceClient(socket_path=socket_path)
+        stats = client.stats()
+        with pytest.raises(InferenceError, match="No mlp model"):
+            client.predict("mlp", 2011, ["GB-QB"])
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    for player_id, rows in zip(expected, responses, strict=True):
+        assert [row["player_id"] for row in rows] == [player_id]
+        assert rows[0]["prediction"] == pytest.approx(expected[player_id])
+    assert stats["requests"] == len(expected)
+    assert stats["batches"] < len(expected)
+    assert stats["p99_ms"] >= stats["p50_ms"] > 0
+
+
+@pytest.mark.parametrize(
+    ("body", "length"),
+    [(b"[]", None), (b'"svr"', None), (b"{}", "-1"), (b"{}", "two")],
+)
+def test_inference_server_rejects_malformed_requests(
+    body: bytes, length: str | None
+) -> None:
+    service = InferenceService([])
+    server = create_server(service)
+    assert isinstance(server, InferenceHTTPServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", server.server_port, timeout=5
+        )
+        connection.putrequest("POST", "/predict")
+        connection.putheader("Content-Length", length or str(len(body)))
+        connection.endheaders(body)
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    assert response.status == 400
+    assert payload["error"]
+
+
+def test_inference_server_reports_predictor_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fail(**_: object) -> pl.DataFrame:
+        raise RuntimeError("estimator failed")
+
+    service = InferenceService([])
+    monkeypatch.setattr(service, "predict", fail)
+    server = create_server(service)
+    assert isinstance(server, InferenceHTTPServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", server.server_port, timeout=5
+        )
+        connection.request(
+            "POST",
+            "/predict",
+            json.dumps({"model": "svr", "season": 2011, "player_ids": []}),
+        )
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    assert response.status == 500
+    assert payload == {"error": "estimator failed"}
+
+
+def test_micro_batcher_fails_callers_when_the_model_drops_rows() -> None:
+    counters = LatencyCounters()
+    batcher = MicroBatcher(lambda features: features[1:, 0], counters=counters)
+    try:
+        futures = [batcher.submit(np.ones((2, 3))) for _ in range(2)]
+        for future in futures:
+            with pytest.raises(InferenceError, match="predictions for"):
+                future.result(timeout=5)
+        assert batcher.submit(np.ones((1, 3))).exception(timeout=5) is not None
+    finally:
+        batcher.close()
+    assert counters.batches == 0
@@ -1,11 +1,22 @@
 import json
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from ffpred.cli.app import main
+from ffpred.dashboard.data import (
+    load_prediction_files,
+    model_scorecard,
+    prediction_file,
+    views_are_fresh,
+)
+from ffpred.features.schema import TARGET_COLUMN
 from ffpred.providers.fakes import FakeProvider
+from ffpred.training.data import training_data_from_frame
+from ffpred.training.svr import train_svr
 from tests.factories import (
     make_dst_provider,
     make_idp_provider,
@@ -13,6 +24,7 @@ from tests.factories import (
     make_kicker_provider,
     make_provider,
     make_receiving_provider,
+    make_training_frame,
 )
 
 
@@ -146,10 +158,12 @@ def test_train_ebm_writes_predictions_and_explanations(
             "0",
             "--jobs",
             "1",
+            "--local-explanations-json",
         ]
     )
     output = json.loads(capsys.readouterr().out)
     explanation_data = json.loads(explanations.read_text(encoding="utf-8"))
+    local_explanations = pl.read_parquet(output["local_explanations"])
 
     assert result == 0
     assert predictions.exists()
@@ -171,6 +185,12 @@ def test_train_ebm_writes_predictions_and_explanations(
         explanation_data["local"][0]["identity"]["player_id"]
         == prediction_frame["player_id"][0]
     )
+    assert output["local_explanations"] == str(
+        tmp_path / "ebm-predictions-local-explanations.parquet"
+    )
+    assert local_explanations["player_id"].to_list() == (
+        prediction_frame["player_id"].to_list()
+    )
 
 
 def test_dst_build_train_and_evaluate_round_trip(
@@ -223,9 +243,10 @@ def test_dst_build_train_and_evaluate_round_trip(
     assert "team" in prediction_frame.columns
 
 
-def test_manual_features_rejected_for_non_qb_position(
+def test_svr_option_combinations_are_rejected(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
+    caplog: pytest.LogCaptureFixture,
 ) -> None:
     main(
         [
@@ -258,6 +279,23 @@ def test_manual_features_rejected_for_non_qb_position(
 
     assert result == 2
 
+    result = main(
+        [
+            "train-svr",
+            "--position",
+            "dst",
+            "--halving-factor",
+            "3",
+            "--train",
+            str(tmp_path / "train.parquet"),
+            "--test",
+            str(tmp_path / "test.parquet"),
+        ]
+    )
+
+    assert result == 2
+    assert "--halving-factor requires" in caplog.text
+
 
 def test_kicker_build_train_and_evaluate_round_trip(
     tmp_path: Path,
@@ -308,6 +346,33 @@ def test_kicker_build_train_and_evaluate_round_trip(
     assert "prediction" in prediction_frame.columns
     assert "player_id" in prediction_frame.columns
 
+    single = tmp_path / "kicker-float32-predictions.parquet"
+    assert (
+        main(
+            [
+                "train-mlp",
+                "--position",
+                "k",
+                "--train",
+                str(tmp_path / "train.parquet"),
+                "--test",
+                str(tmp_path / "test.parquet"),
+                "--predictions",
+                str(single),
+                "--feature-dtype",
+                "float32",
+            ]
+        )
+        == 0
+    )
+    single_frame = pl.read_parquet(single)
+    assert_frame_equal(
+        single_frame.drop("prediction"), prediction_frame.drop("prediction")
+    )
+    np.testing.assert_allclose(
+        single_frame["prediction"], prediction_frame["prediction"], rtol=1e-3
+    )
+
 
 def test_receiving_build_train_and_evaluate_round_trip(
     tmp_path: Path,
@@ -594,3 +659,153 @@ def test_current_injuries_command_reports_zero_matches_without_crosswalk(
     frame = pl.read_csv(output_path)
     assert frame.is_empty()
     assert "status" in frame.columns
+
+
+def test_train_ebm_reuses_stored_model_and_models_command_evicts(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    main(
+        [
+            "build-dataset",
+            "--output-dir",
+            str(tmp_path),
+            "--history-start",
+            "2020",
+            "--train-start",
+            "2021",
+            "--test-year",
+            "2022",
+        ],
+        provider=make_provider(),
+    )
+    capsys.readouterr()
+    store = tmp_path / "models"
+    arguments = [
+        "train-ebm",
+        "--train",
+        str(tmp_path / "train.parquet"),
+        "--test",
+        str(tmp_path / "test.parquet"),
+        "--explanations",
+        str(tmp_path / "ebm-explanations.json"),
+        "--interactions",
+        "0",
+        "--max-rounds",
+        "5",
+        "--min-samples-leaf",
+        "1",
+        "--outer-bags",
+        "1",
+        "--validation-size",
+        "0",
+        "--calibration-fraction",
+        "0",
+        "--jobs",
+        "1",
+        "--model-store",
+        str(store),
+    ]
+    outputs = []
+    predictions = []
+    for name in ("first.parquet", "second.parquet"):
+        assert main([*arguments, "--predictions", str(tmp_path / name)]) == 0
+        outputs.append(json.loads(capsys.readouterr().out))
+        predictions.append(pl.read_parquet(tmp_path / name))
+
+    first, second = (output["model_artifact"] for output in outputs)
+    assert not first["reused"]
+    assert second == {**first, "reused": True}
+    assert outputs[1]["metrics"] == outputs[0]["metrics"]
+    assert predictions[1].equals(predictions[0])
+
+    assert main(["models", "--model-store", str(store)]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert [artifact["digest"] for artifact in report["artifacts"]] == [first["digest"]]
+    assert report["bytes"] == first["bytes"]
+
+    assert (
+        main(["models", "--model-store", str(store), "--model-store-max-bytes", "0"])
+        == 0
+    )
+    report = json.loads(capsys.readouterr().out)
+    assert report["evicted"] == [first["digest"]]
+    assert report["artifacts"] == []
+
+
+def test_train_all_shares_one_split_and_writes_a_scorecard(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    train_path = tmp_path / "train.parquet"
+    test_path = tmp_path / "test.parquet"
+    make_training_frame(48, season=2020).write_parquet(train_path)
+    make_training_frame(8, season=2025).write_parquet(test_path)
+    output_dir = tmp_path / "models"
+
+    exit_code = main(
+        [
+            "train-all",
+            "--train",
+            str(train_path),
+            "--test",
+            str(test_path),
+            "--output-dir",
+            str(output_dir),
+            "--cpus",
+            "3",
+        ]
+    )
+    output = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert {model: run["cpus"] for model, run in output["models"].items()} == {
+        "svr": 1,
+        "mlp": 1,
+        "ebm": 1,
+    }
+    train = training_data_from_frame(pl.read_parquet(train_path))
+    test = training_data_from_frame(pl.read_parquet(test_path))
+    svr = pl.read_parquet(output_dir / "svr-predictions.parquet")
+    np.testing.assert_allclose(
+        svr["prediction"].to_numpy(), train_svr(train, test).predictions
+    )
+    ebm = pl.read_parquet(output_dir / "ebm-predictions.parquet")
+    assert {"prediction_lower", "prediction_upper"} <= set(ebm.columns)
+    scorecard = pl.read_parquet(output_dir / "scorecard.parquet")
+    expected = model_scorecard(
+        load_prediction_files(
+            [output_dir / f"{model}-predictions.parquet" for model in output["models"]]
+        )
+    )
+    assert_frame_equal(scorecard, expected, check_row_order=False)
+    assert scorecard["model"].to_list() == [
+        row["model"] for row in output["scorecard_rows"]
+    ]
+
+
+def test_materialize_dashboard_writes_fresh_sidecars_for_discovered_artifacts(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    frame = make_training_frame(6, season=2025).with_columns(
+        pl.col(TARGET_COLUMN).alias("prediction")
+    )
+    for name in ("svr", "mlp"):
+        frame.write_parquet(tmp_path / f"{name}-predictions.parquet")
+    monkeypatch.chdir(tmp_path)
+
+    assert main(["materialize-dashboard"]) == 0
+    output = json.loads(capsys.readouterr().out)
+    files = [prediction_file(Path(path)) for path in output["predictions"]]
+
+    assert output["directory"] == str(tmp_path.resolve() / ".ffpred-dashboard")
+    assert sorted(Path(path).name for path in output["views"]) == [
+        "consensus.parquet",
+        "draft-aggregates.parquet",
+        "scorecard.parquet",
+    ]
+    assert views_are_fresh(files, Path(output["directory"]))
+    monkeypatch.chdir(tmp_path / ".ffpred-dashboard")
+    assert main(["materialize-dashboard"]) == 2
@@ -1,20 +1,47 @@
+import json
+import time
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 from streamlit.testing.v1 import AppTest
 
 from ffpred.dashboard.data import (
     CONSENSUS_MODEL,
     DashboardDataError,
+    FilterOptions,
+    PredictionFile,
+    StageTiming,
+    chart_data,
     draft_board,
+    draft_board_from_partials,
+    draft_partial,
+    filter_options,
+    load_prediction_files,
+    materialize_views,
     model_choices,
     model_name_from_path,
     model_scorecard,
+    prediction_file,
     prepare_predictions,
+    recording_stages,
+    scan_predictions,
+    season_draft_board,
+    season_error_histogram,
+    season_scorecard,
     select_model,
+    select_predictions,
+    timed,
+    timed_stage,
+    top_n,
+    views_are_fresh,
+    weekly_bands,
     weekly_board,
 )
+from ffpred.datasets.io import file_sha256
 
 
 def _predictions(offset: float = 0.0) -> pl.DataFrame:
@@ -86,6 +113,200 @@ def test_consensus_preserves_forecast_provenance() -> None:
     assert consensus["history_through_season"].unique().to_list() == [2024]
 
 
+def test_scanned_predictions_match_filtering_the_loaded_artifacts(
+    tmp_path: Path,
+) -> None:
+    paths = [tmp_path / "svr-predictions.parquet", tmp_path / "mlp-predictions.parquet"]
+    for path, offset in zip(paths, (0.0, 2.0), strict=True):
+        pl.concat(
+            [
+                _predictions(offset).with_columns(
+                    pl.Series("position", ["qb", "qb", "WR", None])
+                ),
+                _predictions(offset).with_columns(
+                    pl.lit(2024, dtype=pl.Int64).alias("target_season"),
+                    pl.lit("RB").alias("position"),
+                ),
+            ]
+        ).write_parquet(path, row_group_size=4, statistics=True)
+    files = [prediction_file(path) for path in paths]
+    loaded = load_prediction_files(paths)
+
+    scanned = scan_predictions(
+        files,
+        season=2025,
+        positions=["QB"],
+        models={"SVR"},
+    ).collect()
+
+    assert files[0].sha256 == file_sha256(paths[0])
+    assert_frame_equal(
+        scanned,
+        loaded.filter(
+            (pl.col("model") == "SVR")
+            & (pl.col("target_season") == 2025)
+            & (pl.col("position") == "QB")
+        ),
+    )
+    assert scanned.height == 3
+    assert_frame_equal(
+        select_predictions(files, CONSENSUS_MODEL, season=2025),
+        select_model(loaded.filter(pl.col("target_season") == 2025), CONSENSUS_MODEL),
+    )
+    assert filter_options(files) == FilterOptions(
+        seasons=(2025, 2024),
+        positions=("QB", "RB", "WR"),
+        models=("Consensus", "MLP", "SVR"),
+    )
+    with pytest.raises(DashboardDataError, match="no rows"):
+        prediction_file(_write_empty(tmp_path / "empty-predictions.parquet"))
+
+
+def test_materialized_views_match_computed_views_until_stale(tmp_path: Path) -> None:
+    paths = [tmp_path / "svr-predictions.parquet", tmp_path / "mlp-predictions.parquet"]
+    for path, offset in zip(paths, (0.0, 2.0), strict=True):
+        pl.concat(
+            [
+                _predictions(offset).with_columns(
+                    pl.Series("position", ["QB", "QB", "WR", "WR"]),
+                    pl.Series("injury_missed_game", [False, True, False, False]),
+                ),
+                _predictions(offset).with_columns(
+                    pl.lit(2026, dtype=pl.Int64).alias("target_season"),
+                    pl.lit(None, dtype=pl.Float64).alias("fantasy_points"),
+                    pl.lit(False).alias("injury_missed_game"),
+                ),
+            ],
+            how="diagonal",
+        ).write_parquet(path)
+    files = [prediction_file(path) for path in paths]
+    directory = tmp_path / "views"
+
+    assert not views_are_fresh(files, directory)
+    materialize_views(files, directory)
+    assert views_are_fresh(files, directory)
+
+    for season in (2025, 2026):
+        assert_frame_equal(
+            season_scorecard(files, season=season, materialized=directory),
+            season_scorecard(files, season=season),
+        )
+        for model in (CONSENSUS_MODEL, "MLP", "SVR"):
+            for positions in (["QB"], ["QB", "WR"]):
+                assert_frame_equal(
+                    season_draft_board(
+                        files,
+                        model,
+                        season=season,
+                        positions=positions,
+                        materialized=directory,
+                    ),
+                    season_draft_board(
+                        files, model, season=season, positions=positions
+                    ),
+                )
+                assert_frame_equal(
+                    select_predictions(
+                        files,
+                        model,
+                        season=season,
+                        positions=positions,
+                        materialized=directory,
+                    ),
+                    select_predictions(
+                        files, model, season=season, positions=positions
+                    ),
+                )
+
+    pl.read_parquet(paths[0]).with_columns(pl.col("prediction") + 5.0).write_parquet(
+        paths[0]
+    )
+    files = [prediction_file(path) for path in paths]
+    assert not views_are_fresh(files, directory)
+    assert_frame_equal(
+        select_predictions(files, CONSENSUS_MODEL, season=2025, materialized=directory),
+        select_predictions(files, CONSENSUS_MODEL, season=2025),
+    )
+
+
+SYNTHETIC_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+
+
+def _synthetic_archive(root: Path, *, players: int = 32) -> list[PredictionFile]:
+    rng = np.random.default_rng(7)
+    keys = (
+        pl.DataFrame({"target_season": list(range(2010, 2027))})
+        .join(pl.DataFrame({"position": list(SYNTHETIC_POSITIONS)}), how="cross")
+        .join(pl.DataFrame({"slot": list(range(players))}), how="cross")
+        .join(pl.DataFrame({"target_week": list(range(1, 18))}), how="cross")
+        .with_columns(
+            pl.format("{}-{}", "position", "slot").alias("player_id"),
+            pl.format("Player {} {}", "position", "slot").alias("player_name"),
+            pl.format("T{}", "slot").alias("team"),
+        )
+        .drop("slot")
+    )
+    files = []
+    for model in ("svr", "mlp", "ebm", "ridge"):
+        path = root / f"{model}-predictions.parquet"
+        keys.with_columns(
+            pl.Series("prediction", rng.gamma(2.0, 5.0, keys.height)),
+            pl.when(pl.col("target_season") < 2026)
+            .then(pl.Series(rng.gamma(2.0, 5.0, keys.height)))
+            .alias("fantasy_points"),
+            pl.Series("injury_missed_game", rng.random(keys.height) < 0.05),
+            pl.Series("projected_target_share", rng.random(keys.height) * 0.3),
+        ).write_parquet(path)
+        files.append(prediction_file(path))
+    return files
+
+
+def _best_seconds(
+    call: Callable[..., object], *args: object, **kwargs: object
+) -> float:
+    timings = []
+    for _ in range(7):
+        started = time.perf_counter()
+        call(*args, **kwargs)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_position_changes_rerank_cached_draft_partials(tmp_path: Path) -> None:
+    files = _synthetic_archive(tmp_path)
+    directory = tmp_path / "views"
+    materialize_views(files, directory)
+
+    for season, model in ((2020, CONSENSUS_MODEL), (2026, "SVR")):
+        weekly = select_predictions(files, model, season=season)
+        partials = {
+            position: draft_partial(
+                files,
+                model,
+                season=season,
+                position=position,
+                materialized=directory,
+            )
+            for position in SYNTHETIC_POSITIONS
+        }
+        for positions in (["QB"], ["RB", "WR", "TE"], list(SYNTHETIC_POSITIONS)):
+            assert_frame_equal(
+                draft_board_from_partials([partials[name] for name in positions]),
+                draft_board(weekly, season=season, positions=positions),
+            )
+
+        regrouped = _best_seconds(
+            draft_board, weekly, season=season, positions=SYNTHETIC_POSITIONS
+        )
+        reranked = _best_seconds(draft_board_from_partials, list(partials.values()))
+        assert reranked < regrouped
+
+
+def _write_empty(path: Path) -> Path:
+    _predictions().clear().write_parquet(path)
+    return path
+
+
 def test_draft_and_weekly_boards_rank_the_selected_horizon() -> None:
     prepared = select_model(
         prepare_predictions(_predictions(), model_name="SVR"),
@@ -172,6 +393,49 @@ def test_draft_board_flags_fragile_opportunity() -> None:
     assert running_back["opportunity_basis"][0] == "Depth-chart estimate"
 
 
+def test_chart_data_is_reduced_to_a_bounded_size(tmp_path: Path) -> None:
+    files = _synthetic_archive(tmp_path)
+    season = scan_predictions(files, season=2020).collect()
+
+    thinned = chart_data(season)
+    assert 0 < thinned.height <= 5_000 < season.height
+    assert_frame_equal(thinned.head(1), season.head(1))
+    assert_frame_equal(chart_data(season, reduce=weekly_bands), weekly_bands(season))
+    with pytest.raises(DashboardDataError, match="at most 5000"):
+        chart_data(season, reduce=lambda frame: frame)
+
+    histogram = chart_data(season_error_histogram(files, season=2020, bins=20))
+    scorecard = season_scorecard(files, season=2020)
+    assert histogram.height <= scorecard.height * 20
+    assert_frame_equal(
+        histogram.group_by("model")
+        .agg(pl.col("rows").sum().alias("samples"))
+        .sort("model"),
+        scorecard.select("model", "samples").sort("model"),
+    )
+    assert histogram.group_by("model").agg(pl.col("share").sum())[
+        "share"
+    ].to_list() == pytest.approx([1.0] * scorecard.height)
+
+    svr = select_model(season, "SVR")
+    bands = chart_data(weekly_bands(svr))
+    week = svr.filter(pl.col("target_week") == 1)["prediction"]
+    assert bands.height == 17
+    assert bands.row(0, named=True) == {
+        "target_week": 1,
+        "median": pytest.approx(week.median()),
+        "lower": pytest.approx(week.quantile(0.1, interpolation="linear")),
+        "upper": pytest.approx(week.quantile(0.9, interpolation="linear")),
+        "players": week.len(),
+    }
+
+    board = draft_board(svr, season=2020, positions=SYNTHETIC_POSITIONS)
+    assert_frame_equal(
+        top_n(board, "projected_points", n=18),
+        board.sort("projected_points", descending=True).head(18),
+    )
+
+
 def test_model_scorecard_includes_consensus() -> None:
     frame = pl.concat(
         [
@@ -191,6 +455,32 @@ def test_model_scorecard_includes_consensus() -> None:
     assert consensus["bias"] == pytest.approx(-0.5)
 
 
+def test_stage_timings_record_only_while_recording() -> None:
+    @timed("boards")
+    def boards() -> pl.DataFrame:
+        return _predictions()
+
+    boards()
+    with recording_stages() as timings:
+        with timed_stage("discover") as stage:
+            stage.rows = 2
+        boards()
+    boards()
+
+    assert [(timing.stage, timing.rows) for timing in timings.stages] == [
+        ("discover", 2),
+        ("boards", 4),
+    ]
+    assert all(timing.seconds >= 0 for timing in timings.stages)
+    exported = json.loads(timings.to_json())
+    assert [StageTiming(**stage) for stage in exported["stages"]] == list(
+        timings.stages
+    )
+    assert exported["seconds"] == pytest.approx(
+        sum(timing.seconds for timing in timings.stages)
+    )
+
+
 def test_model_name_from_path_is_concise() -> None:
     assert model_name_from_path(Path("svr-predictions.parquet")) == "SVR"
     assert model_name_from_path(Path("experimental-model.parquet")) == (
@@ -223,6 +513,14 @@ def test_dashboard_app_renders_draft_workspace(
     sort.set_value("Adjusted at actual PPG").run()
     assert not app.exception
     assert "Draft board" in [header.value for header in app.header]
+    assert not app.expander
+
+    app.query_params["debug"] = "1"
+    app.run()
+    diagnostics = app.expander[0]
+    stages = diagnostics.dataframe[0].value["Stage"].to_list()
+    assert diagnostics.label == "Diagnostics"
+    assert {"discover artifacts", "draft board", "draft chart"} <= set(stages)
 
 
 def test_dashboard_exposes_all_artifact_seasons_and_positions(
@@ -3,11 +3,12 @@ from pathlib import Path
 import polars as pl
 import pytest
 
+from ffpred.acquisition.games import TWO_POINT_PBP_COLUMNS
 from ffpred.datasets.builder import DatasetBuildConfig, build_datasets
 from ffpred.datasets.manifest import DatasetManifest
 from ffpred.errors import ConfigurationError
 from ffpred.features.schema import FEATURE_COLUMNS
-from tests.factories import make_provider
+from tests.factories import RecordingProvider, make_provider
 
 
 def test_build_datasets_builds_reproducible_artifacts(tmp_path: Path) -> None:
@@ -40,3 +41,35 @@ def test_dataset_build_config_rejects_invalid_ranges() -> None:
             train_start=2021,
             test_year=2022,
         )
+
+
+def test_build_datasets_prefetches_projected_sources_once(tmp_path: Path) -> None:
+    provider = RecordingProvider(make_provider())
+
+    manifest = build_datasets(
+        DatasetBuildConfig(
+            output_dir=tmp_path,
+            history_start=2020,
+            train_start=2021,
+            test_year=2022,
+        ),
+        provider=provider,
+    )
+
+    assert sorted(provider.names()) == [
+        "load_pbp",
+        "load_pbp",
+        "load_pbp",
+        "load_player_stats",
+        "load_players",
+        "load_schedules",
+        "load_team_stats",
+    ]
+    assert all(
+        kwargs["columns"] == TWO_POINT_PBP_COLUMNS
+        for name, kwargs in provider.calls
+        if name == "load_pbp"
+    )
+    assert tuple(manifest.sources["play_by_play:2020"].schema) == (
+        TWO_POINT_PBP_COLUMNS
+    )
@@ -3,8 +3,17 @@ from pathlib import Path
 import polars as pl
 import pytest
 
-from ffpred.datasets.io import read_dataset, write_dataset
-from ffpred.errors import DatasetIntegrityError, EmptyDatasetError
+from ffpred.datasets.io import (
+    read_dataset,
+    write_dataset,
+    write_dataset_view,
+    write_partitioned_dataset,
+)
+from ffpred.errors import (
+    DatasetGenerationError,
+    DatasetIntegrityError,
+    EmptyDatasetError,
+)
 from ffpred.features.schema import FEATURE_SCHEMA
 
 
@@ -44,3 +53,39 @@ def test_checksum_mismatch_is_detected(tmp_path: Path) -> None:
 
     with pytest.raises(DatasetIntegrityError, match="Checksum mismatch"):
         read_dataset(path, expected_sha256="0" * 64)
+
+
+def test_dataset_view_reads_only_partitions_before_its_bound(tmp_path: Path) -> None:
+    frame = pl.concat(
+        [
+            _feature_frame().with_columns(
+                pl.lit(season, dtype=pl.Int64).alias("target_season")
+            )
+            for season in (2020, 2021, 2022)
+        ]
+    )
+    partitions = write_partitioned_dataset(
+        tmp_path / "training",
+        frame,
+        partition_column="target_season",
+    )
+    view = write_dataset_view(
+        tmp_path / "2022" / "training.json",
+        partitions[:2],
+        partition_column="target_season",
+        before=2022,
+        columns=frame.width,
+    )
+
+    restored = read_dataset(Path(view.path), expected_sha256=view.sha256)
+
+    assert restored.to_dicts() == frame.head(2).to_dicts()
+    assert view.rows == 2
+    with pytest.raises(DatasetGenerationError, match="2022"):
+        write_dataset_view(
+            tmp_path / "2022" / "training.json",
+            partitions,
+            partition_column="target_season",
+            before=2022,
+            columns=frame.width,
+        )
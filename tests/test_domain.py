@@ -59,3 +59,19 @@ def test_settings_load_environment(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert settings.output_dir == Path("artifacts")
     assert settings.test_year == 2025
+
+
+def test_settings_require_a_directory_for_the_offline_season_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("FFPRED_CACHE_MODE", "season")
+    monkeypatch.setenv("FFPRED_OFFLINE", "1")
+    with pytest.raises(ConfigurationError, match="cache directory"):
+        Settings.from_env()
+
+    monkeypatch.setenv("FFPRED_CACHE_DIR", "seeded")
+    settings = Settings.from_env()
+
+    assert settings.cache_mode == "season"
+    assert settings.offline
+    assert settings.cache_dir == Path("seeded")
@@ -2,10 +2,13 @@ import numpy as np
 import polars as pl
 import pytest
 from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_absolute_error
 
+from ffpred.errors import ConfigurationError
 from ffpred.evaluation.cohorts import residual_cohorts
 from ffpred.evaluation.explainability import (
     accumulated_local_effects,
+    accumulated_local_effects_batch,
     conformal_prediction_interval,
     model_agnostic_shap_values,
     temporal_permutation_importance,
@@ -44,6 +47,53 @@ def test_ale_curve_recovers_increasing_linear_effect() -> None:
     assert np.average(curve.effects, weights=curve.samples) == pytest.approx(0)
 
 
+class _CountingModel:
+    def __init__(self, estimator: LinearRegression) -> None:
+        self.estimator = estimator
+        self.batches: list[int] = []
+
+    def predict(self, features: np.ndarray) -> np.ndarray:
+        self.batches.append(features.shape[0])
+        return self.estimator.predict(features)
+
+
+def test_batched_ale_matches_per_feature_curves_within_memory_cap() -> None:
+    rng = np.random.default_rng(3)
+    features = np.column_stack(
+        (rng.normal(size=60), np.ones(60), rng.integers(0, 3, 60), rng.normal(size=60))
+    )
+    model = _CountingModel(
+        LinearRegression().fit(features, features[:, 0] - 2 * features[:, 3])
+    )
+    names = ("first", "constant", "discrete", "last")
+    expected = tuple(
+        accumulated_local_effects(model, features, index, name, bins=4)
+        for index, name in enumerate(names)
+    )
+    model.batches.clear()
+
+    curves = accumulated_local_effects_batch(model, features, names, bins=4)
+    uncapped = model.batches.copy()
+    model.batches.clear()
+    capped = accumulated_local_effects_batch(
+        model, features, names, bins=4, max_bytes=40 * features.itemsize * 4
+    )
+
+    assert [curve.feature for curve in curves] == list(names)
+    assert curves[1].effects == (0.0,)
+    for curve, reference in zip(curves, expected, strict=True):
+        assert curve.bin_edges == reference.bin_edges
+        assert curve.samples == reference.samples
+        np.testing.assert_allclose(curve.effects, reference.effects, atol=1e-12)
+    assert uncapped == [6 * features.shape[0]]
+    assert max(model.batches) == 40
+    assert sum(model.batches) == sum(uncapped)
+    for curve, reference in zip(capped, curves, strict=True):
+        np.testing.assert_allclose(curve.effects, reference.effects, atol=1e-12)
+    with pytest.raises(ValueError, match="feature_names"):
+        accumulated_local_effects_batch(model, features, names[:2])
+
+
 def test_temporal_permutation_importance_identifies_signal() -> None:
     signal = np.tile(np.arange(10, dtype=float), 2)
     noise = np.tile([0.0, 1.0], 10)
@@ -67,6 +117,56 @@ def test_temporal_permutation_importance_identifies_signal() -> None:
     assert importance[1].mean_mae_increase == pytest.approx(0, abs=1e-12)
 
 
+def test_temporal_permutation_importance_is_reproducible_across_strategies() -> None:
+    rng = np.random.default_rng(11)
+    features = rng.normal(size=(45, 3))
+    target = features @ np.asarray([3.0, -1.0, 0.0]) + rng.normal(size=45)
+    periods = rng.integers(2020, 2023, 45)
+    names = ("a", "b", "c")
+    estimator = LinearRegression().fit(features, target)
+    baseline = mean_absolute_error(target, estimator.predict(features))
+    random = np.random.default_rng(5)
+    expected = {}
+    for index, name in enumerate(names):
+        increases = []
+        for _ in range(4):
+            permuted = features.copy()
+            for period in np.unique(periods):
+                rows = np.flatnonzero(periods == period)
+                permuted[rows, index] = random.permutation(permuted[rows, index])
+            increases.append(
+                mean_absolute_error(target, estimator.predict(permuted)) - baseline
+            )
+        expected[name] = (float(np.mean(increases)), float(np.std(increases)))
+    original = features.copy()
+
+    def run(**options: int) -> dict[str, tuple[float, float]]:
+        return {
+            result.feature: (result.mean_mae_increase, result.std_mae_increase)
+            for result in temporal_permutation_importance(
+                estimator,
+                features,
+                target,
+                periods,
+                names,
+                repeats=4,
+                random_state=5,
+                **options,
+            )
+        }
+
+    assert run() == expected
+    assert run(jobs=2) == expected
+    batched = run(batch_size=3)
+    for name in names:
+        assert batched[name] == pytest.approx(expected[name], abs=1e-12)
+    np.testing.assert_array_equal(features, original)
+    with pytest.raises(ValueError, match="batch_size"):
+        run(batch_size=0)
+    with pytest.raises(ConfigurationError, match="jobs"):
+        run(jobs=0)
+
+
 def test_model_agnostic_shap_values_reconstruct_predictions() -> None:
     features = np.asarray(
         [[0.0, 1.0], [1.0, 0.0], [2.0, 1.0], [3.0, 0.0]],
@@ -1,5 +1,12 @@
 from datetime import date
 
+import polars as pl
+
+from ffpred.acquisition.games import acquire_defense_games, acquire_quarterback_games
+from ffpred.acquisition.normalize import (
+    acquire_defense_histories,
+    acquire_quarterback_histories,
+)
 from ffpred.domain.identifiers import GameId, PlayerId, Season, TeamCode, Week
 from ffpred.domain.models import (
     DefenseGame,
@@ -12,8 +19,9 @@ from ffpred.domain.models import (
     QuarterbackGameStats,
     QuarterbackHistory,
 )
-from ffpred.features.builder import build_feature_frame
+from ffpred.features.builder import build_feature_frame, build_feature_frame_from_games
 from ffpred.features.schema import FEATURE_COLUMNS
+from tests.factories import make_provider
 
 
 def _context(game_id: str, team: str, opponent: str, day: int) -> GameContext:
@@ -194,3 +202,83 @@ def test_rookie_fallback_records_the_cohort_history_period_used() -> None:
         row["qb_history_through_season"],
         row["qb_history_through_week"],
     ) < (row["target_season"], row["target_week"])
+
+
+def test_columnar_games_build_the_same_frame_as_histories() -> None:
+    provider = make_provider()
+    seasons = (2020, 2021, 2022)
+
+    from_histories = build_feature_frame(
+        acquire_quarterback_histories(seasons, provider=provider),
+        acquire_defense_histories(seasons, provider=provider),
+    )
+    from_games = build_feature_frame_from_games(
+        acquire_quarterback_games(seasons, provider=provider),
+        acquire_defense_games(seasons, provider=provider),
+    )
+
+    assert from_games.equals(from_histories)
+
+
+def test_rookie_fallback_averages_every_earlier_cohort_game() -> None:
+    rookie = PlayerProfile(
+        player_id=PlayerId("rookie"),
+        name="Rookie",
+        birth_date=date(1990, 1, 1),
+        rookie_season=Season(2014),
+    )
+    debut = PlayerProfile(
+        player_id=PlayerId("debut"),
+        name="Debut",
+        birth_date=date(1991, 1, 1),
+        rookie_season=Season(2014),
+    )
+    keys = [GameKey(Season(2014), Week(week)) for week in (1, 2, 3)]
+    quarterbacks = {
+        rookie.player_id: QuarterbackHistory(
+            profile=rookie,
+            games={
+                key: QuarterbackGame(
+                    key=key,
+                    context=_context(f"r{key.week}", "GB", "SEA", key.week),
+                    stats=_qb_stats(100 * key.week),
+                )
+                for key in keys[:2]
+            },
+        ),
+        debut.player_id: QuarterbackHistory(
+            profile=debut,
+            games={
+                keys[2]: QuarterbackGame(
+                    key=keys[2],
+                    context=_context("d3", "NYG", "SEA", 3),
+                    stats=_qb_stats(999),
+                )
+            },
+        ),
+    }
+    defenses = {
+        TeamCode("SEA"): DefenseHistory(
+            team=TeamCode("SEA"),
+            games={
+                key: DefenseGame(
+                    key=key,
+                    context=_context(f"s{key.week}", "SEA", "GB", key.week),
+                    stats=_defense_stats(150),
+                )
+                for key in keys
+            },
+        )
+    }
+
+    frame = build_feature_frame(quarterbacks, defenses).filter(
+        pl.col("player_id") == "debut"
+    )
+
+    row = frame.row(0, named=True)
+    assert row["qb_last_1_passing_yards"] == 150
+    assert row["qb_last_10_passing_yards"] == 150
+    assert (row["qb_history_through_season"], row["qb_history_through_week"]) == (
+        2014,
+        2,
+    )
@@ -1,12 +1,22 @@
+from datetime import date
+
 import polars as pl
+import pytest
 
+from ffpred.acquisition.games import (
+    QUARTERBACK_GAMES_SCHEMA,
+    acquire_defense_games,
+    acquire_quarterback_games,
+)
 from ffpred.acquisition.normalize import (
     acquire_defense_histories,
     acquire_injury_reports,
     acquire_quarterback_histories,
+    quarterback_histories_from_games,
 )
 from ffpred.domain.identifiers import PlayerId, Season, TeamCode, Week
 from ffpred.domain.models import GameKey, InjuryStatus
+from ffpred.errors import DataAcquisitionError
 from ffpred.providers.fakes import FakeProvider
 
 
@@ -102,6 +112,47 @@ def test_quarterback_acquisition_returns_typed_history() -> None:
     assert game.stats.passing_two_point_attempts == 1
 
 
+def test_quarterback_games_are_a_typed_columnar_frame() -> None:
+    games = acquire_quarterback_games([2014], provider=_provider())
+
+    assert dict(games.schema) == QUARTERBACK_GAMES_SCHEMA
+    row = games.row(0, named=True)
+    assert row["player_name"] == "Test Quarterback"
+    assert row["birth_date"] == date(1985, 1, 2)
+    assert row["game_date"] == date(2014, 9, 4)
+    assert row["opponent"] == "SEA"
+    assert row["passing_two_point_attempts"] == 1
+    assert row["rushing_two_point_attempts"] == 0
+
+
+def test_quarterback_histories_are_a_view_over_the_games_frame() -> None:
+    provider = _provider()
+
+    view = quarterback_histories_from_games(
+        acquire_quarterback_games([2014], provider=provider)
+    )
+
+    assert view == acquire_quarterback_histories([2014], provider=provider)
+
+
+def test_quarterback_games_require_a_schedule_row() -> None:
+    provider = _provider()
+    provider.schedules = provider.schedules.with_columns(
+        pl.lit("2014_01_OTHER").alias("game_id")
+    )
+
+    with pytest.raises(DataAcquisitionError, match="No schedule row"):
+        acquire_quarterback_games([2014], provider=provider)
+
+
+def test_defense_games_reject_teams_missing_from_the_schedule() -> None:
+    provider = _provider()
+    provider.team_stats = provider.team_stats.with_columns(pl.lit("NE").alias("team"))
+
+    with pytest.raises(DataAcquisitionError, match="not listed in schedule"):
+        acquire_defense_games([2014], provider=provider)
+
+
 def test_defense_acquisition_attributes_opponent_offense() -> None:
     histories = acquire_defense_histories([2014], provider=_provider())
 
@@ -1,11 +1,29 @@
+import os
+import threading
+import time
+from collections.abc import Sequence
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import Mock
 
 import polars as pl
+import pytest
+from nflreadpy.config import CacheMode, get_config
+from polars.testing import assert_frame_equal
 
+from ffpred.errors import ConfigurationError, DataAcquisitionError
+from ffpred.providers import cache, provenance
+from ffpred.providers.cache import SeasonCacheProvider
 from ffpred.providers.fakes import FakeProvider
 from ffpred.providers.nflreadpy import NFLVERSE_DATA_URL, NflReadPyProvider
-from ffpred.providers.provenance import ProvenanceProvider
+from ffpred.providers.prefetch import PrefetchProvider, PrefetchRequest
+from ffpred.providers.protocol import NflDataProvider
+from ffpred.providers.provenance import (
+    FINGERPRINT_FORMAT,
+    ProvenanceProvider,
+    fingerprint_frame,
+)
+from tests.factories import RecordingProvider
 
 
 def test_nflreadpy_adapter_delegates_all_operations(monkeypatch) -> None:
@@ -97,3 +115,391 @@ def test_provenance_provider_fingerprints_every_delegated_call() -> None:
     assert artifact.rows == 1
     assert artifact.sha256
     assert "players" in provider.artifacts
+
+
+STATS = pl.DataFrame(
+    {
+        "season": [2022, 2023, 2024, 2024, 2025],
+        "player_id": ["a", "a", "a", "b", "b"],
+        "fantasy_points": [1.0, 2.0, 3.0, 4.0, 5.0],
+    }
+)
+
+
+def _seasonal_stats(seasons: Sequence[int]) -> pl.DataFrame:
+    return STATS.filter(pl.col("season").is_in(list(seasons)))
+
+
+def test_season_cache_fetches_only_missing_seasons(tmp_path) -> None:
+    inner = Mock()
+    fetch = inner.load_player_stats
+    fetch.side_effect = _seasonal_stats
+    provider = SeasonCacheProvider(inner, tmp_path, current_season=2025)
+
+    first = provider.load_player_stats((2022, 2023, 2024))
+    second = provider.load_player_stats((2024, 2025))
+
+    assert_frame_equal(first, _seasonal_stats((2022, 2023, 2024)))
+    assert_frame_equal(second, _seasonal_stats((2024, 2025)))
+    assert [call.args[0] for call in fetch.call_args_list] == [
+        (2022, 2023, 2024),
+        (2025,),
+    ]
+    stats = provider.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 4, 0)
+    assert provider.path("player_stats", 2024).exists()
+    assert stats.bytes > 0
+
+
+def test_season_cache_refetches_seasons_a_batch_did_not_return(tmp_path) -> None:
+    inner = Mock()
+    fetch = inner.load_player_stats
+    fetch.side_effect = _seasonal_stats
+    provider = SeasonCacheProvider(inner, tmp_path, current_season=2025)
+
+    first = provider.load_player_stats((2021, 2022))
+    cached = provider.path("player_stats", 2021).exists()
+    provider.load_player_stats((2021,))
+
+    assert_frame_equal(first, _seasonal_stats((2022,)))
+    assert not cached
+    assert [call.args[0] for call in fetch.call_args_list] == [(2021, 2022), (2021,)]
+
+
+def test_season_cache_expires_only_the_current_season(tmp_path) -> None:
+    inner = Mock()
+    fetch = inner.load_player_stats
+    fetch.side_effect = _seasonal_stats
+    provider = SeasonCacheProvider(
+        inner, tmp_path, current_season=2025, ttl=timedelta(hours=1)
+    )
+    provider.load_player_stats((2024, 2025))
+    stale = time.time() - 2 * 60 * 60
+    for season in (2024, 2025):
+        os.utime(provider.path("player_stats", season), (stale, stale))
+
+    provider.load_player_stats((2024, 2025))
+
+    assert [call.args[0] for call in fetch.call_args_list] == [
+        (2024, 2025),
+        (2025,),
+    ]
+
+
+def test_season_cache_evicts_least_recently_read_files(tmp_path) -> None:
+    inner = Mock()
+    inner.load_player_stats.side_effect = _seasonal_stats
+    provider = SeasonCacheProvider(inner, tmp_path, current_season=2030)
+    provider.load_player_stats((2022, 2023))
+    size = provider.path("player_stats", 2022).stat().st_size
+    past = time.time() - 60
+    os.utime(provider.path("player_stats", 2022), (past, past))
+    provider.max_bytes = 2 * size + size // 2
+
+    provider.load_player_stats((2024,))
+
+    assert not provider.path("player_stats", 2022).exists()
+    assert provider.path("player_stats", 2023).exists()
+    assert provider.path("player_stats", 2024).exists()
+    assert provider.stats().evictions == 1
+
+
+def test_season_cache_never_evicts_an_entry_while_it_is_read(
+    tmp_path, monkeypatch
+) -> None:
+    provider = SeasonCacheProvider(
+        FakeProvider(player_stats=STATS), tmp_path, current_season=2030
+    )
+    provider.load_player_stats((2022, 2023))
+    size = provider.path("player_stats", 2022).stat().st_size
+    past = time.time() - 60
+    os.utime(provider.path("player_stats", 2022), (past, past))
+    provider.max_bytes = 2 * size + size // 2
+    project = cache.project_frame
+
+    def evict_during_scan(source: pl.DataFrame | pl.LazyFrame, **kwargs):
+        if isinstance(source, pl.LazyFrame) and not provider.evictions:
+            provider.load_player_stats((2024,))
+        return project(source, **kwargs)
+
+    monkeypatch.setattr(cache, "project_frame", evict_during_scan)
+
+    frame = provider.load_player_stats((2022,), columns=("fantasy_points",))
+
+    assert frame["fantasy_points"].to_list() == [1.0]
+    assert provider.path("player_stats", 2022).exists()
+    assert not provider.path("player_stats", 2023).exists()
+
+
+def test_season_cache_serves_a_preseeded_directory_offline(tmp_path) -> None:
+    seeded = SeasonCacheProvider(
+        FakeProvider(players=pl.DataFrame({"gsis_id": ["a"]})),
+        tmp_path,
+        current_season=2025,
+    )
+    seeded.load_players()
+    inner = Mock()
+    provider = SeasonCacheProvider(
+        inner, tmp_path, current_season=2025, ttl=timedelta(0), offline=True
+    )
+
+    assert provider.load_players()["gsis_id"].to_list() == ["a"]
+    with pytest.raises(DataAcquisitionError, match="play_by_play season 2025"):
+        provider.load_pbp(2025)
+    inner.load_players.assert_not_called()
+    inner.load_pbp.assert_not_called()
+
+
+PREFETCH_FAKE = FakeProvider(
+    player_stats=STATS,
+    team_stats=pl.DataFrame({"season": [2023], "team": ["A"]}),
+    schedules=pl.DataFrame({"season": [2023, 2024], "game_id": ["g1", "g2"]}),
+    players=pl.DataFrame({"gsis_id": ["a"]}),
+    pbp_by_season={2024: pl.DataFrame({"play_id": [1, 2]})},
+)
+
+
+def _calls(provider: NflDataProvider) -> None:
+    provider.load_schedules((2023, 2024))
+    provider.load_player_stats((2023, 2024))
+    provider.load_team_stats((2023, 2024))
+    provider.load_players()
+    provider.load_pbp(2024)
+    provider.load_schedules((2023, 2024))
+
+
+def test_prefetch_provider_loads_the_plan_concurrently_with_same_provenance() -> None:
+    plan = [
+        PrefetchRequest(dataset="schedules", seasons=(2023, 2024)),
+        PrefetchRequest(dataset="player_stats", seasons=(2023, 2024)),
+        PrefetchRequest(dataset="team_stats", seasons=(2023, 2024)),
+        PrefetchRequest(dataset="players"),
+        PrefetchRequest(dataset="pbp", seasons=(2024,)),
+        PrefetchRequest(dataset="schedules", seasons=(2023, 2024)),
+    ]
+    sequential = ProvenanceProvider(PREFETCH_FAKE)
+    _calls(sequential)
+    # Each load only returns once all five distinct loads are in flight.
+    gated = RecordingProvider(PREFETCH_FAKE, gate=threading.Barrier(5, timeout=5).wait)
+
+    with PrefetchProvider(gated, plan, max_workers=5) as prefetching:
+        recording = ProvenanceProvider(prefetching)
+        _calls(recording)
+        assert not prefetching.pending()
+
+    assert sorted(gated.names()) == [
+        "load_pbp",
+        "load_player_stats",
+        "load_players",
+        "load_schedules",
+        "load_team_stats",
+    ]
+    assert list(recording.artifacts) == list(sequential.artifacts)
+    assert recording.artifacts == sequential.artifacts
+
+
+def test_prefetch_provider_bounds_its_lookahead_window() -> None:
+    started = threading.Semaphore(0)
+    release = threading.Event()
+
+    def gate() -> None:
+        started.release()
+        release.wait(timeout=5)
+
+    gated = RecordingProvider(PREFETCH_FAKE, gate=gate)
+    plan = [
+        PrefetchRequest(dataset="schedules", seasons=(2023,)),
+        PrefetchRequest(dataset="team_stats", seasons=(2023,)),
+        PrefetchRequest(dataset="players"),
+        PrefetchRequest(dataset="pbp", seasons=(2024,)),
+    ]
+
+    with PrefetchProvider(gated, plan, max_workers=4, lookahead=2) as prefetching:
+        assert started.acquire(timeout=5)
+        assert started.acquire(timeout=5)
+        assert not started.acquire(timeout=0.1)
+        assert sorted(gated.names()) == ["load_schedules", "load_team_stats"]
+        release.set()
+        # A request beyond the window is submitted as soon as it is called.
+        assert prefetching.load_pbp(2024)["play_id"].to_list() == [1, 2]
+        prefetching.load_schedules((2023,))
+        prefetching.load_team_stats((2023,))
+        prefetching.load_players()
+        assert not prefetching.pending()
+
+    assert sorted(gated.names()) == [
+        "load_pbp",
+        "load_players",
+        "load_schedules",
+        "load_team_stats",
+    ]
+
+
+def test_prefetch_provider_raises_planned_errors_at_the_consuming_call() -> None:
+    inner = Mock()
+    inner.load_injuries.side_effect = DataAcquisitionError("injuries unavailable")
+    provider = PrefetchProvider(
+        inner, [PrefetchRequest(dataset="injuries", seasons=(2024,))]
+    )
+    with provider, pytest.raises(DataAcquisitionError, match="unavailable"):
+        provider.load_injuries([2024])
+
+    with pytest.raises(ConfigurationError, match="pbp"):
+        PrefetchRequest(dataset="pbp", seasons=(2023, 2024))
+
+
+def test_nflreadpy_adapter_projects_each_season_loaded_through_nflreadpy(
+    monkeypatch,
+) -> None:
+    stats = {
+        2023: pl.DataFrame({"season": [2023], "attempts": [30]}),
+        2024: pl.DataFrame({"season": [2024], "attempts": [31.0], "unused": ["x"]}),
+    }
+    load_player_stats = Mock(side_effect=lambda seasons: stats[seasons[0]])
+    monkeypatch.setattr(
+        "ffpred.providers.nflreadpy.nfl.load_player_stats", load_player_stats
+    )
+
+    projected_stats = NflReadPyProvider().load_player_stats(
+        (2023, 2024), columns=("season", "attempts")
+    )
+
+    assert [call.args[0] for call in load_player_stats.call_args_list] == [
+        [2023],
+        [2024],
+    ]
+    assert projected_stats.to_dict(as_series=False) == {
+        "season": [2023, 2024],
+        "attempts": [30.0, 31.0],
+    }
+
+
+def test_nflreadpy_adapter_scans_projected_play_by_play_release_files(
+    monkeypatch,
+    tmp_path,
+) -> None:
+    plays = pl.DataFrame(
+        {"play_id": [1, 2], "season_type": ["REG", "POST"], "yards": [3, 4]}
+    )
+    download = Mock(side_effect=lambda url, path: plays.write_parquet(path))
+    monkeypatch.setattr("ffpred.providers.nflreadpy._download", download)
+    monkeypatch.setattr(
+        "ffpred.providers.nflreadpy.nfl.load_pbp",
+        Mock(side_effect=AssertionError("complete play-by-play was decoded")),
+    )
+    config = get_config()
+    monkeypatch.setattr(config, "cache_mode", CacheMode.FILESYSTEM)
+    monkeypatch.setattr(config, "cache_dir", tmp_path)
+    provider = NflReadPyProvider()
+
+    for _ in range(2):
+        projected = provider.load_pbp(
+            2024,
+            columns=("play_id",),
+            predicate=pl.col("season_type") == "REG",
+        )
+        assert projected.to_dict(as_series=False) == {"play_id": [1]}
+    (cached,) = tmp_path.glob("*.parquet")
+    download.assert_called_once()
+    assert download.call_args.args[0].endswith("pbp/play_by_play_2024.parquet")
+    assert_frame_equal(pl.read_parquet(cached), plays)
+
+    monkeypatch.setattr(config, "cache_mode", CacheMode.OFF)
+    assert provider.load_pbp(2024, columns=("yards",))["yards"].to_list() == [3, 4]
+    assert download.call_count == 2
+    with pytest.raises(DataAcquisitionError, match=r"\['missing'\]"):
+        provider.load_pbp(2024, columns=("play_id", "missing"))
+
+
+def test_season_cache_projects_cached_seasons_without_changing_files(
+    tmp_path,
+) -> None:
+    provider = SeasonCacheProvider(
+        FakeProvider(player_stats=STATS), tmp_path, current_season=2030
+    )
+    predicate = pl.col("player_id") == "b"
+
+    fetched = provider.load_player_stats((2024,), columns=("fantasy_points",))
+    cached = provider.load_player_stats(
+        (2024,), columns=("fantasy_points",), predicate=predicate
+    )
+
+    assert fetched["fantasy_points"].to_list() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert cached["fantasy_points"].to_list() == [4.0, 5.0]
+    assert pl.read_ipc(provider.path("player_stats", 2024)).columns == STATS.columns
+    with pytest.raises(DataAcquisitionError, match="projection"):
+        provider.load_player_stats((2024,), predicate=pl.col("absent") == 1)
+
+
+def test_fingerprint_is_canonical_across_chunks_slices_and_null_slots() -> None:
+    frame = pl.DataFrame(
+        {
+            "player_id": ["a", None, "ccc", "d"],
+            "points": [1.5, 2.0, None, -0.0],
+            "week": pl.Series([1, None, 3, 4], dtype=pl.Int32),
+            "active": [True, None, False, True],
+            "game_date": pl.Series(
+                ["2024-09-08", None, "2024-09-22", None]
+            ).str.to_date(),
+            "tags": [["x"], [], None, ["y", "z"]],
+        }
+    )
+    chunked = pl.concat([frame.head(1), frame.tail(3)], rechunk=False)
+    sliced = pl.concat([frame.head(1), frame]).slice(1)
+    refilled = frame.with_columns(
+        pl.when(pl.col("points").is_null())
+        .then(None)
+        .otherwise(pl.col("points"))
+        .alias("points")
+    )
+
+    digest = fingerprint_frame("source", frame).sha256
+    assert fingerprint_frame("source", chunked).sha256 == digest
+    assert fingerprint_frame("source", sliced).sha256 == digest
+    assert fingerprint_frame("source", refilled).sha256 == digest
+    for changed in (
+        frame.with_columns(pl.col("points").fill_null(0.0)),
+        frame.with_columns(pl.col("player_id").replace("ccc", "cc")),
+        frame.with_columns(pl.col("week").cast(pl.Int64)),
+        frame.rename({"week": "round"}),
+        frame.head(3),
+    ):
+        assert fingerprint_frame("source", changed).sha256 != digest
+
+
+def test_fingerprint_hashes_text_in_slices_without_changing_it(monkeypatch) -> None:
+    frame = pl.DataFrame(
+        {
+            "player_id": ["a", None, "ccc", "dé", "", "f"],
+            "raw": [b"a", None, b"", b"\x00\xff", b"e", b"f"],
+        }
+    ).with_columns(team=pl.col("player_id").cast(pl.Categorical))
+    whole = fingerprint_frame("source", frame).sha256
+
+    monkeypatch.setattr(provenance, "_BYTES_SLICE_ROWS", 4)
+
+    assert fingerprint_frame("source", frame).sha256 == whole
+
+
+def test_provenance_provider_defers_fingerprints_without_changing_them() -> None:
+    fake = FakeProvider(
+        player_stats=STATS,
+        players=pl.DataFrame({"gsis_id": ["a"]}),
+        pbp_by_season={2024: pl.DataFrame({"play_id": [1, 2]})},
+    )
+    recorded = []
+    for mode in ("eager", "background", "lazy"):
+        with ProvenanceProvider(fake, fingerprint=mode) as provider:
+            provider.load_pbp(2024)
+            provider.load_player_stats((2024,), columns=("player_id",))
+            provider.load_players()
+        recorded.append(provider.artifacts)
+
+    assert list(recorded[0]) == ["play_by_play:2024", "player_stats:2024", "players"]
+    assert recorded[1] == recorded[0]
+    assert list(recorded[2]) == list(recorded[0])
+    assert recorded[2] == recorded[0]
+    assert recorded[0]["players"].fingerprint == FINGERPRINT_FORMAT
+    assert not any(
+        thread.name.startswith("ffpred-fingerprint") for thread in threading.enumerate()
+    )
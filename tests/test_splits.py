@@ -1,20 +1,24 @@
+import numpy as np
 import polars as pl
 import pytest
+from sklearn.metrics import mean_absolute_error
 
-from ffpred.errors import ModelTrainingError
+from ffpred.errors import ConfigurationError, ModelTrainingError
 from ffpred.evaluation.splits import (
     chronological_calibration_split,
     chronological_folds,
+    period_index,
 )
 from ffpred.training.data import training_data_from_frame
 from ffpred.training.svr import (
     MANUAL_FEATURE_COLUMNS,
     SvrConfig,
     candidate_configs,
+    create_estimator,
     select_config,
     select_manual_features,
 )
-from tests.test_training import _frame
+from tests.factories import make_training_frame
 
 
 def test_chronological_folds_never_split_or_reverse_periods() -> None:
@@ -64,9 +68,51 @@ def test_chronological_calibration_split_reserves_latest_whole_periods() -> None
     assert calibration.tolist() == [2, 3, 4, 5]
 
 
+def test_period_index_matches_tuple_comparison_on_unsorted_rows() -> None:
+    rng = np.random.default_rng(7)
+    frame = pl.DataFrame(
+        {
+            "target_season": rng.integers(2019, 2023, 200),
+            "target_week": rng.integers(1, 19, 200),
+        }
+    )
+    periods = list(frame.select("target_season", "target_week").iter_rows())
+    ordered = sorted(set(periods))
+    chunks = np.array_split(np.arange(1, len(ordered)), 4)
+
+    for (train, validation), chunk in zip(
+        chronological_folds(frame, 4), chunks, strict=True
+    ):
+        first, last = ordered[chunk[0]], ordered[chunk[-1]]
+        assert train.tolist() == [
+            row for row, period in enumerate(periods) if period < first
+        ]
+        assert validation.tolist() == [
+            row for row, period in enumerate(periods) if first <= period <= last
+        ]
+
+
+def test_period_index_is_shared_per_frame() -> None:
+    frame = pl.DataFrame(
+        {"target_season": [2021, 2020, 2021, 2020], "target_week": [1, 2, 2, 1]}
+    )
+
+    index = period_index(frame)
+    first = tuple(chronological_folds(frame, 2))
+
+    assert period_index(frame) is index
+    assert period_index(frame.clone()) is not index
+    assert index.ordinals.tolist() == [202101, 202002, 202102, 202001]
+    assert index.seasons.tolist() == [2021, 2020, 2021, 2020]
+    assert tuple(chronological_folds(frame, 2)) == first
+    assert not first[0][0].flags.writeable
+    with pytest.raises(ModelTrainingError, match="non-null"):
+        period_index(frame.with_columns(pl.lit(None).alias("target_week")))
+
+
 def test_svr_search_space_and_manual_features_are_stable() -> None:
     assert len(candidate_configs()) == 260
-    data = training_data_from_frame(_frame(16, season=2020))
+    data = training_data_from_frame(make_training_frame(16, season=2020))
 
     selected = select_manual_features(data)
 
@@ -75,10 +121,44 @@ def test_svr_search_space_and_manual_features_are_stable() -> None:
 
 
 def test_select_config_uses_chronological_folds() -> None:
-    data = training_data_from_frame(_frame(16, season=2020))
+    data = training_data_from_frame(make_training_frame(16, season=2020))
     candidates = (
         SvrConfig(c=0.25, kernel="linear"),
         SvrConfig(c=1.0, kernel="linear"),
     )
 
     assert select_config(data, candidates, folds=2) in candidates
+
+
+def test_select_config_matches_exhaustive_search_serially_and_in_parallel() -> None:
+    data = training_data_from_frame(make_training_frame(24, season=2020))
+    candidates = candidate_configs()[::20]
+    scores = []
+    for config in candidates:
+        errors = []
+        for train, validation in chronological_folds(data.frame, 3):
+            prediction = (
+                create_estimator(config)
+                .fit(data.features[train], data.target[train])
+                .predict(data.features[validation])
+            )
+            errors.append(mean_absolute_error(data.target[validation], prediction))
+        scores.append(np.mean(errors))
+    exhaustive = candidates[int(np.argmin(scores))]
+
+    assert select_config(data, candidates, folds=3) == exhaustive
+    assert select_config(data, candidates, folds=3, jobs=2) == exhaustive
+
+
+def test_select_config_halving_is_deterministic_and_validated() -> None:
+    data = training_data_from_frame(make_training_frame(24, season=2020))
+    candidates = candidate_configs()[::20]
+
+    first = select_config(data, candidates, folds=3, halving_factor=3)
+
+    assert first in candidates
+    assert select_config(data, candidates, folds=3, halving_factor=3) == first
+    with pytest.raises(ConfigurationError, match="halving_factor"):
+        select_config(data, candidates, folds=3, halving_factor=1)
+    with pytest.raises(ConfigurationError, match="jobs"):
+        select_config(data, candidates, folds=3, jobs=0)
@@ -4,31 +4,70 @@ from pathlib import Path
 import numpy as np
 import polars as pl
 import pytest
+from interpret.glassbox import ExplainableBoostingRegressor
+from polars.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
 
-from ffpred.features.schema import FEATURE_SCHEMA, TARGET_COLUMN
-from ffpred.training.data import training_data_from_frame
-from ffpred.training.ebm import EbmConfig, train_ebm, write_ebm_explanations
+from ffpred.errors import ModelTrainingError
+from ffpred.features.all_positions import ALL_POSITION_MODEL_FEATURE_COLUMNS
+from ffpred.features.schema import MODEL_FEATURE_COLUMNS, TARGET_COLUMN
+from ffpred.training.data import (
+    KEY_COLUMNS,
+    load_training_data,
+    training_data_from_frame,
+)
+from ffpred.training.ebm import (
+    EbmConfig,
+    train_ebm,
+    write_ebm_explanations,
+    write_ebm_local_explanations,
+)
 from ffpred.training.mlp import MlpConfig, train_mlp
+from ffpred.training.parallel import cpu_budgets
+from ffpred.training.projection import projection_estimator
+from ffpred.training.registry import (
+    ModelRegistry,
+    RegistryStats,
+    config_sha256,
+    model_key,
+)
 from ffpred.training.svr import SvrConfig, train_svr
+from tests.factories import make_training_frame
 
 
-def _frame(rows: int, *, season: int) -> pl.DataFrame:
-    values: dict[str, list[object]] = {}
-    for column, dtype in FEATURE_SCHEMA.items():
-        if dtype == pl.String:
-            values[column] = [f"{column}-{index}" for index in range(rows)]
-        elif dtype == pl.Int64:
-            values[column] = [season + index // 4 for index in range(rows)]
-        else:
-            values[column] = [float(index + 1) for index in range(rows)]
-    values["target_week"] = [index % 4 + 1 for index in range(rows)]
-    values[TARGET_COLUMN] = [float(index * 2 + 1) for index in range(rows)]
-    return pl.DataFrame(values, schema=FEATURE_SCHEMA)
+def test_loaded_training_data_keeps_key_columns_and_rereads_the_rest(
+    tmp_path: Path,
+) -> None:
+    frame = make_training_frame(12, season=2020)
+    path = tmp_path / "train.parquet"
+    frame.write_parquet(path)
+    expected = frame.select(MODEL_FEATURE_COLUMNS).to_numpy()
+
+    data = load_training_data(path)
+    single = load_training_data(path, dtype="float32")
+
+    assert data.frame.columns == [column for column in KEY_COLUMNS if column in frame]
+    assert data.features.dtype == np.float64
+    np.testing.assert_array_equal(data.features, expected)
+    assert single.features.dtype == np.float32
+    np.testing.assert_array_equal(single.features, expected.astype(np.float32))
+    np.testing.assert_array_equal(data.target, frame[TARGET_COLUMN].to_numpy())
+    assert data.columns == tuple(frame.columns)
+    assert_frame_equal(
+        data.select(("player_id", "years_pro", TARGET_COLUMN)),
+        frame.select("player_id", "years_pro", TARGET_COLUMN),
+    )
+    manual = data.with_features(("years_pro", "qb_history_through_week"))
+    np.testing.assert_array_equal(
+        manual.features,
+        frame.select("years_pro", "qb_history_through_week").to_numpy(),
+    )
+    assert_frame_equal(training_data_from_frame(frame).select(frame.columns), frame)
 
 
 def test_svr_training_returns_typed_deterministic_result() -> None:
-    train = training_data_from_frame(_frame(16, season=2020))
-    test = training_data_from_frame(_frame(4, season=2025))
+    train = training_data_from_frame(make_training_frame(16, season=2020))
+    test = training_data_from_frame(make_training_frame(4, season=2025))
 
     first = train_svr(train, test, config=SvrConfig(kernel="linear"))
     second = train_svr(train, test, config=SvrConfig(kernel="linear"))
@@ -39,8 +78,8 @@ def test_svr_training_returns_typed_deterministic_result() -> None:
 
 
 def test_mlp_training_is_reproducible_with_fixed_seed() -> None:
-    train = training_data_from_frame(_frame(16, season=2020))
-    test = training_data_from_frame(_frame(4, season=2025))
+    train = training_data_from_frame(make_training_frame(16, season=2020))
+    test = training_data_from_frame(make_training_frame(4, season=2025))
     config = MlpConfig(
         hidden_units=4,
         max_iterations=2_000,
@@ -57,8 +96,8 @@ def test_mlp_training_is_reproducible_with_fixed_seed() -> None:
 def test_ebm_exports_global_shapes_and_additive_local_explanations(
     tmp_path: Path,
 ) -> None:
-    train = training_data_from_frame(_frame(16, season=2020))
-    test = training_data_from_frame(_frame(4, season=2025))
+    train = training_data_from_frame(make_training_frame(16, season=2020))
+    test = training_data_from_frame(make_training_frame(4, season=2025))
     config = EbmConfig(
         max_bins=16,
         interactions=0,
@@ -71,7 +110,7 @@ def test_ebm_exports_global_shapes_and_additive_local_explanations(
         n_jobs=1,
     )
 
-    result = train_ebm(train, test, config=config)
+    result = train_ebm(train, test, config=config, local_explanations=True)
     explanations_path = tmp_path / "explanations.json"
     identities = [{"player_id": f"player-{index}"} for index in range(4)]
     write_ebm_explanations(
@@ -95,9 +134,77 @@ def test_ebm_exports_global_shapes_and_additive_local_explanations(
         assert contribution_sum == pytest.approx(local["prediction"])
 
 
+def test_ebm_local_explanations_stream_as_columnar_contributions(
+    tmp_path: Path,
+) -> None:
+    train = training_data_from_frame(make_training_frame(24, season=2020))
+    test = training_data_from_frame(make_training_frame(5, season=2025))
+    result = train_ebm(
+        train,
+        test,
+        config=EbmConfig(
+            max_bins=16,
+            interactions=2,
+            max_rounds=20,
+            min_samples_leaf=2,
+            outer_bags=1,
+            validation_size=0,
+            calibration_fraction=0,
+            n_jobs=1,
+        ),
+        local_explanations=True,
+    )
+    identities = pl.DataFrame({"player_id": [f"player-{row}" for row in range(5)]})
+    parquet_path = tmp_path / "local.parquet"
+    arrow_path = tmp_path / "local.arrow"
+
+    for path in (parquet_path, arrow_path):
+        write_ebm_local_explanations(
+            path,
+            result.estimator,
+            test,
+            result.predictions,
+            identities=identities,
+            chunk_rows=2,
+        )
+    frame = pl.read_parquet(parquet_path)
+    terms = [term.name for term in result.explanations.local[0].terms]
+
+    assert sorted(tmp_path.iterdir()) == [arrow_path, parquet_path]
+
+    assert_frame_equal(frame, pl.read_ipc(arrow_path))
+    assert frame.columns == [
+        "player_id",
+        "row",
+        "actual",
+        "prediction",
+        "intercept",
+        *terms,
+    ]
+    assert frame["row"].to_list() == list(range(5))
+    np.testing.assert_allclose(
+        frame["intercept"] + frame.select(terms).sum_horizontal(),
+        result.predictions,
+    )
+    for local in result.explanations.local:
+        assert frame.row(local.row, named=True) == {
+            "player_id": f"player-{local.row}",
+            "row": local.row,
+            "actual": local.actual,
+            "prediction": local.prediction,
+            "intercept": local.intercept,
+            **{term.name: term.contribution for term in local.terms},
+        }
+    assert "local" not in train_ebm(
+        train,
+        test,
+        config=EbmConfig(max_rounds=5, outer_bags=1, calibration_fraction=0, n_jobs=1),
+    ).explanations.to_dict(())
+
+
 def test_ebm_local_interactions_retain_both_feature_values() -> None:
-    train = training_data_from_frame(_frame(24, season=2020))
-    test = training_data_from_frame(_frame(4, season=2025))
+    train = training_data_from_frame(make_training_frame(24, season=2020))
+    test = training_data_from_frame(make_training_frame(4, season=2025))
     result = train_ebm(
         train,
         test,
@@ -111,6 +218,7 @@ def test_ebm_local_interactions_retain_both_feature_values() -> None:
             calibration_fraction=0,
             n_jobs=1,
         ),
+        local_explanations=True,
     )
 
     interaction = next(
@@ -119,3 +227,91 @@ def test_ebm_local_interactions_retain_both_feature_values() -> None:
 
     assert isinstance(interaction.value, dict)
     assert set(interaction.value) == set(interaction.name.split(" & "))
+
+
+def test_model_registry_reuses_matching_estimators_and_evicts_lru(
+    tmp_path: Path,
+) -> None:
+    frame = make_training_frame(16, season=2020)
+    training_path = tmp_path / "train.parquet"
+    frame.write_parquet(training_path)
+    train = training_data_from_frame(frame)
+    test = training_data_from_frame(make_training_frame(4, season=2025))
+    config = SvrConfig(kernel="linear")
+    registry = ModelRegistry(tmp_path / "models")
+    key = model_key("svr", training_path, train.feature_names, config)
+
+    assert registry.load(key, Pipeline) is None
+    fitted = train_svr(train, test, config=config)
+    saved = registry.save(key, fitted.estimator, metadata={"config": "linear"})
+    stored = registry.load(key, Pipeline)
+
+    assert stored is not None
+    assert stored[1].digest == saved.digest
+    assert stored[1].metadata == {"config": "linear"}
+    reused = train_svr(train, test, config=config, estimator=stored[0])
+    np.testing.assert_array_equal(reused.predictions, fitted.predictions)
+    assert registry.load(key, ExplainableBoostingRegressor) is None
+    assert registry.stats().artifacts == 0
+
+    other = model_key("svr", training_path, train.feature_names, SvrConfig(c=2.0))
+    assert other.digest != key.digest
+    kept = registry.save(key, fitted.estimator)
+    Path(registry.save(other, fitted.estimator).path).write_bytes(b"tampered")
+    assert registry.load(other, Pipeline) is None
+    assert registry.stats() == RegistryStats(
+        hits=1,
+        misses=3,
+        evictions=0,
+        artifacts=1,
+        bytes=kept.bytes,
+    )
+
+    registry.save(other, fitted.estimator)
+    assert registry.load(key, Pipeline) is not None
+    evicted = registry.evict(max_bytes=kept.bytes)
+    assert [artifact.digest for artifact in evicted] == [other.digest]
+    assert [artifact.digest for artifact in registry.artifacts()] == [key.digest]
+
+
+def test_model_keys_cover_fixed_estimator_parameters() -> None:
+    spec = projection_estimator("svr", ALL_POSITION_MODEL_FEATURE_COLUMNS)
+    changed = projection_estimator("svr", ALL_POSITION_MODEL_FEATURE_COLUMNS)
+    changed.estimator.set_params(regressor__max_iter=10)
+
+    assert config_sha256(spec.key_config) == config_sha256(
+        projection_estimator("svr", ALL_POSITION_MODEL_FEATURE_COLUMNS).key_config
+    )
+    assert config_sha256(spec.key_config) != config_sha256(changed.key_config)
+
+
+def test_model_registry_skips_an_entry_evicted_while_listed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frame = make_training_frame(8, season=2020)
+    training_path = tmp_path / "train.parquet"
+    frame.write_parquet(training_path)
+    registry = ModelRegistry(tmp_path / "models")
+    key = model_key("svr", training_path, frame.columns, SvrConfig())
+    record = Path(registry.save(key, Pipeline([])).path).with_suffix(".json")
+    original_stat = Path.stat
+
+    def evicting_stat(path: Path, **kwargs: bool) -> object:
+        if path == record:
+            record.unlink()
+        return original_stat(path, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", evicting_stat)
+    assert registry.artifacts() == ()
+
+
+def test_cpu_budgets_keep_svr_single_threaded_and_share_the_rest() -> None:
+    assert cpu_budgets(("svr", "mlp", "ebm"), 8) == {"svr": 1, "mlp": 3, "ebm": 4}
+    assert cpu_budgets(("svr", "mlp", "ebm"), 2) == {"svr": 1, "mlp": 1, "ebm": 1}
+    assert cpu_budgets(("svr", "ebm"), 8, overrides={"svr": 2}) == {
+        "svr": 2,
+        "ebm": 6,
+    }
+    with pytest.raises(ModelTrainingError):
+        cpu_budgets(("mlp",), 0)
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from ffpred.errors import ConfigurationError
+from ffpred.workers import WorkerSlot, worker_count
+
+
+def test_worker_count_counts_negative_jobs_back_from_the_cpus() -> None:
+    cpus = os.cpu_count() or 1
+
+    assert worker_count(3) == 3
+    assert worker_count(-1) == cpus
+    assert worker_count(-cpus - 5) == 1
+    with pytest.raises(ConfigurationError, match="jobs"):
+        worker_count(0)
+
+
+def test_worker_slot_restores_the_previous_value() -> None:
+    slot: WorkerSlot[int] = WorkerSlot("test-slot")
+
+    with pytest.raises(ConfigurationError, match="test-slot"):
+        slot.get()
+    with slot.installed(1):
+        with slot.installed(2):
+            assert slot.get() == 2
+        assert slot.get() == 1
+    with pytest.raises(ConfigurationError, match="test-slot"):
+        slot.get()